@@ -0,0 +1,89 @@
+"""Add world news article store and feed poll state.
+
+Revision ID: 0123456789ab
+Revises: f0123456789a
+Create Date: 2026-10-18 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0123456789ab"
+down_revision: str | None = "f0123456789a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ARTICLES_TABLE = "world_news_articles"
+FEED_STATES_TABLE = "world_news_feed_states"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if ARTICLES_TABLE not in tables:
+        op.create_table(
+            ARTICLES_TABLE,
+            sa.Column("id", sa.String(length=128), primary_key=True),
+            sa.Column("title", sa.Text(), nullable=False),
+            sa.Column("summary", sa.Text(), nullable=True),
+            sa.Column("source_id", sa.String(length=96), nullable=False),
+            sa.Column("source", sa.String(length=128), nullable=False),
+            sa.Column("source_domain", sa.String(length=128), nullable=False),
+            sa.Column("source_url", sa.Text(), nullable=False),
+            sa.Column("feed_url", sa.Text(), nullable=False),
+            sa.Column("url", sa.Text(), nullable=False),
+            sa.Column("published_at", sa.DateTime(), nullable=True),
+            sa.Column("region", sa.String(length=32), nullable=False),
+            sa.Column("category", sa.String(length=32), nullable=False),
+            sa.Column("language", sa.String(length=8), nullable=False),
+            sa.Column("tags", sa.JSON(), nullable=True),
+            sa.Column("relevance_score", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("first_seen_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_world_news_articles_published", ARTICLES_TABLE, ["published_at"])
+        op.create_index(
+            "ix_world_news_articles_source_published",
+            ARTICLES_TABLE,
+            ["source_id", "published_at"],
+        )
+        op.create_index("ix_world_news_articles_first_seen", ARTICLES_TABLE, ["first_seen_at"])
+    if FEED_STATES_TABLE not in tables:
+        op.create_table(
+            FEED_STATES_TABLE,
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("source_id", sa.String(length=96), nullable=False),
+            sa.Column("feed_url", sa.String(length=500), nullable=False),
+            sa.Column("etag", sa.String(length=256), nullable=True),
+            sa.Column("last_modified", sa.String(length=64), nullable=True),
+            sa.Column(
+                "poll_interval_seconds", sa.Integer(), nullable=False, server_default="600"
+            ),
+            sa.Column("next_poll_at", sa.DateTime(), nullable=True),
+            sa.Column("last_polled_at", sa.DateTime(), nullable=True),
+            sa.Column("last_success_at", sa.DateTime(), nullable=True),
+            sa.Column("last_status", sa.String(length=16), nullable=True),
+            sa.Column("last_error", sa.String(length=240), nullable=True),
+            sa.Column("consecutive_failures", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("last_article_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column(
+                "last_new_article_count", sa.Integer(), nullable=False, server_default="0"
+            ),
+            sa.UniqueConstraint("source_id", "feed_url", name="uq_world_news_feed_states_feed"),
+        )
+        op.create_index(
+            "ix_world_news_feed_states_next_poll_at", FEED_STATES_TABLE, ["next_poll_at"]
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if FEED_STATES_TABLE in tables:
+        op.drop_table(FEED_STATES_TABLE)
+    if ARTICLES_TABLE in tables:
+        op.drop_table(ARTICLES_TABLE)
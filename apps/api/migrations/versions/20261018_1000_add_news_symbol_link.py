@@ -0,0 +1,52 @@
+"""Add news_symbol_link inverted index for company news relevance.
+
+Revision ID: 123456789abc
+Revises: 0123456789ab
+Create Date: 2026-10-18 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "123456789abc"
+down_revision: str | None = "0123456789ab"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "news_symbol_link"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if TABLE in tables:
+        return
+    op.create_table(
+        TABLE,
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("symbol", sa.String(length=10), nullable=False),
+        sa.Column(
+            "article_id",
+            sa.Integer(),
+            sa.ForeignKey("market_news.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("reason", sa.String(length=32), nullable=False),
+        sa.Column("published_date", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("symbol", "article_id", name="uq_news_symbol_link_symbol_article"),
+    )
+    op.create_index("ix_news_symbol_link_article_id", TABLE, ["article_id"])
+    op.create_index("ix_news_symbol_link_rank", TABLE, ["symbol", "score", "published_date"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if TABLE in tables:
+        op.drop_table(TABLE)
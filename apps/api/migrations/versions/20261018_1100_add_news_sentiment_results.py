@@ -0,0 +1,49 @@
+"""Add news_sentiment_results memo keyed by normalized content hash.
+
+Revision ID: 23456789abcd
+Revises: 123456789abc
+Create Date: 2026-10-18 11:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "23456789abcd"
+down_revision: str | None = "123456789abc"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "news_sentiment_results"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if TABLE in tables:
+        return
+    op.create_table(
+        TABLE,
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("sentiment", sa.String(length=20), nullable=False),
+        sa.Column("confidence", sa.Integer(), nullable=False),
+        sa.Column("symbols", sa.JSON(), nullable=True),
+        sa.Column("sectors", sa.JSON(), nullable=True),
+        sa.Column("ai_summary", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.UniqueConstraint(
+            "content_hash", "model", name="uq_news_sentiment_results_hash_model"
+        ),
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if TABLE in tables:
+        op.drop_table(TABLE)
@@ -0,0 +1,64 @@
+"""Add parsed estimator features to prediction_markets.
+
+Revision ID: 3456789abcde
+Revises: 23456789abcd
+Create Date: 2026-10-18 12:00:00.000000
+
+Ingest now parses CPI thresholds, FOMC meeting labels, recession years and
+topics once per upsert. The estimators read ``features`` instead of re-running
+the regex sweep over every active market. ``estimator_buckets`` lets them
+load only the markets they consume. Existing rows keep ``features_version``
+NULL and are re-parsed on first load.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "3456789abcde"
+down_revision: str | None = "23456789abcd"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+TABLE_NAME = "prediction_markets"
+INDEX_NAME = "ix_prediction_markets_active_buckets"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if TABLE_NAME not in set(inspector.get_table_names()):
+        return
+    columns = {col["name"] for col in inspector.get_columns(TABLE_NAME)}
+    if "features" not in columns:
+        op.add_column(
+            TABLE_NAME,
+            sa.Column("features", sa.JSON(), nullable=False, server_default=sa.text("'{}'")),
+        )
+    if "features_version" not in columns:
+        op.add_column(TABLE_NAME, sa.Column("features_version", sa.Integer(), nullable=True))
+    if "estimator_buckets" not in columns:
+        op.add_column(
+            TABLE_NAME, sa.Column("estimator_buckets", sa.String(length=64), nullable=True)
+        )
+    indexes = {index["name"] for index in inspector.get_indexes(TABLE_NAME)}
+    if INDEX_NAME not in indexes:
+        op.create_index(INDEX_NAME, TABLE_NAME, ["active", "estimator_buckets"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if TABLE_NAME not in set(inspector.get_table_names()):
+        return
+    indexes = {index["name"] for index in inspector.get_indexes(TABLE_NAME)}
+    if INDEX_NAME in indexes:
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+    columns = {col["name"] for col in inspector.get_columns(TABLE_NAME)}
+    for column in ("estimator_buckets", "features_version", "features"):
+        if column in columns:
+            op.drop_column(TABLE_NAME, column)
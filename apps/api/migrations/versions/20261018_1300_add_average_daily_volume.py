@@ -0,0 +1,87 @@
+"""Add average_daily_volume and a block_trades conflict key.
+
+Revision ID: 456789abcdef
+Revises: 3456789abcde
+Create Date: 2026-10-18 13:00:00.000000
+
+Block detection is now one ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``
+per trading day. It joins intraday trades against a precomputed 20-session
+average daily volume and relies on a unique (symbol, trade_time, price) key
+instead of one existence query per trade. Duplicate block rows left by the
+old per-symbol loop are collapsed before the unique index is created; insider
+alerts pointing at a removed duplicate are repointed to the surviving row.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "456789abcdef"
+down_revision: str | None = "3456789abcde"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ADV_TABLE = "average_daily_volume"
+ADV_INDEX = "ix_average_daily_volume_as_of_date"
+BLOCK_TABLE = "block_trades"
+BLOCK_INDEX = "uq_block_trade_symbol_time_price"
+ALERT_TABLE = "insider_alerts"
+DUPLICATE_BLOCK_IDS = (
+    "SELECT id FROM block_trades WHERE id NOT IN ("
+    "SELECT MIN(id) FROM block_trades GROUP BY symbol, trade_time, price)"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    if ADV_TABLE not in tables:
+        op.create_table(
+            ADV_TABLE,
+            sa.Column("symbol", sa.String(length=10), primary_key=True),
+            sa.Column("as_of_date", sa.Date(), nullable=False),
+            sa.Column("adv_20d", sa.BigInteger(), nullable=False),
+            sa.Column("sessions", sa.Integer(), nullable=False),
+            sa.Column("computed_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index(ADV_INDEX, ADV_TABLE, ["as_of_date"])
+
+    if BLOCK_TABLE not in tables:
+        return
+    indexes = {index["name"] for index in inspector.get_indexes(BLOCK_TABLE)}
+    if BLOCK_INDEX not in indexes:
+        if ALERT_TABLE in tables:
+            # insider_alerts.block_trade_id has no foreign key, so nothing
+            # cascades: move alerts onto the row that survives the dedupe.
+            op.execute(
+                sa.text(
+                    "UPDATE insider_alerts SET block_trade_id = ("
+                    "SELECT MIN(keeper.id) FROM block_trades AS keeper "
+                    "JOIN block_trades AS duplicate ON keeper.symbol = duplicate.symbol "
+                    "AND keeper.trade_time = duplicate.trade_time "
+                    "AND keeper.price = duplicate.price "
+                    "WHERE duplicate.id = insider_alerts.block_trade_id) "
+                    f"WHERE block_trade_id IN ({DUPLICATE_BLOCK_IDS})"
+                )
+            )
+        op.execute(sa.text(f"DELETE FROM block_trades WHERE id IN ({DUPLICATE_BLOCK_IDS})"))
+        op.create_index(
+            BLOCK_INDEX, BLOCK_TABLE, ["symbol", "trade_time", "price"], unique=True
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    if BLOCK_TABLE in tables:
+        indexes = {index["name"] for index in inspector.get_indexes(BLOCK_TABLE)}
+        if BLOCK_INDEX in indexes:
+            op.drop_index(BLOCK_INDEX, table_name=BLOCK_TABLE)
+    if ADV_TABLE in tables:
+        op.drop_index(ADV_INDEX, table_name=ADV_TABLE)
+        op.drop_table(ADV_TABLE)
@@ -0,0 +1,61 @@
+"""Add alert_rules for the streaming alert rule engine.
+
+Revision ID: 56789abcdef0
+Revises: 456789abcdef
+Create Date: 2026-10-18 14:00:00.000000
+
+User rules (price cross, % move, volume spike vs ADV, foreign net flow, RSI)
+are compiled into per-symbol threshold tables and evaluated on every realtime
+tick. Matches are persisted as ``insider_alerts`` rows of the new
+``RULE_TRIGGER`` alert type.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "56789abcdef0"
+down_revision: str | None = "456789abcdef"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "alert_rules"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TYPE alerttype ADD VALUE IF NOT EXISTS 'RULE_TRIGGER'")
+
+    tables = set(sa.inspect(bind).get_table_names())
+    if TABLE in tables:
+        return
+    op.create_table(
+        TABLE,
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("symbol", sa.String(length=10), nullable=False),
+        sa.Column("rule_type", sa.String(length=20), nullable=False),
+        sa.Column("direction", sa.String(length=10), nullable=False),
+        sa.Column("threshold", sa.Float(), nullable=False),
+        sa.Column("cooldown_seconds", sa.Integer(), nullable=False, server_default="300"),
+        sa.Column("enabled", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("note", sa.String(length=255), nullable=True),
+        sa.Column("last_triggered_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_alert_rules_user_id", TABLE, ["user_id"])
+    op.create_index("ix_alert_rules_symbol", TABLE, ["symbol"])
+    op.create_index("ix_alert_rule_enabled_symbol", TABLE, ["enabled", "symbol"])
+
+
+def downgrade() -> None:
+    # Postgres cannot drop a single enum value; RULE_TRIGGER stays in alerttype.
+    bind = op.get_bind()
+    tables = set(sa.inspect(bind).get_table_names())
+    if TABLE in tables:
+        op.drop_table(TABLE)
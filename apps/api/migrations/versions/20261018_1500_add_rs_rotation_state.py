@@ -0,0 +1,85 @@
+"""Add rs_rotation_state and sector rows to rs_snapshots.
+
+Revision ID: 6789abcdef01
+Revises: 56789abcdef0
+Create Date: 2026-10-18 15:00:00.000000
+
+The nightly RRG job computes RS-Ratio/RS-Momentum for the whole universe
+and every sector in one panel pass and carries the EMA state forward in
+``rs_rotation_state``. ``rs_snapshots`` gains a ``scope`` column
+(``symbol``/``sector``) and a wider ``symbol`` column so sector ids fit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "6789abcdef01"
+down_revision: str | None = "56789abcdef0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SNAPSHOT_TABLE = "rs_snapshots"
+SCOPE_INDEX = "ix_rs_snapshot_scope_benchmark_date"
+STATE_TABLE = "rs_rotation_state"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if SNAPSHOT_TABLE in tables:
+        columns = {column["name"] for column in inspector.get_columns(SNAPSHOT_TABLE)}
+        if "scope" not in columns:
+            op.add_column(
+                SNAPSHOT_TABLE,
+                sa.Column("scope", sa.String(length=10), nullable=False, server_default="symbol"),
+            )
+        if bind.dialect.name == "postgresql":
+            op.alter_column(
+                SNAPSHOT_TABLE,
+                "symbol",
+                type_=sa.String(length=32),
+                existing_type=sa.String(length=10),
+                existing_nullable=False,
+            )
+        indexes = {index["name"] for index in inspector.get_indexes(SNAPSHOT_TABLE)}
+        if SCOPE_INDEX not in indexes:
+            op.create_index(
+                SCOPE_INDEX, SNAPSHOT_TABLE, ["scope", "benchmark", "snapshot_date"]
+            )
+
+    if STATE_TABLE not in tables:
+        op.create_table(
+            STATE_TABLE,
+            sa.Column("entity", sa.String(length=32), primary_key=True),
+            sa.Column("benchmark", sa.String(length=20), primary_key=True),
+            sa.Column("scope", sa.String(length=10), nullable=False),
+            sa.Column("as_of_date", sa.Date(), nullable=False),
+            sa.Column("ema_fast", sa.Float(), nullable=False),
+            sa.Column("ema_slow", sa.Float(), nullable=False),
+            sa.Column("ema_momentum", sa.Float(), nullable=False),
+            sa.Column("level", sa.Float(), nullable=True),
+            sa.Column("sessions", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    if STATE_TABLE in tables:
+        op.drop_table(STATE_TABLE)
+    if SNAPSHOT_TABLE in tables:
+        indexes = {index["name"] for index in inspector.get_indexes(SNAPSHOT_TABLE)}
+        if SCOPE_INDEX in indexes:
+            op.drop_index(SCOPE_INDEX, table_name=SNAPSHOT_TABLE)
+        op.execute(sa.text("DELETE FROM rs_snapshots WHERE scope <> 'symbol'"))
+        columns = {column["name"] for column in inspector.get_columns(SNAPSHOT_TABLE)}
+        if "scope" in columns:
+            op.drop_column(SNAPSHOT_TABLE, "scope")
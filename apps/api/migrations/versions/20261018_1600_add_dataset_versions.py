@@ -0,0 +1,42 @@
+"""Add dataset_versions registry table.
+
+Revision ID: 789abcdef012
+Revises: 6789abcdef01
+Create Date: 2026-10-18 16:00:00.000000
+
+Syncs bump a per-dataset version counter; ``@cached`` prefixes that depend
+on a dataset embed its version in the cache key instead of relying on a
+fixed TTL.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "789abcdef012"
+down_revision: str | None = "6789abcdef01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "dataset_versions"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if TABLE in set(inspector.get_table_names()):
+        return
+    op.create_table(
+        TABLE,
+        sa.Column("name", sa.String(length=50), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if TABLE in set(inspector.get_table_names()):
+        op.drop_table(TABLE)
@@ -0,0 +1,81 @@
+"""Key alert rules by the authenticated account.
+
+Revision ID: 89abcdef0123
+Revises: 789abcdef012
+Create Date: 2026-10-19 09:00:00.000000
+
+``alert_rules.user_id`` becomes the auth provider's string user id (the same
+identity dashboards use) instead of an unauthenticated integer, and rule
+matches record their owner in ``insider_alerts.owner_id`` so private alerts
+stay out of the shared insider alert feed. Rules created under the old
+integer ids cannot be attributed to an account and are disabled.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "89abcdef0123"
+down_revision: str | None = "789abcdef012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+RULES_TABLE = "alert_rules"
+ALERTS_TABLE = "insider_alerts"
+OWNER_INDEX = "ix_insider_alerts_owner_id"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if RULES_TABLE in tables:
+        columns = {column["name"]: column for column in inspector.get_columns(RULES_TABLE)}
+        if not isinstance(columns["user_id"]["type"], sa.String):
+            op.execute(sa.text(f"UPDATE {RULES_TABLE} SET enabled = false"))
+            with op.batch_alter_table(RULES_TABLE, schema=None) as batch_op:
+                batch_op.alter_column(
+                    "user_id",
+                    existing_type=sa.BigInteger(),
+                    type_=sa.String(length=36),
+                    existing_nullable=False,
+                    postgresql_using="user_id::text",
+                )
+
+    if ALERTS_TABLE in tables:
+        columns = {column["name"] for column in inspector.get_columns(ALERTS_TABLE)}
+        if "owner_id" not in columns:
+            op.add_column(ALERTS_TABLE, sa.Column("owner_id", sa.String(length=36), nullable=True))
+            op.create_index(OWNER_INDEX, ALERTS_TABLE, ["owner_id"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if ALERTS_TABLE in tables:
+        columns = {column["name"] for column in inspector.get_columns(ALERTS_TABLE)}
+        if "owner_id" in columns:
+            op.execute(sa.text(f"DELETE FROM {ALERTS_TABLE} WHERE owner_id IS NOT NULL"))
+            op.drop_index(OWNER_INDEX, table_name=ALERTS_TABLE)
+            with op.batch_alter_table(ALERTS_TABLE, schema=None) as batch_op:
+                batch_op.drop_column("owner_id")
+
+    if RULES_TABLE in tables:
+        columns = {column["name"]: column for column in inspector.get_columns(RULES_TABLE)}
+        if isinstance(columns["user_id"]["type"], sa.String):
+            # Account ids have no integer form; their rules cannot survive the downgrade.
+            op.execute(sa.text(f"DELETE FROM {RULES_TABLE}"))
+            with op.batch_alter_table(RULES_TABLE, schema=None) as batch_op:
+                batch_op.alter_column(
+                    "user_id",
+                    existing_type=sa.String(length=36),
+                    type_=sa.BigInteger(),
+                    existing_nullable=False,
+                    postgresql_using="user_id::bigint",
+                )
@@ -0,0 +1,47 @@
+"""Add garch_warm_starts for persisted GARCH(1,1) fits.
+
+Revision ID: 9abcdef01234
+Revises: 89abcdef0123
+Create Date: 2026-10-19 10:00:00.000000
+
+Each GARCH fit is stored per (symbol, adjustment_mode, as_of_date); the next
+fit for the symbol warm-starts from the nearest earlier session's parameters
+instead of an in-process or Redis-only cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "9abcdef01234"
+down_revision: str | None = "89abcdef0123"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "garch_warm_starts"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if TABLE in set(inspector.get_table_names()):
+        return
+    op.create_table(
+        TABLE,
+        sa.Column("symbol", sa.String(length=10), primary_key=True),
+        sa.Column("adjustment_mode", sa.String(length=10), primary_key=True),
+        sa.Column("as_of_date", sa.Date(), primary_key=True),
+        sa.Column("omega", sa.Float(), nullable=False),
+        sa.Column("alpha", sa.Float(), nullable=False),
+        sa.Column("beta", sa.Float(), nullable=False),
+        sa.Column("observations", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if TABLE in set(inspector.get_table_names()):
+        op.drop_table(TABLE)
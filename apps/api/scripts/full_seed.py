@@ -103,10 +103,10 @@ async def run_seeding():
                     )
                     if df is not None and not df.empty:
                         from vnibb.models.stock import StockIndex
-                        from vnibb.services.data_pipeline import get_upsert_stmt
+                        from vnibb.services.bulk_writer import bulk_upsert
 
-                        for _, row in df.iterrows():
-                            val = {
+                        index_rows = [
+                            {
                                 "index_code": idx,
                                 "time": row["time"].date()
                                 if hasattr(row["time"], "date")
@@ -118,8 +118,9 @@ async def run_seeding():
                                 "volume": int(row["volume"]),
                                 "created_at": datetime.utcnow(),
                             }
-                            stmt = get_upsert_stmt(StockIndex, ["index_code", "time"], val)
-                            await session.execute(stmt)
+                            for _, row in df.iterrows()
+                        ]
+                        await bulk_upsert(session, StockIndex, ["index_code", "time"], index_rows)
                         total_idx += len(df)
                 except Exception as e:
                     logger.warning(f"Failed to sync index {idx}: {e}")
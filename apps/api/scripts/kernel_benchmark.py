@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the pure compute kernels behind the quant and TA routes.
+
+Each kernel runs against deterministic synthetic daily bars (250, 2,500 and
+25,000 sessions by default). The script records wall time (min and median
+over ``--repeats`` timed runs after one warm-up) and peak Python allocation
+(``tracemalloc``, measured in a separate untimed run so tracing overhead
+does not leak into the timings).
+
+Results are keyed ``<kernel>@<bars>``. Pass ``--baseline`` to compare
+against an earlier run; the script exits 1 when a kernel regresses beyond
+``--max-regression`` (time) or ``--max-memory-regression`` (peak memory).
+Save a run with ``--write-baseline`` to make it the new baseline. A refactor
+or vectorization of a kernel should come with the before/after tables.
+
+Examples::
+
+    python scripts/kernel_benchmark.py
+    python scripts/kernel_benchmark.py --kernels quant.garch --sizes 2500,25000
+    python scripts/kernel_benchmark.py --baseline scripts/benchmarks/kernel_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+API_ROOT = Path(__file__).resolve().parents[1]
+if str(API_ROOT) not in sys.path:
+    sys.path.insert(0, str(API_ROOT))
+
+DEFAULT_BASELINE = API_ROOT / "scripts" / "benchmarks" / "kernel_baseline.json"
+DEFAULT_SIZES = (250, 2_500, 25_000)
+SERIES_SEED = 20_260_101
+SERIES_END = "2026-01-02"
+
+Kernel = Callable[[], Any]
+
+
+# ---------------------------------------------------------------------------
+# Synthetic series
+# ---------------------------------------------------------------------------
+
+
+def synthetic_ohlcv(bars: int, seed: int = SERIES_SEED) -> pd.DataFrame:
+    """Deterministic business-day OHLCV with volatility clustering and drawdowns."""
+    rng = np.random.default_rng(seed)
+    # GARCH(1,1)-like variance so the GARCH fit and drawdown scans see realistic paths.
+    shocks = rng.standard_normal(bars)
+    variance = np.empty(bars)
+    returns = np.empty(bars)
+    variance[0] = 0.0002
+    for index in range(bars):
+        if index:
+            variance[index] = 0.000004 + 0.08 * returns[index - 1] ** 2 + 0.9 * variance[index - 1]
+        returns[index] = 0.0003 + np.sqrt(variance[index]) * shocks[index]
+    close = np.round(20_000 * np.exp(np.cumsum(returns)), 1)
+    spread = np.abs(rng.normal(0.0, 0.01, bars)) * close
+    open_ = np.round(close * (1 + rng.normal(0.0, 0.004, bars)), 1)
+    return pd.DataFrame(
+        {
+            "time": pd.bdate_range(end=SERIES_END, periods=bars),
+            "open": open_,
+            "high": np.round(np.maximum(open_, close) + spread, 1),
+            "low": np.round(np.minimum(open_, close) - spread, 1),
+            "close": close,
+            "volume": rng.integers(50_000, 5_000_000, bars).astype(float),
+        }
+    )
+
+
+def synthetic_pair(bars: int, seed: int = SERIES_SEED) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Two frames whose closes share a stochastic trend plus a mean-reverting spread."""
+    frame_a = synthetic_ohlcv(bars, seed)
+    rng = np.random.default_rng(seed + 1)
+    spread = np.zeros(bars)
+    noise = rng.normal(0.0, 0.01, bars)
+    for index in range(1, bars):
+        spread[index] = 0.95 * spread[index - 1] + noise[index]
+    frame_b = frame_a.copy()
+    frame_b["close"] = np.round(frame_a["close"].to_numpy() * 0.8 * np.exp(spread), 1)
+    return frame_a, frame_b
+
+
+def synthetic_basket_panel(symbols: int, bars: int, seed: int = SERIES_SEED) -> Any:
+    """A ``ClosePanel`` of ``symbols`` independent synthetic close series."""
+    from vnibb.services.price_panel import ClosePanel
+
+    frames = [synthetic_ohlcv(bars, seed + index) for index in range(symbols)]
+    return ClosePanel(
+        dates=frames[0]["time"].to_numpy().astype("datetime64[D]"),
+        symbols=tuple(f"S{index:02d}" for index in range(symbols)),
+        closes=np.column_stack([frame["close"].to_numpy() for frame in frames]),
+    )
+
+
+def log_returns(frame: pd.DataFrame) -> np.ndarray:
+    closes = frame["close"].to_numpy(dtype=float)
+    return np.log(closes[1:] / closes[:-1])
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+
+def _quant_kernels() -> dict[str, Callable[[int], Kernel]]:
+    from vnibb.api.v1 import quant
+    from vnibb.services.pair_scan import scan_pairs
+    from vnibb.services.rrg_panel import RrgState, advance_rrg
+
+    def garch_eps(bars: int) -> np.ndarray:
+        returns = synthetic_ohlcv(bars)["close"].pct_change().dropna().to_numpy() * 100
+        return returns - returns.mean()
+
+    return {
+        "quant.garch_volatility": lambda bars: (
+            lambda frame=synthetic_ohlcv(bars): quant._compute_garch_volatility(frame)
+        ),
+        "quant.fit_garch_params": lambda bars: (
+            lambda eps=garch_eps(bars): quant._fit_garch_params(eps)
+        ),
+        "quant.hurst_rs": lambda bars: (
+            lambda series=log_returns(synthetic_ohlcv(bars)): quant._hurst_rs(series)
+        ),
+        "quant.variance_ratio": lambda bars: (
+            lambda series=log_returns(synthetic_ohlcv(bars)): [
+                quant._variance_ratio(series, q) for q in (2, 5, 10)
+            ]
+        ),
+        "quant.pair_diagnostics": lambda bars: (
+            lambda pair=synthetic_pair(bars): quant._compute_pair_diagnostics(*pair)
+        ),
+        "quant.ema_respect": lambda bars: (
+            lambda frame=synthetic_ohlcv(bars): quant._compute_ema_respect(frame)
+        ),
+        "quant.drawdown_recovery": lambda bars: (
+            lambda frame=synthetic_ohlcv(bars): quant._compute_drawdown_recovery(frame)
+        ),
+        "quant.pair_scan_vn30": lambda bars: (
+            lambda panel=synthetic_basket_panel(30, bars): scan_pairs(panel)
+        ),
+        "quant.rrg_panel_100": lambda bars: (
+            lambda panel=synthetic_basket_panel(101, bars): advance_rrg(
+                RrgState.empty(panel.symbols[1:]),
+                panel.dates,
+                panel.closes[:, 1:],
+                panel.closes[:, 0],
+            )
+        ),
+    }
+
+
+def _ta_kernels() -> dict[str, Callable[[int], Kernel]]:
+    from vnibb.services.technical_analysis import TechnicalAnalysisService
+
+    class FrameTechnicalAnalysisService(TechnicalAnalysisService):
+        """Serves one in-memory frame so only the indicator maths is timed."""
+
+        def __init__(self, frame: pd.DataFrame):
+            self._ta_available = False
+            self._frame = frame
+
+        async def get_ohlcv_data(self, symbol, start_date, end_date, interval="1D"):
+            return self._frame
+
+    def ta_kernel(method: str, **kwargs: Any) -> Callable[[int], Kernel]:
+        def build(bars: int) -> Kernel:
+            service = FrameTechnicalAnalysisService(synthetic_ohlcv(bars))
+            return lambda: getattr(service, method)("BENCH", **kwargs)
+
+        return build
+
+    return {
+        "ta.moving_averages": ta_kernel("get_moving_averages", periods=[10, 20, 50, 200]),
+        "ta.rsi": ta_kernel("get_rsi"),
+        "ta.macd": ta_kernel("get_macd"),
+        "ta.bollinger_bands": ta_kernel("get_bollinger_bands"),
+        "ta.stochastic": ta_kernel("get_stochastic"),
+        "ta.adx": ta_kernel("get_adx"),
+        "ta.ichimoku_cloud": ta_kernel("get_ichimoku_cloud"),
+        "ta.support_resistance": ta_kernel("get_support_resistance"),
+        "ta.full_analysis": ta_kernel("get_full_technical_analysis"),
+    }
+
+
+def kernel_registry() -> dict[str, Callable[[int], Kernel]]:
+    """Kernel name -> builder that prepares inputs for ``bars`` and returns a thunk."""
+    return {**_quant_kernels(), **_ta_kernels()}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _invoke(kernel: Kernel, runner: asyncio.Runner) -> Any:
+    result = kernel()
+    if inspect.isawaitable(result):
+        result = runner.run(result)
+    return result
+
+
+def run_kernel(kernel: Kernel) -> Any:
+    """Run ``kernel`` once (awaiting it if it is a coroutine) and return its result."""
+    with asyncio.Runner() as runner:
+        return _invoke(kernel, runner)
+
+
+def measure_kernel(kernel: Kernel, repeats: int = 5) -> dict[str, Any]:
+    """Time ``kernel`` ``repeats`` times after a warm-up, then trace one run's peak memory."""
+    with asyncio.Runner() as runner:
+        _invoke(kernel, runner)
+        timings: list[float] = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(max(1, repeats)):
+                started = time.perf_counter()
+                _invoke(kernel, runner)
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            _invoke(kernel, runner)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "repeats": len(timings),
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(
+    kernels: dict[str, Callable[[int], Kernel]], sizes: tuple[int, ...], repeats: int
+) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = {}
+    for name, build in kernels.items():
+        for bars in sizes:
+            results[f"{name}@{bars}"] = {"bars": bars, **measure_kernel(build(bars), repeats)}
+    return results
+
+
+def compare_with_baseline(
+    current: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    max_regression: float,
+    max_memory_regression: float,
+) -> list[str]:
+    """Human-readable regressions; kernels missing from the baseline are skipped."""
+    regressions: list[str] = []
+    for key, row in current.items():
+        reference = baseline.get(key)
+        if not reference:
+            continue
+        before = float(reference.get("median_ms") or 0.0)
+        after = float(row["median_ms"])
+        if before > 0 and after > before * (1 + max_regression):
+            regressions.append(
+                f"{key}: median {before:.3f} -> {after:.3f} ms (+{after / before - 1:.0%})"
+            )
+        before_kib = float(reference.get("peak_kib") or 0.0)
+        after_kib = float(row["peak_kib"])
+        if before_kib > 0 and after_kib > before_kib * (1 + max_memory_regression):
+            regressions.append(
+                f"{key}: peak memory {before_kib:.1f} -> {after_kib:.1f} KiB "
+                f"(+{after_kib / before_kib - 1:.0%})"
+            )
+    return regressions
+
+
+def print_markdown(report: dict[str, Any]) -> None:
+    print("# VNIBB Compute Kernel Benchmark")
+    print(f"- Generated: `{report['generated_at']}`")
+    print(f"- Python `{report['python']}`, numpy `{report['numpy']}`, pandas `{report['pandas']}`")
+    print("")
+    print("| Kernel | Bars | min ms | median ms | peak KiB |")
+    print("|--------|------|--------|-----------|----------|")
+    for key, row in report["kernels"].items():
+        name = key.rsplit("@", 1)[0]
+        print(
+            f"| `{name}` | `{row['bars']}` | `{row['min_ms']}` | `{row['median_ms']}` | "
+            f"`{row['peak_kib']}` |"
+        )
+
+
+def configure_environment() -> None:
+    """Keep app settings local and offline; must run before importing ``vnibb``."""
+    os.environ["ENVIRONMENT"] = "development"
+    os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+    os.environ["SENTRY_DSN"] = ""
+    os.environ["CACHE_BACKEND"] = "memory"
+    os.environ["REDIS_URL"] = ""
+    os.environ["MONGODB_ENABLED"] = "false"
+    os.environ["APPWRITE_ENDPOINT"] = ""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the VNIBB compute kernel benchmarks")
+    parser.add_argument(
+        "--kernels",
+        default="",
+        help="Comma-separated name prefixes, e.g. quant.garch,ta.rsi (default: all)",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated bar counts",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per kernel and size")
+    parser.add_argument("--output-json", default="")
+    parser.add_argument("--baseline", default="", help="Baseline JSON to compare against")
+    parser.add_argument("--write-baseline", action="store_true", help=f"Save to {DEFAULT_BASELINE}")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    parser.add_argument("--max-memory-regression", type=float, default=0.25)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    configure_environment()
+    kernels = kernel_registry()
+    prefixes = [item.strip() for item in args.kernels.split(",") if item.strip()]
+    if prefixes:
+        kernels = {
+            name: build
+            for name, build in kernels.items()
+            if any(name.startswith(prefix) for prefix in prefixes)
+        }
+    sizes = tuple(int(item) for item in args.sizes.split(",") if item.strip())
+
+    report = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "sizes": list(sizes),
+        "repeats": args.repeats,
+        "kernels": run_benchmarks(kernels, sizes, args.repeats),
+    }
+    print_markdown(report)
+
+    outputs = [Path(args.output_json)] if args.output_json else []
+    if args.write_baseline:
+        outputs.append(DEFAULT_BASELINE)
+    for output in outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nSaved JSON report to `{output}`")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(
+            report["kernels"],
+            baseline.get("kernels", {}),
+            args.max_regression,
+            args.max_memory_regression,
+        )
+        if regressions:
+            print("\n## Regressions")
+            for line in regressions:
+                print(f"- {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.max_regression:.0%} of `{args.baseline}`")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,730 @@
+#!/usr/bin/env python3
+"""Reproducible load and latency benchmark for the hot API routes.
+
+Unlike ``full_stack_benchmark.py`` (serial availability probes against a live
+deployment), this boots the FastAPI app locally under uvicorn. It runs against
+SQLite or a local Postgres, with an in-process cache (memory or fakeredis)
+and optionally mongomock, all seeded with a deterministic synthetic corpus
+(default 1,600 symbols x 10 years of daily bars). It then drives closed-loop
+concurrent load at each hot route and reports throughput and p50/p95/p99.
+
+Results are written as JSON. Pass ``--baseline`` to compare against an
+earlier run; the script exits 1 when a route regresses beyond
+``--max-regression``, and refuses to run (exit 2) when the load, corpus size
+or environment differ from the baseline's. Save a run with
+``--write-baseline`` to make it the new baseline.
+
+Examples::
+
+    python scripts/load_benchmark.py --symbols 200 --years 3 --duration 10
+    python scripts/load_benchmark.py --baseline scripts/benchmarks/load_baseline.json
+    python scripts/load_benchmark.py --database-url postgresql+asyncpg://localhost/vnibb_bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import string
+import sys
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+API_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = API_ROOT / "scripts" / "benchmarks" / "load_baseline.json"
+DEFAULT_DATABASE_PATH = API_ROOT / ".benchmarks" / "load_benchmark.db"
+CORPUS_SEED = 20_260_101
+INDUSTRIES = (
+    "Banking",
+    "Real Estate",
+    "Securities",
+    "Steel",
+    "Retail",
+    "Technology",
+    "Utilities",
+    "Oil & Gas",
+    "Food & Beverage",
+    "Construction",
+    "Insurance",
+    "Logistics",
+)
+EXCHANGES = ("HOSE", "HNX", "UPCOM")
+INDEX_CODES = ("VNINDEX", "VN30", "HNX")
+INSERT_BATCH_ROWS = 20_000
+# Defaults match the committed baseline; on SQLite the default connection pool
+# (5 + 10 overflow) starves well before 32 concurrent clients.
+DEFAULT_CONCURRENCY = 8
+DEFAULT_DURATION_SECONDS = 30.0
+DEFAULT_WARMUP_SECONDS = 3.0
+# Setup fields that must match before two runs' latencies are comparable.
+COMPARABLE_SETUP = {
+    "environment": ("cpu_count", "database", "cache", "mongo"),
+    "load": ("concurrency", "duration_seconds", "warmup_seconds"),
+    "corpus": ("symbols",),
+}
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+
+def synthetic_symbols(count: int) -> list[str]:
+    """Deterministic three-letter tickers (AAA, AAB, ...), like HOSE/HNX codes."""
+    letters = string.ascii_uppercase
+    symbols: list[str] = []
+    for first in letters:
+        for second in letters:
+            for third in letters:
+                symbols.append(f"{first}{second}{third}")
+                if len(symbols) == count:
+                    return symbols
+    raise ValueError(f"At most {len(letters) ** 3} synthetic symbols are supported")
+
+
+def synthetic_price_rows(
+    symbol: str, index: int, trading_days: list[date]
+) -> Iterator[dict[str, Any]]:
+    """Geometric random walk OHLCV for one symbol, seeded by its position."""
+    rng = np.random.default_rng(CORPUS_SEED + index)
+    sessions = len(trading_days)
+    base = float(rng.uniform(5_000, 150_000))
+    closes = base * np.exp(np.cumsum(rng.normal(0.0002, 0.02, sessions)))
+    opens = closes * (1 + rng.normal(0, 0.005, sessions))
+    highs = np.maximum(opens, closes) * (1 + np.abs(rng.normal(0, 0.01, sessions)))
+    lows = np.minimum(opens, closes) * (1 - np.abs(rng.normal(0, 0.01, sessions)))
+    volumes = rng.lognormal(12, 1.0, sessions).astype(np.int64) * 100
+    for day, open_, high, low, close, volume in zip(
+        trading_days, opens, highs, lows, closes, volumes, strict=True
+    ):
+        close = round(float(close), -1)
+        yield {
+            "symbol": symbol,
+            "time": day,
+            "open": round(float(open_), -1),
+            "high": max(round(float(high), -1), close),
+            "low": min(round(float(low), -1), close),
+            "close": close,
+            "volume": int(volume),
+            "value": float(close * volume),
+        }
+
+
+def synthetic_screener_row(
+    symbol: str, index: int, last_close: float, snapshot_date: date
+) -> dict[str, Any]:
+    rng = random.Random(CORPUS_SEED + index)
+    shares = rng.uniform(50e6, 3e9)
+    return {
+        "symbol": symbol,
+        "snapshot_date": snapshot_date,
+        "company_name": f"{symbol} Synthetic JSC",
+        "exchange": EXCHANGES[index % len(EXCHANGES)],
+        "industry": INDUSTRIES[index % len(INDUSTRIES)],
+        "price": last_close,
+        "volume": rng.uniform(1e4, 5e6),
+        "market_cap": last_close * shares,
+        "pe": rng.uniform(4, 40),
+        "pb": rng.uniform(0.5, 6),
+        "ps": rng.uniform(0.2, 8),
+        "roe": rng.uniform(-5, 35),
+        "roa": rng.uniform(-2, 15),
+        "net_margin": rng.uniform(-10, 30),
+        "revenue_growth": rng.uniform(-20, 60),
+        "earnings_growth": rng.uniform(-40, 80),
+        "dividend_yield": rng.uniform(0, 8),
+        "debt_to_equity": rng.uniform(0, 3),
+        "eps": rng.uniform(-500, 8_000),
+        "bvps": rng.uniform(5_000, 60_000),
+        "foreign_ownership": rng.uniform(0, 49),
+        "source": "benchmark",
+    }
+
+
+async def seed_corpus(
+    engine: Any, *, symbols: list[str], years: int, reseed: bool, mongo_collection: Any = None
+) -> dict[str, Any]:
+    """Create tables and load the corpus unless an identical one is already there."""
+    from sqlalchemy import func, insert, select
+
+    import vnibb.models  # noqa: F401 - registers every table on Base.metadata
+    from vnibb.core.database import Base
+    from vnibb.models.screener import ScreenerSnapshot
+    from vnibb.models.stock import Stock, StockIndex, StockPrice
+    from vnibb.services.price_gap_planner import configured_market_holidays, iter_trading_days
+
+    end = date.today() - timedelta(days=1)
+    trading_days = list(
+        iter_trading_days(end - timedelta(days=365 * years), end, configured_market_holidays())
+    )
+
+    async with engine.begin() as conn:
+        if reseed:
+            await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        stock_count = await conn.scalar(select(func.count()).select_from(Stock))
+        price_count = await conn.scalar(select(func.count()).select_from(StockPrice))
+
+    expected_prices = len(symbols) * len(trading_days)
+    corpus = {"symbols": len(symbols), "sessions": len(trading_days), "price_rows": expected_prices}
+    if stock_count == len(symbols) and price_count == expected_prices and mongo_collection is None:
+        return {**corpus, "seeded": False}
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        for position, index_code in enumerate(INDEX_CODES):
+            await conn.execute(
+                insert(StockIndex.__table__),
+                [
+                    {
+                        "id": position * len(trading_days) + offset + 1,
+                        "index_code": index_code,
+                        **{key: value for key, value in row.items() if key != "symbol"},
+                    }
+                    for offset, row in enumerate(
+                        synthetic_price_rows(index_code, -1 - position, trading_days)
+                    )
+                ],
+            )
+
+    price_id = 0
+    for index, symbol in enumerate(symbols):
+        rows = list(synthetic_price_rows(symbol, index, trading_days))
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(Stock.__table__),
+                [
+                    {
+                        "id": index + 1,
+                        "symbol": symbol,
+                        "company_name": f"{symbol} Synthetic JSC",
+                        "exchange": EXCHANGES[index % len(EXCHANGES)],
+                        "industry": INDUSTRIES[index % len(INDUSTRIES)],
+                        "sector": INDUSTRIES[index % len(INDUSTRIES)],
+                        "is_active": 1,
+                    }
+                ],
+            )
+            for offset in range(0, len(rows), INSERT_BATCH_ROWS):
+                batch = []
+                for row in rows[offset : offset + INSERT_BATCH_ROWS]:
+                    price_id += 1
+                    batch.append(
+                        {**row, "id": price_id, "stock_id": index + 1, "interval": "1D"}
+                    )
+                await conn.execute(insert(StockPrice.__table__), batch)
+            await conn.execute(
+                insert(ScreenerSnapshot.__table__),
+                [synthetic_screener_row(symbol, index, rows[-1]["close"], trading_days[-1])],
+            )
+        if mongo_collection is not None:
+            mongo_collection.insert_many(
+                [
+                    {
+                        **{key: value for key, value in row.items() if key != "time"},
+                        "tradeDate": datetime.combine(row["time"], datetime.min.time()),
+                        "source": "benchmark",
+                    }
+                    for row in rows
+                ]
+            )
+        if (index + 1) % 100 == 0:
+            print(f"  seeded {index + 1}/{len(symbols)} symbols", file=sys.stderr)
+
+    return {**corpus, "seeded": True, "seed_seconds": round(time.perf_counter() - started, 1)}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Linear-interpolated percentile, matching ``full_stack_benchmark``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return round(ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower), 3)
+
+
+@dataclass
+class ScenarioStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+
+    def record(self, latency_ms: float, status: str, ok: bool) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.statuses[status] += 1
+        if not ok:
+            self.errors += 1
+
+
+def summarize_scenario(stats: ScenarioStats, elapsed_seconds: float) -> dict[str, Any]:
+    requests = len(stats.latencies_ms)
+    return {
+        "requests": requests,
+        "errors": stats.errors,
+        "error_rate": round(stats.errors / requests, 4) if requests else 0.0,
+        "throughput_rps": round(requests / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0,
+        "p50_ms": percentile(stats.latencies_ms, 0.50),
+        "p95_ms": percentile(stats.latencies_ms, 0.95),
+        "p99_ms": percentile(stats.latencies_ms, 0.99),
+        "max_ms": round(max(stats.latencies_ms), 3) if stats.latencies_ms else 0.0,
+        "statuses": dict(sorted(stats.statuses.items())),
+    }
+
+
+def run_setup(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    """The ``environment`` and ``load`` blocks recorded with every report."""
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "database": args.database_url.split("://", 1)[0],
+            "cache": args.redis,
+            "mongo": args.mongo,
+        },
+        "load": {
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "warmup_seconds": args.warmup,
+        },
+    }
+
+
+def baseline_setup_mismatches(
+    setup: dict[str, dict[str, Any]], baseline: dict[str, Any]
+) -> list[str]:
+    """``COMPARABLE_SETUP`` fields where this run differs from ``baseline``."""
+    mismatches: list[str] = []
+    for block, fields in COMPARABLE_SETUP.items():
+        recorded = baseline.get(block) or {}
+        for field_name in fields:
+            current = setup.get(block, {}).get(field_name)
+            if recorded.get(field_name) != current:
+                mismatches.append(
+                    f"{block}.{field_name}: run {current!r} != baseline {recorded.get(field_name)!r}"
+                )
+    return mismatches
+
+
+def compare_with_baseline(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    max_regression: float,
+) -> list[str]:
+    """Human-readable regressions of ``results`` against ``baseline`` scenarios."""
+    regressions: list[str] = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            limit = previous[metric] * (1 + max_regression)
+            if previous[metric] > 0 and current[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {current[metric]:.1f}ms > {limit:.1f}ms "
+                    f"(baseline {previous[metric]:.1f}ms)"
+                )
+        floor = previous["throughput_rps"] * (1 - max_regression)
+        if current["throughput_rps"] < floor:
+            regressions.append(
+                f"{name}: throughput {current['throughput_rps']:.1f} rps < {floor:.1f} rps "
+                f"(baseline {previous['throughput_rps']:.1f} rps)"
+            )
+        if current["error_rate"] > previous["error_rate"] + 0.01:
+            regressions.append(
+                f"{name}: error rate {current['error_rate']:.2%} "
+                f"(baseline {previous['error_rate']:.2%})"
+            )
+    return regressions
+
+
+async def run_closed_loop(
+    operation: Callable[[ScenarioStats], Awaitable[None]],
+    *,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+) -> dict[str, Any]:
+    """Run ``concurrency`` workers back to back; only post-warmup calls count."""
+    measured = ScenarioStats()
+    discarded = ScenarioStats()
+    measuring = False
+    deadline = time.perf_counter() + warmup + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            await operation(measured if measuring else discarded)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    await asyncio.sleep(warmup)
+    measuring = True
+    measure_started = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return summarize_scenario(measured, time.perf_counter() - measure_started)
+
+
+def http_scenarios(symbols: list[str]) -> dict[str, Callable[[random.Random], str]]:
+    def pick(rng: random.Random) -> str:
+        return rng.choice(symbols)
+
+    return {
+        "equity.historical": lambda rng: f"/api/v1/equity/historical?symbol={pick(rng)}",
+        "quant.metrics": lambda rng: f"/api/v1/quant/{pick(rng)}?period=5Y",
+        "quant.garch_volatility": lambda rng: f"/api/v1/quant/{pick(rng)}/garch-volatility",
+        "screener": lambda rng: "/api/v1/screener/?limit=100",
+        "market.heatmap": lambda rng: "/api/v1/market/heatmap?group_by=sector",
+    }
+
+
+async def http_scenario(
+    client: Any, path_for: Callable[[random.Random], str], args: argparse.Namespace
+) -> dict[str, Any]:
+    rng = random.Random(CORPUS_SEED)
+
+    async def operation(stats: ScenarioStats) -> None:
+        started = time.perf_counter()
+        try:
+            response = await client.get(path_for(rng))
+            stats.record(
+                (time.perf_counter() - started) * 1000,
+                str(response.status_code),
+                response.status_code < 400,
+            )
+        except Exception as exc:
+            stats.record((time.perf_counter() - started) * 1000, type(exc).__name__, False)
+
+    return await run_closed_loop(
+        operation, concurrency=args.concurrency, duration=args.duration, warmup=args.warmup
+    )
+
+
+async def websocket_scenario(base_ws_url: str, symbols: list[str], args: argparse.Namespace):
+    """Subscribe, then measure ping/pong round trips on ``/ws/prices`` sockets."""
+    import websockets
+
+    rng = random.Random(CORPUS_SEED)
+    connect_stats = ScenarioStats()
+
+    async def open_socket() -> Any:
+        started = time.perf_counter()
+        socket_ = await websockets.connect(f"{base_ws_url}/api/v1/ws/prices")
+        await socket_.recv()  # market_status greeting
+        connect_stats.record((time.perf_counter() - started) * 1000, "open", True)
+        await socket_.send(
+            json.dumps({"action": "subscribe", "symbols": rng.sample(symbols, 5)})
+        )
+        return socket_
+
+    sockets = await asyncio.gather(*(open_socket() for _ in range(args.concurrency)))
+    idle = asyncio.Queue()
+    for socket_ in sockets:
+        idle.put_nowait(socket_)
+
+    async def operation(stats: ScenarioStats) -> None:
+        socket_ = await idle.get()
+        started = time.perf_counter()
+        try:
+            await socket_.send(json.dumps({"action": "ping"}))
+            while json.loads(await socket_.recv()).get("action") != "pong":
+                pass
+            stats.record((time.perf_counter() - started) * 1000, "pong", True)
+        except Exception as exc:
+            stats.record((time.perf_counter() - started) * 1000, type(exc).__name__, False)
+        finally:
+            idle.put_nowait(socket_)
+
+    try:
+        result = await run_closed_loop(
+            operation, concurrency=args.concurrency, duration=args.duration, warmup=args.warmup
+        )
+    finally:
+        await asyncio.gather(*(socket_.close() for socket_ in sockets), return_exceptions=True)
+    result["connect_p50_ms"] = percentile(connect_stats.latencies_ms, 0.50)
+    result["connect_p95_ms"] = percentile(connect_stats.latencies_ms, 0.95)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Stand-in stack
+# ---------------------------------------------------------------------------
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """Point settings at the local stand-ins; must run before importing ``vnibb``."""
+    os.environ["ENVIRONMENT"] = "development"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["DATA_BACKEND"] = "postgres"
+    os.environ["SENTRY_DSN"] = ""
+    os.environ["RATE_LIMIT_MODE"] = "off"
+    os.environ["SCHEDULER_LOCK_ENABLED"] = "false"
+    os.environ["APPWRITE_ENDPOINT"] = ""
+    os.environ["APPWRITE_WRITE_ENABLED"] = "false"
+    os.environ["CORS_ORIGINS"] = '["http://localhost:3000"]'
+    if args.redis == "fakeredis":
+        os.environ["CACHE_BACKEND"] = "redis"
+        os.environ["REDIS_URL"] = "redis://fakeredis"
+    else:
+        os.environ["CACHE_BACKEND"] = "memory"
+        os.environ["REDIS_URL"] = ""
+    if args.mongo == "mongomock":
+        os.environ["MONGODB_ENABLED"] = "true"
+        os.environ["MONGODB_URL"] = "mongodb://mongomock"
+    else:
+        os.environ["MONGODB_ENABLED"] = "false"
+
+
+def install_stand_ins(args: argparse.Namespace) -> Any:
+    """Swap the cache/Mongo clients for in-process fakes. Returns the EOD collection."""
+    if args.redis == "fakeredis":
+        try:
+            import fakeredis
+        except ImportError as exc:
+            raise SystemExit("--redis fakeredis requires `pip install fakeredis`") from exc
+        from vnibb.core.cache import redis_client
+
+        redis_client._client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    if args.mongo != "mongomock":
+        return None
+    try:
+        import mongomock
+    except ImportError as exc:
+        raise SystemExit("--mongo mongomock requires `pip install mongomock`") from exc
+    from vnibb.core.config import settings
+    from vnibb.services.mongo_market_data_service import get_mongo_market_data_service
+
+    client = mongomock.MongoClient()
+    get_mongo_market_data_service()._client = client
+    return client[settings.mongodb_database]["market_prices_eod"]
+
+
+class OfflineGuard:
+    """Refuse non-loopback lookups and connections so provider fallbacks stay local.
+
+    A route that misses the seeded corpus and falls through to vnstock fails
+    fast instead of measuring someone else's API. Blocked attempts are counted
+    per host in the report, which shows where the DB-first path leaks.
+    """
+
+    LOCAL_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+    def __init__(self) -> None:
+        self.blocked: Counter[str] = Counter()
+        self._original_connect = socket.socket.connect
+        self._original_getaddrinfo = socket.getaddrinfo
+
+    def install(self) -> None:
+        guard = self
+
+        def getaddrinfo(host: Any, *args: Any, **kwargs: Any) -> Any:
+            name = host.decode() if isinstance(host, bytes) else str(host)
+            if host is not None and name not in guard.LOCAL_HOSTS:
+                guard.blocked[name] += 1
+                raise socket.gaierror(socket.EAI_NONAME, f"load benchmark is offline: {name}")
+            return guard._original_getaddrinfo(host, *args, **kwargs)
+
+        def connect(sock: socket.socket, address: Any) -> Any:
+            host = str(address[0]) if isinstance(address, tuple) else str(address)
+            if sock.family in (socket.AF_INET, socket.AF_INET6) and host not in guard.LOCAL_HOSTS:
+                guard.blocked[host] += 1
+                raise ConnectionRefusedError(f"load benchmark is offline: {host}")
+            return guard._original_connect(sock, address)
+
+        socket.getaddrinfo = getaddrinfo
+        socket.socket.connect = connect  # type: ignore[method-assign]
+
+    def uninstall(self) -> None:
+        socket.getaddrinfo = self._original_getaddrinfo
+        socket.socket.connect = self._original_connect  # type: ignore[method-assign]
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    configure_environment(args)
+
+    import httpx
+    import uvicorn
+
+    from vnibb.api.main import app
+    from vnibb.core.database import engine
+
+    mongo_collection = install_stand_ins(args)
+    symbols = synthetic_symbols(args.symbols)
+    print(f"Seeding {args.symbols} symbols x {args.years}y", file=sys.stderr)
+    corpus = await seed_corpus(
+        engine,
+        symbols=symbols,
+        years=args.years,
+        reseed=args.reseed,
+        mongo_collection=mongo_collection,
+    )
+
+    guard = OfflineGuard()
+    if not args.allow_network:
+        guard.install()
+
+    port = free_port()
+    # lifespan="off": no scheduler, warmup or provider connectivity checks.
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, lifespan="off", log_level="warning")
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    selected = set(args.scenarios.split(",")) if args.scenarios else None
+    results: dict[str, dict[str, Any]] = {}
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=60.0, limits=limits
+        ) as client:
+            for name, path_for in http_scenarios(symbols).items():
+                if selected is None or name in selected:
+                    print(f"Running {name}", file=sys.stderr)
+                    results[name] = await http_scenario(client, path_for, args)
+        if selected is None or "ws.prices" in selected:
+            print("Running ws.prices", file=sys.stderr)
+            results["ws.prices"] = await websocket_scenario(f"ws://127.0.0.1:{port}", symbols, args)
+    finally:
+        server.should_exit = True
+        await server_task
+        guard.uninstall()
+
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        **run_setup(args),
+        "corpus": corpus,
+        "blocked_connections": dict(guard.blocked.most_common()),
+        "scenarios": results,
+    }
+
+
+def print_markdown(report: dict[str, Any]) -> None:
+    print("# VNIBB Load Benchmark")
+    print(f"- Generated: `{report['generated_at']}`")
+    corpus = report["corpus"]
+    print(f"- Corpus: `{corpus['symbols']}` symbols x `{corpus['sessions']}` sessions")
+    print(f"- Concurrency: `{report['load']['concurrency']}`")
+    if report["blocked_connections"]:
+        print(f"- Blocked outbound connections: `{report['blocked_connections']}`")
+    print("")
+    print("| Scenario | Requests | RPS | p50 ms | p95 ms | p99 ms | Errors |")
+    print("|----------|----------|-----|--------|--------|--------|--------|")
+    for name, row in report["scenarios"].items():
+        print(
+            f"| `{name}` | `{row['requests']}` | `{row['throughput_rps']}` | `{row['p50_ms']}` | "
+            f"`{row['p95_ms']}` | `{row['p99_ms']}` | `{row['errors']}` |"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the VNIBB local load benchmark")
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("VNIBB_BENCHMARK_DATABASE_URL", f"sqlite+aiosqlite:///{DEFAULT_DATABASE_PATH}"),
+        help="SQLite (default) or a local Postgres URL; the corpus is (re)created there",
+    )
+    parser.add_argument("--symbols", type=int, default=1600)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--reseed", action="store_true", help="Drop and reload the corpus")
+    parser.add_argument("--redis", choices=("memory", "fakeredis"), default="memory")
+    parser.add_argument("--mongo", choices=("off", "mongomock"), default="off")
+    parser.add_argument(
+        "--allow-network",
+        action="store_true",
+        help="Let provider fallbacks reach the internet (off: refused, counted in the report)",
+    )
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=DEFAULT_DURATION_SECONDS,
+        help="Measured seconds per route",
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=DEFAULT_WARMUP_SECONDS, help="Unmeasured seconds per route"
+    )
+    parser.add_argument(
+        "--scenarios",
+        default="",
+        help="Comma-separated subset, e.g. equity.historical,ws.prices (default: all)",
+    )
+    parser.add_argument("--output-json", default="")
+    parser.add_argument("--baseline", default="", help="Baseline JSON to compare against")
+    parser.add_argument("--write-baseline", action="store_true", help=f"Save to {DEFAULT_BASELINE}")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    baseline: dict[str, Any] | None = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        setup = {**run_setup(args), "corpus": {"symbols": args.symbols}}
+        mismatches = baseline_setup_mismatches(setup, baseline)
+        if mismatches:
+            print(f"Refusing to compare against `{args.baseline}`: the setup differs", file=sys.stderr)
+            for line in mismatches:
+                print(f"- {line}", file=sys.stderr)
+            return 2
+
+    if args.database_url.startswith("sqlite"):
+        DEFAULT_DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    report = asyncio.run(run_benchmark(args))
+    print_markdown(report)
+
+    outputs = [Path(args.output_json)] if args.output_json else []
+    if args.write_baseline:
+        outputs.append(DEFAULT_BASELINE)
+    for output in outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nSaved JSON report to `{output}`")
+
+    if baseline is not None:
+        regressions = compare_with_baseline(
+            report["scenarios"], baseline.get("scenarios", {}), args.max_regression
+        )
+        if regressions:
+            print("\n## Regressions")
+            for line in regressions:
+                print(f"- {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.max_regression:.0%} of `{args.baseline}`")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -65,6 +65,7 @@ from vnibb.api.main import app
 from vnibb.core.database import Base, get_db
 from vnibb.middleware.rate_limit import RateLimitMiddleware
 from vnibb.models import *
+from vnibb.services.screener_snapshot_store import screener_snapshot_store
 
 TEST_DATABASE_URL = os.environ["DATABASE_URL"] if POSTGRES_CONTRACT else "sqlite+aiosqlite:///:memory:"
 
@@ -106,6 +107,7 @@ def relax_rate_limit_buckets(monkeypatch, request):
 
 @pytest.fixture(autouse=True)
 async def setup_tables(test_engine):
+    screener_snapshot_store.invalidate()
     if POSTGRES_CONTRACT:
         yield
         return
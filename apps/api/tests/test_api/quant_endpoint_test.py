@@ -5,9 +5,11 @@ from types import SimpleNamespace
 
 import pandas as pd
 import pytest
+from sqlalchemy import select
 
 from vnibb.api.v1 import quant
 from vnibb.api.v1.schemas import MetaData, StandardResponse
+from vnibb.models.market import GarchWarmStart
 from vnibb.models.stock import Stock, StockPrice
 from vnibb.providers.vnstock.equity_historical import EquityHistoricalData
 
@@ -1130,6 +1132,93 @@ async def test_garch_volatility_alias_canonicalizes_and_returns_payload(test_db,
     assert "series" in response.data
 
 
+def test_garch_candidate_scores_match_per_candidate_recursion():
+    frame = _build_garch_like_price_frame(rows=5_000)
+    returns = frame["close"].pct_change().dropna().to_numpy() * 100
+    eps = returns - returns.mean()
+    sample_var = float(np.var(eps))
+    candidates = np.array(
+        [
+            [sample_var * 0.05, 0.10, 0.85],
+            [sample_var * 0.30, 0.03, 0.67],
+            [sample_var * 0.01, 0.12, 0.87],
+            [sample_var * 0.10, 0.50, 0.60],
+            [-1.0, 0.05, 0.90],
+        ]
+    )
+
+    scores = quant._score_garch_candidates(eps, candidates)
+
+    for (omega, alpha, beta), score in zip(candidates, scores, strict=True):
+        h = quant._compute_garch_path(eps, omega, alpha, beta)
+        if h is None:
+            assert score == np.inf
+            continue
+        expected = 0.5 * float(np.sum(np.log(h) + eps**2 / h))
+        assert score == pytest.approx(expected, rel=1e-10)
+
+
+def test_garch_volatility_warm_start_reuses_and_refines_previous_fit():
+    frame = _build_garch_like_price_frame(rows=900)
+    cold = quant._compute_garch_volatility(frame.iloc[:-1])
+    assert cold["fit"]["mode"] == "cold"
+
+    reused = quant._compute_garch_volatility(frame.iloc[:-1], warm_start=cold | cold["fit"])
+    assert reused["fit"]["mode"] == "reused"
+    assert reused["current_conditional_vol_pct"] == cold["current_conditional_vol_pct"]
+
+    next_day = quant._compute_garch_volatility(frame, warm_start=cold | cold["fit"])
+    fresh = quant._compute_garch_volatility(frame)
+    assert next_day["fit"]["mode"] == "warm"
+    assert next_day["fit"]["as_of"] > cold["fit"]["as_of"]
+    assert next_day["persistence"] == pytest.approx(fresh["persistence"], abs=0.02)
+    assert next_day["current_conditional_vol_pct"] == pytest.approx(
+        fresh["current_conditional_vol_pct"], rel=0.05
+    )
+
+
+@pytest.mark.asyncio
+async def test_garch_volatility_alias_warm_starts_from_the_nearest_earlier_fit(test_db, monkeypatch):
+    frame = _build_garch_like_price_frame()
+    frames = iter([frame.iloc[:-5], frame.iloc[:-5], frame, frame.iloc[:-10]])
+
+    async def fake_load_quant_frame_with_warning(**_kwargs):
+        return next(frames), None
+
+    monkeypatch.setattr(
+        "vnibb.api.v1.quant._load_quant_frame_with_warning", fake_load_quant_frame_with_warning
+    )
+
+    payloads = []
+    for _ in range(4):
+        response = await quant._get_quant_metric_alias_response(
+            symbol="VNM",
+            metric_name="garch-volatility",
+            period="3Y",
+            source="KBS",
+            adjustment_mode="raw",
+            db=test_db,
+        )
+        payloads.append(response.data)
+
+    fits = [payload["fit"] for payload in payloads]
+    # Same session reuses its fit, a later session warm-starts from it, and
+    # an earlier session never sees a fit from its future.
+    assert [fit["mode"] for fit in fits] == ["cold", "reused", "warm", "cold"]
+    rows = (
+        (await test_db.execute(select(GarchWarmStart).order_by(GarchWarmStart.as_of_date)))
+        .scalars()
+        .all()
+    )
+    assert [row.as_of_date.isoformat() for row in rows] == sorted(
+        {fit["as_of"] for fit in fits}
+    )
+    assert {(row.symbol, row.adjustment_mode) for row in rows} == {("VNM", "raw")}
+    latest = rows[-1]
+    assert latest.alpha == payloads[2]["alpha"]
+    assert latest.observations == fits[2]["observations"]
+
+
 def test_market_structure_insufficient_data_returns_nulls():
     frame = _build_price_frame(rows=50)
     result = quant._compute_market_structure_tests(frame)
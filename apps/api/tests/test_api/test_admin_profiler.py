@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from vnibb.api.main import app
+from vnibb.core.monitoring import CorrelationIDMiddleware
+from vnibb.core.profiler import SamplingProfiler, summarize_session
+
+
+def burn_cpu(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+@pytest.mark.asyncio
+async def test_profiler_tags_loop_samples_with_the_request_route(monkeypatch) -> None:
+    profiler = SamplingProfiler()
+    monkeypatch.setattr("vnibb.core.monitoring.sampling_profiler", profiler)
+    probe = FastAPI()
+    probe.add_middleware(CorrelationIDMiddleware)
+
+    @probe.get("/burn/{symbol}")
+    async def burn(symbol: str):
+        await asyncio.sleep(0)
+        return {"symbol": symbol, "total": burn_cpu(0.3)}
+
+    async with AsyncClient(transport=ASGITransport(app=probe), base_url="http://test") as client:
+        session, response = await asyncio.gather(
+            profiler.profile(0.8, 0.002),
+            client.get("/burn/VNM", headers={"X-Correlation-ID": "req-1"}),
+        )
+
+    assert response.status_code == 200
+    assert not profiler.active
+    payload = summarize_session(session)
+    assert payload["samples"] > 10
+    assert payload["requests_tagged"] == 1
+    route_stacks = payload["routes"]["/burn/{symbol}"]["collapsed"]
+    assert "burn_cpu (" in route_stacks
+    assert route_stacks.splitlines()[0].startswith("thread:")
+    assert payload["overhead"]["percent"] < 50
+
+    only_route = summarize_session(session, route="/burn")
+    assert set(only_route["routes"]) == {"/burn/{symbol}"}
+
+
+@pytest.mark.asyncio
+async def test_profiler_endpoint_requires_admin_key() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/admin/profiler/sample", params={"seconds": 0.5})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_profiler_endpoint_returns_collapsed_stacks(client) -> None:
+    response = await client.post(
+        "/api/v1/admin/profiler/sample", params={"seconds": 0.5, "interval_ms": 5}
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["samples"] > 0
+    assert payload["worker_pid"] > 0
+    assert "thread:" in payload["collapsed"]
@@ -0,0 +1,143 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from vnibb.core.middleware.conditional import etag_matches
+from vnibb.models.screener import ScreenerSnapshot
+from vnibb.models.stock import StockPrice
+from vnibb.models.sync_status import SyncStatus
+from vnibb.services import data_versions
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def probe_sessions(test_engine, monkeypatch):
+    sessions = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(data_versions, "async_session_factory", sessions)
+    return sessions
+
+
+def _price(row_id, symbol, day, close):
+    return StockPrice(
+        id=row_id,
+        stock_id=1,
+        symbol=symbol,
+        time=day,
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=1_000,
+        interval="1D",
+    )
+
+
+def test_if_none_match_uses_weak_comparison_over_lists():
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abcd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+@pytest.mark.asyncio
+async def test_freshness_short_circuits_until_a_new_bar_lands(
+    client, test_db, probe_sessions, monkeypatch
+):
+    test_db.add(_price(1, "VNM", TODAY - timedelta(days=1), 60_000.0))
+    await test_db.commit()
+    calls = 0
+
+    async def counting_settlement_dates(db, limit):
+        nonlocal calls
+        calls += 1
+        return []
+
+    monkeypatch.setattr(
+        "vnibb.api.v1.market._load_completed_foreign_settlement_dates",
+        counting_settlement_dates,
+    )
+
+    first = await client.get("/api/v1/market/freshness")
+    etag = first.headers["ETag"]
+    repeat = await client.get("/api/v1/market/freshness", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert repeat.status_code == 304
+    assert repeat.headers["ETag"] == etag
+    assert repeat.headers["Cache-Control"] == "no-cache"
+    assert repeat.content == b""
+    assert calls == 1
+
+    test_db.add(SyncStatus(sync_type="daily_prices", status="completed"))
+    test_db.add(_price(2, "VNM", TODAY, 61_000.0))
+    await test_db.commit()
+
+    changed = await client.get("/api/v1/market/freshness", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_quote_etag_tracks_the_latest_bar_and_query(
+    client, test_db, probe_sessions
+):
+    test_db.add_all(
+        [_price(1, "FPT", TODAY - timedelta(days=1), 100.0), _price(2, "FPT", TODAY, 101.0)]
+    )
+    await test_db.commit()
+
+    first = await client.get("/api/v1/equity/FPT/quote")
+    etag = first.headers["ETag"]
+    assert first.json()["data"]["price"] == 101.0
+
+    weak = await client.get("/api/v1/equity/FPT/quote", headers={"If-None-Match": f"W/{etag}"})
+    assert weak.status_code == 304
+
+    other = await client.get("/api/v1/equity/FPT/quote", params={"source": "KBS"})
+    assert other.headers["ETag"] != etag
+
+    fresh_bar = await test_db.get(StockPrice, 2)
+    fresh_bar.close = 102.5
+    await test_db.commit()
+
+    updated = await client.get("/api/v1/equity/FPT/quote", headers={"If-None-Match": etag})
+    assert updated.status_code == 200
+    assert updated.json()["data"]["price"] == 102.5
+
+
+@pytest.mark.asyncio
+async def test_screener_etag_follows_the_published_snapshot_frame(
+    client, test_db, probe_sessions
+):
+    test_db.add_all(
+        ScreenerSnapshot(
+            symbol=symbol,
+            snapshot_date=TODAY,
+            exchange="HOSE",
+            price=price,
+            source="KBS",
+            created_at=datetime.utcnow(),
+        )
+        for symbol, price in (("AAA", 10.0), ("BBB", 20.0))
+    )
+    await test_db.commit()
+
+    # The probe never builds the frame itself; the first request does.
+    first = await client.get("/api/v1/screener", params={"limit": 5})
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    repeat = await client.get(
+        "/api/v1/screener", params={"limit": 5}, headers={"If-None-Match": etag}
+    )
+    live = await client.get(
+        "/api/v1/screener",
+        params={"limit": 5, "refresh": "true"},
+        headers={"If-None-Match": etag},
+    )
+
+    assert repeat.status_code == 304
+    assert live.status_code == 200
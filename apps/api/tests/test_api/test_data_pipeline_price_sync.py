@@ -34,12 +34,17 @@ class FakeSession:
     async def execute(self, stmt, params=None):
         sql = str(stmt)
         if "SELECT" in sql and "FROM stocks" in sql:
-            return FakeResult(scalar_value=1)
+            return FakeResult(scalar_value=1, rows=[("VNM", 1)])
         return FakeResult()
 
     async def commit(self):
         return None
 
+    def get_bind(self):
+        return types.SimpleNamespace(
+            dialect=types.SimpleNamespace(name="sqlite", driver="aiosqlite")
+        )
+
 
 @pytest.mark.asyncio
 async def test_fetch_quote_history_frame_uses_premium_quote_and_bypasses_retry(monkeypatch):
@@ -152,12 +157,12 @@ async def test_sync_daily_prices_uses_fast_fail_history_fetch(monkeypatch):
 @pytest.mark.asyncio
 async def test_sync_foreign_trading_persists_derived_values(monkeypatch):
     pipeline = DataPipeline()
-    statements = []
+    written_rows = []
 
-    class CapturingSession(FakeSession):
-        async def execute(self, stmt, params=None):
-            statements.append(stmt)
-            return FakeResult()
+    async def fake_bulk_upsert(session, model, index_elements, rows, **kwargs):
+        assert index_elements == ["symbol", "trade_date"]
+        written_rows.extend(rows)
+        return len(rows)
 
     async def fake_fetch(symbols, source):
         assert symbols == ["VNM", "FPT"]
@@ -185,7 +190,8 @@ async def test_sync_foreign_trading_persists_derived_values(monkeypatch):
         fake_fetch,
     )
     monkeypatch.setattr(pipeline, "_wait_for_rate_limit", fake_wait_for_rate_limit)
-    monkeypatch.setattr(data_pipeline_module, "async_session_maker", lambda: CapturingSession())
+    monkeypatch.setattr(data_pipeline_module, "async_session_maker", lambda: FakeSession())
+    monkeypatch.setattr(data_pipeline_module, "bulk_upsert", fake_bulk_upsert)
     monkeypatch.setattr(settings, "cache_foreign_trading_chunked", False)
 
     count = await pipeline.sync_foreign_trading(
@@ -193,9 +199,8 @@ async def test_sync_foreign_trading_persists_derived_values(monkeypatch):
         symbols=["VNM", "FPT"],
     )
 
-    compiled = [statement.compile().params for statement in statements]
-    vnm = next(values for values in compiled if values.get("symbol") == "VNM")
-    fpt = next(values for values in compiled if values.get("symbol") == "FPT")
+    vnm = next(values for values in written_rows if values.get("symbol") == "VNM")
+    fpt = next(values for values in written_rows if values.get("symbol") == "FPT")
     assert count == 2
     assert vnm["buy_value"] == 1_500.0
     assert vnm["sell_value"] == 600.0
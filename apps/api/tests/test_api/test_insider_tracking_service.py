@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import importlib.util
 from datetime import datetime
+from pathlib import Path
 
 import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
 
 from vnibb.services.insider_tracking import InsiderTrackingService
 
@@ -67,3 +72,185 @@ async def test_recent_block_trades_falls_back_for_legacy_schema():
             "is_proprietary": False,
         }
     ]
+
+
+async def _seed_block_trade_day(db, trade_day):
+    from datetime import timedelta
+
+    from vnibb.models.stock import StockPrice
+    from vnibb.models.trading import IntradayTrade
+
+    for offset in range(1, 26):
+        session_day = trade_day - timedelta(days=offset)
+        # Only the 20 most recent sessions count; older bars are 10x larger.
+        volume = 1_000_000 if offset <= 20 else 10_000_000
+        db.add(
+            StockPrice(
+                id=offset,
+                stock_id=1,
+                symbol="VCB",
+                time=session_day,
+                open=90_000.0,
+                high=91_000.0,
+                low=89_000.0,
+                close=90_000.0,
+                volume=volume,
+            )
+        )
+    day = datetime.combine(trade_day, datetime.min.time())
+    db.add_all(
+        [
+            IntradayTrade(
+                id=1,
+                symbol="VCB",
+                trade_time=day.replace(hour=10),
+                price=90_000.0,
+                volume=200_000,
+                match_type="BUY",
+            ),
+            IntradayTrade(
+                id=2,
+                symbol="VCB",
+                trade_time=day.replace(hour=10, minute=5),
+                price=90_000.0,
+                volume=1_000,
+                match_type="SELL",
+            ),
+            IntradayTrade(
+                id=3,
+                symbol="VCB",
+                trade_time=day - timedelta(hours=10),
+                price=90_000.0,
+                volume=500_000,
+                match_type="SELL",
+            ),
+        ]
+    )
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_block_detection_is_set_based_and_idempotent(test_db, monkeypatch):
+    from datetime import date, timedelta
+
+    from sqlalchemy import func, select
+
+    from vnibb.models.alerts import AlertType, BlockTrade, InsiderAlert, TradeSide
+    from vnibb.models.trading import AverageDailyVolume, IntradayTrade
+    from vnibb.services import insider_tracking
+
+    broadcasts = []
+
+    async def fake_broadcast(payload):
+        broadcasts.append(payload)
+
+    monkeypatch.setattr(insider_tracking.manager, "broadcast_alert", fake_broadcast)
+    trade_day = date(2026, 5, 18)
+    await _seed_block_trade_day(test_db, trade_day)
+    service = InsiderTrackingService(test_db)
+
+    first = await service.detect_block_trades_for_day(trade_date=trade_day)
+
+    assert len(first) == 1
+    assert first[0]["symbol"] == "VCB"
+    assert first[0]["side"] == TradeSide.BUY
+    assert first[0]["value"] == pytest.approx(18_000_000_000.0)
+    assert first[0]["volume_ratio"] == pytest.approx(0.2)
+    adv = await test_db.get(AverageDailyVolume, "VCB")
+    assert (adv.as_of_date, adv.adv_20d, adv.sessions) == (trade_day, 1_000_000, 20)
+    alerts = (await test_db.execute(select(InsiderAlert))).scalars().all()
+    assert len(alerts) == 1
+    assert alerts[0].alert_type == AlertType.BLOCK_TRADE
+    assert alerts[0].block_trade_id == first[0]["id"]
+    assert "0.2x average volume" in alerts[0].description
+    assert [payload["id"] for payload in broadcasts] == [alerts[0].id]
+
+    assert await service.detect_block_trades_for_day(trade_date=trade_day) == []
+
+    test_db.add(
+        IntradayTrade(
+            id=4,
+            symbol="VCB",
+            trade_time=datetime.combine(trade_day, datetime.min.time()) + timedelta(hours=14),
+            price=91_000.0,
+            volume=150_000,
+            match_type="SELL",
+        )
+    )
+    await test_db.commit()
+    later = await service.detect_block_trades(symbol="vcb", trade_date=trade_day)
+
+    assert [(row["side"], row["quantity"]) for row in later] == [(TradeSide.SELL, 150_000)]
+    block_count = await test_db.scalar(select(func.count(BlockTrade.id)))
+    alert_count = await test_db.scalar(select(func.count(InsiderAlert.id)))
+    assert (block_count, alert_count) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_block_detection_volume_ratio_threshold_uses_daily_adv(test_db, monkeypatch):
+    from datetime import date
+
+    from vnibb.services import insider_tracking
+
+    async def fake_broadcast(_payload):
+        return None
+
+    monkeypatch.setattr(insider_tracking.manager, "broadcast_alert", fake_broadcast)
+    trade_day = date(2026, 5, 18)
+    await _seed_block_trade_day(test_db, trade_day)
+    service = InsiderTrackingService(test_db)
+
+    strict = await service.detect_block_trades_for_day(
+        trade_date=trade_day, min_volume_ratio=0.5
+    )
+    loose = await service.detect_block_trades_for_day(
+        trade_date=trade_day, threshold=1_000_000_000, min_volume_ratio=0.1
+    )
+
+    assert strict == []
+    assert [row["quantity"] for row in loose] == [200_000]
+
+
+def test_block_trade_dedupe_migration_repoints_alerts_to_the_surviving_row():
+    migration_path = (
+        Path(__file__).parents[2]
+        / "migrations"
+        / "versions"
+        / "20261018_1300_add_average_daily_volume.py"
+    )
+    spec = importlib.util.spec_from_file_location("vnibb_average_daily_volume", migration_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "CREATE TABLE block_trades (id INTEGER PRIMARY KEY, symbol TEXT, "
+                "trade_time DATETIME, price FLOAT)"
+            )
+        )
+        conn.execute(
+            sa.text("CREATE TABLE insider_alerts (id INTEGER PRIMARY KEY, block_trade_id INTEGER)")
+        )
+        conn.execute(
+            sa.text(
+                "INSERT INTO block_trades VALUES "
+                "(1, 'VCB', '2026-10-16 09:30:00', 90000), "
+                "(2, 'VCB', '2026-10-16 09:30:00', 90000), "
+                "(3, 'FPT', '2026-10-16 10:00:00', 120000), "
+                "(4, 'VCB', '2026-10-16 09:30:00', 90000)"
+            )
+        )
+        conn.execute(sa.text("INSERT INTO insider_alerts VALUES (1, 2), (2, 3), (3, 4), (4, NULL)"))
+
+        with Operations.context(MigrationContext.configure(conn)):
+            module.upgrade()
+
+        trades = conn.execute(sa.text("SELECT id FROM block_trades ORDER BY id")).scalars().all()
+        alerts = conn.execute(
+            sa.text("SELECT id, block_trade_id FROM insider_alerts ORDER BY id")
+        ).all()
+
+    assert trades == [1, 3]
+    assert [tuple(row) for row in alerts] == [(1, 1), (2, 3), (3, 1), (4, None)]
@@ -1,6 +1,21 @@
+import asyncio
+
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from vnibb.core import instrumentation
+from vnibb.core.config import settings
+from vnibb.core.instrumentation import (
+    PROMETHEUS_BUCKETS,
+    LatencyHistogram,
+    SpanRecorder,
+    TimelineStore,
+    record_span,
+    span,
+    traced,
+)
 from vnibb.middleware import metrics as metrics_module
 from vnibb.middleware.metrics import MetricsMiddleware, ProcessMetrics
 
@@ -97,3 +112,121 @@ async def test_metrics_endpoint_reports_template_route_and_timing(client) -> Non
         'vnibb_http_requests_total{method="GET",route="/live",status="200"} '
         in metrics_response.text
     )
+
+
+def test_latency_histogram_quantiles_track_the_tail() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(990):
+        histogram.record(0.010)
+    for _ in range(10):
+        histogram.record(1.5)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.010, rel=0.07)
+    assert histogram.quantile(0.99) == pytest.approx(0.010, rel=0.07)
+    assert histogram.quantile(0.999) == pytest.approx(1.5, rel=0.07)
+    assert histogram.buckets[PROMETHEUS_BUCKETS.index(0.01)] == 990
+    assert histogram.buckets[-1] == 1000
+
+
+def test_process_metrics_render_route_quantiles_and_spans(monkeypatch) -> None:
+    recorder = SpanRecorder()
+    monkeypatch.setattr(metrics_module, "span_recorder", recorder)
+    registry = ProcessMetrics()
+    registry.request_finished("GET", "/api/v1/quant/{symbol}", 200, 0.3)
+    recorder.observe("db.query", 0.002)
+
+    output = registry.render()
+
+    assert (
+        'vnibb_http_request_latency_seconds{method="GET",route="/api/v1/quant/{symbol}",'
+        'quantile="0.99"} 0.3' in output
+    )
+    assert 'vnibb_span_duration_seconds_bucket{span="db.query",le="0.005"} 1' in output
+    assert 'vnibb_span_latency_seconds_count{span="db.query"} 1' in output
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_keeps_slow_request_timelines(monkeypatch) -> None:
+    store = TimelineStore()
+    monkeypatch.setattr(instrumentation, "timeline_store", store)
+    monkeypatch.setattr(metrics_module, "metrics_registry", ProcessMetrics())
+    monkeypatch.setattr(settings, "request_timeline_prefixes", ["/api/v1/quant"])
+    monkeypatch.setattr(settings, "request_timeline_slow_ms", 0.0)
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @traced("quant.load_price_frame")
+    async def load_frame():
+        await asyncio.sleep(0)
+
+    @app.get("/api/v1/quant/{symbol}")
+    async def quant(symbol: str):
+        await load_frame()
+        with span("compute.volatility"):
+            record_span("db.query", 0.0)
+        return {"symbol": symbol}
+
+    @app.get("/other")
+    async def other():
+        with span("compute.other"):
+            return {}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/api/v1/quant/VNM")
+        await client.get("/other")
+
+    [timeline] = store.recent()
+    assert timeline["route"] == "/api/v1/quant/{symbol}"
+    assert timeline["status_code"] == 200
+    assert [item["name"] for item in timeline["spans"]] == [
+        "quant.load_price_frame",
+        "compute.volatility",
+        "db.query",
+    ]
+    assert timeline["spans"][2]["depth"] == 1
+    assert set(timeline["span_totals"]) == {
+        "quant.load_price_frame",
+        "compute.volatility",
+        "db.query",
+    }
+
+
+@pytest.mark.asyncio
+async def test_metrics_timelines_endpoint_filters_by_route(client, monkeypatch) -> None:
+    store = TimelineStore()
+    monkeypatch.setattr("vnibb.api.main.timeline_store", store)
+    for path, duration in (("/api/v1/quant/{symbol}", 2.0), ("/api/v1/market/movers", 0.1)):
+        timeline, token = instrumentation.start_timeline("GET", path)
+        instrumentation.finish_timeline(
+            timeline,
+            token,
+            route=path,
+            status_code=200,
+            duration_seconds=duration,
+            slow_ms=float("inf"),
+            sample_rate=0.0,
+        )
+        store.keep(timeline)
+
+    response = await client.get("/metrics/timelines", params={"route": "quant", "min_ms": 500})
+
+    assert response.status_code == 200
+    [timeline] = response.json()["timelines"]
+    assert timeline["route"] == "/api/v1/quant/{symbol}"
+    assert timeline["duration_ms"] == 2000.0
+
+
+def test_instrumented_engine_clears_start_times_of_failed_statements(monkeypatch) -> None:
+    recorder = SpanRecorder()
+    monkeypatch.setattr(instrumentation, "span_recorder", recorder)
+    engine = create_engine("sqlite://")
+    instrumentation.instrument_engine(engine)
+
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 1"))
+        assert not conn.info.get(instrumentation._DB_START_KEY)
+
+    assert recorder.snapshot()["db.query"].count == 2
+    engine.dispose()
@@ -261,8 +261,7 @@ async def test_get_news_flow_enriches_runtime_sentiment(monkeypatch):
             "company_keywords": ["vinamilk"],
         }
 
-    async def fake_analyze_batch(_articles, max_concurrent=5):
-        assert max_concurrent >= 1
+    async def fake_sentiment_read(_articles):
         return [
             {
                 "sentiment": "bullish",
@@ -279,8 +278,8 @@ async def test_get_news_flow_enriches_runtime_sentiment(monkeypatch):
     )
     monkeypatch.setattr("vnibb.services.news_service._load_symbol_context", fake_symbol_context)
     monkeypatch.setattr(
-        "vnibb.services.news_service.sentiment_analyzer.analyze_batch",
-        fake_analyze_batch,
+        "vnibb.services.news_service.sentiment_queue.read",
+        fake_sentiment_read,
     )
 
     response = await get_news_flow(symbols=["VNM"], limit=5)
@@ -320,7 +319,7 @@ async def test_get_company_news_rows_filters_irrelevant_provider_articles(monkey
             "company_keywords": ["vinamilk"],
         }
 
-    async def fake_analyze_batch(_articles, max_concurrent=5):
+    async def fake_sentiment_read(_articles):
         return [
             {
                 "sentiment": "bullish",
@@ -345,8 +344,8 @@ async def test_get_company_news_rows_filters_irrelevant_provider_articles(monkey
         fake_ranked_rows,
     )
     monkeypatch.setattr(
-        "vnibb.services.news_service.sentiment_analyzer.analyze_batch",
-        fake_analyze_batch,
+        "vnibb.services.news_service.sentiment_queue.read",
+        fake_sentiment_read,
     )
 
     rows = await get_company_news_rows("VNM", limit=5)
@@ -400,8 +399,7 @@ async def test_get_company_news_rows_merges_provider_and_ranked_related_results(
             False,
         )
 
-    async def fake_analyze_batch(articles, max_concurrent=5):
-        _ = max_concurrent
+    async def fake_sentiment_read(articles):
         return [
             {
                 "sentiment": "bullish",
@@ -420,8 +418,8 @@ async def test_get_company_news_rows_merges_provider_and_ranked_related_results(
     monkeypatch.setattr("vnibb.services.news_service._load_symbol_context", fake_symbol_context)
     monkeypatch.setattr("vnibb.services.news_service.get_ranked_news_rows", fake_ranked_rows)
     monkeypatch.setattr(
-        "vnibb.services.news_service.sentiment_analyzer.analyze_batch",
-        fake_analyze_batch,
+        "vnibb.services.news_service.sentiment_queue.read",
+        fake_sentiment_read,
     )
 
     rows = await get_company_news_rows("VCI", limit=5)
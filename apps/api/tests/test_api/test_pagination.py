@@ -0,0 +1,216 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from vnibb.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    seek_after,
+)
+from vnibb.models.alerts import BlockTrade
+from vnibb.models.market_news import MarketNews
+from vnibb.models.news import InsiderDeal
+from vnibb.providers.vnstock.equity_screener import ScreenerData
+
+START = datetime(2026, 10, 1, 9, 15)
+
+
+def test_cursor_round_trips_typed_keys_and_rejects_foreign_tokens():
+    key = (datetime(2026, 10, 1, 9, 15, 30), date(2026, 9, 30), 12.5, 7, "VNM")
+    token = encode_cursor("insider.deals", key)
+
+    assert decode_cursor(token, "insider.deals") == key
+    assert decode_cursor(None, "insider.deals") is None
+    for bad in (token + "x", "not-a-cursor", encode_cursor("news.feed", key)):
+        with pytest.raises(HTTPException) as error:
+            decode_cursor(bad, "insider.deals")
+        assert error.value.status_code == 400
+
+
+def test_seek_after_resumes_after_anchor_and_ends_on_missing_anchor():
+    rows = ["AAA", "BBB", "CCC", "DDD"]
+
+    assert seek_after(rows, str, None) == rows
+    assert seek_after(rows, str, "BBB") == ["CCC", "DDD"]
+    assert seek_after(rows, str, "ZZZ") == []
+
+
+@pytest.mark.asyncio
+async def test_screener_cursor_walks_sorted_rows_with_projection(client, monkeypatch):
+    async def fake_screener_fetch(_params):
+        return [
+            ScreenerData(symbol=symbol, exchange="HOSE", price=price, market_cap=price * 1e9)
+            for symbol, price in (("AAA", 10.0), ("BBB", 40.0), ("CCC", 30.0), ("DDD", 20.0))
+        ]
+
+    monkeypatch.setattr(
+        "vnibb.api.v1.screener.VnstockScreenerFetcher.fetch", fake_screener_fetch
+    )
+
+    symbols, cursor = [], None
+    while True:
+        params = {"limit": 3, "use_cache": "false", "sort_by": "price", "fields": "symbol,price"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/screener", params=params)
+        payload = response.json()
+        assert all(set(row) == {"symbol", "price"} for row in payload["data"])
+        assert "next_cursor" not in payload["meta"]
+        symbols += [row["symbol"] for row in payload["data"]]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    assert symbols == ["BBB", "CCC", "DDD", "AAA"]
+
+
+async def _walk(client, path, params):
+    pages, cursor = [], None
+    while True:
+        page_params = {**params, "cursor": cursor} if cursor else params
+        response = await client.get(path, params=page_params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+async def test_block_trades_keyset_pages_cover_ties_without_overlap(client, test_db):
+    # Pairs of trades share a trade_time so the id tiebreaker is exercised.
+    test_db.add_all(
+        BlockTrade(
+            symbol="VCI" if index % 2 else "HPG",
+            quantity=100_000 + index,
+            price=30_000.0 + index,
+            value=3e9 + index,
+            trade_time=START + timedelta(minutes=index // 2),
+        )
+        for index in range(7)
+    )
+    await test_db.commit()
+
+    full = (await client.get("/api/v1/insider/block-trades", params={"limit": 50})).json()
+    pages = await _walk(client, "/api/v1/insider/block-trades", {"limit": 2})
+
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert [row["id"] for page in pages for row in page] == [row["id"] for row in full]
+
+    narrow = await client.get(
+        "/api/v1/insider/block-trades", params={"limit": 2, "fields": "symbol,value"}
+    )
+    assert narrow.json() == [{"symbol": row["symbol"], "value": row["value"]} for row in full[:2]]
+    assert NEXT_CURSOR_HEADER in narrow.headers
+
+
+@pytest.mark.asyncio
+async def test_insider_deals_projection_and_bad_requests(client, test_db):
+    test_db.add_all(
+        InsiderDeal(
+            id=index + 1,
+            symbol="VNM",
+            announce_date=date(2026, 9, 1) + timedelta(days=index // 2),
+            deal_action="BUY",
+            deal_quantity=1_000.0 * (index + 1),
+            insider_name=f"Insider {index}",
+            raw_data={"blob": "x" * 200},
+        )
+        for index in range(5)
+    )
+    await test_db.commit()
+
+    pages = await _walk(
+        client, "/api/v1/insider/VNM/deals", {"limit": 2, "fields": "insider_name"}
+    )
+
+    assert [row for page in pages for row in page] == [
+        {"insider_name": f"Insider {index}"} for index in (4, 3, 2, 1, 0)
+    ]
+
+    unknown = await client.get("/api/v1/insider/recent", params={"fields": "raw_data"})
+    assert unknown.status_code == 400
+    foreign = await client.get(
+        "/api/v1/insider/recent", params={"cursor": encode_cursor("news.feed", (1, 2))}
+    )
+    assert foreign.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_news_feed_cursor_and_fields_push_down_to_sql(
+    client, test_engine, test_db, monkeypatch
+):
+    test_db.add_all(
+        MarketNews(
+            title=f"Headline {index}",
+            content="body " * 500,
+            source="cafef",
+            url=f"https://example.com/{index}",
+            published_date=START - timedelta(hours=index // 2),
+            sentiment="neutral",
+            sentiment_score=0.6,
+        )
+        for index in range(5)
+    )
+    await test_db.commit()
+    monkeypatch.setattr(
+        "vnibb.services.news_crawler.async_session_maker",
+        async_sessionmaker(test_engine, expire_on_commit=False),
+    )
+
+    titles, cursor = [], None
+    while True:
+        params = {"limit": 2, "fields": "title,published_date"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/news/feed", params=params)
+        payload = response.json()
+        assert all(set(article) == {"title", "published_date"} for article in payload["articles"])
+        titles += [article["title"] for article in payload["articles"]]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    full = (await client.get("/api/v1/news/feed", params={"limit": 10})).json()
+    assert titles == [article["title"] for article in full["articles"]]
+    assert len(titles) == 5
+    assert full["articles"][0]["content"].startswith("body")
+    assert "next_cursor" not in full
+
+
+@pytest.mark.asyncio
+async def test_news_feed_pages_through_undated_articles_last(
+    client, test_engine, test_db, monkeypatch
+):
+    test_db.add_all(
+        MarketNews(
+            title=f"Headline {index}",
+            source="cafef",
+            url=f"https://example.com/{index}",
+            published_date=None if index % 2 else START - timedelta(hours=index),
+        )
+        for index in range(7)
+    )
+    await test_db.commit()
+    monkeypatch.setattr(
+        "vnibb.services.news_crawler.async_session_maker",
+        async_sessionmaker(test_engine, expire_on_commit=False),
+    )
+
+    pages = await _walk(client, "/api/v1/news/feed", {"limit": 2, "fields": "title"})
+    titles = [article["title"] for page in pages for article in page["articles"]]
+
+    # Dated articles newest first, then undated ones newest id first.
+    assert titles == [f"Headline {index}" for index in (0, 2, 4, 6, 5, 3, 1)]
+
+
+@pytest.mark.asyncio
+async def test_offset_is_rejected_alongside_a_cursor(client):
+    cursor = encode_cursor("news.feed", (START, 1))
+
+    for path in ("/api/v1/news/feed", "/api/v1/news/flow"):
+        response = await client.get(path, params={"cursor": cursor, "offset": 20})
+        assert response.status_code == 400
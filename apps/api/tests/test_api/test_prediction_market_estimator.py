@@ -4,12 +4,11 @@ import asyncio
 import pytest
 
 from vnibb.services.prediction_market_estimator import (
-    _extract_threshold,
-    _infer_fomc_label,
     _infer_terminal_rate,
     _weighted_percentile,
     category_taxonomy,
 )
+from vnibb.services.prediction_market_features import extract_threshold, infer_fomc_label
 from vnibb.services.prediction_market_service import category_taxonomy as pm_category_taxonomy
 
 
@@ -47,7 +46,7 @@ def test_pm_and_estimator_taxonomy_agree():
     ],
 )
 def test_extract_threshold(question: str, expected: float | None):
-    assert _extract_threshold(question) == expected
+    assert extract_threshold(question) == expected
 
 
 def test_weighted_percentile_interpolation():
@@ -73,5 +72,5 @@ def test_infer_fomc_label_parses_month_and_year():
         description = None
         end_date = None
 
-    label = _infer_fomc_label(_M())  # type: ignore[arg-type]
+    label = infer_fomc_label(_M())  # type: ignore[arg-type]
     assert label == "2026-07-15"
@@ -0,0 +1,214 @@
+"""Ingest-time feature parsing, incremental estimators and diff-only snapshots."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from vnibb.core.cache import estimation_cache
+from vnibb.models.prediction_market import PredictionMarket
+from vnibb.models.prediction_market_snapshot import PredictionMarketSnapshot
+from vnibb.services.prediction_market_estimator import (
+    estimate_cpi,
+    estimate_fed,
+    estimate_macro_composite,
+    estimate_recession,
+)
+from vnibb.services.prediction_market_estimator_state import (
+    ESTIMATE_CACHE_KEYS,
+    EstimatorState,
+    estimator_state,
+)
+from vnibb.services.prediction_market_features import FEATURES_VERSION
+from vnibb.services.prediction_market_service import (
+    NormalizedPredictionMarket,
+    upsert_prediction_market,
+)
+from vnibb.services.prediction_market_snapshot_service import (
+    snapshot_active_prediction_markets,
+)
+
+
+def _market(source_id: str, question: str, yes: float, liquidity: float = 10_000.0):
+    return NormalizedPredictionMarket(
+        source="polymarket",
+        source_id=source_id,
+        question=question,
+        slug=None,
+        description=None,
+        category="economic",
+        url=None,
+        end_date=datetime(2026, 12, 31, tzinfo=UTC),
+        active=True,
+        closed=False,
+        volume=1_000.0,
+        liquidity=liquidity,
+        outcomes=("Yes", "No"),
+        outcome_prices=(yes, round(1 - yes, 4)),
+    )
+
+
+MARKETS = (
+    _market("cpi-3", "Will Core CPI YoY be above 3.0% in December?", 0.40),
+    _market("cpi-2", "Will headline CPI come in below 2.5%?", 0.70),
+    _market("fed-jul", "Will the Fed cut rates in July 2026?", 0.60),
+    _market("fed-jul-hold", "Fed holds rates at the July 2026 FOMC?", 0.30),
+    _market("rec-2027", "US recession in 2027?", 0.25, liquidity=50_000.0),
+    _market("rec-2026", "Global recession in 2026?", 0.15),
+    _market("sports", "Will the Lakers win the NBA title?", 0.20),
+)
+
+
+def _stable(payload: dict) -> dict:
+    if isinstance(payload, dict):
+        return {
+            key: _stable(value)
+            for key, value in payload.items()
+            if key not in {"last_updated", "date"}
+        }
+    return payload
+
+
+async def _all_estimates(db) -> dict:
+    return _stable(
+        {
+            "cpi": await estimate_cpi(db),
+            "fed": await estimate_fed(db),
+            "recession": await estimate_recession(db),
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_estimator_state():
+    def clear():
+        estimator_state.reset()
+        for key in ESTIMATE_CACHE_KEYS:
+            estimation_cache.invalidate(key)
+
+    clear()
+    yield
+    clear()
+
+
+async def _ingest(db, markets) -> None:
+    for market in markets:
+        await upsert_prediction_market(db, market.to_values(), "sqlite")
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_ingest_stores_parsed_features(test_db):
+    await _ingest(test_db, MARKETS)
+
+    rows = {
+        row.source_id: row
+        for row in (await test_db.execute(select(PredictionMarket))).scalars().all()
+    }
+
+    assert rows["cpi-3"].features["cpi_threshold"] == 3.0
+    assert rows["cpi-3"].estimator_buckets == "cpi"
+    assert rows["fed-jul"].features["fomc_label"] == "2026-07-15"
+    assert rows["fed-jul"].features["fed_direction"] == "cut"
+    assert rows["rec-2027"].features["recession_year"] == 2027
+    assert rows["sports"].estimator_buckets is None
+    assert "sports" in rows["sports"].features["topics"]
+    assert {row.features_version for row in rows.values()} == {FEATURES_VERSION}
+
+
+@pytest.mark.asyncio
+async def test_estimators_follow_ingested_price_changes_without_reloading(test_db):
+    await _ingest(test_db, MARKETS)
+    before = await _all_estimates(test_db)
+    loaded_at = estimator_state.loaded_at
+
+    assert before["cpi"]["n_markets"] == 2
+    assert before["fed"]["meetings"][0]["p_cut"] == pytest.approx(0.6 / 0.9, abs=1e-4)
+    assert before["recession"]["year"] == 2027
+    assert before["recession"]["p_recession"] == pytest.approx(0.2)
+
+    # Prices move, one contract closes: the committed upsert patches the state.
+    await _ingest(
+        test_db,
+        [
+            _market("fed-jul", "Will the Fed cut rates in July 2026?", 0.90),
+            _market("rec-2027", "US recession in 2027?", 0.45, liquidity=50_000.0),
+            replace(_market("rec-2026", "Global recession in 2026?", 0.15), active=False),
+        ],
+    )
+    after = await _all_estimates(test_db)
+
+    assert estimator_state.loaded_at == loaded_at
+    assert after["fed"]["meetings"][0]["p_cut"] == pytest.approx(0.9 / 1.2, abs=1e-4)
+    assert after["recession"]["n_markets"] == 1
+    assert after["recession"]["p_recession"] == pytest.approx(0.45)
+    assert after["recession"]["variance"] == pytest.approx(0.0)
+
+    # The incrementally maintained state matches a cold load of the same rows.
+    cold = EstimatorState()
+    await cold.ensure_loaded(test_db)
+    assert cold.contributions == estimator_state.contributions
+    assert cold.fed_buckets == pytest.approx(estimator_state.fed_buckets)
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_upserts_do_not_touch_the_state(test_db):
+    await _ingest(test_db, MARKETS)
+    before = await _all_estimates(test_db)
+
+    await upsert_prediction_market(
+        test_db,
+        _market("cpi-3", "Will Core CPI YoY be above 3.0% in December?", 0.99).to_values(),
+        "sqlite",
+    )
+    await test_db.rollback()
+
+    assert await _all_estimates(test_db) == before
+
+
+@pytest.mark.asyncio
+async def test_rows_without_stored_features_are_parsed_on_load(test_db):
+    await _ingest(test_db, MARKETS)
+    await test_db.execute(
+        update(PredictionMarket).values(features={}, features_version=None, estimator_buckets=None)
+    )
+    await test_db.commit()
+
+    payload = await estimate_macro_composite(test_db)
+
+    assert payload["cpi"]["n_markets"] == 2
+    assert payload["recession"]["year"] == 2027
+    assert len(payload["fed"]["meetings"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_writes_only_markets_that_moved(test_db):
+    await _ingest(test_db, MARKETS)
+
+    assert await snapshot_active_prediction_markets(test_db) == len(MARKETS)
+    assert await snapshot_active_prediction_markets(test_db) == 0
+
+    await _ingest(
+        test_db,
+        [
+            _market("cpi-3", "Will Core CPI YoY be above 3.0% in December?", 0.4004),
+            _market("fed-jul", "Will the Fed cut rates in July 2026?", 0.65),
+            _market("sports", "Will the Lakers win the NBA title?", 0.20, liquidity=20_000.0),
+        ],
+    )
+    assert await snapshot_active_prediction_markets(test_db) == 2
+
+    # A quiet market still gets a keyframe once its latest row ages out.
+    await test_db.execute(
+        update(PredictionMarketSnapshot)
+        .where(PredictionMarketSnapshot.source_id == "rec-2026")
+        .values(captured_at=datetime.now(UTC) - timedelta(days=8))
+    )
+    await test_db.commit()
+    assert await snapshot_active_prediction_markets(test_db) == 1
+
+    total = await test_db.scalar(select(func.count()).select_from(PredictionMarketSnapshot))
+    assert total == len(MARKETS) + 3
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.orm import Session
 
 from vnibb.services.prediction_market_seed import (
     seed_limitless_from_fixture,
@@ -24,6 +25,9 @@ class _FakeSession:
         self.execute = AsyncMock()
         self.commit = AsyncMock()
         self._dialect_name = "sqlite"
+        # Upserts stage estimator updates on the session until it commits.
+        self.sync_session = Session()
+        self.info = self.sync_session.info
 
     def get_bind(self):
         bind = MagicMock()
@@ -123,9 +127,9 @@ def test_populate_constants_sane():
 @pytest.mark.asyncio
 async def test_seed_predictit_from_fixture_writes_rows(monkeypatch):
     """The seed helper actually invokes the upsert SQL the same number of times as markets in the fixture."""
-    upsert_mock = MagicMock()
+    upsert_mock = AsyncMock()
     monkeypatch.setattr(
-        "vnibb.services.prediction_market_seed._upsert_prediction_market",
+        "vnibb.services.prediction_market_seed.upsert_prediction_market",
         upsert_mock,
     )
     session = _FakeSession()
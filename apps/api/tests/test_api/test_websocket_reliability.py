@@ -3,13 +3,18 @@ import json
 
 import pytest
 from fastapi import WebSocketDisconnect
+from jose import jwt
 from vnibb.api.v1 import websocket as websocket_api
+from vnibb.core.config import settings
 from vnibb.services.websocket_service import ConnectionManager, PriceUpdate
 
 
 class FakeWebSocket:
-    def __init__(self, messages=(), fail_send=False, block_send=False):
-        self.headers = {}
+    def __init__(
+        self, messages=(), fail_send=False, block_send=False, query_params=None, headers=None
+    ):
+        self.headers = headers or {}
+        self.query_params = query_params or {}
         self.messages = iter(messages)
         self.sent = []
         self.fail_send = fail_send
@@ -216,3 +221,68 @@ async def test_websocket_endpoint_reraises_cancellation(monkeypatch):
     websocket.receive_text = cancelled_receive
     with pytest.raises(asyncio.CancelledError):
         await websocket_api.websocket_prices(websocket)
+
+
+def _token(user_id, secret="test-supabase-secret"):
+    return jwt.encode({"sub": user_id, "role": "authenticated"}, secret, algorithm="HS256")
+
+
+@pytest.mark.asyncio
+async def test_rule_alerts_reach_only_the_authenticated_owners_connections(monkeypatch):
+    monkeypatch.setattr(settings, "supabase_jwt_secret", "test-supabase-secret")
+    monkeypatch.setattr(settings, "appwrite_endpoint", None)
+    manager = ConnectionManager()
+    monkeypatch.setattr(websocket_api, "manager", manager)
+    owner = FakeWebSocket(query_params={"token": _token("user-7")})
+    header_owner = FakeWebSocket(headers={"authorization": f"Bearer {_token('user-7')}"})
+    other = FakeWebSocket(query_params={"token": _token("user-8")})
+    claimed = FakeWebSocket(query_params={"user_id": "user-7"})
+    for websocket in (owner, header_owner, other, claimed):
+        assert await manager.connect(websocket, await websocket_api._alert_user_id(websocket))
+
+    alert = {"type": "rule_alert", "user_id": "user-7", "note": "private"}
+    await manager.send_user_alert("user-7", alert)
+
+    assert owner.sent == [alert] and header_owner.sent == [alert]
+    assert other.sent == [] and claimed.sent == []
+    assert claimed not in manager.connection_users
+    manager.disconnect(owner)
+    assert owner not in manager.connection_users
+
+
+@pytest.mark.asyncio
+async def test_invalid_websocket_credentials_close_the_connection(monkeypatch):
+    monkeypatch.setattr(settings, "supabase_jwt_secret", "test-supabase-secret")
+    monkeypatch.setattr(settings, "appwrite_endpoint", None)
+    manager = ConnectionManager()
+    monkeypatch.setattr(websocket_api, "manager", manager)
+    forged = FakeWebSocket(query_params={"token": _token("user-7", secret="not-the-secret")})
+
+    await websocket_api.websocket_prices(forged)
+
+    assert forged.closed_code == 1008
+    assert forged.sent == [] and manager.active_connections == {}
+
+
+@pytest.mark.asyncio
+async def test_rule_engine_failure_does_not_stop_the_price_cycle(monkeypatch, caplog):
+    broadcast = []
+
+    async def fake_fetch(params):
+        return [type("Row", (), {"price": 61_000.0, "volume": 10})()]
+
+    async def fake_broadcast(symbol, update, _timeout):
+        broadcast.append(symbol)
+
+    async def failing_process_tick(_tick):
+        raise RuntimeError("rule tables unavailable")
+
+    monkeypatch.setattr(websocket_api.VnstockScreenerFetcher, "fetch", fake_fetch)
+    monkeypatch.setattr(websocket_api.manager, "broadcast_price", fake_broadcast)
+    monkeypatch.setattr(websocket_api.alert_rule_engine, "process_tick", failing_process_tick)
+
+    with caplog.at_level("WARNING", logger=websocket_api.logger.name):
+        await websocket_api._run_price_cycle({"VNM", "FPT"}, True)
+
+    assert sorted(broadcast) == ["FPT", "VNM"]
+    assert "Alert rule evaluation failed" in caplog.text
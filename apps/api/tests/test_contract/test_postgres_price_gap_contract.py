@@ -0,0 +1,61 @@
+import os
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from vnibb.models.stock import Stock, StockPrice
+from vnibb.services.price_gap_planner import PriceGapPlanner
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("POSTGRES_CONTRACT") != "1",
+    reason="requires the PostgreSQL release-contract database",
+)
+
+SYMBOLS = ("ZZGAPA", "ZZGAPB")
+HOLIDAY = date(2026, 3, 4)
+
+
+@pytest.mark.postgres_contract
+@pytest.mark.asyncio
+async def test_postgres_gap_sql_matches_the_portable_planner(test_db):
+    assert test_db.bind.dialect.name == "postgresql"
+    stored_days = {
+        "ZZGAPA": [date(2026, 3, day) for day in (2, 3, 6, 9, 12, 13)],
+        "ZZGAPB": [date(2026, 3, 2) + timedelta(days=offset) for offset in range(12)],
+    }
+    try:
+        for symbol in SYMBOLS:
+            stock = Stock(symbol=symbol, exchange="HOSE")
+            test_db.add(stock)
+            await test_db.flush()
+            test_db.add_all(
+                StockPrice(
+                    stock_id=stock.id,
+                    symbol=symbol,
+                    time=day,
+                    open=1.0,
+                    high=1.0,
+                    low=1.0,
+                    close=1.0,
+                    volume=1,
+                    interval="1D",
+                )
+                for day in stored_days[symbol]
+            )
+        await test_db.commit()
+
+        planner = PriceGapPlanner()
+        via_sql = await planner.load_gaps_postgres(test_db, list(SYMBOLS), {HOLIDAY})
+        portable = await planner.load_gaps_portable(test_db, list(SYMBOLS), {HOLIDAY})
+
+        assert via_sql[0] == portable[0]
+        assert {symbol: sorted(days) for symbol, days in via_sql[1].items() if days} == {
+            symbol: days for symbol, days in portable[1].items() if days
+        }
+        assert portable[1]["ZZGAPA"] == [date(2026, 3, 5), date(2026, 3, 10), date(2026, 3, 11)]
+    finally:
+        await test_db.rollback()
+        await test_db.execute(delete(StockPrice).where(StockPrice.symbol.in_(SYMBOLS)))
+        await test_db.execute(delete(Stock).where(Stock.symbol.in_(SYMBOLS)))
+        await test_db.commit()
@@ -14,13 +14,18 @@ from __future__ import annotations
 
 import ast
 import asyncio
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
 from vnibb.core import cache
 from vnibb.core.cache import RedisClient, cached, resolve_cache_ttl
-from vnibb.core.cache_constants import REDIS_CACHE_TTLS
+from vnibb.core.cache_constants import (
+    REDIS_CACHE_TTLS,
+    REDIS_TTL_DATASET_VERSIONED,
+    REDIS_TTL_HISTORICAL_VOLATILE,
+)
 from vnibb.core.config import settings
 
 API_V1_DIR = Path(__file__).resolve().parents[2] / "vnibb" / "api" / "v1"
@@ -36,6 +41,9 @@ class TestResolveCacheTtl:
     def test_unknown_prefix_falls_back_to_settings_default(self):
         assert resolve_cache_ttl(None, "not_a_real_prefix") == settings.redis_cache_ttl
 
+    def test_dataset_versioned_prefix_uses_ceiling_ttl(self):
+        assert resolve_cache_ttl(None, "historical_v3") == REDIS_TTL_DATASET_VERSIONED
+
 
 def _iter_cached_decorators():
     """Yield (file, lineno, ttl_value, key_prefix) for every @cached(...) call."""
@@ -168,6 +176,40 @@ async def test_cached_error_result_is_not_cached(monkeypatch):
     assert calls == 2
 
 
+@pytest.mark.asyncio
+async def test_cached_ttl_for_overrides_the_entry_ttl(monkeypatch):
+    monkeypatch.setattr(cache.settings, "environment", "development")
+    monkeypatch.setattr(cache, "_redis_cache_enabled", lambda: False)
+    cache._memory_cache.clear()
+
+    @cached(
+        key_prefix="historical_v3",
+        ttl_for=lambda kwargs, result: 300 if kwargs["interval"] == "5m" else None,
+    )
+    async def load(symbol, *, interval):
+        return {"symbol": symbol, "interval": interval}
+
+    before = datetime.now()
+    await load("VNM", interval="5m")
+    await load("VNM", interval="1D")
+    expiries = sorted(expiry for _, expiry in cache._memory_cache.values())
+
+    assert expiries[0] - before < timedelta(seconds=301)
+    assert expiries[1] - before >= timedelta(seconds=REDIS_TTL_DATASET_VERSIONED)
+
+
+def test_historical_cache_ttl_is_short_for_intraday_and_fallback_responses():
+    from vnibb.api.v1.equity import _historical_cache_ttl
+    from vnibb.api.v1.schemas import MetaData, StandardResponse
+
+    def response(fallback_used):
+        return StandardResponse(data=[], meta=MetaData(count=0, fallback_used=fallback_used))
+
+    assert _historical_cache_ttl({"interval": "15m"}, response(False)) == REDIS_TTL_HISTORICAL_VOLATILE
+    assert _historical_cache_ttl({"interval": "1D"}, response(True)) == REDIS_TTL_HISTORICAL_VOLATILE
+    assert _historical_cache_ttl({"interval": "1D"}, response(False)) is None
+
+
 @pytest.mark.asyncio
 async def test_flush_prefix_deletes_scan_batches(monkeypatch):
     class Client:
@@ -221,3 +263,50 @@ class TestCachedSiteConsistency:
         # Guards against the AST walker silently matching nothing (e.g. after a
         # refactor renames the decorator) and giving false confidence.
         assert any(kp is not None for _, _, _, kp in _iter_cached_decorators())
+
+
+def _encoded_cache_app(calls):
+    from fastapi import FastAPI, Query
+    from pydantic import BaseModel
+
+    class Quote(BaseModel):
+        symbol: str
+        price: float
+        note: str | None = None
+
+    app = FastAPI()
+
+    @app.get("/quote/{symbol}", response_model=Quote, response_model_exclude_none=True)
+    @cached(key_prefix="quote")
+    async def get_quote(symbol: str, scale: float = Query(default=1.0)) -> Quote:
+        calls.append(symbol)
+        return Quote(symbol=symbol, price=25_000.5 * scale)
+
+    return app, get_quote
+
+
+@pytest.mark.asyncio
+async def test_cached_route_serves_encoded_bytes_with_etag(monkeypatch):
+    from httpx import ASGITransport, AsyncClient
+
+    monkeypatch.setattr(cache.settings, "environment", "development")
+    monkeypatch.setattr(cache, "_redis_cache_enabled", lambda: False)
+    cache._memory_cache.clear()
+    calls = []
+    app, get_quote = _encoded_cache_app(calls)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+        miss = await client.get("/quote/VNM", params={"scale": 2})
+        hit = await client.get("/quote/VNM", params={"scale": 2})
+
+    assert calls == ["VNM"]
+    assert miss.content == hit.content
+    assert hit.json() == {"symbol": "VNM", "price": 50_001.0}
+    assert hit.headers["etag"] == miss.headers["etag"]
+    assert hit.headers["content-type"] == "application/json"
+    assert any(isinstance(data, bytes) for data, _ in cache._memory_cache.values())
+
+    # Direct Python callers keep the decoded object under their own key.
+    direct = await get_quote("VNM", scale=2)
+    assert direct.price == 50_001.0
+    assert calls == ["VNM", "VNM"]
@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from vnibb.core import cache
+from vnibb.core import dataset_versions as registry_module
+from vnibb.core.cache import cached
+from vnibb.core.dataset_versions import (
+    DATASET_COMPANY,
+    DATASET_PRICES,
+    bumps_datasets,
+    dataset_versions,
+)
+
+
+@pytest.fixture
+def registry(test_engine, monkeypatch):
+    sessions = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(registry_module, "async_session_maker", sessions)
+    monkeypatch.setattr(cache, "_redis_cache_enabled", lambda: False)
+    dataset_versions.clear_local()
+    yield dataset_versions
+    dataset_versions.clear_local()
+
+
+@pytest.mark.asyncio
+async def test_bump_increments_persisted_versions(registry):
+    assert await registry.get_many([DATASET_PRICES]) == {DATASET_PRICES: 0}
+
+    assert await registry.bump(DATASET_PRICES) == {DATASET_PRICES: 1}
+    assert await registry.bump(DATASET_PRICES, DATASET_COMPANY) == {
+        DATASET_PRICES: 2,
+        DATASET_COMPANY: 1,
+    }
+
+    # A fresh worker (empty memo) reads the same versions from the table.
+    registry.clear_local()
+    assert await registry.get_many([DATASET_PRICES, DATASET_COMPANY]) == {
+        DATASET_PRICES: 2,
+        DATASET_COMPANY: 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_versioned_cache_entry_lives_until_its_dataset_is_bumped(registry, monkeypatch):
+    monkeypatch.setattr(cache.settings, "environment", "development")
+    monkeypatch.setattr(cache, "_redis_cache_enabled", lambda: False)
+    cache._memory_cache.clear()
+    calls = 0
+
+    @cached(key_prefix="historical_v3")
+    async def load(symbol):
+        nonlocal calls
+        calls += 1
+        return {"symbol": symbol, "calls": calls}
+
+    assert await load("VNM") == {"symbol": "VNM", "calls": 1}
+    assert await load("VNM") == {"symbol": "VNM", "calls": 1}
+
+    await registry.bump(DATASET_PRICES)
+    assert await load("VNM") == {"symbol": "VNM", "calls": 2}
+    assert await load("VNM") == {"symbol": "VNM", "calls": 2}
+    cache._memory_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_bumps_datasets_skips_syncs_that_wrote_nothing(registry):
+    @bumps_datasets(DATASET_PRICES)
+    async def sync(count):
+        return count
+
+    await sync(0)
+    assert await registry.get_many([DATASET_PRICES]) == {DATASET_PRICES: 0}
+    await sync(12)
+    assert await registry.get_many([DATASET_PRICES]) == {DATASET_PRICES: 1}
+
+
+@pytest.mark.asyncio
+async def test_stale_reader_never_lowers_the_redis_version(registry, monkeypatch):
+    await registry.bump(DATASET_PRICES)
+
+    class Redis:
+        # Another worker's bump landed between this reader's MGET and its DB read.
+        stored = {registry._redis_key(DATASET_PRICES): 2}
+
+        async def get_multiple(self, keys):
+            return dict.fromkeys(keys)
+
+        async def set_max(self, key, value, ttl=None):
+            self.stored[key] = max(self.stored.get(key, value), value)
+            return self.stored[key]
+
+    redis = Redis()
+    monkeypatch.setattr(registry_module, "redis_client", redis)
+    monkeypatch.setattr(registry_module, "redis_cache_available", lambda: True)
+    registry.clear_local()
+
+    assert await registry.get_many([DATASET_PRICES]) == {DATASET_PRICES: 2}
+    assert redis.stored == {registry._redis_key(DATASET_PRICES): 2}
@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+
+import pytest
+
+from vnibb.core import trading_calendar
+from vnibb.core.trading_calendar import TradingCalendar, get_trading_calendar
+
+HOLIDAY = date(2026, 9, 2)
+
+
+def _walk_sessions(start, end, holidays):
+    return [
+        start + timedelta(days=offset)
+        for offset in range((end - start).days + 1)
+        if (start + timedelta(days=offset)).weekday() < 5
+        and start + timedelta(days=offset) not in holidays
+    ]
+
+
+def test_sessions_match_a_day_by_day_walk():
+    calendar = TradingCalendar({HOLIDAY})
+    start, end = date(2026, 8, 1), date(2026, 10, 31)
+
+    assert calendar.sessions_between(start, end) == _walk_sessions(start, end, {HOLIDAY})
+    assert calendar.count_sessions(start, end) == len(_walk_sessions(start, end, {HOLIDAY}))
+    assert not calendar.is_session(HOLIDAY)
+    assert calendar.latest_session(date(2026, 9, 6)) == date(2026, 9, 4)
+    assert calendar.latest_session(HOLIDAY) == date(2026, 9, 1)
+
+
+@pytest.mark.parametrize("day", [date(1998, 3, 4), date(2026, 9, 3), date(2051, 5, 8)])
+def test_ordinals_round_trip_inside_and_outside_the_index(day):
+    calendar = TradingCalendar({HOLIDAY})
+    ordinal = calendar.session_ordinal(day)
+
+    assert calendar.session_date(ordinal) == day
+    assert calendar.session_date(ordinal + 1) > day
+    assert calendar.session_ordinal(day + timedelta(days=1)) - ordinal in (0, 1)
+
+
+def test_coverage_and_staleness_skip_weekends_and_holidays():
+    calendar = TradingCalendar({HOLIDAY})
+    observed = [date(2026, 8, 31), date(2026, 9, 1), date(2026, 9, 4)]
+
+    assert calendar.missing_sessions(observed, date(2026, 8, 29), date(2026, 9, 4)) == [
+        date(2026, 9, 3)
+    ]
+    assert not calendar.covers(observed, date(2026, 8, 29), date(2026, 9, 4))
+    assert calendar.covers(observed, date(2026, 8, 29), date(2026, 9, 1))
+    assert calendar.sessions_since(date(2026, 9, 1), date(2026, 9, 3)) == 1
+    assert calendar.sessions_since(date(2026, 9, 4), date(2026, 9, 1)) == 0
+    assert not calendar.has_session_between(date(2026, 9, 1), date(2026, 9, 3))
+    assert calendar.has_session_between(date(2026, 9, 3), date(2026, 9, 7)) is True
+
+
+def test_shared_calendar_follows_configured_holidays(monkeypatch):
+    monkeypatch.setattr(trading_calendar.settings, "market_holiday_dates", ["2026-09-02"])
+    assert get_trading_calendar() is get_trading_calendar({HOLIDAY})
+    assert not get_trading_calendar().is_session(HOLIDAY)
+
+    monkeypatch.setattr(trading_calendar.settings, "market_holiday_dates", [])
+    assert get_trading_calendar().is_session(HOLIDAY)
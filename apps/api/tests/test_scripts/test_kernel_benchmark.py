@@ -0,0 +1,90 @@
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).parents[2] / "scripts" / "kernel_benchmark.py"
+SPEC = importlib.util.spec_from_file_location("kernel_benchmark", MODULE_PATH)
+kernel_benchmark = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = kernel_benchmark
+SPEC.loader.exec_module(kernel_benchmark)
+
+BENCHMARKS_ENABLED = os.environ.get("VNIBB_KERNEL_BENCHMARKS") == "1"
+
+
+def test_synthetic_series_are_deterministic_and_well_formed() -> None:
+    first = kernel_benchmark.synthetic_ohlcv(500)
+    again = kernel_benchmark.synthetic_ohlcv(500)
+    frame_a, frame_b = kernel_benchmark.synthetic_pair(500)
+
+    assert first.equals(again)
+    assert len(first) == 500 and first["time"].is_monotonic_increasing
+    assert (first["low"] <= first[["open", "close"]].min(axis=1)).all()
+    assert (first["high"] >= first[["open", "close"]].max(axis=1)).all()
+    assert (first["close"] > 0).all()
+    assert frame_a["time"].equals(frame_b["time"])
+    assert not frame_a["close"].equals(frame_b["close"])
+
+
+def test_every_kernel_produces_a_result_on_the_smallest_series() -> None:
+    registry = kernel_benchmark.kernel_registry()
+
+    assert {name.split(".", 1)[0] for name in registry} == {"quant", "ta"}
+    for name, build in registry.items():
+        assert kernel_benchmark.run_kernel(build(250)) is not None, name
+
+    garch = kernel_benchmark.measure_kernel(registry["quant.garch_volatility"](250), repeats=1)
+    assert garch["repeats"] == 1
+    assert garch["median_ms"] > 0 and garch["peak_kib"] > 0
+
+    full = registry["ta.full_analysis"](250)
+    result = kernel_benchmark.run_kernel(full)
+    assert result["symbol"] == "BENCH"
+    assert result["oscillators"]["rsi"]["value"] is not None
+
+
+def test_compare_with_baseline_flags_time_and_memory_regressions() -> None:
+    baseline = {
+        "quant.hurst_rs@250": {"median_ms": 2.0, "peak_kib": 20.0},
+        "ta.rsi@250": {"median_ms": 2.0, "peak_kib": 20.0},
+    }
+    current = {
+        "quant.hurst_rs@250": {"median_ms": 3.0, "peak_kib": 30.0},
+        "ta.rsi@250": {"median_ms": 2.2, "peak_kib": 21.0},
+        "ta.adx@250": {"median_ms": 9.0, "peak_kib": 90.0},
+    }
+
+    regressions = kernel_benchmark.compare_with_baseline(current, baseline, 0.25, 0.25)
+
+    assert len(regressions) == 2
+    assert all(line.startswith("quant.hurst_rs@250: ") for line in regressions)
+    assert any("median" in line for line in regressions)
+    assert any("peak memory" in line for line in regressions)
+
+
+def _baseline_rows() -> dict:
+    if not kernel_benchmark.DEFAULT_BASELINE.exists():
+        return {}
+    return json.loads(kernel_benchmark.DEFAULT_BASELINE.read_text(encoding="utf-8"))["kernels"]
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not BENCHMARKS_ENABLED, reason="set VNIBB_KERNEL_BENCHMARKS=1 to run")
+@pytest.mark.parametrize("size", kernel_benchmark.DEFAULT_SIZES)
+@pytest.mark.parametrize(
+    "name", sorted(kernel_benchmark.kernel_registry()) if BENCHMARKS_ENABLED else ["disabled"]
+)
+def test_kernel_stays_within_baseline(name: str, size: int) -> None:
+    key = f"{name}@{size}"
+    current = {key: kernel_benchmark.measure_kernel(kernel_benchmark.kernel_registry()[name](size))}
+    max_regression = float(os.environ.get("VNIBB_KERNEL_MAX_REGRESSION", "0.25"))
+
+    regressions = kernel_benchmark.compare_with_baseline(
+        current, _baseline_rows(), max_regression, max_regression
+    )
+
+    assert not regressions, "\n".join(regressions)
@@ -0,0 +1,131 @@
+import asyncio
+import importlib.util
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).parents[2] / "scripts" / "load_benchmark.py"
+SPEC = importlib.util.spec_from_file_location("load_benchmark", MODULE_PATH)
+load_benchmark = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+sys.modules[SPEC.name] = load_benchmark
+SPEC.loader.exec_module(load_benchmark)
+
+
+def test_synthetic_corpus_is_deterministic_and_well_formed() -> None:
+    days = [date(2026, 1, 5) + timedelta(days=offset) for offset in range(60)]
+
+    first = list(load_benchmark.synthetic_price_rows("AAA", 0, days))
+    again = list(load_benchmark.synthetic_price_rows("AAA", 0, days))
+    other = list(load_benchmark.synthetic_price_rows("AAB", 1, days))
+
+    assert first == again
+    assert first != other
+    assert [row["time"] for row in first] == days
+    for row in first:
+        assert row["low"] <= min(row["open"], row["close"])
+        assert row["high"] >= max(row["open"], row["close"])
+        assert row["close"] > 0 and row["volume"] > 0
+    assert load_benchmark.synthetic_symbols(3) == ["AAA", "AAB", "AAC"]
+    assert len(set(load_benchmark.synthetic_symbols(1600))) == 1600
+
+
+def test_compare_with_baseline_flags_latency_throughput_and_errors() -> None:
+    baseline = {
+        "screener": {
+            "p50_ms": 100.0,
+            "p95_ms": 200.0,
+            "p99_ms": 300.0,
+            "throughput_rps": 50.0,
+            "error_rate": 0.0,
+        },
+        "market.heatmap": {
+            "p50_ms": 10.0,
+            "p95_ms": 20.0,
+            "p99_ms": 30.0,
+            "throughput_rps": 500.0,
+            "error_rate": 0.0,
+        },
+    }
+    current = {
+        "screener": {
+            "p50_ms": 110.0,
+            "p95_ms": 260.0,
+            "p99_ms": 320.0,
+            "throughput_rps": 35.0,
+            "error_rate": 0.05,
+        },
+        "market.heatmap": {
+            "p50_ms": 11.0,
+            "p95_ms": 21.0,
+            "p99_ms": 35.0,
+            "throughput_rps": 480.0,
+            "error_rate": 0.0,
+        },
+        "ws.prices": {
+            "p50_ms": 1.0,
+            "p95_ms": 2.0,
+            "p99_ms": 3.0,
+            "throughput_rps": 1.0,
+            "error_rate": 0.0,
+        },
+    }
+
+    regressions = load_benchmark.compare_with_baseline(current, baseline, 0.25)
+
+    assert len(regressions) == 3
+    assert all(line.startswith("screener: ") for line in regressions)
+    assert any("p95_ms" in line for line in regressions)
+    assert any("throughput" in line for line in regressions)
+    assert any("error rate" in line for line in regressions)
+
+
+def test_baseline_setup_mismatches_flag_load_and_environment_drift() -> None:
+    baseline = json.loads(load_benchmark.DEFAULT_BASELINE.read_text(encoding="utf-8"))
+    setup = {
+        "environment": dict(baseline["environment"]),
+        "load": dict(baseline["load"]),
+        "corpus": {"symbols": baseline["corpus"]["symbols"]},
+    }
+
+    assert load_benchmark.baseline_setup_mismatches(setup, baseline) == []
+
+    setup["load"]["concurrency"] = 32
+    setup["environment"]["database"] = "postgresql+asyncpg"
+    mismatches = load_benchmark.baseline_setup_mismatches(setup, baseline)
+
+    assert len(mismatches) == 2
+    assert any(line.startswith("load.concurrency: run 32") for line in mismatches)
+    assert any(line.startswith("environment.database:") for line in mismatches)
+
+
+def test_default_load_matches_the_committed_baseline() -> None:
+    baseline = json.loads(load_benchmark.DEFAULT_BASELINE.read_text(encoding="utf-8"))
+
+    assert baseline["load"] == {
+        "concurrency": load_benchmark.DEFAULT_CONCURRENCY,
+        "duration_seconds": load_benchmark.DEFAULT_DURATION_SECONDS,
+        "warmup_seconds": load_benchmark.DEFAULT_WARMUP_SECONDS,
+    }
+
+
+def test_closed_loop_counts_only_post_warmup_calls() -> None:
+    calls = []
+
+    async def operation(stats) -> None:
+        await asyncio.sleep(0.01)
+        calls.append(stats)
+        stats.record(10.0, "200", True)
+
+    result = asyncio.run(
+        load_benchmark.run_closed_loop(operation, concurrency=4, duration=0.2, warmup=0.1)
+    )
+
+    assert 0 < result["requests"] < len(calls)
+    assert result["errors"] == 0
+    assert result["p50_ms"] == pytest.approx(10.0)
+    assert result["statuses"] == {"200": result["requests"]}
+    assert result["throughput_rps"] > 0
@@ -0,0 +1,257 @@
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+from jose import jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from vnibb.api.v1 import insider as insider_api
+from vnibb.core.config import settings
+from vnibb.models.alerts import (
+    AlertRule,
+    AlertRuleDirection,
+    AlertRuleType,
+    AlertType,
+    InsiderAlert,
+)
+from vnibb.services import alert_rule_engine as engine_module
+from vnibb.services.alert_rule_engine import (
+    AlertRuleEngine,
+    CompiledRule,
+    SymbolSeed,
+    Tick,
+    seed_from_bars,
+)
+
+T0 = datetime(2026, 5, 18, 9, 30)
+AUTH_SECRET = "test-supabase-secret"
+
+
+def _auth_headers(user_id):
+    token = jwt.encode({"sub": user_id, "role": "authenticated"}, AUTH_SECRET, algorithm="HS256")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _rule(rule_id, symbol, rule_type, direction, threshold, cooldown=0):
+    return CompiledRule(
+        id=rule_id,
+        user_id="user-7",
+        symbol=symbol,
+        rule_type=AlertRuleType(rule_type),
+        direction=AlertRuleDirection(direction),
+        threshold=threshold,
+        cooldown_seconds=cooldown,
+    )
+
+
+def _tick(symbol, price, seconds=0, **fields):
+    return Tick(symbol=symbol, price=price, timestamp=T0 + timedelta(seconds=seconds), **fields)
+
+
+def test_price_rules_fire_once_per_crossing_and_only_for_their_symbol():
+    engine = AlertRuleEngine()
+    engine.load(
+        [
+            _rule(1, "VCB", "price", "above", 90_000),
+            _rule(2, "VCB", "price", "below", 88_000),
+            _rule(3, "FPT", "price", "above", 1),
+        ]
+    )
+
+    assert engine.evaluate(_tick("VCB", 89_000)) == []  # first tick seeds state
+    assert [m.rule.id for m in engine.evaluate(_tick("VCB", 90_500, 1))] == [1]
+    assert engine.evaluate(_tick("VCB", 91_000, 2)) == []  # still above: no re-fire
+    assert [m.rule.id for m in engine.evaluate(_tick("VCB", 87_500, 3))] == [2]
+    assert engine.evaluate(_tick("HPG", 30_000)) == []
+    assert [m.rule.id for m in engine.evaluate(_tick("VCB", 90_000, 4))] == [1]
+
+
+def test_cooldown_suppresses_flapping_rules():
+    engine = AlertRuleEngine()
+    engine.load([_rule(1, "VCB", "price", "above", 90_000, cooldown=60)])
+
+    engine.evaluate(_tick("VCB", 89_000))
+    assert len(engine.evaluate(_tick("VCB", 90_100, 1))) == 1
+    engine.evaluate(_tick("VCB", 89_900, 2))
+    assert engine.evaluate(_tick("VCB", 90_100, 3)) == []
+    engine.evaluate(_tick("VCB", 89_900, 61))
+    assert len(engine.evaluate(_tick("VCB", 90_100, 62))) == 1
+
+
+def test_bisected_tables_match_a_brute_force_scan():
+    rng = random.Random(3)
+    rules = [
+        _rule(index, "VCB", "price", rng.choice(["above", "below"]), rng.randint(80, 120) * 1_000)
+        for index in range(500)
+    ]
+    engine = AlertRuleEngine()
+    engine.load(rules)
+    prices = [rng.randint(75, 125) * 1_000 for _ in range(300)]
+
+    previous = None
+    for step, price in enumerate(prices):
+        fired = {match.rule.id for match in engine.evaluate(_tick("VCB", price, step))}
+        expected = set()
+        if previous is not None:
+            for rule in rules:
+                rising = previous < rule.threshold <= price
+                falling = price <= rule.threshold < previous
+                if rising if rule.direction == AlertRuleDirection.ABOVE else falling:
+                    expected.add(rule.id)
+        assert fired == expected
+        previous = price
+
+
+def test_derived_metrics_use_the_daily_seed():
+    closes = [float(100 + (i % 5) * 2 - (i % 3)) for i in range(40)]
+    volumes = [1_000_000.0] * 40
+    seed = seed_from_bars(closes, volumes)
+    engine = AlertRuleEngine()
+    engine.load(
+        [
+            _rule(1, "VCB", "pct_move", "above", 3.0),
+            _rule(2, "VCB", "volume_spike", "above", 1.5),
+            _rule(3, "VCB", "rsi", "above", 0.0001),
+            _rule(4, "VCB", "foreign_net_flow", "below", -5e9),
+        ],
+        {"VCB": seed},
+    )
+
+    engine.evaluate(_tick("VCB", closes[-1], volume=100_000, foreign_net_value=0.0))
+    matches = engine.evaluate(
+        _tick("VCB", closes[-1] * 1.05, 1, volume=2_000_000, foreign_net_value=-6e9)
+    )
+
+    by_type = {match.rule.rule_type: match.value for match in matches}
+    assert by_type[AlertRuleType.PCT_MOVE] == pytest.approx(5.0)
+    assert by_type[AlertRuleType.VOLUME_SPIKE] == pytest.approx(2.0)
+    assert by_type[AlertRuleType.FOREIGN_NET_FLOW] == -6e9
+    # RSI matches TechnicalAnalysisService.get_rsi with the tick as today's close.
+    series = pd.Series(closes + [closes[-1] * 1.05])
+    delta = series.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    expected_rsi = float((100 - 100 / (1 + gain / loss)).iloc[-1])
+    rsi = engine_module._metric_rsi(_tick("VCB", closes[-1] * 1.05), seed)
+    assert rsi == pytest.approx(expected_rsi)
+
+
+@pytest.mark.asyncio
+async def test_process_tick_broadcasts_and_persists_matches(test_engine, monkeypatch):
+    sessions = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    async with sessions() as session:
+        session.add(
+            AlertRule(
+                id=11,
+                user_id="user-7",
+                symbol="VCB",
+                rule_type="price",
+                direction="above",
+                threshold=90_000,
+                cooldown_seconds=0,
+            )
+        )
+        await session.commit()
+
+    sent = []
+
+    async def fake_send_user_alert(user_id, payload):
+        sent.append((user_id, payload))
+
+    async def unexpected_broadcast(_payload):
+        raise AssertionError("rule matches must not be broadcast to every client")
+
+    monkeypatch.setattr(engine_module.manager, "send_user_alert", fake_send_user_alert)
+    monkeypatch.setattr(engine_module.manager, "broadcast_alert", unexpected_broadcast)
+    engine = AlertRuleEngine(session_factory=sessions)
+
+    await engine.process_tick(_tick("VCB", 89_000))
+    matches = await engine.process_tick(_tick("VCB", 90_500, 1))
+    await asyncio.gather(*engine._background)
+
+    assert [match.rule.id for match in matches] == [11]
+    user_id, payload = sent[0]
+    assert user_id == "user-7" and payload["type"] == "rule_alert"
+    assert payload["user_id"] == "user-7" and payload["value"] == 90_500
+    async with sessions() as session:
+        alert = (await session.execute(select(InsiderAlert))).scalar_one()
+        rule = await session.get(AlertRule, 11)
+    assert alert.alert_type == AlertType.RULE_TRIGGER
+    assert alert.owner_id == "user-7" and alert.user_id is None
+    assert alert.symbol == "VCB"
+    assert rule.last_triggered_at == T0 + timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_alert_rule_endpoints_register_rules_with_the_engine(client, monkeypatch):
+    monkeypatch.setattr(settings, "supabase_jwt_secret", AUTH_SECRET)
+    monkeypatch.setattr(settings, "appwrite_endpoint", None)
+    engine = AlertRuleEngine()
+    engine.load([])
+    monkeypatch.setattr(insider_api, "alert_rule_engine", engine)
+    owner = _auth_headers("user-7")
+
+    created = await client.post(
+        "/api/v1/alerts/rules",
+        headers=owner,
+        json={"symbol": "vcb", "rule_type": "rsi", "direction": "below", "threshold": 30},
+    )
+    invalid = await client.post(
+        "/api/v1/alerts/rules",
+        headers=owner,
+        json={"symbol": "VCB", "rule_type": "rsi", "direction": "below", "threshold": 130},
+    )
+
+    assert created.status_code == 201
+    rule = created.json()
+    assert rule["symbol"] == "VCB" and rule["cooldown_seconds"] == 300
+    assert rule["user_id"] == "user-7"
+    assert invalid.status_code == 422
+    assert engine.watched_symbols() == {"VCB"}
+    listed = await client.get("/api/v1/alerts/rules", headers=owner)
+    assert [item["id"] for item in listed.json()] == [rule["id"]]
+
+    deleted = await client.delete(f"/api/v1/alerts/rules/{rule['id']}", headers=owner)
+    missing = await client.delete(f"/api/v1/alerts/rules/{rule['id']}", headers=owner)
+
+    assert deleted.status_code == 204
+    assert missing.status_code == 404
+    assert engine.rule_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_alert_rule_endpoints_scope_rules_to_the_authenticated_user(client, monkeypatch):
+    monkeypatch.setattr(settings, "supabase_jwt_secret", AUTH_SECRET)
+    monkeypatch.setattr(settings, "appwrite_endpoint", None)
+    engine = AlertRuleEngine()
+    engine.load([])
+    monkeypatch.setattr(insider_api, "alert_rule_engine", engine)
+
+    anonymous = await client.post(
+        "/api/v1/alerts/rules",
+        params={"user_id": 7},
+        json={"symbol": "VCB", "rule_type": "price", "direction": "above", "threshold": 1},
+    )
+    created = await client.post(
+        "/api/v1/alerts/rules",
+        headers=_auth_headers("user-7"),
+        json={"symbol": "VCB", "rule_type": "price", "direction": "above", "threshold": 1},
+    )
+    rule_id = created.json()["id"]
+    other = _auth_headers("user-8")
+    listed = await client.get("/api/v1/alerts/rules", headers=other)
+    deleted = await client.delete(f"/api/v1/alerts/rules/{rule_id}", headers=other)
+
+    assert anonymous.status_code == 401
+    assert listed.status_code == 200 and listed.json() == []
+    assert deleted.status_code == 404
+    assert engine.rule_count() == 1
+
+
+def test_seed_requires_enough_history_for_rsi():
+    seed = seed_from_bars([100.0, 101.0], [10.0, 30.0])
+
+    assert seed == SymbolSeed(previous_close=101.0, adv_20d=20.0)
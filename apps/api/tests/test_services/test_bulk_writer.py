@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from vnibb.models.news import Dividend
+from vnibb.models.screener import ScreenerSnapshot
+from vnibb.models.stock import Stock, StockPrice
+from vnibb.services.bulk_writer import (
+    _prepare_rows,
+    build_merge_sql,
+    bulk_upsert,
+    bulk_upsert_isolating_failures,
+    iter_batches,
+)
+
+
+def _snapshot(symbol: str, day: int, price: float) -> dict:
+    return {"symbol": symbol, "snapshot_date": date(2026, 3, day), "price": price}
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_then_updates_in_batches(test_db):
+    rows = [_snapshot("VNM", day, 100.0 + day) for day in range(1, 8)]
+    written = await bulk_upsert(
+        test_db, ScreenerSnapshot, ["symbol", "snapshot_date"], rows, max_rows=3
+    )
+    await test_db.commit()
+    assert written == 7
+
+    updated = [_snapshot("VNM", 2, 999.0), _snapshot("VNM", 2, 555.0), _snapshot("VNM", 9, 109.0)]
+    written = await bulk_upsert(test_db, ScreenerSnapshot, ["symbol", "snapshot_date"], updated)
+    await test_db.commit()
+    assert written == 2
+
+    result = await test_db.execute(
+        select(ScreenerSnapshot.snapshot_date, ScreenerSnapshot.price, ScreenerSnapshot.source)
+        .order_by(ScreenerSnapshot.snapshot_date)
+    )
+    stored = result.all()
+    assert len(stored) == 8
+    assert stored[1].price == 555.0
+    assert {row.source for row in stored} == {"vnstock"}
+
+
+def test_prepare_rows_keeps_rows_with_null_conflict_keys():
+    rows = [
+        {"symbol": "VNM", "exercise_date": None, "cash_year": 2025, "dividend_value": 1.0},
+        {"symbol": "VNM", "exercise_date": None, "cash_year": 2025, "dividend_value": 2.0},
+        {"symbol": "FPT", "exercise_date": date(2026, 1, 5), "cash_year": 2025},
+        {"symbol": "FPT", "exercise_date": date(2026, 1, 5), "cash_year": 2025},
+    ]
+
+    columns, prepared = _prepare_rows(
+        Dividend.__table__, ["symbol", "exercise_date", "cash_year"], rows
+    )
+
+    assert "created_at" in columns
+    assert "id" not in columns
+    assert len(prepared) == 3
+    assert all(row["created_at"] is not None for row in prepared)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_rejects_unknown_columns(test_db):
+    with pytest.raises(ValueError, match="Unknown columns"):
+        await bulk_upsert(test_db, Stock, ["symbol"], [{"symbol": "VNM", "bogus": 1}])
+
+
+def test_iter_batches_respects_row_and_byte_limits():
+    rows = [{"payload": "x" * 100} for _ in range(10)]
+
+    assert [len(batch) for batch in iter_batches(rows, max_rows=4)] == [4, 4, 2]
+    assert [len(batch) for batch in iter_batches(rows, max_rows=100, max_bytes=250)] == [2] * 5
+
+
+def test_build_merge_sql_updates_non_key_columns_from_staging_table():
+    sql = build_merge_sql(
+        StockPrice.__table__,
+        "_bulk_stock_prices_test",
+        ["symbol", "time", "interval", "close"],
+        ["symbol", "time", "interval"],
+    )
+
+    assert sql.startswith('INSERT INTO "stock_prices" ("symbol", "time", "interval", "close") ')
+    assert 'FROM "_bulk_stock_prices_test"' in sql
+    assert 'ON CONFLICT ("symbol", "time", "interval") DO UPDATE SET' in sql
+    assert '"close" = EXCLUDED."close"' in sql
+    assert '"id" =' not in sql
+
+
+@pytest.mark.asyncio
+async def test_isolating_upsert_fails_only_the_bad_row(test_db):
+    rows = [
+        _snapshot("VNM", 1, 101.0),
+        {"symbol": None, "snapshot_date": date(2026, 3, 1), "price": 1.0},
+        _snapshot("FPT", 1, 99.0),
+    ]
+
+    written, failures = await bulk_upsert_isolating_failures(
+        test_db, ScreenerSnapshot, ["symbol", "snapshot_date"], rows
+    )
+    await test_db.commit()
+
+    assert written == 2
+    assert [row["symbol"] for row, _ in failures] == [None]
+    stored = (await test_db.execute(select(ScreenerSnapshot.symbol))).scalars().all()
+    assert sorted(stored) == ["FPT", "VNM"]
+
+
+class _FakeCopyDriver:
+    def __init__(self):
+        self.statements: list[str] = []
+        self.copies: list[tuple[str, list[tuple], list[str]]] = []
+
+    async def execute(self, sql):
+        self.statements.append(sql)
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        self.copies.append((table_name, records, columns))
+
+
+class _FakeCopyConnection:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def exec_driver_sql(self, sql):
+        return None
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self.driver)
+
+
+class _FakeAsyncpgSession:
+    def __init__(self, driver):
+        self.connection_ = _FakeCopyConnection(driver)
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver="asyncpg"))
+
+    async def connection(self):
+        return self.connection_
+
+    async def execute(self, statement):  # pragma: no cover - COPY path must not use it
+        raise AssertionError("asyncpg sessions should stage rows with COPY")
+
+
+@pytest.mark.asyncio
+async def test_asyncpg_path_copies_batches_into_staging_table_and_merges():
+    driver = _FakeCopyDriver()
+    rows = [
+        {"symbol": "VNM", "time": date(2026, 3, day), "interval": "1D", "close": 60.0 + day}
+        for day in range(1, 6)
+    ]
+
+    written = await bulk_upsert(
+        _FakeAsyncpgSession(driver), StockPrice, ["symbol", "time", "interval"], rows, max_rows=2
+    )
+
+    assert written == 5
+    assert [len(records) for _, records, _ in driver.copies] == [2, 2, 1]
+    staging = driver.copies[0][0]
+    assert staging.startswith("_bulk_stock_prices_")
+    _, records, columns = driver.copies[0]
+    first = dict(zip(columns, records[0], strict=True))
+    assert first["symbol"] == "VNM" and first["time"] == date(2026, 3, 1)
+    assert first["close"] == 61.0
+
+    assert driver.statements[0].startswith(f'CREATE TEMP TABLE "{staging}" ON COMMIT DROP')
+    merges = [sql for sql in driver.statements if sql.startswith('INSERT INTO "stock_prices"')]
+    assert len(merges) == 3
+    assert driver.statements.count(f'TRUNCATE "{staging}"') == 3
+    assert driver.statements[-1] == f'DROP TABLE "{staging}"'
@@ -0,0 +1,174 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+from vnibb.services import world_news_service
+from vnibb.services.near_duplicate_index import (
+    NearDuplicateIndex,
+    headline_shingles,
+    jaccard_similarity,
+    overlap_coefficient,
+)
+from vnibb.services.news_crawler import NewsCrawlerService
+from vnibb.services.world_news_service import WorldNewsArticle
+
+
+def _brute_force_duplicates(token_sets, threshold):
+    accepted = []
+    duplicates = []
+    for position, tokens in enumerate(token_sets):
+        if any(jaccard_similarity(tokens, seen) >= threshold for seen in accepted):
+            duplicates.append(position)
+            continue
+        accepted.append(tokens)
+    return duplicates
+
+
+def test_index_matches_pairwise_scan_on_synthetic_headlines():
+    rng = random.Random(7)
+    vocabulary = [f"word{index}" for index in range(400)]
+    token_sets = []
+    for _ in range(300):
+        base = rng.sample(vocabulary, rng.randint(4, 12))
+        token_sets.append(frozenset(base))
+        roll = rng.random()
+        if roll < 0.2:
+            # Syndicated rewrite: swap one token.
+            token_sets.append(frozenset([*base[1:], rng.choice(vocabulary)]))
+        elif roll < 0.3:
+            # Shortened headline that keeps most of the original.
+            token_sets.append(frozenset(base[: max(2, len(base) - 2)]))
+        elif roll < 0.4:
+            # Extended headline, including pairs far below the threshold.
+            token_sets.append(frozenset([*base, *rng.sample(vocabulary, rng.randint(1, 8))]))
+
+    index = NearDuplicateIndex()
+    duplicates = []
+    for position, tokens in enumerate(token_sets):
+        if index.query(tokens) is not None:
+            duplicates.append(position)
+            continue
+        index.add(position, tokens)
+
+    assert duplicates == _brute_force_duplicates(token_sets, index.threshold)
+
+
+def test_index_evicts_oldest_entries_and_supports_removal():
+    index = NearDuplicateIndex(max_items=2)
+    index.add("a", {"alpha", "beta", "gamma"})
+    index.add("b", {"delta", "epsilon", "zeta"})
+    index.add("c", {"eta", "theta", "iota"})
+
+    assert "a" not in index
+    assert len(index) == 2
+    assert index.query({"alpha", "beta", "gamma"}) is None
+    assert index.query({"delta", "epsilon", "zeta", "extra"}) == "b"
+
+    index.remove("b")
+    assert index.query({"delta", "epsilon", "zeta"}) is None
+    assert index.add_if_unique("c2", {"eta", "theta", "iota"}) == "c"
+    assert index.add_if_unique("c", {"eta", "theta", "iota"}) is None
+
+
+def test_headline_shingles_ignore_vietnamese_diacritics():
+    assert headline_shingles("Ngân hàng tăng vốn điều lệ") == headline_shingles(
+        "Ngan hang tang von dieu le"
+    )
+    assert headline_shingles("VN-Index") == frozenset({"vn index"})
+
+
+def test_crawler_drops_syndicated_copies_but_keeps_recrawled_urls():
+    crawler = NewsCrawlerService()
+    first = crawler._drop_near_duplicates(
+        [
+            {"title": "Ngân hàng Nhà nước hạ lãi suất điều hành", "link": "https://cafef.vn/a"},
+            {"title": "Ngân hàng Nhà nước hạ lãi suất điều hành", "link": "https://vietstock.vn/b"},
+            {"title": "Giá vàng lập đỉnh mới trong phiên sáng", "link": "https://cafef.vn/c"},
+        ]
+    )
+    assert [article["link"] for article in first] == ["https://cafef.vn/a", "https://cafef.vn/c"]
+    crawler._remember_headlines(first)
+
+    again = crawler._drop_near_duplicates(
+        [{"title": "Ngân hàng Nhà nước hạ lãi suất điều hành", "link": "https://cafef.vn/a"}]
+    )
+    assert len(again) == 1
+
+
+def _world_article(index: int, title: str) -> WorldNewsArticle:
+    return WorldNewsArticle(
+        id=f"wire-{index}",
+        title=title,
+        source_id=f"wire{index % 7}",
+        source=f"Wire {index % 7}",
+        source_domain=f"wire{index % 7}.example",
+        source_url=f"https://wire{index % 7}.example",
+        feed_url=f"https://wire{index % 7}.example/rss",
+        url=f"https://wire{index % 7}.example/story-{index}",
+        published_at=datetime(2026, 10, 18, tzinfo=UTC) - timedelta(minutes=index),
+        region="global",
+        category="markets",
+        language="en",
+        tags=[],
+        relevance_score=0.5,
+    )
+
+
+def test_world_news_dedupe_tracks_the_exact_overlap_scan():
+    rng = random.Random(11)
+    words = [f"{stem}{index}" for stem in ("market", "stock", "rates", "bond") for index in range(60)]
+    titles = []
+    for _ in range(250):
+        base = rng.sample(words, rng.randint(3, 10))
+        titles.append(" ".join(base))
+        if rng.random() < 0.4:
+            variant = [*base[: rng.randint(2, len(base))], *rng.sample(words, rng.randint(0, 4))]
+            titles.append(" ".join(variant))
+    articles = [_world_article(index, title) for index, title in enumerate(titles)]
+
+    accepted_tokens = []
+    expected = []
+    for article in sorted(articles, key=world_news_service._article_sort_key, reverse=True):
+        tokens = world_news_service._headline_tokens(article.title)
+        if any(
+            overlap_coefficient(tokens, seen) >= world_news_service.HEADLINE_SIMILARITY_THRESHOLD
+            for seen in accepted_tokens
+        ):
+            continue
+        accepted_tokens.append(tokens)
+        expected.append(article.id)
+
+    deduped = [article.id for article in world_news_service._dedupe_articles(articles)]
+    exact_duplicates = len(articles) - len(expected)
+
+    # LSH candidate recall is probabilistic for size-skewed pairs (Jaccard ~0.2),
+    # so a rare duplicate may slip through, but nothing distinct is dropped.
+    assert exact_duplicates > 0
+    assert set(expected) <= set(deduped)
+    assert len(deduped) - len(expected) <= 0.02 * exact_duplicates
+
+
+def test_world_news_dedupe_drops_a_short_rewrite_contained_in_a_longer_headline():
+    articles = [
+        _world_article(0, "Fed holds rates steady as inflation cools and markets rally worldwide"),
+        _world_article(1, "Fed holds rates"),
+    ]
+    long_tokens, short_tokens = (world_news_service._headline_tokens(a.title) for a in articles)
+    assert short_tokens < long_tokens
+    # Well below the plain-Jaccard cut-off, so only the overlap check catches it.
+    assert jaccard_similarity(short_tokens, long_tokens) < 0.45
+
+    assert [article.id for article in world_news_service._dedupe_articles(articles)] == ["wire-0"]
+
+
+def test_crawler_indexes_headlines_only_once_they_are_stored():
+    crawler = NewsCrawlerService()
+    title = "Giá vàng lập đỉnh mới trong phiên sáng"
+    first = crawler._drop_near_duplicates([{"title": title, "link": "https://cafef.vn/c"}])
+    assert len(first) == 1
+
+    # The first copy was never stored, so a syndicated copy is still accepted.
+    retry = crawler._drop_near_duplicates([{"title": title, "link": "https://vietstock.vn/d"}])
+    assert len(retry) == 1
+
+    crawler._remember_headlines(retry)
+    assert crawler._drop_near_duplicates([{"title": title, "link": "https://cafef.vn/c"}]) == []
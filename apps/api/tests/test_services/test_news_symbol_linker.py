@@ -0,0 +1,247 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from vnibb.models.market_news import MarketNews, NewsSymbolLink
+from vnibb.models.stock import Stock
+from vnibb.services.news_crawler import NewsCrawlerService
+from vnibb.services.news_service import get_ranked_news_rows
+from vnibb.services.news_symbol_linker import (
+    AhoCorasick,
+    NewsSymbolLinker,
+    build_symbol_lexicon,
+)
+
+STOCKS = [
+    {
+        "symbol": "VNM",
+        "short_name": "Vinamilk",
+        "company_name": "Vietnam Dairy Products",
+        "industry": "Food",
+        "exchange": "HOSE",
+    },
+    {
+        "symbol": "MSN",
+        "short_name": "Masan",
+        "company_name": "Masan Group",
+        "industry": "Food",
+        "exchange": "HOSE",
+    },
+    {
+        "symbol": "FPT",
+        "short_name": "FPT Corp",
+        "company_name": "FPT Corporation",
+        "industry": "Technology",
+        "exchange": "HOSE",
+    },
+    {
+        "symbol": "VCB",
+        "short_name": "Vietcombank",
+        "company_name": "Vietnam Commercial Bank",
+        "industry": "Banks",
+        "exchange": "HOSE",
+    },
+    {
+        "symbol": "VRE",
+        "short_name": "Vincom Retail",
+        "company_name": "Vietnam Retail",
+        "industry": "Real Estate",
+        "exchange": "HOSE",
+    },
+    {
+        "symbol": "HVN",
+        "short_name": "Vietnam Airlines",
+        "company_name": "Vietnam Airlines",
+        "industry": "Airlines",
+        "exchange": "HOSE",
+    },
+]
+
+
+def test_aho_corasick_matches_every_occurrence():
+    rng = random.Random(3)
+    for _ in range(200):
+        patterns = {"".join(rng.choice("ab") for _ in range(rng.randint(1, 4))) for _ in range(6)}
+        matcher = AhoCorasick()
+        for pattern in patterns:
+            matcher.add(pattern)
+        text = "".join(rng.choice("abc") for _ in range(30))
+
+        expected = sorted(
+            (start, pattern)
+            for pattern in patterns
+            for start in range(len(text))
+            if text.startswith(pattern, start)
+        )
+        assert sorted(matcher.build().iter_matches(text)) == expected
+
+
+def test_lexicon_scores_tickers_keywords_and_peers():
+    lexicon = build_symbol_lexicon(STOCKS)
+
+    links = {
+        link.symbol: link
+        for link in lexicon.link(
+            title="VNM lãi kỷ lục quý III",
+            body="Cổ phiếu FPT và VCBX giảm; fpt không đổi",
+            related_symbols="VCB",
+        )
+    }
+
+    assert (links["VNM"].score, links["VNM"].reason) == (1.0, "exact_symbol_title")
+    assert (links["VCB"].score, links["VCB"].reason) == (0.97, "exact_symbol_related")
+    assert (links["FPT"].score, links["FPT"].reason) == (0.94, "exact_symbol_body")
+    # MSN shares VNM's industry, so a VNM headline is a peer mention for MSN.
+    assert (links["MSN"].score, links["MSN"].reason) == (0.68, "peer_mentions")
+
+    keyword_links = lexicon.link(title="Vinamilk chia cổ tức tiền mặt")
+    assert [(link.symbol, link.reason) for link in keyword_links] == [("VNM", "company_keyword")]
+    # "vietnam" belongs to four companies and does not identify any of them.
+    assert lexicon.link(title="Vietnam exports rise") == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_links_archive_and_serves_indexed_top_k(test_engine, test_db, monkeypatch):
+    test_db.add_all(Stock(**stock) for stock in STOCKS)
+    now = datetime.utcnow()
+    test_db.add_all(
+        [
+            MarketNews(
+                title="VNM công bố kết quả kinh doanh",
+                source="cafef",
+                url="https://example.com/old-vnm",
+                published_date=now - timedelta(days=400),
+                sentiment="neutral",
+                sentiment_score=0.6,
+            ),
+            MarketNews(
+                title="Vinamilk mở rộng nhà máy",
+                source="cafef",
+                url="https://example.com/vinamilk",
+                published_date=now - timedelta(days=2),
+                sentiment="neutral",
+                sentiment_score=0.6,
+            ),
+            MarketNews(
+                title="Masan tái cấu trúc mảng bán lẻ, MSN tăng trần",
+                source="vietstock",
+                url="https://example.com/msn",
+                published_date=now - timedelta(days=1),
+                sentiment="neutral",
+                sentiment_score=0.6,
+            ),
+            MarketNews(
+                title="Giá vàng lập đỉnh mới",
+                source="cafef",
+                url="https://example.com/gold",
+                published_date=now,
+                sentiment="neutral",
+                sentiment_score=0.6,
+            ),
+        ]
+    )
+    await test_db.commit()
+
+    summary = await NewsSymbolLinker().backfill(test_db, batch_size=2)
+    assert summary["articles"] == 4
+
+    links = (
+        await test_db.execute(
+            select(NewsSymbolLink.symbol, NewsSymbolLink.reason).where(
+                NewsSymbolLink.symbol.in_(["VNM", "MSN"])
+            )
+        )
+    ).all()
+    assert set(links) == {
+        ("VNM", "exact_symbol_title"),
+        ("VNM", "company_keyword"),
+        ("VNM", "peer_mentions"),
+        ("MSN", "exact_symbol_title"),
+        ("MSN", "peer_mentions"),
+    }
+
+    session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+    monkeypatch.setattr("vnibb.services.news_crawler.async_session_maker", session_maker)
+    monkeypatch.setattr("vnibb.services.news_service.async_session_maker", session_maker)
+
+    async def unexpected_scan(**_kwargs):
+        raise AssertionError("a full page of links must not rescan recent rows")
+
+    monkeypatch.setattr("vnibb.services.news_service.news_crawler.get_latest_news", unexpected_scan)
+
+    rows, fallback_used = await get_ranked_news_rows(symbol="vnm", limit=2, mode="related")
+
+    assert fallback_used is False
+    # The 400-day-old exact title match outranks newer keyword/peer hits.
+    assert [row["url"] for row in rows] == [
+        "https://example.com/old-vnm",
+        "https://example.com/vinamilk",
+    ]
+    assert rows[0]["relevance_score"] == 1.0
+    assert rows[1]["match_reason"] == "company_keyword"
+
+
+@pytest.mark.asyncio
+async def test_symbol_filter_follows_mentions_and_unlinked_rows_until_backfilled(
+    test_engine, test_db, monkeypatch
+):
+    test_db.add_all(Stock(**stock) for stock in STOCKS)
+    now = datetime.utcnow()
+    articles = [
+        MarketNews(title="VNM công bố kết quả kinh doanh", url="https://example.com/vnm"),
+        MarketNews(title="Masan tái cấu trúc, MSN tăng trần", url="https://example.com/peer"),
+        MarketNews(title="Vinamilk mở rộng nhà máy", url="https://example.com/keyword"),
+    ]
+    for hours, article in enumerate(articles, start=1):
+        article.source = "cafef"
+        article.published_date = now - timedelta(hours=hours)
+    test_db.add_all(articles)
+    await test_db.flush()
+    linker = NewsSymbolLinker()
+    for article in articles:
+        await linker.link_article(
+            test_db, article_id=article.id, published_date=article.published_date, title=article.title
+        )
+    # Stored before ingest-time linking existed: only ``related_symbols`` knows.
+    test_db.add(
+        MarketNews(
+            title="Cổ phiếu ngành sữa hồi phục",
+            source="vietstock",
+            url="https://example.com/legacy",
+            published_date=now - timedelta(hours=4),
+            related_symbols="VNM,FPT",
+        )
+    )
+    await test_db.commit()
+
+    monkeypatch.setattr(
+        "vnibb.services.news_crawler.async_session_maker",
+        async_sessionmaker(test_engine, expire_on_commit=False),
+    )
+    monkeypatch.setattr("vnibb.services.news_symbol_linker.news_symbol_linker", linker)
+
+    async def urls():
+        rows = await NewsCrawlerService().get_latest_news(symbol="VNM", limit=10)
+        return [row["url"] for row in rows]
+
+    # Peer and company-keyword links never satisfy a symbol filter.
+    assert await urls() == ["https://example.com/vnm", "https://example.com/legacy"]
+
+    await linker.backfill(test_db)
+    assert await NewsSymbolLinker().backfill_complete(test_db) is True
+
+    # Once the archive is linked, an unlinked row no longer matches by substring.
+    test_db.add(
+        MarketNews(
+            title="Unlinked",
+            source="cafef",
+            url="https://example.com/unlinked",
+            published_date=now,
+            related_symbols="VNM",
+        )
+    )
+    await test_db.commit()
+    assert await urls() == ["https://example.com/vnm", "https://example.com/legacy"]
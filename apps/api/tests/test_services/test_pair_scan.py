@@ -0,0 +1,176 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vnibb.api.v1 import quant
+from vnibb.services.pair_scan import scan_pairs
+from vnibb.services.price_panel import ClosePanel
+
+
+def _synthetic_panel(symbols: int, sessions: int, seed: int = 7) -> ClosePanel:
+    rng = np.random.default_rng(seed)
+    market = np.cumsum(rng.normal(0.0, 0.01, sessions))
+    columns = []
+    for index in range(symbols):
+        spread = np.zeros(sessions)
+        noise = rng.normal(0.0, 0.01, sessions)
+        persistence = 0.8 + 0.19 * (index / max(symbols - 1, 1))
+        for row in range(1, sessions):
+            spread[row] = persistence * spread[row - 1] + noise[row]
+        beta = 0.6 + 0.05 * index
+        columns.append(20_000 * np.exp(beta * market + spread + 0.002 * index))
+    dates = np.array(pd.bdate_range("2023-01-02", periods=sessions).date, dtype="datetime64[D]")
+    return ClosePanel(
+        dates=dates,
+        symbols=tuple(f"S{index:02d}" for index in range(symbols)),
+        closes=np.column_stack(columns),
+    )
+
+
+def _frame(panel: ClosePanel, column: int) -> pd.DataFrame:
+    values = panel.closes[:, column]
+    keep = ~np.isnan(values)
+    return pd.DataFrame({"time": pd.to_datetime(panel.dates[keep]), "close": values[keep]})
+
+
+def test_scan_matches_single_pair_diagnostics_including_late_listings():
+    panel = _synthetic_panel(symbols=5, sessions=400)
+    panel.closes[:150, 3] = np.nan  # listed later: its pairs start at row 150
+
+    payload = scan_pairs(panel, limit=100)
+
+    assert payload["pair_count"] == 10
+    assert payload["scanned_pairs"] == 10
+    rows = {(row["symbol"], row["pair_symbol"]): row for row in payload["candidates"]}
+    for i in range(5):
+        for j in range(i + 1, 5):
+            key = (panel.symbols[i], panel.symbols[j])
+            expected = quant._compute_pair_diagnostics(_frame(panel, i), _frame(panel, j))
+            row = rows.get(key)
+            if row is None:
+                assert expected["half_life_days"] is None
+                continue
+            assert row["aligned_days"] == expected["aligned_days"]
+            for field in (
+                "hedge_ratio_ols",
+                "hedge_intercept",
+                "adf_tstat",
+                "half_life_days",
+                "rolling_correlation_63d",
+                "spread_z_score",
+            ):
+                assert row[field] == pytest.approx(expected[field], abs=2e-4), field
+            assert row["adf_verdict"] == expected["adf_verdict"]
+
+
+def test_scan_ranks_by_half_life_and_returns_symmetric_correlations():
+    panel = _synthetic_panel(symbols=6, sessions=300)
+
+    payload = scan_pairs(panel, limit=5, max_half_life=50)
+
+    candidates = payload["candidates"]
+    assert [row["rank"] for row in candidates] == list(range(1, len(candidates) + 1))
+    half_lives = [row["half_life_days"] for row in candidates]
+    assert half_lives == sorted(half_lives)
+    assert all(value <= 50 for value in half_lives)
+    matrix = np.array(payload["correlation_matrix"], dtype=float)
+    np.testing.assert_allclose(matrix, matrix.T)
+    np.testing.assert_allclose(np.diag(matrix), 1.0)
+    expected = np.corrcoef(np.diff(panel.closes, axis=0).T / panel.closes[:-1].T)
+    np.testing.assert_allclose(matrix, expected, atol=1e-4)
+
+
+def test_candidates_carry_the_rolling_correlation_series():
+    panel = _synthetic_panel(symbols=4, sessions=200)
+    panel.closes[120:125, 2] = np.nan  # a gap: windows spanning it are undefined
+
+    payload = scan_pairs(panel, limit=100)
+
+    dates = payload["rolling_correlation_dates"]
+    assert dates[0] == str(panel.dates[63]) and dates[-1] == str(panel.dates[-1])
+    returns = pd.DataFrame(panel.closes).ffill().pct_change(fill_method=None)
+    for row in payload["candidates"]:
+        i, j = panel.symbols.index(row["symbol"]), panel.symbols.index(row["pair_symbol"])
+        expected = returns[i].rolling(63).corr(returns[j]).iloc[63:].to_numpy()
+        series = np.array(row["rolling_correlation_63d_series"], dtype=float)
+        assert len(series) == len(dates)
+        np.testing.assert_allclose(series, expected, atol=1e-4)
+        assert series[-1] == pytest.approx(row["rolling_correlation_63d"], abs=1e-4)
+
+
+def test_vn30_sized_scan_runs_well_under_a_second():
+    panel = _synthetic_panel(symbols=30, sessions=750)
+    scan_pairs(panel)
+
+    started = time.perf_counter()
+    payload = scan_pairs(panel)
+    elapsed = time.perf_counter() - started
+
+    assert payload["pair_count"] == 435
+    assert payload["scanned_pairs"] == 435
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_pair_scan_endpoint_loads_the_basket_once(client, monkeypatch):
+    calls = []
+
+    async def fake_load_close_panel(symbols, start_date, end_date, *, source):
+        calls.append(tuple(symbols))
+        panel = _synthetic_panel(symbols=len(symbols), sessions=200)
+        return ClosePanel(dates=panel.dates, symbols=tuple(symbols), closes=panel.closes)
+
+    monkeypatch.setattr(quant, "load_close_panel", fake_load_close_panel)
+
+    response = await client.get(
+        "/api/v1/quant/pairs/scan",
+        params={"symbols": "vcb,tcb,mbb,VCB", "adjustment_mode": "raw", "limit": 2},
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert calls == [("VCB", "TCB", "MBB")]
+    assert data["basket"] == "custom"
+    assert data["pair_count"] == 3
+    assert len(data["candidates"]) <= 2
+    assert len(data["correlation_matrix"]) == 3
+
+    unknown = await client.get("/api/v1/quant/pairs/scan", params={"basket": "nope"})
+    assert unknown.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_adjusted_panel_loads_corporate_actions_in_one_batch(monkeypatch):
+    panel = _synthetic_panel(symbols=3, sessions=30)
+    calls = []
+
+    async def fake_load_actions(_db, symbols, start_date, end_date):
+        calls.append(list(symbols))
+        return {
+            symbol: (
+                [
+                    {
+                        "effective_date": pd.Timestamp(panel.dates[10]).date(),
+                        "action_category": "split",
+                        "action_subtype": "split",
+                        "cash_amount_per_share": None,
+                        "share_ratio": "2:1",
+                        "percent_ratio": None,
+                    }
+                ]
+                if symbol == "S01"
+                else []
+            )
+            for symbol in symbols
+        }
+
+    monkeypatch.setattr(quant, "_load_corporate_actions_for_symbols", fake_load_actions)
+
+    adjusted = await quant._adjust_close_panel(None, panel, None, None)
+
+    assert calls == [list(panel.symbols)]
+    np.testing.assert_allclose(adjusted.closes[:, [0, 2]], panel.closes[:, [0, 2]])
+    np.testing.assert_allclose(adjusted.closes[:10, 1], panel.closes[:10, 1] * 0.5)
+    np.testing.assert_allclose(adjusted.closes[10:, 1], panel.closes[10:, 1])
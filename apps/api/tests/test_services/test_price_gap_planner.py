@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from vnibb.core.config import settings
+from vnibb.models.stock import Stock, StockPrice
+from vnibb.services.price_gap_planner import (
+    PriceGapPlanner,
+    coalesce_missing_days,
+    plan_fetch_ranges,
+)
+
+
+def test_coalesce_missing_days_bridges_weekends_and_holidays():
+    missing = [date(2026, 3, 5), date(2026, 3, 6), date(2026, 3, 9), date(2026, 3, 11)]
+
+    assert coalesce_missing_days(missing) == [
+        (date(2026, 3, 5), date(2026, 3, 9)),
+        (date(2026, 3, 11), date(2026, 3, 11)),
+    ]
+    assert coalesce_missing_days(missing, holidays={date(2026, 3, 10)}) == [
+        (date(2026, 3, 5), date(2026, 3, 11)),
+    ]
+    assert coalesce_missing_days(missing, max_range_days=2) == [
+        (date(2026, 3, 5), date(2026, 3, 6)),
+        (date(2026, 3, 9), date(2026, 3, 9)),
+        (date(2026, 3, 11), date(2026, 3, 11)),
+    ]
+
+
+def test_plan_fetch_ranges_adds_head_and_tail_windows():
+    ranges = plan_fetch_ranges(
+        bounds=(date(2026, 3, 3), date(2026, 3, 10)),
+        missing_days=[date(2026, 3, 5)],
+        start=date(2026, 3, 1),
+        end=date(2026, 3, 13),
+    )
+
+    assert ranges == [
+        (date(2026, 3, 5), date(2026, 3, 5)),
+        (date(2026, 3, 11), date(2026, 3, 13)),
+        (date(2026, 3, 1), date(2026, 3, 2)),
+    ]
+    assert plan_fetch_ranges(
+        bounds=None, missing_days=[], start=date(2026, 3, 1), end=date(2026, 3, 13)
+    ) == [(date(2026, 3, 1), date(2026, 3, 13))]
+
+
+@pytest.mark.asyncio
+async def test_planner_plans_whole_universe_and_caches_stock_ids(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "market_holiday_dates", ["2026-03-04"])
+    test_db.add_all(
+        [
+            Stock(id=1, symbol="VNM", exchange="HOSE"),
+            Stock(id=2, symbol="FPT", exchange="HOSE"),
+        ]
+    )
+    for offset, day in enumerate([2, 3, 6, 9, 10]):
+        test_db.add(
+            StockPrice(
+                id=offset + 1,
+                stock_id=1,
+                symbol="VNM",
+                time=date(2026, 3, day),
+                open=1.0,
+                high=1.0,
+                low=1.0,
+                close=1.0,
+                volume=1,
+                interval="1D",
+            )
+        )
+    await test_db.commit()
+
+    planner = PriceGapPlanner()
+    plans = await planner.plan(
+        test_db,
+        ["VNM", "FPT", "ZZZ"],
+        start=date(2026, 3, 2),
+        end=date(2026, 3, 12),
+        fill_missing_gaps=True,
+    )
+
+    assert set(plans) == {"VNM", "FPT"}
+    assert plans["VNM"].stock_id == 1
+    assert plans["VNM"].ranges == (
+        (date(2026, 3, 5), date(2026, 3, 5)),
+        (date(2026, 3, 11), date(2026, 3, 12)),
+    )
+    assert plans["FPT"].ranges == ((date(2026, 3, 2), date(2026, 3, 12)),)
+
+    await test_db.delete(await test_db.get(Stock, 2))
+    await test_db.commit()
+    cached = await planner.resolve_stock_ids(test_db, ["FPT"])
+    assert cached == {"FPT": 2}
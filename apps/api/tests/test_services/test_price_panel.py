@@ -0,0 +1,133 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from vnibb.models.stock import Stock, StockPrice
+from vnibb.services.comparison_service import ComparisonService, _performance_window
+from vnibb.services.price_gap_planner import configured_market_holidays, iter_trading_days
+from vnibb.services.price_panel import (
+    HEAD_GAP_TOLERANCE_SESSIONS,
+    _provider_ranges,
+    build_close_panel,
+    forward_fill,
+    rebase,
+)
+
+
+def test_panel_aligns_forward_fills_and_rebases():
+    d1, d2, d3, d4 = (date(2026, 3, day) for day in (2, 3, 4, 5))
+    panel = build_close_panel(
+        {
+            "VNM": {d1: 50.0, d2: 55.0, d4: 60.0},
+            "FPT": {d2: 100.0, d3: 90.0},
+            "BAD": {d1: 0.0, d2: 10.0},
+        },
+        ["VNM", "FPT", "BAD"],
+    )
+
+    assert panel.dates.tolist() == [d1, d2, d3, d4]
+    filled = forward_fill(panel.closes)
+    np.testing.assert_allclose(filled[:, 0], [50.0, 55.0, 55.0, 60.0])
+    assert np.isnan(filled[0, 1])
+    np.testing.assert_allclose(filled[1:, 1], [100.0, 90.0, 90.0])
+
+    rebased = rebase(filled)
+    np.testing.assert_allclose(rebased[:, 0], [100.0, 110.0, 110.0, 120.0])
+    assert np.isnan(rebased[0, 1])
+    np.testing.assert_allclose(rebased[1:, 1], [100.0, 90.0, 90.0])
+    # A non-positive base close pins the series to 100, as before.
+    np.testing.assert_allclose(rebased[:, 2], [100.0] * 4)
+
+
+@pytest.mark.asyncio
+async def test_compare_price_performance_reads_db_and_fetches_only_gaps(
+    test_engine, test_db, monkeypatch
+):
+    start_date, end_date = _performance_window("1M")
+    sessions = list(
+        iter_trading_days(start_date, end_date - timedelta(days=1), configured_market_holidays())
+    )
+    assert len(sessions) >= 5
+    hole = sessions[2]
+
+    for stock_id, symbol in ((1, "VNM"), (2, "FPT"), (3, "HPG")):
+        test_db.add(Stock(id=stock_id, symbol=symbol, exchange="HOSE"))
+    price_id = 0
+    for index, day in enumerate(sessions):
+        for stock_id, symbol, close in ((1, "VNM", 50.0 + index), (2, "FPT", 100.0)):
+            if symbol == "FPT" and day == hole:
+                continue
+            price_id += 1
+            test_db.add(
+                StockPrice(
+                    id=price_id,
+                    stock_id=stock_id,
+                    symbol=symbol,
+                    time=day,
+                    open=close,
+                    high=close,
+                    low=close,
+                    close=close,
+                    volume=1_000,
+                    interval="1D",
+                )
+            )
+    await test_db.commit()
+
+    provider_calls = []
+
+    async def fake_fetch(params):
+        provider_calls.append((params.symbol, params.start_date, params.end_date))
+        if params.symbol == "FPT":
+            return [SimpleNamespace(time=hole, close=120.0)]
+        return [
+            SimpleNamespace(time=sessions[-2], close=20.0),
+            SimpleNamespace(time=sessions[-1], close=30.0),
+        ]
+
+    monkeypatch.setattr(
+        "vnibb.services.price_panel.async_session_maker",
+        async_sessionmaker(test_engine, expire_on_commit=False),
+    )
+    monkeypatch.setattr(
+        "vnibb.providers.vnstock.equity_historical.VnstockEquityHistoricalFetcher.fetch",
+        fake_fetch,
+    )
+
+    history = await ComparisonService().compare_price_performance(["VNM", "FPT", "HPG"], "1M")
+
+    assert sorted(provider_calls) == [("FPT", hole, hole), ("HPG", start_date, end_date)]
+    by_date = {point.date: point.values for point in history}
+    assert list(by_date) == [day.isoformat() for day in sessions]
+    assert by_date[sessions[0].isoformat()] == {"VNM": 100.0, "FPT": 100.0}
+    assert by_date[hole.isoformat()]["FPT"] == pytest.approx(120.0)
+    assert by_date[sessions[-1].isoformat()]["VNM"] == pytest.approx(
+        (50.0 + len(sessions) - 1) / 50.0 * 100
+    )
+    assert by_date[sessions[-1].isoformat()]["HPG"] == pytest.approx(150.0)
+    assert "HPG" not in by_date[sessions[0].isoformat()]
+
+
+def test_all_period_keeps_the_five_year_window():
+    today = date(2026, 10, 19)
+
+    assert _performance_window("ALL", today) == _performance_window("5Y", today)
+    assert _performance_window("10Y", today)[0] < _performance_window("ALL", today)[0]
+
+
+def test_provider_ranges_fetch_history_before_a_short_stored_series():
+    start_date, end_date = date(2021, 10, 18), date(2026, 10, 16)
+    expected = list(iter_trading_days(start_date, end_date, frozenset()))
+    # Only the last year is stored: the four years before it come from the provider.
+    stored = dict.fromkeys(expected[-250:], 10.0)
+
+    assert _provider_ranges(stored, expected, start_date, end_date, frozenset()) == [
+        (start_date, expected[-250] - timedelta(days=1))
+    ]
+
+    # A series starting within the tolerance (e.g. after a holiday run) is complete.
+    late_start = dict.fromkeys(expected[HEAD_GAP_TOLERANCE_SESSIONS:], 10.0)
+    assert _provider_ranges(late_start, expected, start_date, end_date, frozenset()) == []
@@ -0,0 +1,218 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from vnibb.api.v1 import quant
+from vnibb.models.market import RsRotationState, RsSnapshot
+from vnibb.models.stock import StockIndex, StockPrice
+from vnibb.services import rs_snapshot_service as service
+from vnibb.services.rrg_panel import (
+    FAST_SPAN,
+    MOMENTUM_SPAN,
+    SLOW_SPAN,
+    WARMUP_SESSIONS,
+    RrgState,
+    advance_rrg,
+    sector_levels,
+)
+
+SYMBOLS = ("AAA", "BBB", "CCC")
+START = date(2026, 1, 5)
+
+
+def _walk(sessions, columns, seed=7):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.015, (sessions, columns)), axis=0))
+
+
+def _sessions(count):
+    return np.array(pd.bdate_range(START, periods=count).date, dtype="datetime64[D]")
+
+
+def test_panel_matches_per_symbol_ema_reference():
+    dates = _sessions(160)
+    closes = _walk(160, 3)
+    bench = _walk(160, 1, seed=11)[:, 0]
+    closes[:30, 2] = np.nan  # late listing
+
+    _, series = advance_rrg(RrgState.empty(SYMBOLS), dates, closes, bench)
+
+    for column in range(3):
+        rs = pd.Series(closes[:, column] / bench).dropna()
+        ratio = 100 * rs.ewm(span=FAST_SPAN, adjust=False).mean() / rs.ewm(
+            span=SLOW_SPAN, adjust=False
+        ).mean()
+        momentum = 100 * ratio / ratio.ewm(span=MOMENTUM_SPAN, adjust=False).mean()
+        ready = slice(WARMUP_SESSIONS - 1, None)
+        observed = series.rs_ratio[rs.index, column]
+        assert np.isnan(observed[: WARMUP_SESSIONS - 1]).all()
+        np.testing.assert_allclose(observed[ready], ratio.to_numpy()[ready])
+        np.testing.assert_allclose(
+            series.rs_momentum[rs.index, column][ready], momentum.to_numpy()[ready]
+        )
+
+
+def test_carried_state_matches_a_full_replay():
+    dates = _sessions(150)
+    closes = _walk(150, 3)
+    bench = _walk(150, 1, seed=11)[:, 0]
+
+    full_state, full = advance_rrg(RrgState.empty(SYMBOLS), dates, closes, bench)
+    state, _ = advance_rrg(RrgState.empty(SYMBOLS), dates[:120], closes[:120], bench[:120])
+    # Overlapping window: sessions up to the stored as_of date are skipped.
+    state, tail = advance_rrg(state, dates[100:], closes[100:], bench[100:])
+
+    np.testing.assert_allclose(tail.rs_ratio[20:], full.rs_ratio[120:])
+    np.testing.assert_allclose(tail.rs_momentum[20:], full.rs_momentum[120:])
+    assert np.isnan(tail.rs_ratio[:20]).all()
+    np.testing.assert_allclose(state.ema_slow, full_state.ema_slow)
+    assert (state.sessions == 150).all()
+
+
+def test_sector_levels_are_equal_weighted_member_returns():
+    dates = _sessions(40)
+    closes = _walk(40, 3)
+    closes[:10, 1] = np.nan
+    sectors = {"banking": ["AAA", "BBB"], "steel": ["CCC", "ZZZ"], "empty": ["ZZZ"]}
+
+    levels = sector_levels(
+        dates, SYMBOLS, closes, sectors, RrgState.empty(["banking", "empty", "steel"])
+    )
+
+    returns = pd.DataFrame(closes[:, :2]).pct_change(fill_method=None)
+    expected = 100 * (1 + returns.mean(axis=1).fillna(0)).cumprod()
+    np.testing.assert_allclose(levels[:, 0], expected.to_numpy())
+    np.testing.assert_allclose(levels[:, 2], 100 * closes[:, 2] / closes[0, 2])
+    assert np.isnan(levels[:, 1]).all()
+
+
+async def _seed_prices(session, sessions):
+    days = pd.bdate_range(START, periods=sessions).date
+    closes = _walk(sessions, len(SYMBOLS))
+    bench = _walk(sessions, 1, seed=11)[:, 0]
+    rows = []
+    for column, symbol in enumerate(SYMBOLS):
+        for row, day in enumerate(days):
+            close = float(closes[row, column])
+            rows.append(
+                StockPrice(
+                    id=len(rows) + 1,
+                    stock_id=column + 1,
+                    symbol=symbol,
+                    time=day,
+                    open=close,
+                    high=close,
+                    low=close,
+                    close=close,
+                    volume=1_000,
+                    interval="1D",
+                )
+            )
+    for row, day in enumerate(days):
+        close = float(bench[row])
+        rows.append(
+            StockIndex(
+                id=row + 1,
+                index_code="VNINDEX",
+                time=day,
+                open=close,
+                high=close,
+                low=close,
+                close=close,
+                volume=1,
+            )
+        )
+    session.add_all(rows)
+    await session.commit()
+    return list(days)
+
+
+@pytest.mark.asyncio
+async def test_nightly_snapshot_advances_state_and_serves_trails(test_engine, client):
+    sessions = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    async with sessions() as session:
+        days = await _seed_prices(session, 140)
+    sectors = {"banking": ["AAA", "BBB"]}
+
+    first = await service.take_rs_snapshot(
+        sectors=sectors, as_of=days[-3], session_factory=sessions
+    )
+    second = await service.take_rs_snapshot(
+        sectors=sectors, as_of=days[-1], session_factory=sessions
+    )
+
+    assert first == 4 * service.SNAPSHOT_BACKFILL_SESSIONS
+    assert second == 4 * 2
+    async with sessions() as session:
+        states = (await session.execute(select(RsRotationState))).scalars().all()
+        stored = (
+            await session.execute(
+                select(RsSnapshot).where(
+                    RsSnapshot.symbol == "AAA", RsSnapshot.snapshot_date == days[-1]
+                )
+            )
+        ).scalar_one()
+    assert {state.entity: state.as_of_date for state in states} == {
+        "AAA": days[-1],
+        "BBB": days[-1],
+        "CCC": days[-1],
+        "banking": days[-1],
+    }
+    assert all(state.sessions == 140 for state in states)
+
+    # The incremental run matches a one-shot computation over the same bars.
+    async with sessions() as session:
+        live = await service.compute_rotation(
+            session, list(SYMBOLS), start_date=days[0], end_date=days[-1]
+        )
+    live_aaa = next(point for point in live["points"] if point["symbol"] == "AAA")
+    assert stored.rs_ratio == pytest.approx(live_aaa["rs_ratio"], abs=0.01)
+    assert stored.rs_momentum == pytest.approx(live_aaa["rs_momentum"], abs=0.01)
+
+    async with sessions() as session:
+        trail = await service.get_rs_trail("aaa", weeks=4, db=session)
+    assert [point["snapshot_date"] for point in trail] == [
+        days[index].isoformat() for index in (-21, -16, -11, -6, -1)
+    ]
+
+    response = await client.get("/api/v1/quant/rotation/sectors", params={"weeks": 4})
+    assert response.status_code == 200
+    payload = response.json()["data"]
+    assert payload["as_of"] == days[-1].isoformat()
+    assert [point["symbol"] for point in payload["points"]] == ["banking"]
+    assert payload["points"][0]["name"] == "Banking"
+    assert len(payload["points"][0]["trail"]) == 5
+
+    rotation = await client.get("/api/v1/quant/AAA/relative-rotation")
+    data = rotation.json()["data"]
+    assert data["source"] == "snapshot"
+    assert data["selected"]["rs_ratio"] == pytest.approx(stored.rs_ratio, abs=0.01)
+    assert {point["symbol"] for point in data["universe"]} == {"AAA"}
+
+
+@pytest.mark.asyncio
+async def test_relative_rotation_computes_live_before_the_first_snapshot(
+    test_engine, client, monkeypatch
+):
+    sessions = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    async with sessions() as session:
+        days = await _seed_prices(session, 90)
+    today = days[-1] + timedelta(days=1)
+
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return today
+
+    monkeypatch.setattr(quant, "date", FixedDate)
+    response = await client.get("/api/v1/quant/BBB/relative-rotation")
+
+    data = response.json()["data"]
+    assert data["source"] == "live"
+    assert data["selected"]["symbol"] == "BBB"
+    assert data["as_of"] == days[-1].isoformat()
+    assert data["selected"]["quadrant"] in {"Leading", "Weakening", "Lagging", "Improving"}
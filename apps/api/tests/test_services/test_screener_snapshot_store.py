@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from vnibb.models.screener import ScreenerSnapshot
+from vnibb.services.cache_manager import CacheManager
+from vnibb.services.screener_snapshot_store import (
+    ScreenerSnapshotFrame,
+    ScreenerSnapshotRow,
+    screener_snapshot_store,
+)
+
+
+def _snapshot(symbol: str, snapshot_date: date, source: str, **kwargs) -> ScreenerSnapshot:
+    return ScreenerSnapshot(
+        symbol=symbol,
+        snapshot_date=snapshot_date,
+        source=source,
+        created_at=kwargs.pop("created_at", datetime.utcnow()),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_screener_data_reads_latest_partition_from_frame(test_db):
+    today = date.today()
+    test_db.add_all(
+        [
+            _snapshot("VNM", today - timedelta(days=1), "KBS", price=60_000.0),
+            _snapshot("VNM", today, "vnstock_ratio", price=61_000.0, pe=15.0),
+            _snapshot("FPT", today, "vnstock_ratio", price=120_000.0),
+        ]
+    )
+    await test_db.commit()
+
+    manager = CacheManager(db=test_db)
+
+    kbs = await manager.get_screener_data(source="KBS", allow_stale=True)
+    assert kbs.hit is True
+    assert [row.symbol for row in kbs.data] == ["VNM"]
+    assert kbs.data[0].price == 60_000.0
+
+    missing_source = await manager.get_screener_data(source="VCI", allow_stale=True)
+    assert missing_source.hit is True
+    assert sorted(row.symbol for row in missing_source.data) == ["FPT", "VNM"]
+
+    single = await manager.get_screener_data(symbol="vnm", source="vnstock_ratio")
+    assert len(single.data) == 1
+    row = single.data[0]
+    assert isinstance(row, ScreenerSnapshotRow)
+    assert row.pe == 15.0
+    assert getattr(row, "change_1d", None) is None
+    with pytest.raises(AttributeError):
+        row.price = 1.0
+
+
+@pytest.mark.asyncio
+async def test_get_screener_data_treats_old_snapshot_as_stale_miss(test_db):
+    old_date = date.today() - timedelta(days=CacheManager.MAX_STALE_DAYS + 3)
+    test_db.add(_snapshot("VNM", old_date, "KBS", price=60_000.0))
+    await test_db.commit()
+
+    result = await CacheManager(db=test_db).get_screener_data(source="KBS")
+
+    assert result.hit is False
+    assert result.is_stale is True
+
+
+@pytest.mark.asyncio
+async def test_frame_is_shared_until_rebuilt(test_db):
+    today = date.today()
+    test_db.add(_snapshot("VNM", today, "KBS", price=60_000.0))
+    await test_db.commit()
+
+    first = await screener_snapshot_store.get_frame(test_db)
+    assert await screener_snapshot_store.get_frame(test_db) is first
+
+    test_db.add(_snapshot("HPG", today, "KBS", price=25_000.0))
+    await test_db.commit()
+    assert len(await screener_snapshot_store.get_frame(test_db)) == 1
+
+    await screener_snapshot_store.refresh_after_write(test_db)
+    rebuilt = screener_snapshot_store.frame
+    assert rebuilt is not first
+    assert sorted(row.symbol for row in rebuilt.select(snapshot_date=today, source="KBS")) == [
+        "HPG",
+        "VNM",
+    ]
+
+
+def test_empty_frame_selects_nothing():
+    frame = ScreenerSnapshotFrame.from_rows([])
+
+    assert frame.is_empty
+    assert frame.latest_date() is None
+    assert frame.select(snapshot_date=date.today()) == []
@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from vnibb.core.config import settings
+from vnibb.models.news_sentiment import NewsSentimentResult
+from vnibb.services.sentiment_analyzer import SentimentAnalyzer, sentiment_content_hash
+from vnibb.services.sentiment_queue import SentimentQueue
+
+
+class StubBackend:
+    """Deterministic local model: bullish iff the title mentions "lãi"."""
+
+    name = "stub-model"
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def analyze_many(self, articles):
+        self.batches.append([article["title"] for article in articles])
+        return [
+            {
+                "sentiment": "bullish" if "lãi" in article["title"].lower() else "bearish",
+                "confidence": 90,
+                "symbols": [],
+                "sectors": [],
+                "ai_summary": f"stub: {article['title']}",
+            }
+            for article in articles
+        ]
+
+
+@pytest.fixture
+def ai_enabled(monkeypatch, test_engine):
+    monkeypatch.setattr(settings, "enable_ai_sentiment_analysis", True)
+    monkeypatch.setattr(settings, "sentiment_batch_size", 3)
+    monkeypatch.setattr(
+        "vnibb.core.database.async_session_maker",
+        async_sessionmaker(test_engine, expire_on_commit=False),
+    )
+
+
+def test_content_hash_ignores_case_punctuation_and_whitespace():
+    assert sentiment_content_hash("VNM lãi kỷ lục!", summary="Quý  III") == sentiment_content_hash(
+        "vnm lãi kỷ lục", summary="quý III."
+    )
+    assert sentiment_content_hash("VNM lãi kỷ lục") != sentiment_content_hash("VNM lỗ kỷ lục")
+
+
+@pytest.mark.asyncio
+async def test_batch_packs_unique_articles_and_memoizes_by_content(ai_enabled, test_db):
+    backend = StubBackend()
+    analyzer = SentimentAnalyzer(backend=backend)
+    articles = [{"title": f"Tin {index} lãi"} for index in range(5)]
+    # Syndicated copies of the first two articles.
+    articles += [{"title": "TIN 0 LÃI!"}, {"title": "tin 1   lãi"}]
+
+    results = await analyzer.analyze_batch(articles)
+
+    assert [len(batch) for batch in backend.batches] == [3, 2]
+    assert results[5] == results[0]
+    assert results[6] == results[1]
+    assert {result["sentiment"] for result in results} == {"bullish"}
+
+    stored = await test_db.scalar(select(func.count()).select_from(NewsSentimentResult))
+    assert stored == 5
+
+    # A fresh process (empty memory cache) reads the persisted verdicts.
+    restarted_backend = StubBackend()
+    restarted = SentimentAnalyzer(backend=restarted_backend)
+    again = await restarted.analyze_batch(articles[:2])
+    assert restarted_backend.batches == []
+    assert again == results[:2]
+
+
+@pytest.mark.asyncio
+async def test_queue_read_never_waits_on_the_model(ai_enabled, test_db):
+    backend = StubBackend()
+    queue = SentimentQueue(SentimentAnalyzer(backend=backend), max_size=10)
+    article = {"title": "HPG lỗ quý III", "summary": "Giá thép giảm mạnh"}
+
+    provisional = await queue.read([article, dict(article)])
+
+    assert backend.batches == []
+    assert len(queue) == 1
+    assert provisional[0]["ai_summary"] == "HPG lỗ quý III"
+
+    assert await queue.drain() == 1
+    assert backend.batches == [["HPG lỗ quý III"]]
+
+    scored = await queue.read([article])
+    assert scored[0]["ai_summary"] == "stub: HPG lỗ quý III"
+    assert len(queue) == 0
@@ -0,0 +1,202 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from vnibb.services import data_pipeline as data_pipeline_module
+from vnibb.services.data_pipeline import DataPipeline, RateLimiter
+from vnibb.services.stage_dag import (
+    StageGraph,
+    StageSpec,
+    init_stage_progress,
+    run_stage_graph,
+    summarize_progress,
+)
+
+
+def test_stage_graph_orders_validates_and_subsets():
+    graph = StageGraph(
+        [
+            StageSpec("b", depends_on=("a",)),
+            StageSpec("a"),
+            StageSpec("c", depends_on=("b",)),
+        ]
+    )
+    assert graph.order == ["a", "b", "c"]
+    assert graph.subset(["a", "c"]).specs["c"].depends_on == ()
+
+    with pytest.raises(ValueError, match="cycle"):
+        StageGraph([StageSpec("a", depends_on=("b",)), StageSpec("b", depends_on=("a",))])
+    with pytest.raises(ValueError, match="unknown"):
+        StageGraph([StageSpec("a", depends_on=("missing",))])
+
+
+@pytest.mark.asyncio
+async def test_run_stage_graph_overlaps_independent_stages_and_respects_pools():
+    graph = StageGraph(
+        [
+            StageSpec("root"),
+            StageSpec("left", depends_on=("root",)),
+            StageSpec("right", depends_on=("root",)),
+            StageSpec("bulk_a", pool="bulk"),
+            StageSpec("bulk_b", pool="bulk"),
+        ]
+    )
+    active: set[str] = set()
+    overlaps: list[frozenset[str]] = []
+    finished: list[str] = []
+
+    async def runner(stage: str) -> None:
+        if stage in {"left", "right"}:
+            assert "root" in finished
+        active.add(stage)
+        overlaps.append(frozenset(active))
+        await asyncio.sleep(0.01)
+        active.discard(stage)
+        finished.append(stage)
+
+    ran = await run_stage_graph(
+        graph, runner, completed={"bulk_b"}, max_parallel=4, pool_limits={"bulk": 1}
+    )
+
+    assert sorted(ran) == ["bulk_a", "left", "right", "root"]
+    assert any({"left", "right"} <= snapshot for snapshot in overlaps)
+    assert any({"root", "bulk_a"} <= snapshot for snapshot in overlaps)
+    assert "bulk_b" not in finished
+
+
+@pytest.mark.asyncio
+async def test_run_stage_graph_cancels_in_flight_stages_on_failure():
+    graph = StageGraph([StageSpec("slow"), StageSpec("broken")])
+    cancelled = asyncio.Event()
+
+    async def runner(stage: str) -> None:
+        if stage == "broken":
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await run_stage_graph(graph, runner, max_parallel=2)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stage_dag_resumes_per_stage_and_checkpoints_root(monkeypatch):
+    pipeline = DataPipeline()
+    saved: list[dict] = []
+
+    async def fake_save_progress(data, key=None, ttl=None):
+        saved.append(dict(data))
+
+    async def fake_update_sync_record(sync_id, **kwargs):
+        return None
+
+    monkeypatch.setattr(pipeline, "_save_progress", fake_save_progress)
+    monkeypatch.setattr(pipeline, "_update_sync_record", fake_update_sync_record)
+
+    # Legacy flat cursor: stock_list/screener done, profiles interrupted at FPT.
+    progress = {
+        "job_id": "full-test",
+        "status": "running",
+        "stage": "profiles",
+        "stage_index": 2,
+        "last_symbol": "FPT",
+        "success_count": 7,
+        "error_count": 1,
+        "stage_stats": {"profiles": {"success": 7, "errors": 1, "total": 20}},
+    }
+    seen: dict[str, dict] = {}
+
+    async def runner(stage, stage_progress):
+        seen[stage] = dict(stage_progress)
+        stage_progress["success_count"] += 2
+        await pipeline._checkpoint(stage_progress, 1)
+
+    graph = data_pipeline_module.FULL_SEEDING_GRAPH.subset(["stock_list", "screener", "profiles", "indices"])
+    await pipeline._run_stage_dag(
+        graph,
+        runner,
+        progress,
+        1,
+        legacy_order=data_pipeline_module.STAGE_ORDER,
+    )
+
+    assert set(seen) == {"profiles", "indices"}
+    assert seen["profiles"]["stage"] == "profiles"
+    assert seen["profiles"]["last_symbol"] == "FPT"
+    assert progress["stages"]["profiles"]["status"] == "completed"
+    assert progress["success_count"] == 11
+    assert progress["stage_stats"]["profiles"]["total"] == 20
+    assert all("stages" in document for document in saved)
+
+
+def test_init_stage_progress_and_summary_report_eta():
+    graph = StageGraph([StageSpec("prices"), StageSpec("indices")])
+    progress = {"job_id": "full-x", "status": "running", "started_at": "2026-03-02T00:00:00", "stages": {}}
+    slices = init_stage_progress(progress, graph)
+    slices["prices"].update(
+        {
+            "status": "running",
+            "started_at": "2026-03-02T00:00:00",
+            "stage_stats": {"prices": {"success": 90, "errors": 10, "total": 400}},
+        }
+    )
+    slices["indices"].update(
+        {
+            "status": "completed",
+            "started_at": "2026-03-02T00:00:00",
+            "finished_at": "2026-03-02T00:00:10",
+            "success_count": 4,
+        }
+    )
+
+    summary = summarize_progress(progress, now=datetime(2026, 3, 2, 0, 1, 40))
+    by_stage = {row["stage"]: row for row in summary["stages"]}
+
+    assert by_stage["prices"]["throughput_per_second"] == 1.0
+    assert by_stage["prices"]["eta_seconds"] == 300.0
+    assert by_stage["indices"]["eta_seconds"] == 0.0
+    assert summary["eta_seconds"] == pytest.approx(288.5, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_concurrent_callers():
+    limiter = RateLimiter(calls_per_minute=600)
+    loop = asyncio.get_event_loop()
+    stamps: list[float] = []
+
+    async def call():
+        await limiter.wait()
+        stamps.append(loop.time())
+
+    await asyncio.gather(*(call() for _ in range(3)))
+    stamps.sort()
+    assert stamps[2] - stamps[0] >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_sync_progress_endpoint_reports_active_runs(client, monkeypatch):
+    async def fake_load_progress(key=data_pipeline_module.SYNC_PROGRESS_KEY):
+        if key != data_pipeline_module.SYNC_PROGRESS_KEY:
+            return None
+        return {
+            "job_id": "full-abc",
+            "status": "running",
+            "running_stages": ["prices"],
+            "stages": {"prices": {"status": "running", "success_count": 3}},
+        }
+
+    monkeypatch.setattr(data_pipeline_module.data_pipeline, "_load_progress", fake_load_progress)
+
+    response = await client.get("/api/v1/data/sync/progress")
+
+    assert response.status_code == 200
+    runs = {run["sync_type"]: run for run in response.json()}
+    assert runs["full"]["active"] is True
+    assert runs["full"]["running_stages"] == ["prices"]
+    assert runs["full"]["stages"][0]["processed"] == 3
+    assert runs["daily_trading"]["active"] is False
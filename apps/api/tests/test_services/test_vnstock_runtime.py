@@ -0,0 +1,133 @@
+import asyncio
+import threading
+
+import pytest
+
+from vnibb.providers.vnstock import runtime as runtime_module
+from vnibb.providers.vnstock.runtime import VnstockRuntime
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_calls_share_one_execution():
+    runtime = VnstockRuntime(max_workers=2)
+    release = threading.Event()
+    executions = []
+
+    def fetch():
+        executions.append(1)
+        release.wait(timeout=5)
+        return [{"symbol": "VNM", "close": 70.0}]
+
+    first = asyncio.create_task(runtime.call("quote", fetch, key={"symbol": "VNM"}))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(runtime.call("quote", fetch, key={"symbol": "VNM"}))
+    await asyncio.sleep(0.01)
+    release.set()
+    left, right = await asyncio.gather(first, second)
+
+    assert len(executions) == 1
+    assert left == right
+    left[0]["close"] = 0.0
+    assert right[0]["close"] == 70.0
+
+    metrics = runtime.metrics()["fetchers"]["quote"]
+    assert metrics["calls"] == 1
+    assert metrics["coalesced"] == 1
+    assert metrics["in_flight"] == 0
+    assert metrics["queued"] == 0
+    assert runtime.metrics()["in_flight_keys"] == 0
+    runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_calls_without_key_are_not_coalesced_and_errors_are_counted():
+    runtime = VnstockRuntime(max_workers=2)
+    executions = []
+
+    def fetch():
+        executions.append(1)
+        return len(executions)
+
+    def broken():
+        raise ValueError("provider down")
+
+    await asyncio.gather(runtime.call("listing", fetch), runtime.call("listing", fetch))
+    with pytest.raises(ValueError):
+        await runtime.call("listing", broken)
+
+    assert len(executions) == 2
+    metrics = runtime.metrics()["fetchers"]["listing"]
+    assert metrics["calls"] == 3
+    assert metrics["errors"] == 1
+    assert metrics["p95_ms"] is not None
+    runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_counted_and_queue_depth_reflects_saturation():
+    runtime = VnstockRuntime(max_workers=1)
+    release = threading.Event()
+
+    def slow():
+        release.wait(timeout=5)
+        return "done"
+
+    blocker = asyncio.create_task(runtime.call("intraday", slow, key="a"))
+    await asyncio.sleep(0.01)
+    queued = asyncio.create_task(runtime.call("intraday", slow, key="b"))
+    await asyncio.sleep(0.01)
+    assert runtime.metrics()["fetchers"]["intraday"]["queued"] == 1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await runtime.call("intraday", slow, key="a", timeout=0.01)
+    release.set()
+
+    assert await blocker == "done"
+    assert await queued == "done"
+    metrics = runtime.metrics()["fetchers"]["intraday"]
+    assert metrics["timeouts"] == 1
+    assert metrics["queued"] == 0
+    runtime.shutdown()
+
+
+def test_stock_clients_are_reused_per_symbol_and_source(monkeypatch):
+    created = []
+
+    class FakeVnstock:
+        def stock(self, symbol, source):
+            created.append((symbol, source))
+            return object()
+
+    monkeypatch.setattr(runtime_module, "get_vnstock_class", lambda: FakeVnstock)
+    runtime = VnstockRuntime()
+
+    first = runtime.stock_client("VNM", "KBS")
+    assert runtime.stock_client("VNM", "KBS") is first
+    assert runtime.stock_client("VNM", "VCI") is not first
+    assert created == [("VNM", "KBS"), ("VNM", "VCI")]
+
+    runtime.clear_clients()
+    runtime.stock_client("VNM", "KBS")
+    assert len(created) == 3
+
+
+@pytest.mark.asyncio
+async def test_counters_stay_consistent_across_many_worker_threads():
+    runtime = VnstockRuntime(max_workers=8)
+
+    def fetch(index):
+        if index % 10 == 0:
+            raise ValueError("provider down")
+        return index
+
+    results = await asyncio.gather(
+        *(runtime.call("ratios", lambda index=index: fetch(index)) for index in range(400)),
+        return_exceptions=True,
+    )
+
+    metrics = runtime.metrics()["fetchers"]["ratios"]
+    assert metrics["calls"] == len(results) == 400
+    assert metrics["errors"] == sum(isinstance(result, ValueError) for result in results) == 40
+    assert metrics["in_flight"] == 0
+    assert metrics["queued"] == 0
+    runtime.shutdown()
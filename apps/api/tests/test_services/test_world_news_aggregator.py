@@ -0,0 +1,250 @@
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from vnibb.models.world_news import WorldNewsArticleRecord, WorldNewsFeedState
+from vnibb.services import world_news_service
+from vnibb.services.world_news_aggregator import (
+    FEED_STATUS_FAILED,
+    FEED_STATUS_NOT_MODIFIED,
+    FEED_STATUS_OK,
+    WorldNewsAggregator,
+    next_poll_interval,
+)
+from vnibb.services.world_news_service import (
+    FeedFetchResult,
+    WorldNewsArticle,
+    WorldNewsFailedFeed,
+    WorldNewsSourceConfig,
+    get_world_news_feed,
+)
+
+
+def _source(source_id: str, category: str = "markets") -> WorldNewsSourceConfig:
+    return WorldNewsSourceConfig(
+        id=source_id,
+        name=source_id.title(),
+        domain=f"{source_id}.example",
+        region="vietnam",
+        category=category,
+        language="vi",
+        tier=1,
+        homepage_url=f"https://{source_id}.example",
+        feed_urls=(f"https://{source_id}.example/rss",),
+    )
+
+
+def _article(source: WorldNewsSourceConfig, slug: str, published_at: datetime) -> WorldNewsArticle:
+    return WorldNewsArticle(
+        id=f"{source.id}-{slug}",
+        title=f"{slug.replace('-', ' ').title()} headline",
+        source_id=source.id,
+        source=source.name,
+        source_domain=source.domain,
+        source_url=source.homepage_url,
+        feed_url=source.feed_urls[0],
+        url=f"https://{source.domain}/{slug}",
+        published_at=published_at,
+        region=source.region,
+        category=source.category,
+        language=source.language,
+        tags=[source.category],
+        relevance_score=0.8,
+    )
+
+
+def test_next_poll_interval_follows_publish_cadence_and_backs_off():
+    now = datetime.now(UTC)
+    hourly = [now - timedelta(hours=offset) for offset in range(5)]
+
+    assert (
+        next_poll_interval(
+            600,
+            status=FEED_STATUS_OK,
+            published_at=hourly,
+            new_articles=2,
+            min_seconds=120,
+            max_seconds=3600,
+        )
+        == 1800
+    )
+    assert (
+        next_poll_interval(600, status=FEED_STATUS_NOT_MODIFIED, min_seconds=120, max_seconds=3600)
+        == 900
+    )
+    assert (
+        next_poll_interval(2400, status=FEED_STATUS_FAILED, min_seconds=120, max_seconds=3600)
+        == 3600
+    )
+    bursty = [now - timedelta(seconds=30 * offset) for offset in range(5)]
+    assert (
+        next_poll_interval(
+            600,
+            status=FEED_STATUS_OK,
+            published_at=bursty,
+            new_articles=5,
+            min_seconds=120,
+            max_seconds=3600,
+        )
+        == 120
+    )
+
+
+@pytest.mark.asyncio
+async def test_poll_upserts_articles_and_uses_conditional_validators(test_db, monkeypatch):
+    markets = _source("markets")
+    broken = _source("broken", category="business")
+    now = datetime.utcnow()
+    published = datetime.now(UTC) - timedelta(hours=1)
+    seen_validators: list[tuple[str, str | None]] = []
+
+    async def fake_fetch_feed(_client, source, feed_url, *, etag=None, last_modified=None):
+        seen_validators.append((source.id, etag))
+        if source.id == "broken":
+            return FeedFetchResult(
+                articles=[],
+                failed=True,
+                failed_feed=world_news_service._failed_feed(source, feed_url, reason="HTTP 503"),
+            )
+        if etag == '"v1"':
+            return FeedFetchResult(articles=[], not_modified=True, etag=etag)
+        return FeedFetchResult(
+            articles=[
+                _article(markets, "vn-index-rallies", published),
+                _article(markets, "banks-lead", published - timedelta(minutes=30)),
+            ],
+            etag='"v1"',
+            last_modified="Sun, 18 Oct 2026 08:00:00 GMT",
+        )
+
+    monkeypatch.setattr(world_news_service, "WORLD_NEWS_SOURCES", (markets, broken))
+    monkeypatch.setattr(world_news_service, "_fetch_feed", fake_fetch_feed)
+    aggregator = WorldNewsAggregator()
+
+    first = await aggregator.poll(test_db, now=now)
+    assert first["feeds_due"] == 2
+    assert first["new_articles"] == 2
+    assert first["failed"] == 1
+
+    records = (await test_db.execute(select(WorldNewsArticleRecord))).scalars().all()
+    assert {record.id for record in records} == {"markets-vn-index-rallies", "markets-banks-lead"}
+    assert all(record.published_at.tzinfo is None for record in records)
+
+    states = {
+        state.source_id: state
+        for state in (await test_db.execute(select(WorldNewsFeedState))).scalars().all()
+    }
+    assert states["markets"].etag == '"v1"'
+    assert states["markets"].last_status == FEED_STATUS_OK
+    assert states["broken"].last_status == FEED_STATUS_FAILED
+    assert states["broken"].consecutive_failures == 1
+    assert states["markets"].next_poll_at > now
+
+    idle = await aggregator.poll(test_db, now=now + timedelta(seconds=1))
+    assert idle["feeds_due"] == 0
+
+    second = await aggregator.poll(test_db, force=True, now=now + timedelta(minutes=5))
+    assert second["not_modified"] == 1
+    assert second["new_articles"] == 0
+    assert ("markets", '"v1"') in seen_validators
+    await test_db.refresh(states["markets"])
+    assert states["markets"].last_status == FEED_STATUS_NOT_MODIFIED
+    await aggregator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_world_news_feed_reads_store_without_fetching(test_db, monkeypatch):
+    markets = _source("markets")
+    broken = _source("broken", category="business")
+    published = datetime.now(UTC) - timedelta(hours=2)
+    now = datetime.utcnow()
+
+    async def fake_fetch_feed(_client, source, feed_url, *, etag=None, last_modified=None):
+        if source.id == "broken":
+            return FeedFetchResult(
+                articles=[],
+                failed=True,
+                failed_feed=world_news_service._failed_feed(source, feed_url, reason="HTTP 503"),
+            )
+        return FeedFetchResult(
+            articles=[
+                _article(markets, "vn-index-rallies", published),
+                _article(markets, "stale-story", published - timedelta(days=5)),
+            ]
+        )
+
+    monkeypatch.setattr(world_news_service, "WORLD_NEWS_SOURCES", (markets, broken))
+    monkeypatch.setattr(world_news_service, "_fetch_feed", fake_fetch_feed)
+    await WorldNewsAggregator().poll(test_db, now=now)
+
+    async def unexpected_fetch(*_args, **_kwargs):
+        raise AssertionError("stored reads must not fetch feeds")
+
+    monkeypatch.setattr(world_news_service, "_fetch_feed", unexpected_fetch)
+    response = await get_world_news_feed(region="vietnam", freshness_hours=24, db=test_db)
+
+    assert [article.id for article in response.articles] == ["markets-vn-index-rallies"]
+    assert response.articles[0].live is False
+    assert response.articles[0].published_at == published
+    assert response.failed_feed_count == 1
+    assert isinstance(response.failed_feeds[0], WorldNewsFailedFeed)
+    assert response.failed_feeds[0].reason == "HTTP 503"
+    assert response.fetched_at == now.replace(tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_sends_validators_and_handles_not_modified():
+    source = _source("cond")
+    requests: list[httpx.Request] = []
+
+    async def handler(request):
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"abc"':
+            return httpx.Response(304, headers={"etag": '"abc"'})
+        return httpx.Response(
+            200,
+            headers={"etag": '"abc"', "last-modified": "Sun, 18 Oct 2026 08:00:00 GMT"},
+            content=b"<rss><channel></channel></rss>",
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        fresh = await world_news_service._fetch_feed(client, source, source.feed_urls[0])
+        cached = await world_news_service._fetch_feed(
+            client, source, source.feed_urls[0], etag=fresh.etag
+        )
+
+    assert fresh.etag == '"abc"'
+    assert fresh.last_modified == "Sun, 18 Oct 2026 08:00:00 GMT"
+    assert cached.not_modified is True
+    assert cached.failed is False
+    assert requests[1].headers["if-none-match"] == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_retention_keeps_articles_a_feed_still_carries(test_db, monkeypatch):
+    markets = _source("markets")
+    start = datetime.utcnow()
+    published = datetime.now(UTC) - timedelta(days=30)
+    carried = [_article(markets, "evergreen", published)]
+
+    async def fake_fetch_feed(_client, source, feed_url, *, etag=None, last_modified=None):
+        return FeedFetchResult(articles=list(carried))
+
+    monkeypatch.setattr(world_news_service, "WORLD_NEWS_SOURCES", (markets,))
+    monkeypatch.setattr(world_news_service, "_fetch_feed", fake_fetch_feed)
+    aggregator = WorldNewsAggregator()
+    await aggregator.poll(test_db, now=start)
+
+    carried.append(_article(markets, "dropped-soon", published))
+    await aggregator.poll(test_db, force=True, now=start + timedelta(days=1))
+
+    carried.pop()
+    later = await aggregator.poll(test_db, force=True, now=start + timedelta(days=20))
+
+    assert later["pruned"] == 1
+    assert later["new_articles"] == 0
+    records = (await test_db.execute(select(WorldNewsArticleRecord))).scalars().all()
+    assert [record.id for record in records] == ["markets-evergreen"]
+    assert records[0].first_seen_at == start
@@ -33,7 +33,7 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Query, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import HTTPException, RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -46,9 +46,15 @@ from vnibb.core.appwrite_client import check_appwrite_connectivity
 from vnibb.core.cache import redis_client
 from vnibb.core.config import settings
 from vnibb.core.exceptions import VniBBException
+from vnibb.core.instrumentation import timeline_store
 from vnibb.core.logging_config import setup_logging
-from vnibb.core.middleware import APIVersionMiddleware, RequestLoggingMiddleware
+from vnibb.core.middleware import (
+    APIVersionMiddleware,
+    ConditionalRequestMiddleware,
+    RequestLoggingMiddleware,
+)
 from vnibb.core.monitoring import init_monitoring
+from vnibb.core.pagination import NEXT_CURSOR_HEADER
 from vnibb.middleware.metrics import MetricsMiddleware, metrics_registry
 from vnibb.middleware.rate_limit import RateLimitMiddleware
 from vnibb.models.api_errors import (
@@ -56,6 +62,7 @@ from vnibb.models.api_errors import (
     ValidationError,
     ValidationErrorResponse,
 )
+from vnibb.services.data_versions import ENDPOINT_VERSION_PROBES
 
 # Configure structured logging
 setup_logging()
@@ -196,6 +203,7 @@ class RequestTimeoutMiddleware(BaseHTTPMiddleware):
         "/ready",
         "/health",
         "/metrics",
+        "/api/v1/admin/profiler",
         "/docs",
         "/openapi.json",
         "/redoc",
@@ -235,6 +243,7 @@ class ResponseCacheControlMiddleware(BaseHTTPMiddleware):
 
     Classes:
     - real_time: never cached
+    - revalidate: stored but revalidated on every use (ETag-backed polls)
     - near_real_time: short caching with stale-while-revalidate
     - staticish: longer caching with stale-while-revalidate
     """
@@ -243,10 +252,14 @@ class ResponseCacheControlMiddleware(BaseHTTPMiddleware):
         re.compile(r"^/health(/|$)"),
         re.compile(r"^/live/?$"),
         re.compile(r"^/ready/?$"),
-        re.compile(r"^/api/v1/equity/[^/]+/quote/?$"),
         re.compile(r"^/api/v1/ws(/|$)"),
     )
 
+    REVALIDATE_PATTERNS = (
+        re.compile(r"^/api/v1/equity/[^/]+/quote/?$"),
+        re.compile(r"^/api/v1/market/(indices|freshness)/?$"),
+    )
+
     NEAR_REAL_TIME_PATTERNS = (
         re.compile(r"^/api/v1/screener(/|$)"),
         re.compile(r"^/api/v1/alerts(/|$)"),
@@ -268,6 +281,7 @@ class ResponseCacheControlMiddleware(BaseHTTPMiddleware):
 
     CACHE_HEADERS = {
         "real_time": "no-store, max-age=0",
+        "revalidate": "no-cache",
         "near_real_time": "public, max-age=30, stale-while-revalidate=90",
         "staticish": "public, max-age=300, stale-while-revalidate=1800",
     }
@@ -277,6 +291,9 @@ class ResponseCacheControlMiddleware(BaseHTTPMiddleware):
         if any(pattern.match(path) for pattern in cls.REAL_TIME_PATTERNS):
             return "real_time"
 
+        if any(pattern.match(path) for pattern in cls.REVALIDATE_PATTERNS):
+            return "revalidate"
+
         if any(pattern.match(path) for pattern in cls.NEAR_REAL_TIME_PATTERNS):
             return "near_real_time"
 
@@ -291,7 +308,8 @@ class ResponseCacheControlMiddleware(BaseHTTPMiddleware):
         if request.method not in {"GET", "HEAD"}:
             return response
 
-        if response.status_code < 200 or response.status_code >= 300:
+        # 304s carry the same cache policy as the 200 they revalidate.
+        if response.status_code != 304 and not 200 <= response.status_code < 300:
             return response
 
         if response.headers.get("Cache-Control"):
@@ -506,6 +524,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.warning(f"Scheduler start failed (non-fatal): {e}")
 
+    # Background sentiment scoring; read paths only enqueue cache misses
+    try:
+        from vnibb.services.sentiment_queue import sentiment_queue
+
+        sentiment_queue.start()
+    except Exception as e:
+        logger.warning(f"Sentiment queue start failed (non-fatal): {e}")
+
     # Start WebSocket price broadcaster for real-time updates
 
     if _env_flag("SKIP_WEBSOCKET_STARTUP", False):
@@ -550,6 +576,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Scheduler shutdown error: {e}")
 
+    from vnibb.providers.vnstock.runtime import vnstock_runtime
+
+    vnstock_runtime.shutdown()
+
+    try:
+        from vnibb.services.world_news_aggregator import world_news_aggregator
+
+        await world_news_aggregator.aclose()
+    except Exception as e:
+        logger.warning(f"World news aggregator shutdown error: {e}")
+
+    try:
+        from vnibb.services.sentiment_queue import sentiment_queue
+
+        await sentiment_queue.stop()
+    except Exception as e:
+        logger.warning(f"Sentiment queue shutdown error: {e}")
+
     if settings.redis_url:
         await redis_client.disconnect()
 
@@ -579,6 +623,10 @@ def create_app() -> FastAPI:
     # Initialize monitoring (Sentry) - must be done early
     init_monitoring(app)
 
+    # Answer unchanged polls with 304 from data version stamps; innermost so
+    # probes stay behind the rate limiter.
+    app.add_middleware(ConditionalRequestMiddleware, probes=ENDPOINT_VERSION_PROBES)
+
     # Add Rate Limiting Middleware
     app.add_middleware(RateLimitMiddleware, requests_per_minute=120)
 
@@ -620,7 +668,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["*"],
+        # "*" is literal for credentialed requests, so name the cursor header.
+        expose_headers=["*", NEXT_CURSOR_HEADER],
     )
 
     # Exception Handlers with explicit CORS headers and standardized error format
@@ -714,6 +763,21 @@ def create_app() -> FastAPI:
             media_type="text/plain; version=0.0.4",
         )
 
+    @app.get("/metrics/timelines", include_in_schema=False)
+    async def metrics_timelines(
+        limit: int = Query(20, ge=1, le=100),
+        route: str | None = Query(None, max_length=200),
+        min_ms: float = Query(0.0, ge=0.0),
+    ):
+        """Recent slow or sampled request timelines, newest first."""
+        return {
+            "slow_ms": settings.request_timeline_slow_ms,
+            "sample_rate": settings.request_timeline_sample_rate,
+            "timelines": timeline_store.recent(
+                limit=limit, route_contains=route, min_duration_ms=min_ms
+            ),
+        }
+
     @app.get("/debug", tags=["Debug"])
     async def debug_status():
         """Lightweight debug endpoint for sync and dependency status."""
@@ -3,6 +3,7 @@
 import hmac
 import json
 import logging
+import os
 import re
 from collections import Counter
 from datetime import datetime, timedelta
@@ -20,6 +21,8 @@ from vnibb.core.cache import redis_client
 from vnibb.core.config import settings
 from vnibb.core.database import engine, get_db
 from vnibb.core.middleware.logging import get_recent_error_events
+from vnibb.core.profiler import ProfilerBusyError, sampling_profiler, summarize_session
+from vnibb.providers.vnstock.runtime import vnstock_runtime
 from vnibb.services.ai_model_catalog_service import ai_model_catalog_service
 from vnibb.services.ai_prompt_library_service import ai_prompt_library_service
 from vnibb.services.ai_runtime_config_service import ai_runtime_config_service
@@ -83,6 +86,7 @@ def _vnstock_runtime_status() -> Dict[str, Any]:
         "preferred_runtime": "vnstock_data" if packages["vnstock_data"]["installed"] else "vnstock",
         "sponsor_packages_installed": all(packages[name]["installed"] for name in sponsor_names),
         "packages": packages,
+        "executor": vnstock_runtime.metrics(),
     }
 
 TABLE_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
@@ -317,6 +321,28 @@ async def get_provider_status() -> Dict[str, Any]:
     }
 
 
+@router.post("/profiler/sample", dependencies=[Depends(require_admin_access)])
+async def sample_worker_profile(
+    seconds: float = Query(default=10.0, ge=0.5, le=120.0),
+    interval_ms: float = Query(default=10.0, ge=1.0, le=200.0),
+    route: Optional[str] = Query(default=None, max_length=200, description="Route substring"),
+    max_stacks: int = Query(default=500, ge=10, le=5000),
+) -> Dict[str, Any]:
+    """Sample this worker's Python stacks for ``seconds`` against live traffic.
+
+    Returns collapsed stacks (``frame;frame;frame count`` lines, ready for
+    flamegraph.pl / speedscope), overall and per route template.
+    """
+    try:
+        session = await sampling_profiler.profile(seconds, interval_ms / 1000)
+    except ProfilerBusyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return {
+        "worker_pid": os.getpid(),
+        **summarize_session(session, route=route, max_stacks=max_stacks),
+    }
+
+
 @router.get("/mongo/collections", dependencies=[Depends(require_admin_access)])
 async def inspect_mongo_collections(
     name_filter: Optional[str] = Query(default=None, description="Optional case-insensitive collection-name filter"),
@@ -1638,6 +1664,10 @@ async def trigger_seed(seed_type: str, background_tasks: BackgroundTasks):
         background_tasks.add_task(data_pipeline.sync_stock_list)
     elif seed_type == "screener":
         background_tasks.add_task(data_pipeline.sync_screener_data)
+    elif seed_type == "news_links":
+        from vnibb.services.news_symbol_linker import run_news_symbol_link_backfill
+
+        background_tasks.add_task(run_news_symbol_link_backfill)
     else:
         raise HTTPException(status_code=400, detail="Invalid seed type")
 
@@ -25,12 +25,12 @@ async def _build_comparison_response(symbols: str, period: str) -> ComparisonRes
 
 @router.get("/performance")
 async def get_multi_performance(
-    symbols: str = Query(..., description="Comma-separated stock symbols (max 5)"),
-    days: int = Query(30, ge=7, le=365),
+    symbols: str = Query(..., description="Comma-separated stock symbols (max 40)"),
+    days: int = Query(30, ge=7, le=3650),
     period: str | None = Query(
         default=None,
-        pattern=r"^(1M|3M|6M|1Y|3Y|5Y|YTD|ALL)$",
-        description="Optional period override: 1M, 3M, 6M, 1Y, 3Y, 5Y, YTD, ALL",
+        pattern=r"^(1M|3M|6M|1Y|3Y|5Y|10Y|YTD|ALL)$",
+        description="Optional period override: 1M, 3M, 6M, 1Y, 3Y, 5Y, 10Y, YTD, ALL",
     ),
 ):
     """
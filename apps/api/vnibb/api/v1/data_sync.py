@@ -144,6 +144,49 @@ async def get_sync_history(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class SyncRunProgress(BaseModel):
+    """Live progress of one resumable pipeline run."""
+
+    sync_type: str
+    active: bool
+    job_id: Optional[str] = None
+    status: Optional[str] = None
+    running_stages: List[str] = []
+    success_count: int = 0
+    error_count: int = 0
+    started_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    elapsed_seconds: Optional[float] = None
+    throughput_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    stages: List[dict] = []
+
+
+@router.get(
+    "/sync/progress",
+    response_model=List[SyncRunProgress],
+    summary="Get Sync Progress",
+    description="Per-stage throughput and ETA for in-flight full seeding and daily trading runs.",
+)
+async def get_sync_progress() -> List[SyncRunProgress]:
+    """Read the checkpointed progress of resumable runs and derive ETA/throughput."""
+    from vnibb.services.data_pipeline import (
+        DAILY_TRADING_PROGRESS_KEY,
+        SYNC_PROGRESS_KEY,
+        data_pipeline,
+    )
+    from vnibb.services.stage_dag import summarize_progress
+
+    runs = []
+    for sync_type, key in (("full", SYNC_PROGRESS_KEY), ("daily_trading", DAILY_TRADING_PROGRESS_KEY)):
+        summary = summarize_progress(await data_pipeline._load_progress(key=key))
+        if summary is None:
+            runs.append(SyncRunProgress(sync_type=sync_type, active=False))
+            continue
+        runs.append(SyncRunProgress(sync_type=sync_type, active=True, **summary))
+    return runs
+
+
 # =============================================================================
 # SEED ENDPOINTS
 # =============================================================================
@@ -23,9 +23,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from vnibb.api.v1.schemas import MetaData, StandardResponse
 from vnibb.core.appwrite_client import get_appwrite_stock, get_appwrite_stock_prices
 from vnibb.core.cache import build_cache_key, cached, redis_client
+from vnibb.core.cache_constants import REDIS_TTL_HISTORICAL_VOLATILE
 from vnibb.core.config import settings
 from vnibb.core.database import get_db
 from vnibb.core.exceptions import ProviderTimeoutError
+from vnibb.core.pagination import parse_fields
+from vnibb.core.trading_calendar import get_trading_calendar
 from vnibb.core.vn_sectors import VN_SECTORS
 from vnibb.models.company import Company, Shareholder
 
@@ -72,7 +75,11 @@ from vnibb.providers.vnstock.foreign_trading import (
     VnstockForeignTradingFetcher,
 )
 from vnibb.providers.vnstock.general_rating import VnstockGeneralRatingFetcher
-from vnibb.providers.vnstock.intraday import IntradayQueryParams, VnstockIntradayFetcher
+from vnibb.providers.vnstock.intraday import (
+    IntradayQueryParams,
+    IntradayTradeData,
+    VnstockIntradayFetcher,
+)
 from vnibb.providers.vnstock.officers import OfficersQueryParams, VnstockOfficersFetcher
 from vnibb.providers.vnstock.ownership import VnstockOwnershipFetcher
 from vnibb.providers.vnstock.price_depth import VnstockPriceDepthFetcher
@@ -87,7 +94,6 @@ from vnibb.providers.vnstock.trading_stats import TradingStatsData, VnstockTradi
 from vnibb.services.cache_manager import CacheManager
 from vnibb.services.comparison_service import comparison_service
 from vnibb.services.data_pipeline import CACHE_TTL_ORDERBOOK, CACHE_TTL_ORDERBOOK_DAILY
-from vnibb.services.data_quality import is_market_business_day
 from vnibb.services.financial_service import get_financials_with_ttm, normalize_statement_period
 from vnibb.services.mongo_market_data_service import get_mongo_market_data_service
 from vnibb.services.news_service import get_company_news_rows
@@ -1541,20 +1547,106 @@ def _cash_dividend_factor(
     return (close - cash) / close
 
 
-async def _load_corporate_actions_for_adjustment(
+def _dividend_action(row: Dividend) -> dict[str, Any] | None:
+    effective_date = row.exercise_date or row.record_date or row.payment_date
+    if not effective_date:
+        return None
+    issue_method = str(row.issue_method or "").strip().lower()
+    raw_payload = row.raw_data if isinstance(row.raw_data, dict) else {}
+    share_ratio = raw_payload.get("ratio") or raw_payload.get("dividend_ratio")
+    stock_dividend_ratio = _coerce_optional_float(
+        raw_payload.get("stock_dividend") or row.dividend_rate
+    )
+
+    if issue_method == "cash" or row.dividend_value not in (None, 0):
+        return {
+            "effective_date": effective_date,
+            "action_category": "dividend",
+            "action_subtype": "cash_dividend",
+            "cash_amount_per_share": _coerce_optional_float(row.dividend_value),
+            "share_ratio": None,
+            "percent_ratio": None,
+        }
+    if issue_method == "stock" or share_ratio or stock_dividend_ratio not in (None, 0):
+        return {
+            "effective_date": effective_date,
+            "action_category": "dividend",
+            "action_subtype": "stock_dividend",
+            "cash_amount_per_share": None,
+            "share_ratio": str(share_ratio) if share_ratio not in (None, "") else None,
+            "percent_ratio": stock_dividend_ratio,
+        }
+    return None
+
+
+def _company_event_action(
+    row: CompanyEvent, start_date: date, end_date: date
+) -> dict[str, Any] | None:
+    action_category, action_subtype = _normalize_company_action_category(
+        row.event_type,
+        None,
+        row.description,
+    )
+    effective_date = row.ex_date or row.event_date or row.record_date or row.payment_date
+    if not effective_date or effective_date < start_date or effective_date > end_date:
+        return None
+    if action_category not in {"dividend", "split", "issuance"}:
+        return None
+
+    raw_payload = row.raw_data if isinstance(row.raw_data, dict) else {}
+    parsed_cash, parsed_ratio = _parse_company_action_value(
+        str(row.value) if row.value is not None else None,
+        row.description,
+    )
+    return {
+        "effective_date": effective_date,
+        "action_category": action_category,
+        "action_subtype": action_subtype,
+        "cash_amount_per_share": parsed_cash,
+        "share_ratio": parsed_ratio,
+        "percent_ratio": _coerce_optional_float(
+            raw_payload.get("stock_dividend") or raw_payload.get("dividend_ratio")
+        ),
+    }
+
+
+def _dedupe_corporate_actions(actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    actions.sort(key=lambda item: item["effective_date"])
+    deduped: list[dict[str, Any]] = []
+    seen: set[tuple[Any, ...]] = set()
+    for action in actions:
+        key = (
+            action.get("effective_date"),
+            action.get("action_category"),
+            action.get("action_subtype"),
+            action.get("cash_amount_per_share"),
+            action.get("share_ratio"),
+            action.get("percent_ratio"),
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(action)
+    return deduped
+
+
+async def _load_corporate_actions_for_symbols(
     db: AsyncSession,
-    symbol: str,
+    symbols: list[str],
     start_date: date,
     end_date: date,
-) -> list[dict[str, Any]]:
-    actions: list[dict[str, Any]] = []
+) -> dict[str, list[dict[str, Any]]]:
+    """Corporate actions for many symbols with one dividend and one event query."""
+    actions: dict[str, list[dict[str, Any]]] = {symbol: [] for symbol in symbols}
+    if not symbols:
+        return actions
 
     dividend_rows = (
         (
             await db.execute(
                 select(Dividend)
                 .where(
-                    Dividend.symbol == symbol,
+                    Dividend.symbol.in_(symbols),
                     Dividend.exercise_date >= start_date,
                     Dividend.exercise_date <= end_date,
                 )
@@ -1565,100 +1657,47 @@ async def _load_corporate_actions_for_adjustment(
         .all()
     )
     for row in dividend_rows:
-        effective_date = row.exercise_date or row.record_date or row.payment_date
-        if not effective_date:
-            continue
-        issue_method = str(row.issue_method or "").strip().lower()
-        raw_payload = row.raw_data if isinstance(row.raw_data, dict) else {}
-        share_ratio = raw_payload.get("ratio") or raw_payload.get("dividend_ratio")
-        stock_dividend_ratio = _coerce_optional_float(
-            raw_payload.get("stock_dividend") or row.dividend_rate
-        )
-
-        if issue_method == "cash" or row.dividend_value not in (None, 0):
-            actions.append(
-                {
-                    "effective_date": effective_date,
-                    "action_category": "dividend",
-                    "action_subtype": "cash_dividend",
-                    "cash_amount_per_share": _coerce_optional_float(row.dividend_value),
-                    "share_ratio": None,
-                    "percent_ratio": None,
-                }
-            )
-        elif issue_method == "stock" or share_ratio or stock_dividend_ratio not in (None, 0):
-            actions.append(
-                {
-                    "effective_date": effective_date,
-                    "action_category": "dividend",
-                    "action_subtype": "stock_dividend",
-                    "cash_amount_per_share": None,
-                    "share_ratio": str(share_ratio) if share_ratio not in (None, "") else None,
-                    "percent_ratio": stock_dividend_ratio,
-                }
-            )
-
+        action = _dividend_action(row)
+        if action is not None and row.symbol in actions:
+            actions[row.symbol].append(action)
+
+    event_effective_date = func.coalesce(
+        CompanyEvent.ex_date,
+        CompanyEvent.event_date,
+        CompanyEvent.record_date,
+        CompanyEvent.payment_date,
+    )
     event_rows = (
         (
             await db.execute(
                 select(CompanyEvent)
-                .where(CompanyEvent.symbol == symbol)
+                .where(
+                    CompanyEvent.symbol.in_(symbols),
+                    event_effective_date >= start_date,
+                    event_effective_date <= end_date,
+                )
                 .order_by(desc(CompanyEvent.event_date), desc(CompanyEvent.ex_date))
-                .limit(400)
             )
         )
         .scalars()
         .all()
     )
     for row in event_rows:
-        action_category, action_subtype = _normalize_company_action_category(
-            row.event_type,
-            None,
-            row.description,
-        )
-        effective_date = row.ex_date or row.event_date or row.record_date or row.payment_date
-        if not effective_date or effective_date < start_date or effective_date > end_date:
-            continue
-        if action_category not in {"dividend", "split", "issuance"}:
-            continue
+        action = _company_event_action(row, start_date, end_date)
+        if action is not None and row.symbol in actions:
+            actions[row.symbol].append(action)
 
-        raw_payload = row.raw_data if isinstance(row.raw_data, dict) else {}
-        parsed_cash, parsed_ratio = _parse_company_action_value(
-            str(row.value) if row.value is not None else None,
-            row.description,
-        )
+    return {symbol: _dedupe_corporate_actions(items) for symbol, items in actions.items()}
 
-        actions.append(
-            {
-                "effective_date": effective_date,
-                "action_category": action_category,
-                "action_subtype": action_subtype,
-                "cash_amount_per_share": parsed_cash,
-                "share_ratio": parsed_ratio,
-                "percent_ratio": _coerce_optional_float(
-                    raw_payload.get("stock_dividend") or raw_payload.get("dividend_ratio")
-                ),
-            }
-        )
 
-    actions.sort(key=lambda item: item["effective_date"])
-    deduped: list[dict[str, Any]] = []
-    seen: set[tuple[Any, ...]] = set()
-    for action in actions:
-        key = (
-            action.get("effective_date"),
-            action.get("action_category"),
-            action.get("action_subtype"),
-            action.get("cash_amount_per_share"),
-            action.get("share_ratio"),
-            action.get("percent_ratio"),
-        )
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(action)
-
-    return deduped
+async def _load_corporate_actions_for_adjustment(
+    db: AsyncSession,
+    symbol: str,
+    start_date: date,
+    end_date: date,
+) -> list[dict[str, Any]]:
+    actions = await _load_corporate_actions_for_symbols(db, [symbol], start_date, end_date)
+    return actions[symbol]
 
 
 def _apply_corporate_action_adjustments(
@@ -1797,18 +1836,29 @@ def _merge_historical_rows(
     return merged, source_counts
 
 
+_INTRADAY_HISTORICAL_INTERVALS = frozenset({"1m", "5m", "15m", "30m", "1H"})
+
+
+def _historical_cache_ttl(kwargs: dict[str, Any], result: Any) -> int | None:
+    """Short cache TTL for results no dataset bump invalidates.
+
+    Only the daily price sync bumps ``prices``, so intraday bars and responses
+    that had to fall back past Mongo/cache would otherwise sit for the full
+    versioned ceiling.
+    """
+    if kwargs.get("interval") in _INTRADAY_HISTORICAL_INTERVALS:
+        return REDIS_TTL_HISTORICAL_VOLATILE
+    if getattr(getattr(result, "meta", None), "fallback_used", False):
+        return REDIS_TTL_HISTORICAL_VOLATILE
+    return None
+
+
 def _historical_rows_cover_request(
     rows: list[EquityHistoricalData], start_date: date, end_date: date, interval: str
 ) -> bool:
     if (interval or "1D").upper() != "1D":
         return bool(rows)
-    holidays = {date.fromisoformat(value) for value in settings.market_holiday_dates}
-    returned_dates = {row.time for row in rows}
-    return all(
-        cursor in returned_dates
-        for cursor in (start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1))
-        if is_market_business_day(cursor, holidays)
-    )
+    return get_trading_calendar().covers((row.time for row in rows), start_date, end_date)
 
 
 def _historical_resolution_meta(
@@ -1831,14 +1881,9 @@ def _historical_resolution_meta(
     )
     completeness_status = "unknown"
     if normalized_interval == "1D":
-        holidays = {date.fromisoformat(value) for value in settings.market_holiday_dates}
-        expected_dates = [
-            cursor
-            for cursor in (start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1))
-            if is_market_business_day(cursor, holidays)
-        ]
-        returned_dates = {row.time for row in rows}
-        missing_dates = [day for day in expected_dates if day not in returned_dates]
+        calendar = get_trading_calendar()
+        expected_dates = calendar.sessions_between(start_date, end_date)
+        missing_dates = calendar.missing_sessions((row.time for row in rows), start_date, end_date)
         completeness_status = "complete" if not missing_dates else "partial"
         if missing_dates:
             first_expected = expected_dates[0] if expected_dates else None
@@ -1850,7 +1895,7 @@ def _historical_resolution_meta(
                 warnings.append("internal business-day gaps detected; exchange-calendar certainty is limited")
             else:
                 warnings.append("requested-range boundary gaps detected; exchange-calendar certainty is limited")
-        elif not holidays:
+        elif not calendar.holidays:
             warnings.append("business-day completeness excludes unconfigured exchange holidays")
     mongo_units = {str(doc.get("priceUnit") or "").strip().upper() for doc in mongo_docs}
     unit_status = (
@@ -4706,7 +4751,7 @@ async def _enrich_missing_ratio_metrics(
 
 
 @router.get("/historical", response_model=StandardResponse[list[EquityHistoricalData]])
-@cached(ttl=300, key_prefix="historical_v3")
+@cached(key_prefix="historical_v3", ttl_for=_historical_cache_ttl)
 async def get_historical_prices(
     symbol: str = Query(..., min_length=1, max_length=10),
     start_date: date = Query(default_factory=lambda: date.today() - timedelta(days=365)),
@@ -5647,7 +5692,7 @@ async def get_equity_peers(
 @router.get(
     "/{symbol}/correlation-matrix", response_model=StandardResponse[CorrelationMatrixPayload]
 )
-@cached(ttl=900, key_prefix="correlation_matrix")
+@cached(key_prefix="correlation_matrix")
 async def get_correlation_matrix(
     symbol: str,
     days: int = Query(default=60, ge=20, le=252),
@@ -5791,7 +5836,7 @@ async def get_correlation_matrix(
 
 
 @router.get("/{symbol}/ttm", response_model=StandardResponse[dict[str, Any]])
-@cached(ttl=3600, key_prefix="equity_ttm")
+@cached(key_prefix="equity_ttm")
 async def get_ttm_snapshot(
     symbol: str,
 ):
@@ -5830,7 +5875,7 @@ def _growth_rate(current: Optional[float], previous: Optional[float]) -> Optiona
 
 
 @router.get("/{symbol}/growth", response_model=StandardResponse[dict[str, Any]])
-@cached(ttl=3600, key_prefix="equity_growth")
+@cached(key_prefix="equity_growth")
 async def get_growth_rates(
     symbol: str,
     db: AsyncSession = Depends(get_db),
@@ -6593,12 +6638,21 @@ async def get_orderbook(symbol: str, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{symbol}/intraday", response_model=StandardResponse[List[Any]])
-async def get_intraday(symbol: str, limit: int = Query(200, ge=1, le=1000)):
+async def get_intraday(
+    symbol: str,
+    limit: int = Query(200, ge=1, le=1000),
+    fields: Optional[str] = Query(None, description="Comma-separated trade fields to return"),
+):
+    # The provider tick feed has no cursor of its own; narrow tape widgets
+    # still avoid shipping every trade column.
+    selection = parse_fields(fields, IntradayTradeData)
     try:
         data = await asyncio.wait_for(
             VnstockIntradayFetcher.fetch(IntradayQueryParams(symbol=symbol.upper(), limit=limit)),
             timeout=30,
         )
+        if selection.is_projected:
+            data = [selection.project(trade) for trade in data]
         return StandardResponse(data=data, meta=MetaData(count=len(data)))
     except (asyncio.TimeoutError, ProviderTimeoutError):
         return StandardResponse(data=[], error="Request timed out")
@@ -6951,7 +7005,7 @@ async def get_rating(symbol: str):
 
 @router.get("/{symbol}/financial-ratios", response_model=StandardResponse[List[FinancialRatioData]])
 @router.get("/{symbol}/ratios", response_model=StandardResponse[List[FinancialRatioData]])
-@cached(ttl=86400, key_prefix="ratios_v4")
+@cached(key_prefix="ratios_v4")
 async def get_financial_ratios(
     symbol: str,
     period: Literal["year", "quarter", "Q", "FY", "Q1", "Q2", "Q3", "Q4", "TTM"] = "year",
@@ -7157,7 +7211,7 @@ async def get_ratio_history(
 
 
 @router.get("/{symbol}/metrics/history", response_model=MetricsHistoryResponse)
-@cached(ttl=3600, key_prefix="metrics_history")
+@cached(key_prefix="metrics_history")
 async def get_metrics_history(
     symbol: str,
     days: int = Query(30, ge=1, le=3650),
@@ -7255,7 +7309,7 @@ async def get_metrics_history(
 @router.get(
     "/{symbol}/income-statement", response_model=StandardResponse[List[FinancialStatementData]]
 )
-@cached(ttl=86400, key_prefix="income_statement_v4")
+@cached(key_prefix="income_statement_v4")
 async def get_income_statement(
     symbol: str,
     period: Literal[
@@ -7340,7 +7394,7 @@ async def get_income_statement(
 @router.get(
     "/{symbol}/balance-sheet", response_model=StandardResponse[List[FinancialStatementData]]
 )
-@cached(ttl=86400, key_prefix="balance_sheet_v4")
+@cached(key_prefix="balance_sheet_v4")
 async def get_balance_sheet(
     symbol: str,
     period: Literal[
@@ -7396,7 +7450,7 @@ async def get_balance_sheet(
 
 
 @router.get("/{symbol}/cash-flow", response_model=StandardResponse[List[FinancialStatementData]])
-@cached(ttl=86400, key_prefix="cash_flow_v4")
+@cached(key_prefix="cash_flow_v4")
 async def get_cash_flow(
     symbol: str,
     period: Literal[
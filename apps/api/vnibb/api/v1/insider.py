@@ -10,23 +10,74 @@ Endpoints:
 - PUT /api/v1/alerts/{alert_id}/read - Mark alert as read
 - GET /api/v1/alerts/settings - Get alert settings
 - PUT /api/v1/alerts/settings - Update alert thresholds
+- GET /api/v1/alerts/rules - User's streaming alert rules
+- POST /api/v1/alerts/rules - Create a streaming alert rule
+- DELETE /api/v1/alerts/rules/{rule_id} - Delete a streaming alert rule
 """
 
 import logging
 from typing import List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from vnibb.core.auth import User, get_current_user
 from vnibb.core.database import get_db
+from vnibb.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    FieldSelection,
+    attach_cursor,
+    decode_cursor,
+    next_cursor,
+    parse_fields,
+    projected_response,
+)
+from vnibb.models.alerts import AlertRuleDirection, AlertRuleType, BlockTrade, InsiderAlert
+from vnibb.models.news import InsiderDeal
+from vnibb.services.alert_rule_engine import (
+    CompiledRule,
+    alert_rule_engine,
+    load_symbol_seeds,
+)
 from vnibb.services.insider_tracking import InsiderTrackingService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Insider Trading & Alerts"])
 
+DEALS_CURSOR = "insider.deals"
+BLOCK_TRADES_CURSOR = "insider.block_trades"
+ALERTS_CURSOR = "insider.alerts"
+
+CURSOR_QUERY = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header")
+FIELDS_QUERY = Query(None, description="Comma-separated response fields to return")
+
+
+def _row_value(row, name: str):
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def _page_response(
+    rows: list,
+    *,
+    model: type[BaseModel],
+    selection: FieldSelection,
+    scope: str,
+    sort_key: str,
+    limit: int,
+    response: Response,
+):
+    """Serialize one keyset page, returning the next cursor in a response header."""
+    cursor = next_cursor(
+        scope, rows, lambda row: (_row_value(row, sort_key), _row_value(row, "id")), limit
+    )
+    if selection.is_projected:
+        return projected_response([selection.project(row) for row in rows], cursor=cursor)
+    attach_cursor(response, cursor)
+    return [model.model_validate(row) for row in rows]
+
 
 # ============================================================================
 # Pydantic Models
@@ -117,6 +168,45 @@ class AlertSettingsUpdate(BaseModel):
     notification_email: Optional[str] = None
 
 
+class AlertRuleCreate(BaseModel):
+    """Streaming alert rule create request"""
+
+    symbol: str = Field(..., pattern=r"^[A-Za-z0-9]{3,6}$")
+    rule_type: AlertRuleType
+    direction: AlertRuleDirection
+    threshold: float
+    cooldown_seconds: int = Field(300, ge=0, le=86_400)
+    note: Optional[str] = Field(None, max_length=255)
+
+    @model_validator(mode="after")
+    def _check_threshold(self):
+        if self.rule_type == AlertRuleType.RSI and not 0 < self.threshold < 100:
+            raise ValueError("RSI threshold must be between 0 and 100")
+        if self.rule_type in (AlertRuleType.PRICE, AlertRuleType.VOLUME_SPIKE) and (
+            self.threshold <= 0
+        ):
+            raise ValueError(f"{self.rule_type.value} threshold must be positive")
+        return self
+
+
+class AlertRuleResponse(BaseModel):
+    """Streaming alert rule response model"""
+
+    id: int
+    user_id: str
+    symbol: str
+    rule_type: str
+    direction: str
+    threshold: float
+    cooldown_seconds: int
+    enabled: bool
+    note: Optional[str]
+    last_triggered_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
 class InsiderSentimentResponse(BaseModel):
     """Insider sentiment analysis response"""
 
@@ -138,7 +228,12 @@ class InsiderSentimentResponse(BaseModel):
 
 @router.get("/insider/{symbol}/deals", response_model=List[InsiderDealResponse])
 async def get_insider_deals(
-    symbol: str, limit: int = Query(50, ge=1, le=500), db: AsyncSession = Depends(get_db)
+    symbol: str,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get insider trading deals for a specific stock.
@@ -146,15 +241,32 @@ async def get_insider_deals(
     Args:
         symbol: Stock symbol (e.g., 'VNM', 'HPG')
         limit: Maximum number of deals to return
+        cursor: Cursor of the previous page
+        fields: Optional subset of response fields
 
     Returns:
         List of insider deals
     """
+    after = decode_cursor(cursor, DEALS_CURSOR)
+    selection = parse_fields(fields, InsiderDealResponse)
     try:
         service = InsiderTrackingService(db)
-        deals = await service.get_recent_insider_deals(symbol=symbol, limit=limit)
+        deals = await service.get_recent_insider_deals(
+            symbol=symbol,
+            limit=limit,
+            after=after,
+            columns=selection.columns(InsiderDeal, always=("id", "announce_date")),
+        )
 
-        return [InsiderDealResponse.model_validate(deal) for deal in deals]
+        return _page_response(
+            deals,
+            model=InsiderDealResponse,
+            selection=selection,
+            scope=DEALS_CURSOR,
+            sort_key="announce_date",
+            limit=limit,
+            response=response,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching insider deals for {symbol}: {e}")
@@ -163,22 +275,42 @@ async def get_insider_deals(
 
 @router.get("/insider/recent", response_model=List[InsiderDealResponse])
 async def get_recent_insider_deals(
-    limit: int = Query(100, ge=1, le=500), db: AsyncSession = Depends(get_db)
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Get recent insider trading deals across all stocks.
 
     Args:
         limit: Maximum number of deals to return
+        cursor: Cursor of the previous page
+        fields: Optional subset of response fields
 
     Returns:
         List of recent insider deals
     """
+    after = decode_cursor(cursor, DEALS_CURSOR)
+    selection = parse_fields(fields, InsiderDealResponse)
     try:
         service = InsiderTrackingService(db)
-        deals = await service.get_recent_insider_deals(limit=limit)
+        deals = await service.get_recent_insider_deals(
+            limit=limit,
+            after=after,
+            columns=selection.columns(InsiderDeal, always=("id", "announce_date")),
+        )
 
-        return [InsiderDealResponse.model_validate(deal) for deal in deals]
+        return _page_response(
+            deals,
+            model=InsiderDealResponse,
+            selection=selection,
+            scope=DEALS_CURSOR,
+            sort_key="announce_date",
+            limit=limit,
+            response=response,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching recent insider deals: {e}")
@@ -217,8 +349,11 @@ async def get_insider_sentiment(
 
 @router.get("/insider/block-trades", response_model=List[BlockTradeResponse])
 async def get_block_trades(
+    response: Response,
     symbol: Optional[str] = None,
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -227,15 +362,32 @@ async def get_block_trades(
     Args:
         symbol: Optional stock symbol filter
         limit: Maximum number of trades to return
+        cursor: Cursor of the previous page
+        fields: Optional subset of response fields
 
     Returns:
         List of block trades
     """
+    after = decode_cursor(cursor, BLOCK_TRADES_CURSOR)
+    selection = parse_fields(fields, BlockTradeResponse)
     try:
         service = InsiderTrackingService(db)
-        trades = await service.get_recent_block_trades(symbol=symbol, limit=limit)
+        trades = await service.get_recent_block_trades(
+            symbol=symbol,
+            limit=limit,
+            after=after,
+            columns=selection.columns(BlockTrade, always=("id", "trade_time")),
+        )
 
-        return [BlockTradeResponse.model_validate(trade) for trade in trades]
+        return _page_response(
+            trades,
+            model=BlockTradeResponse,
+            selection=selection,
+            scope=BLOCK_TRADES_CURSOR,
+            sort_key="trade_time",
+            limit=limit,
+            response=response,
+        )
 
     except Exception as e:
         logger.exception("Error fetching block trades: %s", e)
@@ -249,9 +401,12 @@ async def get_block_trades(
 
 @router.get("/alerts/insider", response_model=List[InsiderAlertResponse])
 async def get_insider_alerts(
+    response: Response,
     user_id: Optional[int] = None,
     unread_only: bool = False,
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -261,17 +416,33 @@ async def get_insider_alerts(
         user_id: Optional user ID filter
         unread_only: Only return unread alerts
         limit: Maximum number of alerts to return
+        cursor: Cursor of the previous page
+        fields: Optional subset of response fields
 
     Returns:
         List of insider alerts
     """
+    after = decode_cursor(cursor, ALERTS_CURSOR)
+    selection = parse_fields(fields, InsiderAlertResponse)
     try:
         service = InsiderTrackingService(db)
         alerts = await service.get_user_alerts(
-            user_id=user_id, unread_only=unread_only, limit=limit
+            user_id=user_id,
+            unread_only=unread_only,
+            limit=limit,
+            after=after,
+            columns=selection.columns(InsiderAlert, always=("id", "timestamp")),
         )
 
-        return [InsiderAlertResponse.model_validate(alert) for alert in alerts]
+        return _page_response(
+            alerts,
+            model=InsiderAlertResponse,
+            selection=selection,
+            scope=ALERTS_CURSOR,
+            sort_key="timestamp",
+            limit=limit,
+            response=response,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching insider alerts: {e}")
@@ -363,3 +534,101 @@ async def update_alert_settings(
     except Exception as e:
         logger.error(f"Error updating alert settings for user {user_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# ============================================================================
+# Streaming Alert Rule Endpoints
+# ============================================================================
+
+
+@router.get("/alerts/rules", response_model=List[AlertRuleResponse])
+async def get_alert_rules(
+    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the authenticated user's streaming alert rules.
+
+    Returns:
+        List of alert rules
+    """
+    user_id = current_user.id
+    try:
+        service = InsiderTrackingService(db)
+        rules = await service.list_alert_rules(user_id)
+
+        return [AlertRuleResponse.model_validate(rule) for rule in rules]
+
+    except Exception as e:
+        logger.error(f"Error fetching alert rules for user {user_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/alerts/rules", response_model=AlertRuleResponse, status_code=201)
+async def create_alert_rule(
+    rule: AlertRuleCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create a streaming alert rule owned by the authenticated user.
+
+    The rule is registered with the realtime rule engine immediately and
+    fires on the first tick whose metric crosses the threshold. Matches are
+    sent only to websocket connections authenticated as the same user.
+
+    Args:
+        rule: Symbol, metric, crossing direction and threshold
+
+    Returns:
+        Created alert rule
+    """
+    user_id = current_user.id
+    try:
+        service = InsiderTrackingService(db)
+        created = await service.create_alert_rule(
+            user_id,
+            symbol=rule.symbol,
+            rule_type=rule.rule_type.value,
+            direction=rule.direction.value,
+            threshold=rule.threshold,
+            cooldown_seconds=rule.cooldown_seconds,
+            note=rule.note,
+        )
+
+        compiled = CompiledRule.from_model(created)
+        seed = None
+        if not alert_rule_engine.has_seed(compiled.symbol):
+            seed = (await load_symbol_seeds(db, [compiled.symbol])).get(compiled.symbol)
+        alert_rule_engine.add_rule(compiled, seed)
+
+        return AlertRuleResponse.model_validate(created)
+
+    except Exception as e:
+        logger.error(f"Error creating alert rule for user {user_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/alerts/rules/{rule_id}", status_code=204)
+async def delete_alert_rule(
+    rule_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> None:
+    """
+    Delete one of the authenticated user's streaming alert rules.
+
+    Args:
+        rule_id: Alert rule ID
+    """
+    try:
+        service = InsiderTrackingService(db)
+        if not await service.delete_alert_rule(current_user.id, rule_id):
+            raise HTTPException(status_code=404, detail="Alert rule not found")
+
+        alert_rule_engine.remove_rule(rule_id)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error deleting alert rule {rule_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -26,6 +26,7 @@ from sqlalchemy import select, func, text
 
 from vnibb.core.config import settings
 from vnibb.core.database import async_session_maker, get_db
+from vnibb.core.trading_calendar import get_trading_calendar
 from vnibb.core.vn_sectors import VN_SECTORS
 from vnibb.providers.vnstock.equity_screener import (
     VnstockScreenerFetcher,
@@ -1627,19 +1628,16 @@ async def _load_latest_income_revenue(symbols: List[str]) -> Dict[str, Optional[
 
 
 def _expected_latest_trading_day(today: Optional[date] = None) -> date:
-    """Most recent weekday on/before ``today`` (ignores VN holidays).
+    """Most recent trading session on/before ``today``.
 
     Used only as a *staleness floor*: if the freshest screener snapshot predates
     this date, the Postgres universe is considered behind and the canonical Mongo
-    corpus is consulted. Holidays are not modeled, so the floor is intentionally
-    lenient (a holiday simply means Mongo will also be a day behind and the
-    "only replace when Mongo is strictly fresher" guard prevents a downgrade).
+    corpus is consulted. Holidays come from ``settings.market_holiday_dates``;
+    an unconfigured holiday only makes the floor stricter, and the "only replace
+    when Mongo is strictly fresher" guard prevents a downgrade.
     """
 
-    anchor = today or date.today()
-    while anchor.weekday() >= 5:  # 5=Sat, 6=Sun
-        anchor -= timedelta(days=1)
-    return anchor
+    return get_trading_calendar().latest_session(today or date.today())
 
 
 def _coerce_to_date(value: Any) -> Optional[date]:
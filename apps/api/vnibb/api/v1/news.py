@@ -9,12 +9,22 @@ import logging
 from collections import defaultdict
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from vnibb.core.cache import cached
 from vnibb.core.config import settings
+from vnibb.core.database import get_db
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
+from vnibb.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    FieldSelection,
+    attach_cursor,
+    parse_fields,
+    projected_response,
+    reject_offset_with_cursor,
+)
 from vnibb.core.vn_sectors import VN_SECTORS
 from vnibb.providers.vnstock.equity_screener import (
     ScreenerData,
@@ -25,8 +35,10 @@ from vnibb.services.cache_manager import CacheManager
 from vnibb.services.news_crawler import news_crawler
 from vnibb.services.news_service import (
     NewsResponse,
+    decode_news_cursor,
     get_news_flow,
     get_ranked_news_rows,
+    news_next_cursor,
 )
 from vnibb.services.sentiment_analyzer import sentiment_analyzer
 from vnibb.services.world_news_service import (
@@ -90,6 +102,77 @@ class NewsFeed(BaseModel):
     source: str | None = None
     mode: str = "all"
     fallback_used: bool = False
+    # Served in the X-Next-Cursor header by the endpoint, not in the body.
+    next_cursor: str | None = Field(default=None, exclude=True)
+
+
+CURSOR_DESCRIPTION = f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+
+
+def _normalize_article(item: dict[str, Any]) -> dict[str, Any]:
+    published_date = item.get("published_date") or item.get("published_at")
+    if hasattr(published_date, "isoformat"):
+        published_date = published_date.isoformat()
+
+    related_symbols = item.get("related_symbols", [])
+    if isinstance(related_symbols, str):
+        related_symbols = [s.strip() for s in related_symbols.split(",") if s.strip()]
+
+    sectors = item.get("sectors", [])
+    if isinstance(sectors, str):
+        sectors = [s.strip() for s in sectors.split(",") if s.strip()]
+
+    return {
+        "id": item.get("id"),
+        "title": item.get("title", ""),
+        "summary": item.get("summary"),
+        "content": item.get("content"),
+        "source": item.get("source", ""),
+        "url": item.get("url"),
+        "author": item.get("author"),
+        "image_url": item.get("image_url"),
+        "category": item.get("category"),
+        "published_date": published_date,
+        "related_symbols": related_symbols,
+        "sectors": sectors,
+        "sentiment": item.get("sentiment"),
+        "sentiment_score": item.get("sentiment_score"),
+        "ai_summary": item.get("ai_summary"),
+        "read_count": item.get("read_count", 0),
+        "bookmarked": item.get("bookmarked", False),
+        "relevance_score": item.get("relevance_score"),
+        "matched_symbols": item.get("matched_symbols", []),
+        "match_reason": item.get("match_reason"),
+        "is_market_wide_fallback": bool(item.get("is_market_wide_fallback", False)),
+    }
+
+
+async def _load_news_page(
+    *,
+    source: str | None,
+    sentiment: str | None,
+    symbol: str | None,
+    limit: int,
+    offset: int,
+    mode: str,
+    cursor: str | None,
+    selection: FieldSelection,
+) -> tuple[list[dict[str, Any]], bool, str | None]:
+    related = bool(symbol and symbol.strip()) and mode == "related"
+    articles, fallback_used = await get_ranked_news_rows(
+        source=source,
+        sentiment=sentiment,
+        symbol=symbol,
+        limit=limit,
+        offset=offset,
+        mode=mode,
+        after=decode_news_cursor(cursor, related=related),
+        columns=list(selection.names) if selection.is_projected else None,
+    )
+    cursor_out = news_next_cursor(
+        articles, related=related, fallback_used=fallback_used, limit=limit
+    )
+    return articles, fallback_used, cursor_out
 
 
 async def get_news_feed(
@@ -99,56 +182,20 @@ async def get_news_feed(
     limit: int = 20,
     offset: int = 0,
     mode: str = "all",
+    cursor: str | None = None,
 ) -> NewsFeed:
     """Fetch latest news and normalize into NewsFeed."""
-    articles, fallback_used = await get_ranked_news_rows(
+    articles, fallback_used, next_cursor = await _load_news_page(
         source=source,
         sentiment=sentiment,
         symbol=symbol,
         limit=limit,
         offset=offset,
         mode=mode,
+        cursor=cursor,
+        selection=FieldSelection(),
     )
-
-    normalized: list[NewsArticle] = []
-    for item in articles:
-        published_date = item.get("published_date") or item.get("published_at")
-        if hasattr(published_date, "isoformat"):
-            published_date = published_date.isoformat()
-
-        related_symbols = item.get("related_symbols", [])
-        if isinstance(related_symbols, str):
-            related_symbols = [s.strip() for s in related_symbols.split(",") if s.strip()]
-
-        sectors = item.get("sectors", [])
-        if isinstance(sectors, str):
-            sectors = [s.strip() for s in sectors.split(",") if s.strip()]
-
-        normalized.append(
-            NewsArticle(
-                id=item.get("id"),
-                title=item.get("title", ""),
-                summary=item.get("summary"),
-                content=item.get("content"),
-                source=item.get("source", ""),
-                url=item.get("url"),
-                author=item.get("author"),
-                image_url=item.get("image_url"),
-                category=item.get("category"),
-                published_date=published_date,
-                related_symbols=related_symbols,
-                sectors=sectors,
-                sentiment=item.get("sentiment"),
-                sentiment_score=item.get("sentiment_score"),
-                ai_summary=item.get("ai_summary"),
-                read_count=item.get("read_count", 0),
-                bookmarked=item.get("bookmarked", False),
-                relevance_score=item.get("relevance_score"),
-                matched_symbols=item.get("matched_symbols", []),
-                match_reason=item.get("match_reason"),
-                is_market_wide_fallback=bool(item.get("is_market_wide_fallback", False)),
-            )
-        )
+    normalized = [NewsArticle(**_normalize_article(item)) for item in articles]
 
     return NewsFeed(
         articles=normalized,
@@ -156,6 +203,7 @@ async def get_news_feed(
         source=source,
         mode=mode,
         fallback_used=fallback_used,
+        next_cursor=next_cursor,
     )
 
 
@@ -236,7 +284,10 @@ class HeatmapResponse(BaseModel):
     "/world",
     response_model=WorldNewsFeedResponse,
     summary="Get World News Monitor Feed",
-    description="Get live RSS/Atom headlines from Vietnam and global business, market, and macro sources.",
+    description=(
+        "Get RSS/Atom headlines from Vietnam and global business, market, and macro sources, "
+        "served from the background-polled article store."
+    ),
 )
 @cached(ttl=300, key_prefix="world_news")
 async def get_world_news_api(
@@ -271,6 +322,7 @@ async def get_world_news_api(
     ),
     limit: int = Query(default=40, ge=1, le=100),
     freshness_hours: int = Query(default=72, ge=1, le=168),
+    db: AsyncSession = Depends(get_db),
 ) -> WorldNewsFeedResponse:
     return await get_world_news_feed(
         region=region,
@@ -281,6 +333,7 @@ async def get_world_news_api(
         custom_source_name=custom_source_name,
         limit=limit,
         freshness_hours=freshness_hours,
+        db=db,
     )
 
 
@@ -319,6 +372,7 @@ async def get_world_news_map_api(
     ),
     limit: int = Query(default=100, ge=1, le=200),
     freshness_hours: int = Query(default=72, ge=1, le=168),
+    db: AsyncSession = Depends(get_db),
 ) -> WorldNewsMapResponse:
     return await get_world_news_map(
         region=region,
@@ -328,6 +382,7 @@ async def get_world_news_map_api(
         custom_source_name=custom_source_name,
         limit=limit,
         freshness_hours=freshness_hours,
+        db=db,
     )
 
 
@@ -365,6 +420,7 @@ async def get_world_news_sources_api(
     description="Get latest market news with optional filters.",
 )
 async def get_news_feed_api(
+    response: Response,
     background_tasks: BackgroundTasks,
     source: str | None = Query(default=None, description="Filter by source"),
     sentiment: str | None = Query(default=None, description="Filter by sentiment"),
@@ -372,17 +428,45 @@ async def get_news_feed_api(
     mode: str = Query(default="all", pattern=r"^(all|related)$", description="Feed mode"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    fields: str | None = Query(default=None, description="Comma-separated article fields"),
 ) -> NewsFeed:
-    feed = await get_news_feed(
-        source=source,
-        sentiment=sentiment,
-        symbol=symbol,
-        mode=mode if symbol else "all",
-        limit=limit,
-        offset=offset,
-    )
+    reject_offset_with_cursor(cursor, offset)
+    selection = parse_fields(fields, NewsArticle)
+    mode = mode if symbol else "all"
+    if selection.is_projected:
+        articles, fallback_used, next_cursor = await _load_news_page(
+            source=source,
+            sentiment=sentiment,
+            symbol=symbol,
+            limit=limit,
+            offset=offset,
+            mode=mode,
+            cursor=cursor,
+            selection=selection,
+        )
+        total = len(articles)
+        payload = {
+            "articles": [selection.project(_normalize_article(item)) for item in articles],
+            "total": total,
+            "source": source,
+            "mode": mode,
+            "fallback_used": fallback_used,
+        }
+    else:
+        feed = await get_news_feed(
+            source=source,
+            sentiment=sentiment,
+            symbol=symbol,
+            mode=mode,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        total = feed.total
+        next_cursor = feed.next_cursor
 
-    if feed.total == 0 and news_crawler._news_available:
+    if total == 0 and not cursor and news_crawler._news_available:
         background_tasks.add_task(
             news_crawler.crawl_market_news,
             sources=None,
@@ -390,6 +474,9 @@ async def get_news_feed_api(
             analyze_sentiment=True,
         )
 
+    if selection.is_projected:
+        return projected_response(payload, cursor=next_cursor)
+    attach_cursor(response, next_cursor)
     return feed
 
 
@@ -400,6 +487,7 @@ async def get_news_feed_api(
     description="Get chronological news flow with optional filters for symbols and sentiment.",
 )
 async def get_news_flow_api(
+    response: Response,
     symbols: str | None = Query(None, description="Comma-separated symbols"),
     sector: str | None = Query(None),
     sentiment: str | None = Query(
@@ -408,20 +496,25 @@ async def get_news_flow_api(
     mode: str = Query(default="related", pattern=r"^(all|related)$"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
 ):
     """
     Get news flow with optional filters.
     """
+    reject_offset_with_cursor(cursor, offset)
     symbol_list = symbols.split(",") if symbols else None
 
-    return await get_news_flow(
+    flow = await get_news_flow(
         symbols=symbol_list,
         sector=sector,
         sentiment=sentiment,
         mode=mode,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
+    attach_cursor(response, flow.next_cursor)
+    return flow
 
 
 @router.get(
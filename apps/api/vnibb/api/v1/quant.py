@@ -21,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from vnibb.api.v1.equity import (
     _apply_corporate_action_adjustments,
     _load_corporate_actions_for_adjustment,
+    _load_corporate_actions_for_symbols,
     _load_historical_from_appwrite,
     _load_historical_from_db,
     _load_historical_from_mongo,
@@ -28,12 +29,15 @@ from vnibb.api.v1.equity import (
 )
 
 from vnibb.api.v1.schemas import MetaData, StandardResponse
+from vnibb.api.v1.sectors import resolve_sector_symbols
 from vnibb.core.cache import cached
 from vnibb.core.config import settings
 from vnibb.core.database import get_db
-from vnibb.core.vn_sectors import VN_SECTORS
+from vnibb.core.instrumentation import span, traced
+from vnibb.core.vn_sectors import VN_SECTORS, get_sector_by_id
 from vnibb.models.alerts import BlockTrade
 from vnibb.models.financials import BalanceSheet, CashFlow, IncomeStatement
+from vnibb.models.market import GarchWarmStart
 from vnibb.models.stock import Stock, StockIndex, StockPrice
 from vnibb.models.trading import ForeignTrading
 from vnibb.providers.vnstock.equity_historical import (
@@ -43,6 +47,22 @@ from vnibb.providers.vnstock.equity_historical import (
 )
 from vnibb.providers.vnstock.stock_quote import VnstockStockQuoteFetcher
 from vnibb.services.mongo_market_data_service import get_mongo_market_data_service
+from vnibb.services.pair_scan import (
+    ADF_CAVEAT,
+    ADF_COINTEGRATION_CRITICAL,
+    MAX_BASKET_SYMBOLS,
+    adf_verdict,
+    normalize_basket_symbols,
+    scan_pairs,
+)
+from vnibb.services.bulk_writer import bulk_upsert
+from vnibb.services.price_panel import ClosePanel, load_close_panel
+from vnibb.services.rs_snapshot_service import (
+    SCOPE_SECTOR,
+    SCOPE_SYMBOL,
+    compute_rotation,
+    get_rotation,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -1375,13 +1395,18 @@ async def _get_quant_metric_alias_response(
         )
 
     try:
-        metric_payload = (
-            _compute_benchmark_risk(
-                frame.copy(), benchmark_frame if benchmark_frame is not None else pd.DataFrame()
-            )
-            if canonical_metric == "benchmark_risk"
-            else calculator(frame.copy())
-        )
+        with span(f"compute.{canonical_metric}"):
+            if canonical_metric == "benchmark_risk":
+                metric_payload = _compute_benchmark_risk(
+                    frame.copy(),
+                    benchmark_frame if benchmark_frame is not None else pd.DataFrame(),
+                )
+            elif canonical_metric == "garch_volatility":
+                metric_payload = await _compute_symbol_garch_volatility(
+                    frame.copy(), db=db, symbol=symbol_upper, adjustment_mode=adjustment_mode
+                )
+            else:
+                metric_payload = calculator(frame.copy())
     except Exception as exc:
         logger.warning(
             "Quant metric alias %s failed for %s: %s", canonical_metric, symbol_upper, exc
@@ -1475,53 +1500,6 @@ def _label_gamma_regime(regime: str) -> str:
     return "Unknown"
 
 
-def _classify_rrg_quadrant(rs_ratio: float | None, rs_momentum: float | None) -> str:
-    if rs_ratio is None or rs_momentum is None:
-        return "Unknown"
-    if rs_ratio >= 100 and rs_momentum >= 100:
-        return "Leading"
-    if rs_ratio >= 100 and rs_momentum < 100:
-        return "Weakening"
-    if rs_ratio < 100 and rs_momentum < 100:
-        return "Lagging"
-    return "Improving"
-
-
-def _compute_rrg_metrics(
-    rs_series: pd.Series,
-    *,
-    ratio_lookback: int = 60,
-    momentum_lookback: int = 10,
-) -> tuple[float | None, float | None]:
-    series = pd.to_numeric(rs_series, errors="coerce").dropna()
-    if series.empty:
-        return None, None
-
-    ratio_window = series.tail(ratio_lookback)
-    ratio_mean = ratio_window.mean()
-    ratio_std = ratio_window.std(ddof=0)
-
-    if ratio_std and not np.isnan(ratio_std):
-        rs_ratio = 100 + ((series.iloc[-1] - ratio_mean) / ratio_std) * 10
-    else:
-        rs_ratio = 100.0
-
-    momentum_base = series.pct_change(momentum_lookback) * 100
-    momentum_window = momentum_base.dropna().tail(ratio_lookback)
-    if momentum_window.empty:
-        return _safe_float(rs_ratio, decimals=2), None
-
-    momentum_std = momentum_window.std(ddof=0)
-    if momentum_std and not np.isnan(momentum_std):
-        rs_momentum = (
-            100 + ((momentum_window.iloc[-1] - momentum_window.mean()) / momentum_std) * 10
-        )
-    else:
-        rs_momentum = 100.0
-
-    return _safe_float(rs_ratio, decimals=2), _safe_float(rs_momentum, decimals=2)
-
-
 def _normalize_trade_side(value: Any) -> str | None:
     if value is None:
         return None
@@ -1610,6 +1588,7 @@ async def _load_block_trade_rows(
         return []
 
 
+@traced("quant.load_price_frame")
 async def _load_price_frame(
     db: AsyncSession,
     symbol: str,
@@ -2202,6 +2181,9 @@ def _empty_garch_payload() -> Dict[str, Any]:
     }
 
 
+GARCH_BLOCK_BARS = 256
+
+
 def _compute_garch_path(eps: np.ndarray, omega: float, alpha: float, beta: float) -> np.ndarray | None:
     persistence = alpha + beta
     if omega <= 0 or alpha < 0 or beta < 0 or persistence >= 1:
@@ -2214,66 +2196,129 @@ def _compute_garch_path(eps: np.ndarray, omega: float, alpha: float, beta: float
     unconditional_var = omega / (1 - persistence)
     h = np.empty(eps.size, dtype=float)
     h[0] = max(unconditional_var, sample_var, 1e-12)
-    for idx in range(1, eps.size):
-        h[idx] = omega + alpha * eps[idx - 1] ** 2 + beta * h[idx - 1]
-        if not np.isfinite(h[idx]) or h[idx] <= 1e-12:
-            return None
+    previous = float(h[0])
+    # Recurse on plain Python floats one block at a time: far cheaper than
+    # indexing numpy scalars, without materialising the whole series as a list.
+    for start in range(1, eps.size, GARCH_BLOCK_BARS):
+        stop = min(eps.size, start + GARCH_BLOCK_BARS)
+        block = []
+        for shock in eps[start - 1 : stop - 1].tolist():
+            previous = omega + alpha * shock * shock + beta * previous
+            block.append(previous)
+        h[start:stop] = block
+    if not np.all(np.isfinite(h)) or float(h.min()) <= 1e-12:
+        return None
     return h
 
 
-def _score_garch_params(eps: np.ndarray, omega: float, alpha: float, beta: float) -> tuple[float, np.ndarray | None]:
-    h = _compute_garch_path(eps, omega, alpha, beta)
-    if h is None:
-        return float("inf"), None
-    score = 0.5 * float(np.sum(np.log(h) + (eps**2 / h)))
-    if not np.isfinite(score):
-        return float("inf"), None
-    return score, h
-
+def _score_garch_candidates(eps: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """Gaussian negative log-likelihood for every (omega, alpha, beta) row at once.
 
-def _fit_garch_params(eps: np.ndarray) -> tuple[float, float, float, np.ndarray] | None:
+    The recursion runs over time with one state vector holding all candidates,
+    so each session costs a couple of numpy calls instead of one Python loop
+    per candidate. Invalid or non-stationary candidates score ``inf``.
+    """
+    params = np.atleast_2d(np.asarray(params, dtype=float))
+    scores = np.full(params.shape[0], np.inf)
+    sample_var = float(np.var(eps, ddof=0))
+    if eps.size == 0 or not np.isfinite(sample_var) or sample_var <= 1e-12:
+        return scores
+
+    omega, alpha, beta = params[:, 0], params[:, 1], params[:, 2]
+    valid = (omega > 0) & (alpha >= 0) & (beta >= 0) & (alpha + beta < 1)
+    if not valid.any():
+        return scores
+    omega, alpha, beta = omega[valid], alpha[valid], beta[valid]
+
+    eps_sq = eps**2
+    with np.errstate(all="ignore"):
+        previous = np.maximum(np.maximum(omega / (1 - alpha - beta), sample_var), 1e-12)
+        ok = np.isfinite(previous)
+        total = np.log(previous) + eps_sq[0] / previous
+        scratch = np.empty_like(previous)
+        for start in range(1, eps.size, GARCH_BLOCK_BARS):
+            stop = min(eps.size, start + GARCH_BLOCK_BARS)
+            block = np.multiply.outer(eps_sq[start - 1 : stop - 1], alpha)
+            block += omega
+            np.multiply(beta, previous, out=scratch)
+            block[0] += scratch
+            for row in range(1, stop - start):
+                np.multiply(beta, block[row - 1], out=scratch)
+                block[row] += scratch
+            ok &= np.isfinite(block).all(axis=0) & (block > 1e-12).all(axis=0)
+            previous = block[-1].copy()
+            ratio = eps_sq[start:stop, None] / block
+            np.log(block, out=block)
+            block += ratio
+            total += block.sum(axis=0)
+
+    valid_scores = np.where(ok & np.isfinite(total), 0.5 * total, np.inf)
+    scores[valid] = valid_scores
+    return scores
+
+
+def _fit_garch_params(
+    eps: np.ndarray, warm_start: tuple[float, float, float] | None = None
+) -> tuple[float, float, float, np.ndarray] | None:
     sample_var = float(np.var(eps, ddof=0))
     if not np.isfinite(sample_var) or sample_var <= 1e-12:
         return None
 
-    best: tuple[float, float, float, float, np.ndarray] | None = None
+    best: tuple[float, float, float, float] | None = None
     persistence_grid = [0.20, 0.50, 0.70, 0.85, 0.93, 0.97]
     alpha_grid = [0.01, 0.03, 0.05, 0.08, 0.12, 0.18]
     scale_grid = [0.5, 1.0, 1.5]
 
-    def consider(omega: float, alpha: float, beta: float) -> None:
+    def consider(candidates: List[tuple[float, float, float]]) -> None:
         nonlocal best
-        persistence = alpha + beta
-        score, h = _score_garch_params(eps, omega, alpha, beta)
-        if h is None:
+        if not candidates:
             return
-        if best is None or score < best[0] - 1e-9:
-            best = (score, omega, alpha, beta, h)
-            return
-        if best is not None and abs(score - best[0]) <= 1e-9:
-            current_rank = (persistence, alpha, omega)
-            best_rank = (best[2] + best[3], best[2], best[1])
-            if current_rank < best_rank:
-                best = (score, omega, alpha, beta, h)
-
-    for persistence in persistence_grid:
-        for alpha in alpha_grid:
-            if alpha >= persistence:
+        scores = _score_garch_candidates(eps, np.asarray(candidates, dtype=float))
+        for (omega, alpha, beta), score in zip(candidates, scores.tolist(), strict=True):
+            if not np.isfinite(score):
+                continue
+            persistence = alpha + beta
+            if best is None or score < best[0] - 1e-9:
+                best = (score, omega, alpha, beta)
                 continue
-            beta = persistence - alpha
-            base_omega = sample_var * (1 - persistence)
-            for scale in scale_grid:
-                consider(base_omega * scale, alpha, beta)
+            if abs(score - best[0]) <= 1e-9:
+                current_rank = (persistence, alpha, omega)
+                best_rank = (best[2] + best[3], best[2], best[1])
+                if current_rank < best_rank:
+                    best = (score, omega, alpha, beta)
 
     step_persistence = 0.08
     step_alpha = 0.03
     step_scale = 0.40
-    for _ in range(4):
+    rounds = 4
+    if warm_start is not None:
+        consider([tuple(float(value) for value in warm_start)])
+    if best is not None:
+        # Yesterday's optimum is already close: skip the coarse grid and the
+        # widest refinement round; the final step sizes match a cold fit.
+        step_persistence *= 0.5
+        step_alpha *= 0.5
+        step_scale *= 0.5
+        rounds = 3
+    else:
+        coarse: List[tuple[float, float, float]] = []
+        for persistence in persistence_grid:
+            for alpha in alpha_grid:
+                if alpha >= persistence:
+                    continue
+                beta = persistence - alpha
+                base_omega = sample_var * (1 - persistence)
+                for scale in scale_grid:
+                    coarse.append((base_omega * scale, alpha, beta))
+        consider(coarse)
+
+    for _ in range(rounds):
         if best is None:
             return None
-        _, best_omega, best_alpha, best_beta, _ = best
+        _, best_omega, best_alpha, best_beta = best
         best_persistence = best_alpha + best_beta
         best_scale = best_omega / max(sample_var * (1 - best_persistence), 1e-12)
+        refined: List[tuple[float, float, float]] = []
         for persistence in [best_persistence - step_persistence, best_persistence, best_persistence + step_persistence]:
             if persistence <= 0.02 or persistence >= 0.995:
                 continue
@@ -2285,18 +2330,24 @@ def _fit_garch_params(eps: np.ndarray) -> tuple[float, float, float, np.ndarray]
                 for scale in [best_scale - step_scale, best_scale, best_scale + step_scale]:
                     if scale <= 0:
                         continue
-                    consider(base_omega * scale, alpha, beta)
+                    refined.append((base_omega * scale, alpha, beta))
+        consider(refined)
         step_persistence *= 0.5
         step_alpha *= 0.5
         step_scale *= 0.5
 
     if best is None:
         return None
-    _, omega, alpha, beta, h = best
+    _, omega, alpha, beta = best
+    h = _compute_garch_path(eps, omega, alpha, beta)
+    if h is None:
+        return None
     return omega, alpha, beta, h
 
 
-def _compute_garch_volatility(frame: pd.DataFrame) -> Dict[str, Any]:
+def _compute_garch_volatility(
+    frame: pd.DataFrame, warm_start: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
     enriched = frame[["time", "close"]].copy()
     enriched["time"] = pd.to_datetime(enriched["time"], errors="coerce")
     enriched["close"] = pd.to_numeric(enriched["close"], errors="coerce")
@@ -2314,7 +2365,23 @@ def _compute_garch_volatility(frame: pd.DataFrame) -> Dict[str, Any]:
         return _empty_garch_payload()
 
     eps = returns - float(np.mean(returns))
-    fitted = _fit_garch_params(eps)
+    as_of = enriched["time"].iloc[-1].strftime("%Y-%m-%d")
+    fitted = None
+    fit_mode = "cold"
+    warm_params = _garch_warm_start_params(warm_start)
+    if (
+        warm_params is not None
+        and warm_start.get("as_of") == as_of
+        and warm_start.get("observations") == int(eps.size)
+    ):
+        # Same symbol, same as-of session, same window: the fit is already known.
+        h = _compute_garch_path(eps, *warm_params)
+        if h is not None:
+            fitted = (*warm_params, h)
+            fit_mode = "reused"
+    if fitted is None:
+        fitted = _fit_garch_params(eps, warm_start=warm_params)
+        fit_mode = "warm" if warm_params is not None else "cold"
     if fitted is None:
         return _empty_garch_payload()
 
@@ -2340,10 +2407,92 @@ def _compute_garch_volatility(frame: pd.DataFrame) -> Dict[str, Any]:
             }
             for row in series_frame.tail(400).itertuples(index=False)
         ],
+        "fit": {"mode": fit_mode, "as_of": as_of, "observations": int(eps.size)},
         "note": "GARCH(1,1) Gaussian QMLE in-sample estimate of conditional volatility; this is not a one-step-ahead forecast.",
     }
 
 
+def _garch_warm_start_params(record: Dict[str, Any] | None) -> tuple[float, float, float] | None:
+    if not isinstance(record, dict):
+        return None
+    try:
+        params = (float(record["omega"]), float(record["alpha"]), float(record["beta"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+    omega, alpha, beta = params
+    if not all(np.isfinite(params)) or omega <= 0 or alpha < 0 or beta < 0 or alpha + beta >= 1:
+        return None
+    return params
+
+
+async def _load_garch_warm_start(
+    db: AsyncSession, symbol: str, adjustment_mode: str, as_of: date
+) -> Dict[str, Any] | None:
+    """Stored fit for the symbol at the nearest as-of session on or before ``as_of``."""
+    stmt = (
+        select(GarchWarmStart)
+        .where(
+            GarchWarmStart.symbol == symbol.upper(),
+            GarchWarmStart.adjustment_mode == _normalize_adjustment_mode(adjustment_mode),
+            GarchWarmStart.as_of_date <= as_of,
+        )
+        .order_by(GarchWarmStart.as_of_date.desc())
+        .limit(1)
+    )
+    try:
+        row = (await db.execute(stmt)).scalar_one_or_none()
+    except Exception as exc:
+        logger.debug("GARCH warm start lookup failed for %s: %s", symbol, exc)
+        await _rollback_after_query_error(db, "GARCH warm start lookup")
+        return None
+    if row is None:
+        return None
+    return {
+        "omega": row.omega,
+        "alpha": row.alpha,
+        "beta": row.beta,
+        "as_of": row.as_of_date.isoformat(),
+        "observations": row.observations,
+    }
+
+
+async def _store_garch_warm_start(
+    db: AsyncSession, symbol: str, adjustment_mode: str, payload: Dict[str, Any]
+) -> None:
+    fit = payload.get("fit")
+    if not isinstance(fit, dict) or fit.get("mode") == "reused" or payload.get("omega") is None:
+        return
+    row = {
+        "symbol": symbol.upper(),
+        "adjustment_mode": _normalize_adjustment_mode(adjustment_mode),
+        "as_of_date": date.fromisoformat(fit["as_of"]),
+        "omega": payload["omega"],
+        "alpha": payload["alpha"],
+        "beta": payload["beta"],
+        "observations": fit["observations"],
+        "updated_at": datetime.utcnow(),
+    }
+    try:
+        await bulk_upsert(db, GarchWarmStart, ["symbol", "adjustment_mode", "as_of_date"], [row])
+        await db.commit()
+    except Exception as exc:
+        logger.debug("GARCH warm start write failed for %s: %s", symbol, exc)
+        await _rollback_after_query_error(db, "GARCH warm start write")
+
+
+async def _compute_symbol_garch_volatility(
+    frame: pd.DataFrame, *, db: AsyncSession, symbol: str, adjustment_mode: str
+) -> Dict[str, Any]:
+    """GARCH(1,1) for one symbol, warm-started from its latest earlier stored fit."""
+    as_of = pd.to_datetime(frame["time"], errors="coerce").max() if "time" in frame else None
+    warm_start = None
+    if as_of is not None and not pd.isna(as_of):
+        warm_start = await _load_garch_warm_start(db, symbol, adjustment_mode, as_of.date())
+    payload = _compute_garch_volatility(frame, warm_start=warm_start)
+    await _store_garch_warm_start(db, symbol, adjustment_mode, payload)
+    return payload
+
+
 # ---------------------------------------------------------------------------
 # Market-structure tests (variance ratio, squared-return ACF, R/S Hurst).
 # Descriptive diagnostics, numpy/pandas only. scipy is NOT a dependency.
@@ -2494,11 +2643,6 @@ def _compute_market_structure_tests(frame: pd.DataFrame) -> Dict[str, Any]:
     }
 
 
-# Engle-Granger step-2 ADF approximate critical values (cointegration residual,
-# constant only, large sample, MacKinnon). Labeled approximate downstream.
-ADF_COINTEGRATION_CRITICAL = {"1%": -3.90, "5%": -3.34, "10%": -3.04}
-
-
 def _adf_tstat_fixed_lag(residuals: np.ndarray, lag: int = 1) -> float | None:
     """Augmented Dickey-Fuller t-stat on the lag coefficient, fixed augmentation.
 
@@ -2555,10 +2699,7 @@ def _compute_pair_diagnostics(frame_a: pd.DataFrame, frame_b: pd.DataFrame) -> D
         "adf_tstat": None,
         "adf_critical_values": ADF_COINTEGRATION_CRITICAL,
         "adf_verdict": None,
-        "adf_caveat": (
-            "Approximate Engle-Granger step-2 ADF (fixed lag=1, MacKinnon 5% ≈ -3.34). "
-            "Indicative only — not a formal cointegration test."
-        ),
+        "adf_caveat": ADF_CAVEAT,
         "half_life_days": None,
         "rolling_correlation_63d": None,
         "spread_z_score": None,
@@ -2596,14 +2737,6 @@ def _compute_pair_diagnostics(frame_a: pd.DataFrame, frame_b: pd.DataFrame) -> D
     residuals = log_a - (intercept + hedge_ratio * log_b)
 
     adf_tstat = _adf_tstat_fixed_lag(residuals, lag=1)
-    adf_verdict = None
-    if adf_tstat is not None:
-        if adf_tstat <= ADF_COINTEGRATION_CRITICAL["5%"]:
-            adf_verdict = "residual stationary at ~5% (approx)"
-        elif adf_tstat <= ADF_COINTEGRATION_CRITICAL["10%"]:
-            adf_verdict = "residual stationary at ~10% (approx)"
-        else:
-            adf_verdict = "no stationarity evidence (approx)"
 
     # AR(1) half-life on demeaned residual: x_t = phi x_{t-1} + e.
     x = residuals - float(np.mean(residuals))
@@ -2639,7 +2772,7 @@ def _compute_pair_diagnostics(frame_a: pd.DataFrame, frame_b: pd.DataFrame) -> D
         "hedge_intercept": _safe_float(intercept, 4),
         "adf_tstat": adf_tstat,
         "adf_critical_values": ADF_COINTEGRATION_CRITICAL,
-        "adf_verdict": adf_verdict,
+        "adf_verdict": adf_verdict(adf_tstat),
         "adf_caveat": base_payload["adf_caveat"],
         "half_life_days": half_life,
         "rolling_correlation_63d": current_corr,
@@ -3468,149 +3601,79 @@ async def get_relative_rotation(
     lookback_days: int = Query(default=260, ge=120, le=520),
     db: AsyncSession = Depends(get_db),
 ):
-    """Relative Rotation Graph (RRG) snapshot for VN30 versus VNINDEX."""
+    """Relative Rotation Graph (RRG) snapshot for VN30 versus VNINDEX.
+
+    Served from the nightly ``rs_snapshots`` rows; computed from stored bars
+    over ``lookback_days`` only until the first snapshot run.
+    """
     symbol_upper = symbol.upper().strip()
     if not symbol_upper:
         raise HTTPException(status_code=400, detail="Symbol is required")
 
-    end_date = date.today()
-    start_date = end_date - timedelta(days=max(lookback_days * 2, 320))
-    min_overlap_days = min(80, max(40, lookback_days // 5))
-    universe_symbols = set(VN30_SYMBOLS)
-    universe_symbols.add(symbol_upper)
-
-    prices_result = await db.execute(
-        select(StockPrice.symbol, StockPrice.time, StockPrice.close)
-        .where(
-            and_(
-                StockPrice.symbol.in_(sorted(universe_symbols)),
-                StockPrice.interval == "1D",
-                StockPrice.time >= start_date,
-                StockPrice.time <= end_date,
-            )
-        )
-        .order_by(StockPrice.symbol, StockPrice.time)
-    )
-    index_result = await db.execute(
-        select(StockIndex.time, StockIndex.close)
-        .where(
-            and_(
-                StockIndex.index_code == "VNINDEX",
-                StockIndex.time >= start_date,
-                StockIndex.time <= end_date,
-            )
-        )
-        .order_by(StockIndex.time)
-    )
-
-    price_frame = pd.DataFrame(prices_result.all(), columns=["symbol", "time", "close"])
-    index_frame = pd.DataFrame(index_result.all(), columns=["time", "close_index"])
-
-    if price_frame.empty or index_frame.empty:
-        return StandardResponse(
-            data={
-                "symbol": symbol_upper,
-                "benchmark": "VNINDEX",
-                "computed_at": datetime.utcnow(),
-                "selected": None,
-                "universe": [],
-                "coverage": {
-                    "lookback_days": lookback_days,
-                    "min_overlap_days": min_overlap_days,
-                    "price_symbol_count": 0 if price_frame.empty else int(price_frame["symbol"].nunique()),
-                    "benchmark_rows": 0 if index_frame.empty else int(len(index_frame.index)),
-                },
-            },
-            meta=MetaData(count=0),
-            error="Insufficient data for relative rotation.",
-        )
-
-    price_frame["close"] = pd.to_numeric(price_frame["close"], errors="coerce")
-    price_frame = price_frame.dropna(subset=["close"])
-    index_frame["close_index"] = pd.to_numeric(index_frame["close_index"], errors="coerce")
-    index_frame = index_frame.dropna(subset=["close_index"])
-
-    universe_points: List[Dict[str, Any]] = []
-    skipped_symbols: List[Dict[str, Any]] = []
-    for stock_symbol, group in price_frame.groupby("symbol"):
-        merged = group.merge(index_frame, on="time", how="inner")
-        if len(merged) < min_overlap_days:
-            skipped_symbols.append(
-                {
-                    "symbol": stock_symbol,
-                    "overlap_days": int(len(merged)),
-                    "reason": "insufficient_overlap",
-                }
+    universe_symbols = sorted({*VN30_SYMBOLS, symbol_upper})
+    with span("quant.relative_rotation.load"):
+        rotation = await get_rotation(SCOPE_SYMBOL, entities=universe_symbols, db=db)
+    source = "snapshot"
+    if rotation["as_of"] is None:
+        source = "live"
+        end_date = date.today()
+        start_date = end_date - timedelta(days=max(lookback_days * 2, 320))
+        with span("compute.relative_rotation"):
+            rotation = await compute_rotation(
+                db, universe_symbols, start_date=start_date, end_date=end_date
             )
-            continue
 
-        rs_series = (merged["close"] / merged["close_index"]).replace([np.inf, -np.inf], np.nan)
-        rs_series = rs_series.dropna() * 100
-        if len(rs_series) < min_overlap_days:
-            skipped_symbols.append(
-                {
-                    "symbol": stock_symbol,
-                    "overlap_days": int(len(rs_series)),
-                    "reason": "insufficient_clean_rs_series",
-                }
-            )
-            continue
-
-        rs_ratio, rs_momentum = _compute_rrg_metrics(rs_series)
-        if rs_ratio is None or rs_momentum is None:
-            continue
-
-        # QA-v3 E.4: produce a longer trail (up to 12 weekly steps,
-        # spaced 5 trading days apart) so the RRG widget shows a
-        # meaningful rotation path instead of a near-stationary cluster.
-        trail_steps = 12
-        step_distance = 5
-        trail: List[Dict[str, float | None]] = []
-        for step in range(trail_steps, -1, -1):
-            idx = len(rs_series) - 1 - step * step_distance
-            if idx < 30:
-                continue
-            trail_ratio, trail_momentum = _compute_rrg_metrics(rs_series.iloc[: idx + 1])
-            trail.append(
-                {
-                    "rs_ratio": trail_ratio,
-                    "rs_momentum": trail_momentum,
-                }
-            )
-
-        universe_points.append(
-            {
-                "symbol": stock_symbol,
-                "rs_ratio": rs_ratio,
-                "rs_momentum": rs_momentum,
-                "quadrant": _classify_rrg_quadrant(rs_ratio, rs_momentum),
-                "trail": trail,
-            }
-        )
-
-    universe_points = sorted(
-        universe_points,
-        key=lambda item: (item.get("rs_ratio") is not None, item.get("rs_ratio")),
-        reverse=True,
-    )
+    universe_points = rotation["points"]
+    eligible = {point["symbol"] for point in universe_points}
     selected = next((item for item in universe_points if item["symbol"] == symbol_upper), None)
-
     payload: Dict[str, Any] = {
         "symbol": symbol_upper,
-        "benchmark": "VNINDEX",
+        "benchmark": rotation["benchmark"],
         "computed_at": datetime.utcnow(),
+        "as_of": rotation["as_of"],
+        "source": source,
         "selected": selected,
         "universe": universe_points,
         "coverage": {
             "lookback_days": lookback_days,
-            "min_overlap_days": min_overlap_days,
-            "price_symbol_count": int(price_frame["symbol"].nunique()),
-            "benchmark_rows": int(len(index_frame.index)),
             "eligible_symbols": len(universe_points),
-            "skipped_symbols": skipped_symbols[:20],
+            "skipped_symbols": [
+                {"symbol": item, "reason": "insufficient_history"}
+                for item in universe_symbols
+                if item not in eligible
+            ][:20],
         },
     }
-    return StandardResponse(data=payload, meta=MetaData(count=len(universe_points)))
+    return StandardResponse(
+        data=payload,
+        meta=MetaData(count=len(universe_points), last_data_date=rotation["as_of"]),
+        error=None if universe_points else "Insufficient data for relative rotation.",
+    )
+
+
+@router.get("/rotation/{scope}", response_model=StandardResponse[Dict[str, Any]])
+async def get_rotation_board(
+    scope: Literal["universe", "sectors"],
+    weeks: int = Query(default=12, ge=1, le=52),
+    limit: int = Query(default=500, ge=1, le=2000),
+    db: AsyncSession = Depends(get_db),
+):
+    """Precomputed RRG for every symbol or every ``VN_SECTORS`` group versus
+    VNINDEX, strongest RS-Ratio first, with weekly trails."""
+    snapshot_scope = SCOPE_SECTOR if scope == "sectors" else SCOPE_SYMBOL
+    with span("quant.rotation_board.load"):
+        rotation = await get_rotation(snapshot_scope, weeks=weeks, db=db)
+    points = rotation["points"][:limit]
+    if scope == "sectors":
+        for point in points:
+            sector_cfg = VN_SECTORS.get(point["symbol"])
+            point["name"] = sector_cfg.name_en if sector_cfg else point["symbol"]
+
+    return StandardResponse(
+        data={**rotation, "scope": scope, "weeks": weeks, "points": points},
+        meta=MetaData(count=len(points), last_data_date=rotation["as_of"]),
+        error=None if points else "No relative-rotation snapshots yet.",
+    )
 
 
 @router.get("/{symbol}/volume-flow", response_model=StandardResponse[Dict[str, Any]])
@@ -3940,6 +4003,96 @@ async def get_pair_diagnostics(
     )
 
 
+async def _adjust_close_panel(
+    db: AsyncSession, panel: ClosePanel, start_date: date, end_date: date
+) -> ClosePanel:
+    """Apply stored corporate actions to each panel column (adjusted mode)."""
+    closes = panel.closes.copy()
+    days = [day.item() for day in panel.dates]
+    actions_by_symbol = await _load_corporate_actions_for_symbols(
+        db, list(panel.symbols), start_date, end_date
+    )
+    for column, symbol in enumerate(panel.symbols):
+        actions = actions_by_symbol.get(symbol)
+        if not actions:
+            continue
+        observed = np.flatnonzero(closes[:, column] > 0)
+        rows = [
+            EquityHistoricalData(
+                symbol=symbol,
+                time=days[index],
+                open=closes[index, column],
+                high=closes[index, column],
+                low=closes[index, column],
+                close=closes[index, column],
+                volume=0,
+            )
+            for index in observed.tolist()
+        ]
+        adjusted = _apply_corporate_action_adjustments(rows, actions, "adjusted")
+        closes[observed, column] = [row.close for row in adjusted]
+    return ClosePanel(dates=panel.dates, symbols=panel.symbols, closes=closes)
+
+
+@router.get("/pairs/scan", response_model=StandardResponse[Dict[str, Any]])
+async def scan_pair_basket(
+    basket: str | None = Query(default=None, description="Sector id, e.g. vn30 or banking"),
+    symbols: str | None = Query(default=None, description="Comma-separated tickers"),
+    period: str = Query(default="3Y"),
+    source: str = Query(default=settings.vnstock_source, pattern=r"^(KBS|VCI|MSN|FMP)$"),
+    adjustment_mode: str = Query(default="adjusted", pattern=r"^(raw|adjusted)$"),
+    limit: int = Query(default=25, ge=1, le=500),
+    max_half_life: float | None = Query(default=None, gt=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """Scan every pair in a basket: correlation matrices, OLS hedge ratios,
+    approximate Engle-Granger ADF, spread half-life and z-score, ranked by
+    half-life then |z|. Descriptive — not a trading signal."""
+    if symbols:
+        basket_name = "custom"
+        members = normalize_basket_symbols(symbols.split(","))
+    elif basket:
+        basket_name = basket.strip().lower()
+        if get_sector_by_id(basket_name) is None:
+            raise HTTPException(status_code=400, detail=f"Unknown basket: {basket}")
+        members = await resolve_sector_symbols(db, basket_name, MAX_BASKET_SYMBOLS)
+    else:
+        raise HTTPException(status_code=400, detail="Provide a basket or a symbols list")
+    if len(members) < 2:
+        raise HTTPException(status_code=400, detail="A pair scan needs at least two symbols")
+    if len(members) > MAX_BASKET_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A pair scan accepts at most {MAX_BASKET_SYMBOLS} symbols",
+        )
+
+    period_upper = _normalize_quant_period(period)
+    end_date = date.today()
+    start_date = _resolve_start_date(period_upper, end_date)
+    with span("quant.pair_scan.load"):
+        panel = await load_close_panel(members, start_date, end_date, source=source)
+        if _normalize_adjustment_mode(adjustment_mode) == "adjusted":
+            panel = await _adjust_close_panel(db, panel, start_date, end_date)
+    with span("compute.pair_scan"):
+        payload = scan_pairs(panel, limit=limit, max_half_life=max_half_life)
+
+    return StandardResponse(
+        data={
+            "basket": basket_name,
+            "period": period_upper,
+            "adjustment_mode": _normalize_adjustment_mode(adjustment_mode),
+            "metric": "pair_scan",
+            **payload,
+        },
+        meta=MetaData(
+            count=payload["candidate_count"],
+            data_points=payload["sessions"],
+            last_data_date=payload["end_date"],
+        ),
+        error=None if payload["scanned_pairs"] else "Insufficient overlap for any pair.",
+    )
+
+
 @router.post("/{symbol}/backtest", response_model=StandardResponse[QuantBacktestResponseData])
 async def run_quant_backtest(
     symbol: str,
@@ -4200,12 +4353,19 @@ async def get_quant_metrics(
                         end_date=end_date,
                         source=source,
                     )
-                computed_metrics[metric_name] = _compute_benchmark_risk(
-                    frame.copy(),
-                    benchmark_frame,
-                )
+                with span("compute.benchmark_risk"):
+                    computed_metrics[metric_name] = _compute_benchmark_risk(
+                        frame.copy(),
+                        benchmark_frame,
+                    )
+            elif metric_name == "garch_volatility":
+                with span("compute.garch_volatility"):
+                    computed_metrics[metric_name] = await _compute_symbol_garch_volatility(
+                        frame.copy(), db=db, symbol=symbol_upper, adjustment_mode=adjustment_mode
+                    )
             else:
-                computed_metrics[metric_name] = calculator(frame.copy())
+                with span(f"compute.{metric_name}"):
+                    computed_metrics[metric_name] = calculator(frame.copy())
         except Exception as exc:
             logger.warning("Quant metric %s failed for %s: %s", metric_name, symbol_upper, exc)
             computed_metrics[metric_name] = {"error": str(exc)}
@@ -13,13 +13,22 @@ import math
 from datetime import date, datetime, timedelta
 from typing import Any, List, Optional, Callable, Awaitable
 
-from fastapi import APIRouter, Query, Request, Depends
+from fastapi import APIRouter, Query, Request, Depends, Response
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 import pandas as pd
 
 from vnibb.core.config import settings
 from vnibb.core.database import get_db
+from vnibb.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    attach_cursor,
+    decode_cursor,
+    next_cursor,
+    parse_fields,
+    projected_response,
+    seek_after,
+)
 from vnibb.models.stock import Stock, StockPrice
 from vnibb.models.company import Company
 from vnibb.models.financials import IncomeStatement, BalanceSheet, CashFlow
@@ -39,6 +48,8 @@ from vnibb.core.retry import vnstock_cb
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+SCREENER_CURSOR = "screener"
+
 _REFRESH_LOCK = asyncio.Lock()
 _REFRESH_IN_FLIGHT: set[str] = set()
 
@@ -61,6 +72,13 @@ def _coerce_meta_datetime(value: Any) -> Optional[datetime]:
     return None
 
 
+def _page_rows(
+    rows: List[ScreenerData], after_symbol: Optional[str], limit: int
+) -> List[ScreenerData]:
+    """One page of an ordered row list, continuing after the cursor's symbol."""
+    return seek_after(rows, lambda row: row.symbol, after_symbol)[:limit]
+
+
 def _latest_screener_timestamp(rows: List[ScreenerData]) -> Optional[str]:
     timestamps = [
         parsed
@@ -1400,6 +1418,7 @@ async def _prepare_cached_screener_rows(
     as_of_date: Optional[date],
     min_listing_age_days: Optional[int],
     target_upside_min: Optional[float],
+    after_symbol: Optional[str] = None,
 ) -> tuple[List[ScreenerData], dict[str, Any]]:
     data = [_to_screener_data_row(snapshot) for snapshot in snapshots]
 
@@ -1428,10 +1447,12 @@ async def _prepare_cached_screener_rows(
         and not industry
         and min_listing_age_days is None
         and target_upside_min is None
-        and len(data) > limit
+        and (len(data) > limit or after_symbol is not None)
     )
     if can_early_limit:
-        data = data[:limit]
+        # Snapshot order is the final order here, so only the requested page
+        # is hydrated and enriched, however deep the cursor is.
+        data = _page_rows(data, after_symbol, limit)
 
     data = await _hydrate_screener_rows(data, db)
     data = fill_market_cap(data)
@@ -1468,8 +1489,10 @@ async def _prepare_cached_screener_rows(
             sort_order=sort_order,
         )
     data = _sort_discovery_rows(data, sort_by, sort_order)
+    if not can_early_limit:
+        data = _page_rows(data, after_symbol, limit)
 
-    return data[:limit], discovery_meta
+    return data, discovery_meta
 
 
 async def _refresh_screener_cache(params: StockScreenerParams) -> None:
@@ -1513,6 +1536,7 @@ async def _refresh_screener_cache(params: StockScreenerParams) -> None:
 )
 async def get_screener(
     request: Request,
+    response: Response,
     symbol: Optional[str] = Query(None),
     universe: str = Query(default="ALL", pattern=r"^(ALL|VN30|VN100|HNX30)$"),
     exchange: str = Query(default="ALL", pattern=r"^(HOSE|HNX|UPCOM|ALL)$"),
@@ -1551,9 +1575,16 @@ async def get_screener(
     fcf_positive: Optional[bool] = Query(None),
     sort_by: Optional[str] = Query(None),
     sort_order: str = Query(default="desc", pattern=r"^(asc|desc)$"),
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    ),
+    fields: Optional[str] = Query(None, description="Comma-separated row fields to return"),
     db: AsyncSession = Depends(get_db),
 ) -> StandardResponse[List[ScreenerData]]:
     cache_manager = CacheManager(db)
+    after = decode_cursor(cursor, SCREENER_CURSOR)
+    after_symbol = str(after[0]) if after else None
+    selection = parse_fields(fields, ScreenerData)
 
     async def _respond(
         rows: List[ScreenerData],
@@ -1566,6 +1597,9 @@ async def get_screener(
     ) -> StandardResponse[List[ScreenerData]]:
         """Single funnel for every row-emitting return path: merge fundamental
         snapshots, apply fundamental filters, then build the response."""
+        # The cursor anchors on the page as sliced, before fundamental filters
+        # drop rows from it, so the next page resumes where this one ended.
+        page_cursor = next_cursor(SCREENER_CURSOR, rows, lambda row: (row.symbol,), limit)
         rows = await _finalize_fundamental_rows(
             rows,
             moat=moat,
@@ -1574,17 +1608,25 @@ async def get_screener(
             dividend_years_min=dividend_years_min,
             fcf_positive=fcf_positive,
         )
-        return StandardResponse(
-            data=rows,
-            meta=_build_screener_meta(
-                rows,
-                cached=cached,
-                stale=stale,
-                fallback=fallback,
-                cached_at=cached_at,
-                discovery_meta=discovery_meta,
-            ),
+        meta = _build_screener_meta(
+            rows,
+            cached=cached,
+            stale=stale,
+            fallback=fallback,
+            cached_at=cached_at,
+            discovery_meta=discovery_meta,
         )
+        if selection.is_projected:
+            return projected_response(
+                {
+                    "data": [selection.project(row) for row in rows],
+                    "meta": meta.model_dump(),
+                    "error": None,
+                },
+                cursor=page_cursor,
+            )
+        attach_cursor(response, page_cursor)
+        return StandardResponse(data=rows, meta=meta)
 
     if use_cache and not refresh:
         try:
@@ -1618,6 +1660,7 @@ async def get_screener(
                     as_of_date=as_of_date,
                     min_listing_age_days=min_listing_age_days,
                     target_upside_min=target_upside_min,
+                    after_symbol=after_symbol,
                 )
                 if cache_result.is_stale and not refresh:
                     refresh_key = f"screener:{source}:full"
@@ -1673,6 +1716,7 @@ async def get_screener(
                         as_of_date=as_of_date,
                         min_listing_age_days=min_listing_age_days,
                         target_upside_min=target_upside_min,
+                        after_symbol=after_symbol,
                     )
                     return await _respond(
                         data,
@@ -1727,7 +1771,7 @@ async def get_screener(
             sort_by=sort_by,
             sort_order=sort_order,
         )
-        data = _sort_discovery_rows(data, sort_by, sort_order)[:limit]
+        data = _page_rows(_sort_discovery_rows(data, sort_by, sort_order), after_symbol, limit)
 
         await cache_manager.store_screener_data(data=[d.model_dump() for d in cache_data], source=source)
         return await _respond(data, discovery_meta=discovery_meta)
@@ -1764,6 +1808,7 @@ async def get_screener(
                     as_of_date=as_of_date,
                     min_listing_age_days=min_listing_age_days,
                     target_upside_min=target_upside_min,
+                    after_symbol=after_symbol,
                 )
                 return await _respond(
                     data,
@@ -175,6 +175,87 @@ def _build_sector_symbol_list(
     return merged[:symbol_limit]
 
 
+async def _load_sector_membership_rows(
+    db: AsyncSession,
+) -> tuple[list[tuple[str, str | None, str | None]], dict[str, float]]:
+    """(symbol, industry, sector) rows plus latest market caps for sector membership."""
+    latest_snapshot_date = (
+        await db.execute(select(func.max(ScreenerSnapshot.snapshot_date)))
+    ).scalar()
+
+    stock_rows = (
+        await db.execute(
+            select(Stock.symbol, Stock.industry, Stock.sector).where(Stock.is_active == 1)
+        )
+    ).all()
+
+    snapshot_industry_rows: list[tuple[str, str | None, str | None]] = []
+
+    market_cap_by_symbol: dict[str, float] = {}
+    if latest_snapshot_date is not None:
+        snapshot_rows = (
+            await db.execute(
+                select(ScreenerSnapshot.symbol, ScreenerSnapshot.market_cap).where(
+                    ScreenerSnapshot.snapshot_date == latest_snapshot_date,
+                    ScreenerSnapshot.market_cap.is_not(None),
+                )
+            )
+        ).all()
+        for symbol, market_cap in snapshot_rows:
+            market_cap_value = _coerce_optional_float(market_cap)
+            if market_cap_value is not None:
+                market_cap_by_symbol[str(symbol).strip().upper()] = market_cap_value
+
+        snapshot_industry_rows = (
+            await db.execute(
+                select(ScreenerSnapshot.symbol, ScreenerSnapshot.industry).where(
+                    ScreenerSnapshot.snapshot_date == latest_snapshot_date,
+                    ScreenerSnapshot.industry.is_not(None),
+                )
+            )
+        ).all()
+
+    combined_rows = list(stock_rows)
+    combined_rows.extend((symbol, industry, None) for symbol, industry in snapshot_industry_rows)
+    return combined_rows, market_cap_by_symbol
+
+
+async def resolve_sector_symbols(
+    db: AsyncSession, sector_id: str, symbol_limit: int = 50
+) -> list[str]:
+    """Member symbols of a ``VN_SECTORS`` group, largest market cap first."""
+    sector_cfg = get_sector_by_id(sector_id)
+    if not sector_cfg:
+        return []
+    if sector_id == "vn30":
+        return _build_sector_symbol_list(sector_id, sector_cfg, [], {}, symbol_limit)
+    combined_rows, market_cap_by_symbol = await _load_sector_membership_rows(db)
+    return _build_sector_symbol_list(
+        sector_id=sector_id,
+        sector_cfg=sector_cfg,
+        stock_rows=combined_rows,
+        market_cap_by_symbol=market_cap_by_symbol,
+        symbol_limit=symbol_limit,
+    )
+
+
+async def resolve_all_sector_symbols(
+    db: AsyncSession, symbol_limit: int = 50
+) -> dict[str, list[str]]:
+    """Member symbols of every ``VN_SECTORS`` group from one membership load."""
+    combined_rows, market_cap_by_symbol = await _load_sector_membership_rows(db)
+    return {
+        sector_id: _build_sector_symbol_list(
+            sector_id=sector_id,
+            sector_cfg=sector_cfg,
+            stock_rows=combined_rows,
+            market_cap_by_symbol=market_cap_by_symbol,
+            symbol_limit=symbol_limit,
+        )
+        for sector_id, sector_cfg in get_all_sectors().items()
+    }
+
+
 class SectorTopMoversResponse(BaseModel):
     count: int
     type: str
@@ -222,44 +303,7 @@ async def list_sectors(
     if not sectors:
         return {}
 
-    latest_snapshot_date = (
-        await db.execute(select(func.max(ScreenerSnapshot.snapshot_date)))
-    ).scalar()
-
-    stock_rows = (
-        await db.execute(
-            select(Stock.symbol, Stock.industry, Stock.sector).where(Stock.is_active == 1)
-        )
-    ).all()
-
-    snapshot_industry_rows: list[tuple[str, str | None, str | None]] = []
-
-    market_cap_by_symbol: dict[str, float] = {}
-    if latest_snapshot_date is not None:
-        snapshot_rows = (
-            await db.execute(
-                select(ScreenerSnapshot.symbol, ScreenerSnapshot.market_cap).where(
-                    ScreenerSnapshot.snapshot_date == latest_snapshot_date,
-                    ScreenerSnapshot.market_cap.is_not(None),
-                )
-            )
-        ).all()
-        for symbol, market_cap in snapshot_rows:
-            market_cap_value = _coerce_optional_float(market_cap)
-            if market_cap_value is not None:
-                market_cap_by_symbol[str(symbol).strip().upper()] = market_cap_value
-
-        snapshot_industry_rows = (
-            await db.execute(
-                select(ScreenerSnapshot.symbol, ScreenerSnapshot.industry).where(
-                    ScreenerSnapshot.snapshot_date == latest_snapshot_date,
-                    ScreenerSnapshot.industry.is_not(None),
-                )
-            )
-        ).all()
-
-    combined_rows = list(stock_rows)
-    combined_rows.extend((symbol, industry, None) for symbol, industry in snapshot_industry_rows)
+    combined_rows, market_cap_by_symbol = await _load_sector_membership_rows(db)
 
     payload: dict[str, dict] = {}
     for sector_id, sector_cfg in sectors.items():
@@ -16,12 +16,14 @@ from typing import Any, Literal
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from vnibb.api.v1.market import _fetch_yahoo_market_indices, _merge_market_index_rows
+from vnibb.core.auth import AuthError, get_current_user
 from vnibb.core.config import settings
 from vnibb.providers.vnstock.equity_screener import StockScreenerParams, VnstockScreenerFetcher
 from vnibb.providers.vnstock.market_overview import (
     MarketOverviewQueryParams,
     VnstockMarketOverviewFetcher,
 )
+from vnibb.services.alert_rule_engine import Tick, alert_rule_engine
 from vnibb.services.websocket_service import VN_TZ, PriceUpdate, manager
 
 logger = logging.getLogger(__name__)
@@ -144,6 +146,26 @@ def _to_int(value: Any) -> int:
     return int(parsed) if parsed is not None else 0
 
 
+async def _alert_user_id(websocket: WebSocket) -> str | None:
+    """
+    Authenticated alert-rule owner of the handshake, or None when anonymous.
+
+    Browsers cannot set headers on a WebSocket handshake, so the bearer token
+    is also accepted as the ``token`` query parameter.
+
+    Raises:
+        AuthError: If credentials were presented but do not validate
+    """
+    authorization = websocket.headers.get("authorization")
+    token = websocket.query_params.get("token")
+    if not authorization and token:
+        authorization = f"Bearer {token}"
+    if not authorization:
+        return None
+    user = await get_current_user(authorization)
+    return user.id
+
+
 async def _fetch_index_updates(index_codes: set[str]) -> list[PriceUpdate]:
     if not index_codes:
         return []
@@ -209,18 +231,22 @@ async def _fetch_and_broadcast_equity(symbol: str, semaphore: asyncio.Semaphore)
             if not results:
                 return
             stock = results[0]
-            await manager.broadcast_price(
-                symbol,
-                PriceUpdate(
-                    symbol=symbol,
-                    price=float(stock.price) if stock.price else 0.0,
-                    change=0.0,
-                    change_pct=0.0,
-                    volume=int(stock.volume) if stock.volume else 0,
-                    timestamp=datetime.now(VN_TZ).isoformat(),
-                ),
-                settings.websocket_send_timeout_seconds,
+            update = PriceUpdate(
+                symbol=symbol,
+                price=float(stock.price) if stock.price else 0.0,
+                change=0.0,
+                change_pct=0.0,
+                volume=int(stock.volume) if stock.volume else 0,
+                timestamp=datetime.now(VN_TZ).isoformat(),
             )
+            await manager.broadcast_price(symbol, update, settings.websocket_send_timeout_seconds)
+            if update.price > 0:
+                try:
+                    await alert_rule_engine.process_tick(
+                        Tick(symbol=symbol, price=update.price, volume=update.volume)
+                    )
+                except Exception as error:
+                    logger.warning("Alert rule evaluation failed for %s: %s", symbol, error)
         except BaseException as e:
             if isinstance(e, (KeyboardInterrupt, GeneratorExit, asyncio.CancelledError)):
                 raise
@@ -277,11 +303,17 @@ async def fetch_and_broadcast_prices():
     """Background task to fetch and broadcast prices."""
     while True:
         try:
-            if manager.active_connection_count() == 0 or manager.total_subscription_count() == 0:
+            if manager.active_connection_count() == 0:
+                await asyncio.sleep(IDLE_SLEEP_SECONDS)
+                continue
+            # Connected clients also receive rule alerts, so rule symbols are
+            # polled even when nobody subscribed to their prices.
+            symbols = manager.get_all_subscribed_symbols() | alert_rule_engine.watched_symbols()
+            if not symbols:
                 await asyncio.sleep(IDLE_SLEEP_SECONDS)
                 continue
             market_open = is_market_open()
-            await _run_price_cycle(manager.get_all_subscribed_symbols(), market_open)
+            await _run_price_cycle(symbols, market_open)
             await asyncio.sleep(ACTIVE_MARKET_SLEEP_SECONDS if market_open else IDLE_SLEEP_SECONDS)
         except BaseException as e:
             if isinstance(e, (KeyboardInterrupt, GeneratorExit, asyncio.CancelledError)):
@@ -295,6 +327,11 @@ async def websocket_prices(websocket: WebSocket):
     """
     WebSocket endpoint for real-time price updates.
 
+    Connect with ``?token=<access token>`` (or an ``Authorization: Bearer``
+    header) to also receive the authenticated user's alert rule matches.
+    Anonymous connections get prices only; invalid credentials close the
+    connection with code 1008.
+
     Client sends:
     - {"action": "subscribe", "symbols": ["VNM", "FPT"]}
     - {"action": "unsubscribe", "symbols": ["VNM"]}
@@ -303,6 +340,7 @@ async def websocket_prices(websocket: WebSocket):
     Server sends:
     - {"symbol": "VNM", "price": 61000, "change": 500, "change_pct": 0.82, ...}
     - {"type": "market_status", "is_open": true, ...}
+    - {"type": "rule_alert", "rule_id": 11, "symbol": "VNM", ...} (owner only)
     """
     origin = websocket.headers.get("origin", "")
     if not _is_allowed_ws_origin(origin):
@@ -310,7 +348,14 @@ async def websocket_prices(websocket: WebSocket):
         await websocket.close(code=1008)
         return
 
-    if not await manager.connect(websocket):
+    try:
+        user_id = await _alert_user_id(websocket)
+    except AuthError as exc:
+        logger.warning("Rejected WebSocket credentials: %s", exc.detail)
+        await websocket.close(code=1008)
+        return
+
+    if not await manager.connect(websocket, user_id):
         return
 
     if not await manager.send_json(
@@ -11,6 +11,8 @@ round-trips when a result is fresh.
 """
 
 import asyncio
+import hashlib
+import inspect
 import json
 import logging
 import os
@@ -20,13 +22,20 @@ from datetime import datetime, timedelta
 
 from typing import Any, Awaitable, Callable, Optional, TypeVar, Union, Dict, List
 
+import orjson
 import redis.asyncio as redis
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response
 from pydantic import BaseModel
 
 from vnibb.core.config import settings
+from vnibb.core.instrumentation import span, traced
 from vnibb.core.cache_constants import (
     REDIS_CACHE_TTLS as CACHE_TTLS,
     REDIS_CACHE_PREFIX_SHORT as CACHE_PREFIX_SHORT,
+    REDIS_CACHE_DATASETS as CACHE_DATASETS,
+    REDIS_TTL_DATASET_VERSIONED,
 )
 
 logger = logging.getLogger(__name__)
@@ -91,6 +100,11 @@ def _redis_cache_enabled() -> bool:
     return backend == "redis" and bool(settings.redis_url)
 
 
+def redis_cache_available() -> bool:
+    """Whether cache reads and writes should go to Redis right now."""
+    return _redis_cache_enabled() and redis_client.is_connected
+
+
 def _has_error_result(result: Any) -> bool:
     error = result.get("error") if isinstance(result, dict) else getattr(result, "error", None)
     return bool(error)
@@ -105,15 +119,76 @@ def _record_cache_outcome(key_prefix: str, outcome: str) -> None:
         pass
 
 
+# Keyword-only ``Request`` parameter appended to the signature FastAPI sees
+# for every ``@cached`` endpoint. Its presence tells the wrapper the call came
+# through a route, so the cache can hold and serve the final response bytes.
+_ROUTE_REQUEST_PARAM = "_cached_route_request"
+
+
+async def encode_route_payload(request: Request, result: Any) -> bytes:
+    """Encode ``result`` to the JSON bytes the matched route would send.
+
+    Routes with a response model go through FastAPI's own ``serialize_response``
+    in its pydantic-core ``dump_json`` mode, so a cached body is byte-for-byte
+    what an uncached call returns; untyped routes fall back to orjson.
+    """
+    route = request.scope.get("route")
+    field = getattr(route, "response_field", None)
+    if field is not None:
+        return await serialize_response(
+            field=field,
+            response_content=result,
+            include=route.response_model_include,
+            exclude=route.response_model_exclude,
+            by_alias=route.response_model_by_alias,
+            exclude_unset=route.response_model_exclude_unset,
+            exclude_defaults=route.response_model_exclude_defaults,
+            exclude_none=route.response_model_exclude_none,
+            dump_json=True,
+        )
+    return orjson.dumps(jsonable_encoder(result))
+
+
+def payload_etag(body: bytes) -> str:
+    """Strong ETag for an encoded response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def encoded_json_response(request: Request, body: bytes) -> Response:
+    route = request.scope.get("route")
+    return Response(
+        content=body,
+        status_code=getattr(route, "status_code", None) or 200,
+        media_type="application/json",
+        headers={"ETag": payload_etag(body)},
+    )
+
+
+def _with_route_request_param(func: Callable[..., Any]) -> inspect.Signature:
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    request_param = inspect.Parameter(
+        _ROUTE_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request
+    )
+    if parameters and parameters[-1].kind is inspect.Parameter.VAR_KEYWORD:
+        parameters.insert(len(parameters) - 1, request_param)
+    else:
+        parameters.append(request_param)
+    return signature.replace(parameters=parameters)
+
+
 def resolve_cache_ttl(ttl: Optional[int], key_prefix: str) -> int:
     """Resolve the effective cache TTL for a decorated function.
 
-    Precedence: explicit ``ttl`` > centralized ``CACHE_TTLS[key_prefix]`` >
+    Precedence: explicit ``ttl`` > dataset-versioned ceiling for prefixes in
+    ``CACHE_DATASETS`` > centralized ``CACHE_TTLS[key_prefix]`` >
     ``settings.redis_cache_ttl``. Kept as a pure function so the resolution
     order can be unit-tested without exercising Redis.
     """
     if ttl is not None:
         return ttl
+    if key_prefix in CACHE_DATASETS:
+        return REDIS_TTL_DATASET_VERSIONED
     return CACHE_TTLS.get(key_prefix, settings.redis_cache_ttl)
 
 
@@ -122,27 +197,34 @@ def cached(
     key_prefix: str = "cache",
     exclude_args: Optional[List[int]] = None,
     exclude_kwargs: Optional[List[str]] = None,
+    ttl_for: Callable[[dict[str, Any], Any], int | None] | None = None,
 ):
     """
     Decorator for caching async function results in Redis.
 
+    When the decorated function is called as a FastAPI endpoint, the cache
+    stores the final encoded response body and serves hits as a raw
+    ``Response`` with an ETag, skipping model building and JSON encoding.
+    Direct Python callers keep getting decoded values from a separate key.
+
     Args:
         ttl: Time to live in seconds (defaults to settings.redis_cache_ttl)
         key_prefix: Prefix for the cache key
         exclude_args: List of argument indices to exclude from cache key
         exclude_kwargs: List of keyword argument names to exclude from cache key
+        ttl_for: Optional ``(kwargs, result) -> ttl`` hook; a non-None return
+            overrides the TTL for that one entry (e.g. shorter for volatile results)
     """
     import functools
-    import hashlib
 
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            route_request = kwargs.pop(_ROUTE_REQUEST_PARAM, None)
             if settings.environment == "test":
                 return await func(*args, **kwargs)
 
-            redis_enabled = _redis_cache_enabled()
-            redis_available = redis_enabled and redis_client._client is not None
+            redis_available = redis_cache_available()
 
             effective_ttl = resolve_cache_ttl(ttl, key_prefix)
 
@@ -157,7 +239,7 @@ def cached(
                 # Skip the first arg if it's 'self' or 'cls' (instance methods)
                 # But here we don't know for sure, so we include it unless excluded
                 # Except if it's Request, Response, BackgroundTasks etc (FastAPI deps)
-                from fastapi import Request, Response, BackgroundTasks
+                from fastapi import BackgroundTasks
 
                 if isinstance(arg, (Request, Response, BackgroundTasks)):
                     continue
@@ -171,7 +253,7 @@ def cached(
                 if exclude_kwargs and k in exclude_kwargs:
                     continue
                 # Skip FastAPI dependencies
-                from fastapi import Request, Response, BackgroundTasks
+                from fastapi import BackgroundTasks
                 from sqlalchemy.orm import Session
                 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -184,27 +266,41 @@ def cached(
             if filtered_kwargs:
                 key_parts.append(str(filtered_kwargs))
 
+            # Dataset-versioned prefixes roll their key when a sync bumps an input.
+            datasets = CACHE_DATASETS.get(key_prefix)
+            if datasets:
+                from vnibb.core.dataset_versions import dataset_versions
+
+                versions = await dataset_versions.get_many(datasets)
+                key_parts.append(",".join(f"{name}@{versions[name]}" for name in datasets))
+
             # Generate stable hash to avoid key length issues
             key_string = ":".join(key_parts)
             short_prefix = CACHE_PREFIX_SHORT.get(key_prefix, key_prefix[:2])
-            cache_key = f"v:{short_prefix}:{hashlib.md5(key_string.encode()).hexdigest()}"
+            key_hash = hashlib.md5(key_string.encode()).hexdigest()
+            encoded = route_request is not None
+            # Encoded bodies live beside the object entry so prefix flushes cover both.
+            cache_key = f"v:{short_prefix}:{'r:' if encoded else ''}{key_hash}"
 
             # Helper for memory fallback
             async def get_mem_cache():
                 now = datetime.now()
-                async with _memory_cache_lock:
-                    cached_entry = _memory_cache.get(cache_key)
-                    if not cached_entry:
+                with span("cache.memory.get"):
+                    async with _memory_cache_lock:
+                        cached_entry = _memory_cache.get(cache_key)
+                        if not cached_entry:
+                            return None
+                        data, expiry = cached_entry
+                        if now < expiry:
+                            return data
+                        _memory_cache.pop(cache_key, None)
                         return None
-                    data, expiry = cached_entry
-                    if now < expiry:
-                        return data
-                    _memory_cache.pop(cache_key, None)
-                    return None
 
-            async def set_mem_cache(data):
+            async def set_mem_cache(data, entry_ttl: int):
                 try:
-                    payload_size = len(json.dumps(data, default=str))
+                    payload_size = (
+                        len(data) if encoded else len(json.dumps(data, default=str))
+                    )
                 except (TypeError, ValueError):
                     payload_size = 0
 
@@ -217,7 +313,7 @@ def cached(
                     )
                     return
 
-                expiry = datetime.now() + timedelta(seconds=effective_ttl)
+                expiry = datetime.now() + timedelta(seconds=entry_ttl)
                 async with _memory_cache_lock:
                     _memory_cache.pop(cache_key, None)
                     _memory_cache[cache_key] = (data, expiry)
@@ -227,7 +323,11 @@ def cached(
                 nonlocal redis_available
                 if redis_available:
                     try:
-                        cached_data = await redis_client.get_json(cache_key)
+                        if encoded:
+                            raw = await redis_client.get(cache_key)
+                            cached_data = raw.encode() if raw else None
+                        else:
+                            cached_data = await redis_client.get_json(cache_key)
                         if cached_data is not None:
                             return cached_data
                     except Exception as redis_err:
@@ -245,6 +345,8 @@ def cached(
                 return await func(*args, **kwargs)
             if cached_data is not None:
                 _record_cache_outcome(key_prefix, "hit")
+                if encoded:
+                    return encoded_json_response(route_request, cached_data)
                 return cached_data
 
             async def load_and_store() -> Any:
@@ -260,22 +362,30 @@ def cached(
 
                 _record_cache_outcome(key_prefix, "miss")
                 result = await func(*args, **kwargs)
-                if _has_error_result(result):
+                if _has_error_result(result) or isinstance(result, Response):
                     return result
+                entry_ttl = (ttl_for(kwargs, result) if ttl_for else None) or effective_ttl
+                if encoded:
+                    result = await encode_route_payload(route_request, result)
 
                 stored_in_redis = False
                 if redis_available:
                     try:
-                        stored_in_redis = await redis_client.set_json(
-                            cache_key, result, ttl=effective_ttl
-                        )
+                        if encoded:
+                            stored_in_redis = await redis_client.set(
+                                cache_key, result.decode(), ttl=entry_ttl
+                            )
+                        else:
+                            stored_in_redis = await redis_client.set_json(
+                                cache_key, result, ttl=entry_ttl
+                            )
                     except Exception as redis_err:
                         logger.warning(f"Failed to set Redis cache: {redis_err}")
                 if not stored_in_redis:
                     if redis_available:
                         _record_cache_outcome(key_prefix, "store_error")
                     try:
-                        await set_mem_cache(result)
+                        await set_mem_cache(result, entry_ttl)
                     except Exception as error:
                         logger.warning(f"Failed to set memory cache: {error}")
                         _record_cache_outcome(key_prefix, "store_error")
@@ -297,13 +407,29 @@ def cached(
                 else:
                     _record_cache_outcome(key_prefix, "waiter")
 
-            return await asyncio.shield(task)
+            value = await asyncio.shield(task)
+            if encoded and isinstance(value, bytes):
+                return encoded_json_response(route_request, value)
+            return value
 
+        wrapper.__signature__ = _with_route_request_param(func)
         return wrapper
 
     return decorator
 
 
+# Raise-only integer write: keeps the larger of the stored and new value.
+_SET_MAX_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]))
+local value = tonumber(ARGV[1])
+if current and current >= value then
+    return current
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return value
+"""
+
+
 class RedisClient:
     """
     Async Redis client wrapper with JSON serialization support.
@@ -358,6 +484,10 @@ class RedisClient:
             self._pool = None
             logger.info("Redis connection closed")
 
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None
+
     @property
     def client(self) -> redis.Redis:
         """Get Redis client, raise if not connected."""
@@ -388,6 +518,20 @@ class RedisClient:
             logger.warning(f"Redis SET error for key {key}: {e}")
             return False
 
+    async def set_max(self, key: str, value: int, ttl: int | None = None) -> int | None:
+        """Store integer ``value`` unless the key already holds a larger one.
+
+        Returns the value left in Redis (``None`` on error), so a stale writer
+        can never lower a counter another process has already advanced.
+        """
+        try:
+            ttl = ttl or settings.redis_cache_ttl
+            return int(await self.client.eval(_SET_MAX_SCRIPT, 1, key, value, ttl))
+        except (redis.RedisError, RuntimeError, TypeError, ValueError) as e:
+            logger.warning(f"Redis SET_MAX error for key {key}: {e}")
+            return None
+
+    @traced("cache.redis.get")
     async def get_json(self, key: str) -> Optional[Any]:
         """Get JSON-deserialized value from cache."""
         raw = await self.get(key)
@@ -398,6 +542,7 @@ class RedisClient:
                 logger.warning(f"Invalid JSON in cache for key {key}")
         return None
 
+    @traced("cache.redis.mget")
     async def get_multiple(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Batch get JSON values from cache."""
         if not keys:
@@ -418,6 +563,7 @@ class RedisClient:
             logger.warning(f"Redis MGET error: {e}")
             return {key: None for key in keys}
 
+    @traced("cache.redis.set")
     async def set_json(
         self,
         key: str,
@@ -578,7 +724,9 @@ class TtlCache:
     def __init__(self, default_ttl: float = 600.0) -> None:
         self._default_ttl = default_ttl
         self._store: dict[str, CacheEntry] = {}
-        self._lock = asyncio.Lock()
+        # Per-key locks: a loader may read other keys (the macro estimate
+        # composes the CPI / Fed / recession ones) without deadlocking.
+        self._locks: dict[str, asyncio.Lock] = {}
 
     async def get_or_set(
         self,
@@ -590,7 +738,7 @@ class TtlCache:
         existing = self._store.get(key)
         if existing is not None and existing.expires_at > now:
             return existing.value
-        async with self._lock:
+        async with self._locks.setdefault(key, asyncio.Lock()):
             existing = self._store.get(key)
             if existing is not None and existing.expires_at > time.monotonic():
                 return existing.value
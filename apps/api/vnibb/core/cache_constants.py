@@ -5,7 +5,7 @@ This module consolidates all TTL (Time To Live) constants used across
 the caching system, including Redis cache TTLs and database cache TTLs.
 """
 
-from typing import Dict
+from typing import Dict, Tuple
 
 # =============================================================================
 # Redis Cache TTLs (in seconds)
@@ -59,6 +59,34 @@ REDIS_CACHE_TTLS: Dict[str, int] = {
     "profile": REDIS_TTL_PROFILE,
 }
 
+# Dataset-versioned prefixes: the cache key embeds the current version of each
+# dataset (see vnibb.core.dataset_versions), so entries are invalidated by the
+# sync that changes their inputs. The TTL is only a ceiling for lost bumps.
+REDIS_TTL_DATASET_VERSIONED = 86400  # 24 hours
+# Versioned entries whose inputs no sync bumps (intraday bars, provider
+# fallbacks) keep a short TTL via the ``ttl_for`` hook of ``@cached``.
+REDIS_TTL_HISTORICAL_VOLATILE = 300  # 5 minutes
+
+DATASET_LISTING = "listing"
+DATASET_PRICES = "prices"
+DATASET_INDICES = "indices"
+DATASET_SCREENER = "screener"
+DATASET_FINANCIALS = "financials"
+DATASET_COMPANY = "company"
+DATASET_FOREIGN_TRADING = "foreign_trading"
+
+REDIS_CACHE_DATASETS: Dict[str, Tuple[str, ...]] = {
+    "historical_v3": (DATASET_PRICES, DATASET_COMPANY),
+    "correlation_matrix": (DATASET_PRICES,),
+    "metrics_history": (DATASET_SCREENER,),
+    "ratios_v4": (DATASET_FINANCIALS,),
+    "income_statement_v4": (DATASET_FINANCIALS,),
+    "balance_sheet_v4": (DATASET_FINANCIALS,),
+    "cash_flow_v4": (DATASET_FINANCIALS,),
+    "equity_ttm": (DATASET_FINANCIALS,),
+    "equity_growth": (DATASET_FINANCIALS,),
+}
+
 # Redis cache key prefixes (short versions for key length optimization)
 REDIS_CACHE_PREFIX_SHORT: Dict[str, str] = {
     "screener": "sc",
@@ -191,6 +191,7 @@ class Settings(BaseSettings):
     vnstock_rate_limit_rps: float = 500 / 60  # Global vnstock request budget (500/min)
     vnstock_reinforcement_rps: float = 50 / 60  # Reserved reinforcement budget (50/min)
     vnstock_calls_per_minute: Optional[int] = None  # Override per-operation limits
+    vnstock_executor_workers: int = Field(default=16, ge=1, le=128)  # Provider thread pool size
     big_order_threshold_vnd: float = 10_000_000_000
     intraday_limit: int = 500
     intraday_symbols_per_run: int = 200
@@ -207,8 +208,11 @@ class Settings(BaseSettings):
     intraday_break_end: Optional[str] = "13:00"
     orderflow_at_close_only: bool = True
     orderbook_at_close_only: bool = True
+    block_trades_at_close_only: bool = False  # Detection is set-based; safe intraday
     store_intraday_trades: bool = False
     progress_checkpoint_every: int = 50
+    sync_max_parallel_stages: int = 3
+    sync_bulk_stage_concurrency: int = 1
     cache_chunk_size: int = 200
     cache_foreign_trading_chunked: bool = True
     cache_foreign_trading_per_symbol: bool = False
@@ -262,6 +266,8 @@ class Settings(BaseSettings):
     llm_timeout: int = 30
     llm_max_tokens: int = 1024
     enable_ai_sentiment_analysis: bool = False  # Keep news sentiment paused until runtime is stable
+    sentiment_batch_size: int = Field(default=20, ge=1, le=100)  # Articles per model request
+    sentiment_queue_max_size: int = Field(default=2000, ge=1)  # Pending background scoring jobs
 
     # ==========================================================================
     # Scraper Settings
@@ -273,6 +279,9 @@ class Settings(BaseSettings):
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
+    world_news_aggregator_enabled: bool = True  # Serve /news/world from the polled article store
+    world_news_poll_min_seconds: int = Field(default=120, ge=30)
+    world_news_poll_max_seconds: int = Field(default=3600, ge=60)
 
     # ==========================================================================
     # Logging Configuration
@@ -291,6 +300,14 @@ class Settings(BaseSettings):
     sentry_profiles_sample_rate: float = 0.1  # Profile 10% of requests
     sentry_environment: Optional[str] = None  # Override environment name for Sentry
 
+    # In-process latency histograms and request timelines (no Sentry needed).
+    # Timelines are kept for every traced request slower than the threshold,
+    # plus a random sample of the rest; see GET /metrics/timelines.
+    request_timeline_prefixes: List[str] = ["/api/v1/quant", "/api/v1/market"]
+    request_timeline_slow_ms: float = 1000.0
+    request_timeline_sample_rate: float = 0.01
+    request_timeline_buffer_size: int = 100
+
     # ==========================================================================
     # Validators
     # ==========================================================================
@@ -45,6 +45,7 @@ _ALEMBIC_RUNNING = os.environ.get("ALEMBIC_RUNNING", "false").lower() == "true"
 if not _ALEMBIC_RUNNING:
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
     from vnibb.core.config import settings
+    from vnibb.core.instrumentation import instrument_engine
 
     def _build_connect_args() -> dict:
         """
@@ -130,6 +131,9 @@ if not _ALEMBIC_RUNNING:
     if not settings.database_url.startswith("sqlite"):
         event.listen(engine.sync_engine, "connect", _apply_server_timeouts_on_connect)
 
+    # Every statement feeds the ``db.query`` span histogram and request timelines.
+    instrument_engine(engine)
+
     # Enforce statement/lock/idle-in-tx timeouts on every new DBAPI connection
     # via the sync engine defined below. (Applied in the post-sync_engine block.)
 
@@ -0,0 +1,175 @@
+"""
+Dataset version registry.
+
+Each synced dataset (daily prices, screener snapshots, financial statements,
+...) carries a monotonically increasing version in the ``dataset_versions``
+table, mirrored to Redis. Writers bump it after a successful sync, and
+``@cached`` prefixes listed in ``REDIS_CACHE_DATASETS`` embed the current
+versions of the datasets they read in their cache key. An entry is therefore
+served until the data it was built from changes, and the first request after
+a bump recomputes it, instead of guessing a fixed TTL per prefix.
+
+Reads go local memo (``LOCAL_TTL_SECONDS``) -> Redis MGET -> Postgres, so a
+bump from the scheduler process is visible to API workers within seconds.
+Redis writes are raise-only (``RedisClient.set_max``), so a reader that
+loaded an older version from Postgres cannot overwrite a concurrent bump.
+"""
+
+import functools
+import logging
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import select
+
+from vnibb.core.cache import redis_cache_available, redis_client
+from vnibb.core.cache_constants import (  # noqa: F401 - re-exported for writers
+    DATASET_COMPANY,
+    DATASET_FINANCIALS,
+    DATASET_FOREIGN_TRADING,
+    DATASET_INDICES,
+    DATASET_LISTING,
+    DATASET_PRICES,
+    DATASET_SCREENER,
+)
+from vnibb.core.database import async_session_maker
+from vnibb.models.dataset_version import DatasetVersion
+
+logger = logging.getLogger(__name__)
+
+
+def _upsert_bump(dialect_name: str, name: str, now: datetime):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    stmt = insert(DatasetVersion).values(name=name, version=1, updated_at=now)
+    return stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"version": DatasetVersion.version + 1, "updated_at": now},
+    ).returning(DatasetVersion.version)
+
+
+class DatasetVersionRegistry:
+    """Reads and bumps dataset versions; Postgres is the source of truth."""
+
+    LOCAL_TTL_SECONDS = 5.0
+    REDIS_KEY_PREFIX = "vnibb:dataset_version:"
+    REDIS_TTL_SECONDS = 30 * 24 * 60 * 60
+
+    def __init__(self) -> None:
+        self._local: dict[str, tuple[int, float]] = {}
+
+    def _redis_key(self, name: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}{name}"
+
+    async def get_many(self, names: Iterable[str]) -> dict[str, int]:
+        """Current version per dataset; unknown datasets are version 0."""
+        now = time.monotonic()
+        versions: dict[str, int] = {}
+        missing = []
+        for name in names:
+            entry = self._local.get(name)
+            if entry is not None and now - entry[1] < self.LOCAL_TTL_SECONDS:
+                versions[name] = entry[0]
+            else:
+                missing.append(name)
+
+        if missing:
+            loaded = await self._load(missing)
+            for name in missing:
+                versions[name] = loaded.get(name, 0)
+                self._local[name] = (versions[name], now)
+        return versions
+
+    async def _load(self, names: list[str]) -> dict[str, int]:
+        loaded: dict[str, int] = {}
+        if redis_cache_available():
+            cached = await redis_client.get_multiple([self._redis_key(name) for name in names])
+            for name in names:
+                value = cached.get(self._redis_key(name))
+                if isinstance(value, int):
+                    loaded[name] = value
+
+        pending = [name for name in names if name not in loaded]
+        if not pending:
+            return loaded
+        try:
+            async with async_session_maker() as session:
+                rows = (
+                    await session.execute(
+                        select(DatasetVersion.name, DatasetVersion.version).where(
+                            DatasetVersion.name.in_(pending)
+                        )
+                    )
+                ).all()
+        except Exception as exc:
+            logger.debug("Dataset version lookup failed for %s: %s", pending, exc)
+            return loaded
+
+        for name, version in rows:
+            loaded[name] = int(version)
+            if redis_cache_available():
+                # Raise-only: a concurrent bump may already have stored a newer version.
+                stored = await redis_client.set_max(
+                    self._redis_key(name), loaded[name], ttl=self.REDIS_TTL_SECONDS
+                )
+                if stored is not None:
+                    loaded[name] = max(loaded[name], stored)
+        return loaded
+
+    async def bump(self, *names: str) -> dict[str, int]:
+        """Increment each dataset's version after a write; never raises."""
+        bumped: dict[str, int] = {}
+        now = datetime.now(UTC).replace(tzinfo=None)
+        try:
+            async with async_session_maker() as session:
+                dialect_name = session.bind.dialect.name
+                for name in dict.fromkeys(names):
+                    result = await session.execute(_upsert_bump(dialect_name, name, now))
+                    bumped[name] = int(result.scalar_one())
+                await session.commit()
+        except Exception as exc:
+            logger.warning("Dataset version bump failed for %s: %s", names, exc)
+            for name in names:
+                self._local.pop(name, None)
+            return bumped
+
+        stamp = time.monotonic()
+        for name, version in bumped.items():
+            self._local[name] = (version, stamp)
+            if redis_cache_available():
+                await redis_client.set_max(
+                    self._redis_key(name), version, ttl=self.REDIS_TTL_SECONDS
+                )
+        logger.info("Bumped dataset versions: %s", bumped)
+        return bumped
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+
+dataset_versions = DatasetVersionRegistry()
+
+
+def bumps_datasets(*names: str) -> Callable:
+    """Bump ``names`` after the decorated sync returns.
+
+    A sync that reports writing nothing (returns ``0``/``False``) leaves the
+    versions alone; exceptions propagate without a bump.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await func(*args, **kwargs)
+            if not (isinstance(result, int) and result == 0):
+                await dataset_versions.bump(*names)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,453 @@
+"""
+In-process latency instrumentation.
+
+Sentry (``core/monitoring.py``) is optional and SaaS-backed. This module is
+the built-in, always-on surface exported on ``/metrics``:
+
+- :class:`LatencyHistogram`: HDR-style log-linear histogram (16 sub-buckets
+  per power of two, so about 6% relative error) for accurate p50/p99/p999.
+  It also keeps fixed Prometheus ``le`` buckets so series aggregate across
+  workers.
+- :func:`span` / :func:`traced` / :func:`record_span`: named spans for hot
+  paths (``db.query``, ``mongo.find``, ``provider.*``, ``cache.*``,
+  ``compute.*``). Every span feeds a per-name histogram.
+- Request timelines: while a request is being traced, spans are also appended
+  to its :class:`RequestTimeline`. Finished timelines are kept in a small ring
+  buffer when they are slow or randomly sampled, and served by
+  ``/metrics/timelines``.
+
+Recording a span is a ``perf_counter`` pair, a dict lookup and a lock-guarded
+integer increment, so spans are cheap enough to leave on in production.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from math import inf
+from typing import Any, TypeVar
+
+from vnibb.core.config import settings
+
+T = TypeVar("T")
+
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, inf)
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with microsecond resolution.
+
+    Values below ``2**SUB_BUCKET_BITS`` microseconds get one bucket each.
+    Above that, every power of two is split into ``2**SUB_BUCKET_BITS`` equal
+    sub-buckets, the same layout HdrHistogram uses. Counts are stored sparsely,
+    so an idle series costs a few dict entries.
+    """
+
+    SUB_BUCKET_BITS = 4
+    _SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    __slots__ = ("_counts", "count", "sum_seconds", "min_seconds", "max_seconds", "buckets")
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.sum_seconds = 0.0
+        self.min_seconds = inf
+        self.max_seconds = 0.0
+        self.buckets = [0] * len(PROMETHEUS_BUCKETS)
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        if micros < cls._SUB_BUCKETS:
+            return max(micros, 0)
+        shift = micros.bit_length() - 1 - cls.SUB_BUCKET_BITS
+        return (shift + 1) * cls._SUB_BUCKETS + (micros >> shift) - cls._SUB_BUCKETS
+
+    @classmethod
+    def _upper_micros(cls, index: int) -> int:
+        if index < cls._SUB_BUCKETS:
+            return index
+        shift = index // cls._SUB_BUCKETS - 1
+        sub = index % cls._SUB_BUCKETS
+        return ((cls._SUB_BUCKETS + sub + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        index = self._index(int(seconds * 1_000_000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum_seconds += seconds
+        self.min_seconds = min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        for position, boundary in enumerate(PROMETHEUS_BUCKETS):
+            if seconds <= boundary:
+                self.buckets[position] += 1
+
+    def quantile(self, fraction: float) -> float:
+        """Highest value in the bucket holding the ``fraction`` quantile, in seconds."""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(round(fraction * self.count)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._upper_micros(index) / 1_000_000, self.max_seconds)
+        return self.max_seconds
+
+    def copy(self) -> LatencyHistogram:
+        clone = LatencyHistogram()
+        clone._counts = dict(self._counts)
+        clone.count = self.count
+        clone.sum_seconds = self.sum_seconds
+        clone.min_seconds = self.min_seconds
+        clone.max_seconds = self.max_seconds
+        clone.buckets = list(self.buckets)
+        return clone
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum_seconds / self.count * 1000, 3) if self.count else 0.0,
+            "min_ms": round(self.min_seconds * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            **{
+                f"p{str(q * 100).rstrip('0').rstrip('.').replace('.', '')}_ms": round(
+                    self.quantile(q) * 1000, 3
+                )
+                for q in SUMMARY_QUANTILES
+            },
+        }
+
+
+def render_histogram(
+    name: str, labels: str, histogram: LatencyHistogram, lines: list[str]
+) -> None:
+    """Append Prometheus ``_bucket``/``_sum``/``_count`` lines for one series."""
+    for boundary, count in zip(PROMETHEUS_BUCKETS, histogram.buckets, strict=True):
+        upper_bound = "+Inf" if boundary == inf else f"{boundary:g}"
+        lines.append(f'{name}_bucket{{{labels},le="{upper_bound}"}} {count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum_seconds:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def render_summary(
+    name: str, labels: str, histogram: LatencyHistogram, lines: list[str]
+) -> None:
+    """Append Prometheus summary quantile lines for one series."""
+    for q in SUMMARY_QUANTILES:
+        lines.append(f'{name}{{{labels},quantile="{q:g}"}} {histogram.quantile(q):.6f}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum_seconds:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+class SpanRecorder:
+    """Per-name span histograms for this process."""
+
+    MAX_SPANS = 256
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                if len(self._histograms) >= self.MAX_SPANS:
+                    name = "__overflow__"
+                histogram = self._histograms.setdefault(name, LatencyHistogram())
+            histogram.record(seconds)
+
+    def snapshot(self) -> dict[str, LatencyHistogram]:
+        with self._lock:
+            return {name: histogram.copy() for name, histogram in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def render_lines(self) -> list[str]:
+        histograms = self.snapshot()
+        lines = [
+            "# HELP vnibb_span_duration_seconds Duration of instrumented hot-path spans.",
+            "# TYPE vnibb_span_duration_seconds histogram",
+        ]
+        for name, histogram in sorted(histograms.items()):
+            render_histogram(
+                "vnibb_span_duration_seconds", f'span="{escape_label(name)}"', histogram, lines
+            )
+        lines.extend(
+            [
+                "# HELP vnibb_span_latency_seconds Span latency quantiles (HDR histogram).",
+                "# TYPE vnibb_span_latency_seconds summary",
+            ]
+        )
+        for name, histogram in sorted(histograms.items()):
+            render_summary(
+                "vnibb_span_latency_seconds", f'span="{escape_label(name)}"', histogram, lines
+            )
+        return lines
+
+
+span_recorder = SpanRecorder()
+
+
+# ---------------------------------------------------------------------------
+# Request timelines
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RequestTimeline:
+    """Spans recorded while serving one request, offsets relative to its start."""
+
+    MAX_SPANS = 500
+
+    method: str
+    path: str
+    started_at: float = field(default_factory=time.time)
+    started_perf: float = field(default_factory=time.perf_counter)
+    route: str = "__unmatched__"
+    status_code: int | None = None
+    duration_ms: float | None = None
+    spans: list[dict[str, Any]] = field(default_factory=list)
+    dropped_spans: int = 0
+
+    def add(self, name: str, started_perf: float, seconds: float, depth: int) -> None:
+        if len(self.spans) >= self.MAX_SPANS:
+            self.dropped_spans += 1
+            return
+        self.spans.append(
+            {
+                "name": name,
+                "start_ms": round((started_perf - self.started_perf) * 1000, 3),
+                "duration_ms": round(seconds * 1000, 3),
+                "depth": depth,
+            }
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        by_name: dict[str, dict[str, float]] = {}
+        for item in self.spans:
+            totals = by_name.setdefault(item["name"], {"count": 0, "total_ms": 0.0})
+            totals["count"] += 1
+            totals["total_ms"] = round(totals["total_ms"] + item["duration_ms"], 3)
+        return {
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status_code": self.status_code,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "span_totals": dict(
+                sorted(by_name.items(), key=lambda pair: pair[1]["total_ms"], reverse=True)
+            ),
+            "spans": sorted(self.spans, key=lambda item: item["start_ms"]),
+            "dropped_spans": self.dropped_spans,
+        }
+
+
+_current_timeline: ContextVar[RequestTimeline | None] = ContextVar(
+    "vnibb_request_timeline", default=None
+)
+_span_depth: ContextVar[int] = ContextVar("vnibb_span_depth", default=0)
+
+
+class TimelineStore:
+    """Ring buffer of slow or sampled request timelines."""
+
+    def __init__(self, max_entries: int = 100) -> None:
+        self._lock = threading.Lock()
+        self._entries: deque[RequestTimeline] = deque(maxlen=max_entries)
+
+    def keep(self, timeline: RequestTimeline) -> None:
+        with self._lock:
+            self._entries.append(timeline)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def recent(
+        self,
+        *,
+        limit: int = 20,
+        route_contains: str | None = None,
+        min_duration_ms: float = 0.0,
+    ) -> list[dict[str, Any]]:
+        with self._lock:
+            entries = list(self._entries)
+        selected = [
+            timeline
+            for timeline in reversed(entries)
+            if (timeline.duration_ms or 0.0) >= min_duration_ms
+            and (not route_contains or route_contains in timeline.route)
+        ]
+        return [timeline.as_dict() for timeline in selected[:limit]]
+
+
+timeline_store = TimelineStore(settings.request_timeline_buffer_size)
+
+
+def start_timeline(method: str, path: str) -> tuple[RequestTimeline, Any]:
+    timeline = RequestTimeline(method=method, path=path)
+    return timeline, _current_timeline.set(timeline)
+
+
+def finish_timeline(
+    timeline: RequestTimeline,
+    token: Any,
+    *,
+    route: str,
+    status_code: int,
+    duration_seconds: float,
+    slow_ms: float,
+    sample_rate: float,
+) -> bool:
+    """Close a timeline; keep it when slow or sampled. Returns whether it was kept."""
+    _current_timeline.reset(token)
+    timeline.route = route
+    timeline.status_code = status_code
+    timeline.duration_ms = round(duration_seconds * 1000, 3)
+    if timeline.duration_ms >= slow_ms or random.random() < sample_rate:
+        timeline_store.keep(timeline)
+        return True
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Span API
+# ---------------------------------------------------------------------------
+
+
+def record_span(name: str, seconds: float, *, started_perf: float | None = None) -> None:
+    """Record a span measured elsewhere (driver event hooks, callbacks)."""
+    span_recorder.observe(name, seconds)
+    timeline = _current_timeline.get()
+    if timeline is not None:
+        start = started_perf if started_perf is not None else time.perf_counter() - seconds
+        timeline.add(name, start, seconds, _span_depth.get())
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the enclosed block as span ``name``. Works in sync and async code."""
+    depth = _span_depth.get()
+    token = _span_depth.set(depth + 1)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        _span_depth.reset(token)
+        span_recorder.observe(name, elapsed)
+        timeline = _current_timeline.get()
+        if timeline is not None:
+            timeline.add(name, started, elapsed, depth)
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator form of :func:`span` for sync and async callables."""
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Driver hooks
+# ---------------------------------------------------------------------------
+
+_DB_START_KEY = "vnibb_span_db_started"
+
+
+def instrument_engine(engine: Any) -> None:
+    """Record every cursor execution on ``engine`` as a ``db.query`` span."""
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_DB_START_KEY, []).append(time.perf_counter())
+
+    def _finish(conn) -> None:
+        starts = conn.info.get(_DB_START_KEY)
+        if starts:
+            started = starts.pop()
+            record_span("db.query", time.perf_counter() - started, started_perf=started)
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _finish(conn)
+
+    def handle_error(exception_context):
+        # A failed statement never reaches after_cursor_execute; without this
+        # its start time would stay on the pooled connection.
+        if exception_context.connection is not None:
+            _finish(exception_context.connection)
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(sync_engine, "handle_error", handle_error)
+
+
+def mongo_command_listener() -> Any:
+    """A pymongo ``CommandListener`` recording ``mongo.<command>`` spans."""
+    from pymongo import monitoring
+
+    class _MongoSpanListener(monitoring.CommandListener):
+        def started(self, event) -> None:
+            pass
+
+        def succeeded(self, event) -> None:
+            record_span(f"mongo.{event.command_name}", event.duration_micros / 1_000_000)
+
+        def failed(self, event) -> None:
+            record_span(f"mongo.{event.command_name}", event.duration_micros / 1_000_000)
+
+    return _MongoSpanListener()
+
+
+__all__ = [
+    "LatencyHistogram",
+    "RequestTimeline",
+    "SpanRecorder",
+    "TimelineStore",
+    "finish_timeline",
+    "instrument_engine",
+    "mongo_command_listener",
+    "record_span",
+    "span",
+    "span_recorder",
+    "start_timeline",
+    "timeline_store",
+    "traced",
+]
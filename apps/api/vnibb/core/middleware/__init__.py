@@ -5,13 +5,16 @@ Provides:
 - Rate limiting with per-endpoint configuration
 - Request/response logging
 - API versioning headers
+- Conditional GET (ETag / If-None-Match)
 - Performance monitoring
 """
 
+from .conditional import ConditionalRequestMiddleware
 from .logging import RequestLoggingMiddleware, get_recent_error_events
 from .versioning import APIVersionMiddleware
 
 __all__ = [
+    "ConditionalRequestMiddleware",
     "RequestLoggingMiddleware",
     "get_recent_error_events",
     "APIVersionMiddleware",
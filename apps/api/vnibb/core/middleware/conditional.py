@@ -0,0 +1,107 @@
+"""
+Conditional GET Middleware.
+
+Provides:
+- Strong ETags derived from data version stamps for registered endpoints
+- 304 Not Modified before the endpoint runs when If-None-Match matches
+- 304 for any other response that already carries an ETag
+  (``@cached`` route hits)
+"""
+
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from re import Pattern
+from typing import Any
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from vnibb.core.cache import payload_etag
+
+logger = logging.getLogger(__name__)
+
+VersionProbe = Callable[[Mapping[str, str]], Any]
+
+_BYPASS_VALUES = {"1", "true", "yes"}
+
+
+def version_etag(request: Request, version: tuple[Any, ...]) -> str:
+    """Strong ETag for one representation of ``version``: path and query included."""
+    query = sorted(request.query_params.multi_items())
+    return payload_etag(repr((request.url.path, query, version)).encode())
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so ``W/`` prefixes are ignored."""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+class ConditionalRequestMiddleware(BaseHTTPMiddleware):
+    """
+    Answer polling GETs with 304 while the underlying data is unchanged.
+
+    Each probe maps a path pattern to an async callable taking the path
+    groups merged over the query params and returning a version tuple, or
+    None when the response cannot be stamped. ``refresh=true`` always
+    reaches the endpoint.
+    """
+
+    def __init__(self, app, probes: Iterable[tuple[Pattern[str], VersionProbe]] = ()):
+        super().__init__(app)
+        self.probes = tuple(probes)
+
+    def _resolve_probe(self, request: Request) -> tuple[VersionProbe | None, dict[str, str]]:
+        path = request.url.path
+        for pattern, probe in self.probes:
+            match = pattern.match(path)
+            if match:
+                return probe, {**request.query_params, **match.groupdict()}
+        return None, {}
+
+    async def _etag(
+        self, request: Request, probe: VersionProbe, params: Mapping[str, str]
+    ) -> str | None:
+        try:
+            version = await probe(params)
+        except Exception as exc:
+            logger.debug("Version probe failed for %s: %s", request.url.path, exc)
+            return None
+        return version_etag(request, version) if version is not None else None
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if request.method not in {"GET", "HEAD"}:
+            return await call_next(request)
+
+        if_none_match = request.headers.get("If-None-Match")
+        probe, params = self._resolve_probe(request)
+        if probe is not None and params.get("refresh", "").lower() in _BYPASS_VALUES:
+            probe = None
+
+        etag = await self._etag(request, probe, params) if probe is not None else None
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        response = await call_next(request)
+        if response.status_code < 200 or response.status_code >= 300:
+            return response
+
+        if probe is not None:
+            # The endpoint may have loaded what the probe needed (screener frame).
+            etag = etag or await self._etag(request, probe, params)
+            if etag is not None:
+                response.headers["ETag"] = etag
+
+        existing = response.headers.get("ETag")
+        if existing and etag_matches(if_none_match, existing):
+            return not_modified(existing)
+        return response
@@ -23,6 +23,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from vnibb.core.config import settings
+from vnibb.core.profiler import reset_request_tag, sampling_profiler, set_request_tag
 
 logger = logging.getLogger(__name__)
 
@@ -224,8 +225,15 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
             except Exception:
                 pass  # Don't fail request if Sentry fails
         
-        # Process request
-        response = await call_next(request)
+        # Process request; tasks it spawns carry the ID for profiler samples.
+        tag_token = set_request_tag(correlation_id)
+        try:
+            response = await call_next(request)
+        finally:
+            reset_request_tag(tag_token)
+            if sampling_profiler.active:
+                route = getattr(request.scope.get("route"), "path", None)
+                sampling_profiler.note_request(correlation_id, route or "__unmatched__")
         
         # Add correlation ID to response headers
         response.headers["X-Correlation-ID"] = correlation_id
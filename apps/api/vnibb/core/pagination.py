@@ -0,0 +1,189 @@
+"""
+Keyset cursors and ``fields=`` projection shared by list endpoints.
+
+``limit/offset`` makes page N read and discard every earlier row, and the
+list models ship every column to widgets that render three of them. List
+endpoints here page with an opaque cursor holding the sort key of the last
+row served -- the next page seeks past it with a range predicate on the same
+index as page one -- and accept ``fields=a,b,c`` so only those columns are
+selected in SQL and the full response model is never built.
+
+Cursors are url-safe base64 JSON tagged with the endpoint scope, so a token
+from one list is rejected by another instead of seeking on the wrong key.
+Every cursor-paged endpoint returns the next cursor in the ``X-Next-Cursor``
+response header (absent on the last page) and rejects ``offset`` together
+with ``cursor``.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("unknown cursor value tag")
+    return value
+
+
+def encode_cursor(scope: str, key: Sequence[Any]) -> str:
+    """Encode the sort key of the last row served as an opaque cursor."""
+    payload = json.dumps([scope, [_encode_value(value) for value in key]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str | None, scope: str) -> tuple[Any, ...] | None:
+    """Decode a cursor issued for ``scope``; malformed or foreign tokens are a 400."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        tag, values = json.loads(raw)
+        if tag != scope or not isinstance(values, list) or not values:
+            raise ValueError("cursor scope mismatch")
+        return tuple(_decode_value(value) for value in values)
+    except (ValueError, TypeError, KeyError, binascii.Error, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from exc
+
+
+def reject_offset_with_cursor(cursor: str | None, offset: int) -> None:
+    """A cursor already encodes the position; a non-zero ``offset`` beside it is a 400."""
+    if cursor and offset:
+        raise HTTPException(status_code=400, detail="offset cannot be combined with cursor")
+
+
+def attach_cursor(response: Response, cursor: str | None) -> None:
+    """Set the next-page cursor header on ``response`` when there is a next page."""
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def next_cursor(
+    scope: str,
+    rows: Sequence[Any],
+    key: Callable[[Any], Sequence[Any] | None],
+    limit: int,
+) -> str | None:
+    """Cursor for the page after ``rows``, or None when the list is exhausted."""
+    if not rows or len(rows) < limit:
+        return None
+    last_key = key(rows[-1])
+    if last_key is None:
+        return None
+    return encode_cursor(scope, last_key)
+
+
+def keyset_before(columns: Sequence[Any], key: Sequence[Any]) -> ColumnElement[bool]:
+    """Row-value predicate selecting rows after ``key`` in a descending sort on ``columns``."""
+    bound = [literal(value, type_=column.type) for column, value in zip(columns, key, strict=True)]
+    if len(columns) == 1:
+        return columns[0] < bound[0]
+    return tuple_(*columns) < tuple_(*bound)
+
+
+def keyset_before_nulls_last(
+    column: Any, tiebreak: Any, key: Sequence[Any]
+) -> ColumnElement[bool]:
+    """Rows after ``key`` in a ``column DESC NULLS LAST, tiebreak DESC`` sort.
+
+    For a nullable sort column: rows with a NULL ``column`` follow every dated
+    row, ordered by ``tiebreak`` among themselves, so a key whose value is None
+    seeks within that tail.
+    """
+    value, last = key
+    tie = literal(last, type_=tiebreak.type)
+    if value is None:
+        return and_(column.is_(None), tiebreak < tie)
+    bound = literal(value, type_=column.type)
+    return or_(column < bound, and_(column == bound, tiebreak < tie), column.is_(None))
+
+
+def seek_after(rows: Sequence[Any], key: Callable[[Any], Any], after: Any) -> list[Any]:
+    """Rows following the row whose ``key`` equals ``after`` in an in-memory ordered list.
+
+    Used where the ordering is computed in Python (cached screener snapshots).
+    A cursor whose anchor row has dropped out of the list ends the walk with an
+    empty page rather than restarting from the top.
+    """
+    if after is None:
+        return list(rows)
+    for index, row in enumerate(rows):
+        if key(row) == after:
+            return list(rows[index + 1 :])
+    return []
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    """Fields requested through ``fields=``; ``names=None`` means the full model."""
+
+    names: tuple[str, ...] | None = None
+
+    @property
+    def is_projected(self) -> bool:
+        return self.names is not None
+
+    def wants(self, *names: str) -> bool:
+        return self.names is None or any(name in self.names for name in names)
+
+    def columns(self, model: Any, *, always: Iterable[str] = ()) -> list[str] | None:
+        """Mapped column names to load for ``model``, or None to load every column."""
+        if self.names is None:
+            return None
+        wanted = dict.fromkeys([*always, *self.names])
+        return [name for name in wanted if hasattr(model, name)]
+
+    def project(self, row: Any) -> dict[str, Any]:
+        if isinstance(row, Mapping):
+            return {name: row.get(name) for name in self.names or row.keys()}
+        if isinstance(row, BaseModel) and self.names is None:
+            return row.model_dump()
+        return {name: getattr(row, name, None) for name in self.names or ()}
+
+
+def parse_fields(raw: str | None, model: type[BaseModel]) -> FieldSelection:
+    """Parse a comma-separated ``fields=`` value against ``model``'s fields."""
+    if raw is None or not raw.strip():
+        return FieldSelection()
+    names = tuple(dict.fromkeys(part.strip() for part in raw.split(",") if part.strip()))
+    unknown = [name for name in names if name not in model.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return FieldSelection(names=names)
+
+
+def projected_response(content: Any, *, cursor: str | None = None) -> JSONResponse:
+    """Serialize a projected payload as-is; ``response_model`` would refill dropped fields."""
+    response = JSONResponse(content=jsonable_encoder(content))
+    attach_cursor(response, cursor)
+    return response
@@ -0,0 +1,245 @@
+"""
+Statistical sampling profiler for live API workers.
+
+A background thread wakes every ``interval`` seconds, reads every thread's
+current frame via :func:`sys._current_frames` and counts the collapsed
+stack (``outer;...;inner``), the format flamegraph tools consume. Nothing is
+installed in the interpreter (no ``sys.setprofile`` / ``settrace``). The
+profiled code therefore runs at full speed. The cost is the sampler
+thread's own CPU time plus its GIL holds, reported back as ``overhead``.
+
+Samples taken on the event-loop thread are tagged with the request that owns
+the running asyncio task. ``CorrelationIDMiddleware`` publishes the request's
+correlation ID through :func:`set_request_tag`. While a session is running,
+a task factory remembers the tag each new task was created under, and the
+route template is attached when the request finishes. The result can be split
+per route.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+UNTAGGED = "(untagged)"
+MAX_STACK_DEPTH = 96
+
+_request_tag: ContextVar[str | None] = ContextVar("vnibb_profiler_request_tag", default=None)
+
+
+def set_request_tag(correlation_id: str) -> Token:
+    return _request_tag.set(correlation_id)
+
+
+def reset_request_tag(token: Token) -> None:
+    _request_tag.reset(token)
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profiling session is already running in this process."""
+
+
+@dataclass
+class ProfileSession:
+    interval: float
+    loop: asyncio.AbstractEventLoop
+    loop_thread_id: int
+    started_at: float = field(default_factory=time.time)
+    started_perf: float = field(default_factory=time.perf_counter)
+    finished_perf: float | None = None
+    samples: int = 0
+    stacks: Counter[tuple[str, str]] = field(default_factory=Counter)
+    task_tags: weakref.WeakKeyDictionary = field(default_factory=weakref.WeakKeyDictionary)
+    request_routes: dict[str, str] = field(default_factory=dict)
+    sampler_cpu_seconds: float = 0.0
+    sample_cost_seconds: float = 0.0
+
+
+class SamplingProfiler:
+    """One-at-a-time, in-process wall-clock sampler."""
+
+    def __init__(self) -> None:
+        self._session: ProfileSession | None = None
+        self._lock = threading.Lock()
+        self._labels: dict[Any, str] = {}
+
+    @property
+    def active(self) -> bool:
+        return self._session is not None
+
+    # -- request tagging ------------------------------------------------------
+
+    def note_request(self, correlation_id: str, route: str) -> None:
+        """Attach a finished request's route template to its correlation ID."""
+        session = self._session
+        if session is not None:
+            session.request_routes[correlation_id] = route
+
+    def _task_factory(self, session: ProfileSession, previous: Any):
+        def factory(loop, coro, **kwargs):
+            task = (
+                previous(loop, coro, **kwargs)
+                if previous is not None
+                else asyncio.Task(coro, loop=loop, **kwargs)
+            )
+            context = kwargs.get("context")
+            tag = context.get(_request_tag) if context is not None else _request_tag.get()
+            if tag is not None:
+                session.task_tags[task] = tag
+            return task
+
+        return factory
+
+    def _current_tag(self, session: ProfileSession) -> str:
+        try:
+            task = asyncio.current_task(session.loop)
+            tag = session.task_tags.get(task) if task is not None else None
+        except Exception:  # pragma: no cover - racing the loop thread
+            tag = None
+        return tag or UNTAGGED
+
+    # -- sampling -------------------------------------------------------------
+
+    def _frame_label(self, code: Any) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            marker = f"{os.sep}vnibb{os.sep}"
+            if marker in filename:
+                filename = "vnibb/" + filename.split(marker, 1)[1].replace(os.sep, "/")
+            else:
+                filename = os.path.basename(filename)
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _sample(self, session: ProfileSession, own_thread_id: int, names: dict[int, str]) -> None:
+        frames = sys._current_frames()
+        for thread_id, frame in frames.items():
+            if thread_id == own_thread_id:
+                continue
+            labels: list[str] = []
+            while frame is not None and len(labels) < MAX_STACK_DEPTH:
+                labels.append(self._frame_label(frame.f_code))
+                frame = frame.f_back
+            if not labels:
+                continue
+            labels.append(f"thread:{names.get(thread_id, thread_id)}")
+            labels.reverse()
+            tag = self._current_tag(session) if thread_id == session.loop_thread_id else UNTAGGED
+            session.stacks[(tag, ";".join(labels))] += 1
+        session.samples += 1
+
+    def _run(self, session: ProfileSession, stop: threading.Event) -> None:
+        own_thread_id = threading.get_ident()
+        cpu_started = time.thread_time()
+        names: dict[int, str] = {}
+        while not stop.wait(session.interval):
+            tick = time.perf_counter()
+            if len(names) != threading.active_count():
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            self._sample(session, own_thread_id, names)
+            session.sample_cost_seconds += time.perf_counter() - tick
+        session.sampler_cpu_seconds = time.thread_time() - cpu_started
+
+    async def profile(self, seconds: float, interval: float) -> ProfileSession:
+        """Sample this process for ``seconds`` and return the finished session."""
+        with self._lock:
+            if self._session is not None:
+                raise ProfilerBusyError("A profiling session is already running")
+            loop = asyncio.get_running_loop()
+            session = ProfileSession(
+                interval=interval, loop=loop, loop_thread_id=threading.get_ident()
+            )
+            self._session = session
+            self._labels = {}
+
+        previous_factory = loop.get_task_factory()
+        loop.set_task_factory(self._task_factory(session, previous_factory))
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._run, args=(session, stop), name="vnibb-profiler", daemon=True
+        )
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stop.set()
+            await asyncio.to_thread(sampler.join)
+            session.finished_perf = time.perf_counter()
+            loop.set_task_factory(previous_factory)
+            with self._lock:
+                self._session = None
+        return session
+
+
+def collapsed_lines(stacks: Counter[str], limit: int) -> list[str]:
+    return [f"{stack} {count}" for stack, count in stacks.most_common(limit)]
+
+
+def summarize_session(
+    session: ProfileSession, *, route: str | None = None, max_stacks: int = 500
+) -> dict[str, Any]:
+    """Flamegraph-ready payload: collapsed stacks overall and per route."""
+    wall_seconds = (session.finished_perf or time.perf_counter()) - session.started_perf
+    overall: Counter[str] = Counter()
+    by_route: dict[str, Counter[str]] = {}
+    for (tag, stack), count in session.stacks.items():
+        route_name = session.request_routes.get(tag, UNTAGGED if tag == UNTAGGED else "(in-flight)")
+        if route is not None and route not in route_name:
+            continue
+        overall[stack] += count
+        by_route.setdefault(route_name, Counter())[stack] += count
+
+    hot_frames: Counter[str] = Counter()
+    for stack, count in overall.items():
+        hot_frames[stack.rsplit(";", 1)[-1]] += count
+
+    return {
+        "started_at": session.started_at,
+        "duration_seconds": round(wall_seconds, 3),
+        "interval_ms": round(session.interval * 1000, 3),
+        "samples": session.samples,
+        "overhead": {
+            "sampler_cpu_seconds": round(session.sampler_cpu_seconds, 4),
+            "sampling_seconds": round(session.sample_cost_seconds, 4),
+            "percent": round(session.sample_cost_seconds / wall_seconds * 100, 3)
+            if wall_seconds > 0
+            else 0.0,
+        },
+        "requests_tagged": len(session.request_routes),
+        "hot_frames": [
+            {"frame": frame, "samples": count} for frame, count in hot_frames.most_common(25)
+        ],
+        "collapsed": "\n".join(collapsed_lines(overall, max_stacks)),
+        "routes": {
+            name: {
+                "samples": sum(stacks.values()),
+                "collapsed": "\n".join(collapsed_lines(stacks, max_stacks)),
+            }
+            for name, stacks in sorted(
+                by_route.items(), key=lambda item: sum(item[1].values()), reverse=True
+            )
+        },
+    }
+
+
+sampling_profiler = SamplingProfiler()
+
+
+__all__ = [
+    "ProfilerBusyError",
+    "SamplingProfiler",
+    "reset_request_tag",
+    "sampling_profiler",
+    "set_request_tag",
+    "summarize_session",
+]
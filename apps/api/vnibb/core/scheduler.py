@@ -8,6 +8,7 @@ Jobs:
 - Daily sync at 4:00 PM VNT (9:00 AM UTC) - Full data refresh
 - Hourly news sync - Company and market news
 - Intraday sync during market hours - Real-time price/trades
+- World news aggregation every few minutes (per-feed adaptive polling)
 - Market open/close - Start/stop real-time streaming
 """
 
@@ -30,6 +31,7 @@ DAILY_SYNC_TIMEOUT_SECONDS = 2 * 60 * 60
 DAILY_TRADING_TIMEOUT_SECONDS = 2 * 60 * 60
 SUPPLEMENTAL_SYNC_TIMEOUT_SECONDS = 90 * 60
 RS_RATING_TIMEOUT_SECONDS = 15 * 60
+RS_ROTATION_TIMEOUT_SECONDS = 10 * 60
 HOURLY_NEWS_TIMEOUT_SECONDS = 20 * 60
 INTRADAY_TIMEOUT_SECONDS = 30 * 60
 MONGO_EOD_SYNC_TIMEOUT_SECONDS = 90 * 60
@@ -40,6 +42,8 @@ PREDICTION_MARKET_INTRADAY_CADENCE_MINUTES = 15
 PREDICTION_MARKET_POPULATE_TIMEOUT_SECONDS = 5 * 60
 DATA_QUALITY_TIMEOUT_SECONDS = 15 * 60
 REALTIME_CONTROL_TIMEOUT_SECONDS = 5 * 60
+WORLD_NEWS_AGGREGATOR_TIMEOUT_SECONDS = 5 * 60
+WORLD_NEWS_AGGREGATOR_TICK_MINUTES = 2
 
 # Last-run counters for the ``predictions_status`` health contribution. Reset
 # at the start of each guarded run; read by the ``/health/predictions``
@@ -539,6 +543,30 @@ def configure_scheduler():
     )
     logger.info("Scheduled: rs_rating_sync at 9:10 UTC (4:10 PM VNT)")
 
+    # =========================================================================
+    # RRG Snapshot - 5:45 PM VNT (10:45 AM UTC)
+    # Universe + sector RS-Ratio/RS-Momentum, advanced from yesterday's EMA
+    # state once the nightly price backfill has landed.
+    # =========================================================================
+    async def rs_rotation_snapshot_job():
+        from vnibb.services.rs_snapshot_service import run_rs_rotation_snapshot
+
+        await _run_guarded_job(
+            "rs_rotation_snapshot", run_rs_rotation_snapshot, RS_ROTATION_TIMEOUT_SECONDS
+        )
+
+    scheduler.add_job(
+        rs_rotation_snapshot_job,
+        trigger=CronTrigger(hour=10, minute=45, timezone="UTC"),
+        id="rs_rotation_snapshot",
+        name="RRG Snapshot",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=600,
+    )
+    logger.info("Scheduled: rs_rotation_snapshot at 10:45 UTC (5:45 PM VNT)")
+
     # =========================================================================
     # Hourly News Sync - Every hour
     # Company and market news updates
@@ -555,6 +583,35 @@ def configure_scheduler():
     )
     logger.info("Scheduled: hourly_news every hour")
 
+    # =========================================================================
+    # World News Aggregation - ticks every 2 minutes
+    # Each tick only fetches feeds whose adaptive poll interval has elapsed.
+    # =========================================================================
+    if settings.world_news_aggregator_enabled:
+        from vnibb.services.world_news_aggregator import run_world_news_aggregation
+
+        async def guarded_world_news_aggregation():
+            await _run_guarded_job(
+                "world_news_aggregator",
+                run_world_news_aggregation,
+                WORLD_NEWS_AGGREGATOR_TIMEOUT_SECONDS,
+            )
+
+        scheduler.add_job(
+            guarded_world_news_aggregation,
+            trigger=CronTrigger(minute=f"*/{WORLD_NEWS_AGGREGATOR_TICK_MINUTES}", timezone="UTC"),
+            id="world_news_aggregator",
+            name="World News Aggregator",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=60,
+        )
+        logger.info(
+            "Scheduled: world_news_aggregator every %s min",
+            WORLD_NEWS_AGGREGATOR_TICK_MINUTES,
+        )
+
     # =========================================================================
     # Supplemental Company Sync - After close / off hours
     # Rotates shareholders, officers, subsidiaries, and broad company news.
@@ -0,0 +1,163 @@
+"""
+Trading calendar shared by coverage, gap and staleness checks.
+
+VN exchanges trade Monday-Friday except ``settings.market_holiday_dates``.
+Every "is this a session", "which sessions lie in this range" and "how many
+sessions behind is this" question used to walk calendar days one at a time
+and rebuild the holiday set per call. ``TradingCalendar`` builds a NumPy
+business-day index once per holiday set:
+
+- ``is_session`` and ``session_ordinal`` (index of the latest session on or
+  before a day) are array lookups, and ``session_date`` maps back;
+- range questions (``sessions_between``, ``missing_sessions``, ``covers``,
+  ``sessions_since``) are slices and ``np.isin`` over the session array.
+
+Days outside the precomputed window fall back to ``np.busday_*`` with the
+same ``busdaycalendar``, so answers stay consistent at the edges.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
+
+from vnibb.core.config import settings
+
+INDEX_START = date(2000, 1, 1)
+INDEX_END = date(2045, 12, 31)
+
+_ONE_DAY = timedelta(days=1)
+
+
+def _as_day(value: date) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _day_array(days: Iterable[date]) -> np.ndarray:
+    return np.array([_as_day(day) for day in days], dtype="datetime64[D]")
+
+
+class TradingCalendar:
+    """Precomputed session index for weekdays minus ``holidays``."""
+
+    def __init__(
+        self,
+        holidays: Iterable[date] = (),
+        *,
+        start: date = INDEX_START,
+        end: date = INDEX_END,
+    ) -> None:
+        self.holidays = frozenset(holidays)
+        self._busdaycal = np.busdaycalendar(holidays=_day_array(sorted(self.holidays)))
+        self._origin = np.datetime64(start, "D")
+        self._start = start
+        self._end = end
+
+        days = np.arange(self._origin, np.datetime64(end, "D") + 1)
+        self._is_session = np.is_busday(days, busdaycal=self._busdaycal)
+        # Ordinal of the latest session on or before each calendar day.
+        self._ordinals = np.cumsum(self._is_session, dtype=np.int64) - 1
+        self._sessions = days[self._is_session]
+
+    def _offset(self, day: date) -> int | None:
+        if self._start <= day <= self._end:
+            return (day - self._start).days
+        return None
+
+    def is_session(self, day: date) -> bool:
+        day = _as_day(day)
+        offset = self._offset(day)
+        if offset is not None:
+            return bool(self._is_session[offset])
+        return bool(np.is_busday(np.datetime64(day, "D"), busdaycal=self._busdaycal))
+
+    def session_ordinal(self, day: date) -> int:
+        """Index of the latest session on or before ``day`` (negative before the index)."""
+        day = _as_day(day)
+        offset = self._offset(day)
+        if offset is not None:
+            return int(self._ordinals[offset])
+        end = np.datetime64(day + _ONE_DAY, "D")
+        if end >= self._origin:
+            return int(np.busday_count(self._origin, end, busdaycal=self._busdaycal)) - 1
+        # busday_count(begin > end) counts (end, begin], so count forward instead.
+        return -int(np.busday_count(end, self._origin, busdaycal=self._busdaycal)) - 1
+
+    def session_date(self, ordinal: int) -> date:
+        """Inverse of ``session_ordinal`` for session days."""
+        if 0 <= ordinal < len(self._sessions):
+            return self._sessions[ordinal].item()
+        shifted = np.busday_offset(
+            self._origin, ordinal, roll="forward", busdaycal=self._busdaycal
+        )
+        return shifted.item()
+
+    def latest_session(self, day: date) -> date:
+        """Most recent session on or before ``day``."""
+        return self.session_date(self.session_ordinal(day))
+
+    def _ordinal_bounds(self, start: date, end: date) -> tuple[int, int]:
+        """Half-open ordinal range of the sessions in ``[start, end]``."""
+        low = self.session_ordinal(_as_day(start) - _ONE_DAY) + 1
+        high = self.session_ordinal(end) + 1
+        return low, max(low, high)
+
+    def _session_slice(self, start: date, end: date) -> np.ndarray:
+        low, high = self._ordinal_bounds(start, end)
+        if 0 <= low and high <= len(self._sessions):
+            return self._sessions[low:high]
+        days = np.arange(np.datetime64(_as_day(start), "D"), np.datetime64(_as_day(end), "D") + 1)
+        return days[np.is_busday(days, busdaycal=self._busdaycal)]
+
+    def count_sessions(self, start: date, end: date) -> int:
+        low, high = self._ordinal_bounds(start, end)
+        return high - low
+
+    def sessions_between(self, start: date, end: date) -> list[date]:
+        """Sessions in ``[start, end]`` in order."""
+        return self._session_slice(start, end).tolist()
+
+    def sessions_since(self, since: date, until: date) -> int:
+        """Sessions after ``since`` up to and including ``until`` (0 if not behind)."""
+        return max(0, self.session_ordinal(until) - self.session_ordinal(since))
+
+    def has_session_between(self, after: date, before: date) -> bool:
+        """Whether any session lies strictly between ``after`` and ``before``."""
+        return self.session_ordinal(_as_day(before) - _ONE_DAY) > self.session_ordinal(after)
+
+    def missing_sessions(self, observed: Iterable[date], start: date, end: date) -> list[date]:
+        """Sessions in ``[start, end]`` absent from ``observed``."""
+        expected = self._session_slice(start, end)
+        if not len(expected):
+            return []
+        present = np.isin(expected, _day_array(observed))
+        return expected[~present].tolist()
+
+    def covers(self, observed: Iterable[date], start: date, end: date) -> bool:
+        """Whether ``observed`` includes every session in ``[start, end]``."""
+        expected = self._session_slice(start, end)
+        return bool(np.isin(expected, _day_array(observed)).all())
+
+
+@lru_cache(maxsize=16)
+def _calendar_for(holidays: frozenset[date]) -> TradingCalendar:
+    return TradingCalendar(holidays)
+
+
+@lru_cache(maxsize=4)
+def _configured_holidays(values: tuple[str, ...]) -> frozenset[date]:
+    return frozenset(date.fromisoformat(value) for value in values)
+
+
+def configured_market_holidays() -> frozenset[date]:
+    return _configured_holidays(tuple(settings.market_holiday_dates))
+
+
+def get_trading_calendar(holidays: Iterable[date] | None = None) -> TradingCalendar:
+    """Shared calendar for ``holidays`` (default: the configured market holidays)."""
+    if holidays is None:
+        return _calendar_for(configured_market_holidays())
+    return _calendar_for(frozenset(holidays))
@@ -2,18 +2,28 @@ import logging
 import threading
 import time
 from collections import defaultdict
-from math import inf
 
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from vnibb.core.cache_constants import REDIS_CACHE_TTLS
+from vnibb.core.config import settings
+from vnibb.core.instrumentation import (
+    PROMETHEUS_BUCKETS,
+    LatencyHistogram,
+    escape_label,
+    finish_timeline,
+    render_histogram,
+    render_summary,
+    span_recorder,
+    start_timeline,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class ProcessMetrics:
-    DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, inf)
+    DURATION_BUCKETS = PROMETHEUS_BUCKETS
     METHODS = {"DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"}
     CACHE_OUTCOMES = {"hit", "miss", "waiter", "store_error", "bypass"}
     CACHE_PREFIXES = frozenset(REDIS_CACHE_TTLS)
@@ -24,10 +34,9 @@ class ProcessMetrics:
         self._active_requests = 0
         self._routes: set[str] = set()
         self._request_counts: defaultdict[tuple[str, str, str], int] = defaultdict(int)
-        self._duration_counts: defaultdict[tuple[str, str], list[int]] = defaultdict(
-            lambda: [0] * len(self.DURATION_BUCKETS)
+        self._durations: defaultdict[tuple[str, str], LatencyHistogram] = defaultdict(
+            LatencyHistogram
         )
-        self._duration_sums: defaultdict[tuple[str, str], float] = defaultdict(float)
         self._cache_outcomes: defaultdict[tuple[str, str], int] = defaultdict(int)
 
     def cache_outcome(self, key_prefix: str, outcome: str) -> None:
@@ -53,11 +62,7 @@ class ProcessMetrics:
             self._active_requests = max(0, self._active_requests - 1)
             normalized_route = self._bounded_route(route)
             self._request_counts[(normalized_method, normalized_route, str(status_code))] += 1
-            duration_key = (normalized_method, normalized_route)
-            for index, boundary in enumerate(self.DURATION_BUCKETS):
-                if duration_seconds <= boundary:
-                    self._duration_counts[duration_key][index] += 1
-            self._duration_sums[duration_key] += duration_seconds
+            self._durations[(normalized_method, normalized_route)].record(duration_seconds)
 
     def _bounded_route(self, route: str) -> str:
         if route in self._routes:
@@ -67,16 +72,13 @@ class ProcessMetrics:
         self._routes.add(route)
         return route
 
-    @staticmethod
-    def _escape_label(value: str) -> str:
-        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    _escape_label = staticmethod(escape_label)
 
     def render(self) -> str:
         with self._lock:
             active_requests = self._active_requests
             request_counts = dict(self._request_counts)
-            duration_counts = {key: list(counts) for key, counts in self._duration_counts.items()}
-            duration_sums = dict(self._duration_sums)
+            durations = {key: histogram.copy() for key, histogram in self._durations.items()}
             cache_outcomes = dict(self._cache_outcomes)
 
         lines = [
@@ -100,20 +102,19 @@ class ProcessMetrics:
                 "# TYPE vnibb_http_request_duration_seconds histogram",
             ]
         )
-        for (method, route), counts in sorted(duration_counts.items()):
+        for (method, route), histogram in sorted(durations.items()):
             labels = f'method="{self._escape_label(method)}",route="{self._escape_label(route)}"'
-            for boundary, count in zip(self.DURATION_BUCKETS, counts, strict=True):
-                upper_bound = "+Inf" if boundary == inf else f"{boundary:g}"
-                lines.append(
-                    f'vnibb_http_request_duration_seconds_bucket{{{labels},le="{upper_bound}"}} '
-                    f"{count}"
-                )
-            count = counts[-1]
-            lines.append(
-                f"vnibb_http_request_duration_seconds_sum{{{labels}}} "
-                f"{duration_sums[(method, route)]:.6f}"
-            )
-            lines.append(f"vnibb_http_request_duration_seconds_count{{{labels}}} {count}")
+            render_histogram("vnibb_http_request_duration_seconds", labels, histogram, lines)
+
+        lines.extend(
+            [
+                "# HELP vnibb_http_request_latency_seconds HTTP latency quantiles (HDR histogram).",
+                "# TYPE vnibb_http_request_latency_seconds summary",
+            ]
+        )
+        for (method, route), histogram in sorted(durations.items()):
+            labels = f'method="{self._escape_label(method)}",route="{self._escape_label(route)}"'
+            render_summary("vnibb_http_request_latency_seconds", labels, histogram, lines)
 
         lines.extend(
             [
@@ -127,6 +128,8 @@ class ProcessMetrics:
                 f'outcome="{self._escape_label(outcome)}"'
             )
             lines.append(f"vnibb_cache_outcomes_total{{{labels}}} {count}")
+
+        lines.extend(span_recorder.render_lines())
         return "\n".join(lines) + "\n"
 
 
@@ -155,19 +158,38 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         route_path = getattr(route, "path", None)
         return route_path if isinstance(route_path, str) else "__unmatched__"
 
+    @staticmethod
+    def _finish_timeline(timeline, token, route: str, status_code: int, seconds: float) -> None:
+        if timeline is None:
+            return
+        finish_timeline(
+            timeline,
+            token,
+            route=route,
+            status_code=status_code,
+            duration_seconds=seconds,
+            slow_ms=settings.request_timeline_slow_ms,
+            sample_rate=settings.request_timeline_sample_rate,
+        )
+
     async def dispatch(self, request: Request, call_next):
         start_time = time.perf_counter()
         metrics_registry.request_started()
+        timeline = token = None
+        if request.url.path.startswith(tuple(settings.request_timeline_prefixes)):
+            timeline, token = start_timeline(request.method, request.url.path)
         try:
             response = await call_next(request)
         except BaseException:
             duration_seconds = time.perf_counter() - start_time
+            route_template = self._route_template(request)
             metrics_registry.request_finished(
                 request.method,
-                self._route_template(request),
+                route_template,
                 500,
                 duration_seconds,
             )
+            self._finish_timeline(timeline, token, route_template, 500, duration_seconds)
             raise
 
         duration_seconds = time.perf_counter() - start_time
@@ -179,6 +201,9 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             response.status_code,
             duration_seconds,
         )
+        self._finish_timeline(
+            timeline, token, route_template, response.status_code, duration_seconds
+        )
         slow_threshold_ms = self._slow_threshold_ms(request.url.path)
 
         if duration_ms > slow_threshold_ms:
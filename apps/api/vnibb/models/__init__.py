@@ -13,18 +13,20 @@ Complete database schema for Vietnam stock market data:
 """
 
 # Alert system models (new)
-from vnibb.models.alerts import AlertSettings, BlockTrade, InsiderAlert
+from vnibb.models.alerts import AlertRule, AlertSettings, BlockTrade, InsiderAlert
 from vnibb.models.app_kv import AppKeyValue
 from vnibb.models.company import Company, Officer, Shareholder
 from vnibb.models.dashboard import DashboardWidget, UserDashboard
 from vnibb.models.data_quality import DataQualityBreachState, DataQualityRun
+from vnibb.models.dataset_version import DatasetVersion
 from vnibb.models.derivatives import DerivativePrice
 from vnibb.models.financials import BalanceSheet, CashFlow, IncomeStatement
 from vnibb.models.market import MarketSector, SectorPerformance, Subsidiary
-from vnibb.models.market_news import MarketNews
+from vnibb.models.market_news import MarketNews, NewsSymbolLink
 
 # Existing models
 from vnibb.models.news import CompanyEvent, CompanyNews, Dividend, InsiderDeal
+from vnibb.models.news_sentiment import NewsSentimentResult
 from vnibb.models.prediction_market import PredictionMarket
 from vnibb.models.screener import ScreenerSnapshot
 from vnibb.models.stock import Stock, StockIndex, StockPrice
@@ -35,12 +37,14 @@ from vnibb.models.sync_status import SyncStatus
 # New models for vnstock premium integration
 from vnibb.models.technical_indicator import TechnicalIndicator
 from vnibb.models.trading import (
+    AverageDailyVolume,
     FinancialRatio,
     ForeignTrading,
     IntradayTrade,
     OrderbookSnapshot,
     OrderFlowDaily,
 )
+from vnibb.models.world_news import WorldNewsArticleRecord, WorldNewsFeedState
 
 __all__ = [
     # Stock
@@ -71,6 +75,7 @@ __all__ = [
     "ForeignTrading",
     "FinancialRatio",
     "OrderFlowDaily",
+    "AverageDailyVolume",
     # Market
     "MarketSector",
     "SectorPerformance",
@@ -79,6 +84,8 @@ __all__ = [
     "TechnicalIndicator",
     # Market News Aggregation (new)
     "MarketNews",
+    "NewsSymbolLink",
+    "NewsSentimentResult",
     "PredictionMarket",
     "DerivativePrice",
     "DerivativePrice",
@@ -86,11 +93,16 @@ __all__ = [
     "BlockTrade",
     "InsiderAlert",
     "AlertSettings",
+    "AlertRule",
     "AppKeyValue",
     "DataQualityRun",
     "DataQualityBreachState",
+    # World News Store
+    "WorldNewsArticleRecord",
+    "WorldNewsFeedState",
     # Sync Tracking
     "SyncStatus",
+    "DatasetVersion",
 ]
 
 
@@ -5,6 +5,7 @@ Models for:
 - BlockTrade: Large block trade detection
 - InsiderAlert: User alerts for insider activity
 - AlertSettings: User-configurable alert thresholds
+- AlertRule: User price/flow rules evaluated on realtime ticks
 """
 
 from datetime import datetime
@@ -35,6 +36,7 @@ class AlertType(str, Enum):
     INSIDER_SELL = "INSIDER_SELL"
     BLOCK_TRADE = "BLOCK_TRADE"
     OWNERSHIP_CHANGE = "OWNERSHIP_CHANGE"
+    RULE_TRIGGER = "RULE_TRIGGER"
 
 
 class AlertSeverity(str, Enum):
@@ -62,7 +64,10 @@ class BlockTrade(Base):
 
     __tablename__ = "block_trades"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # INTEGER on SQLite so set-based INSERT ... SELECT gets rowid ids there too.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
 
     # Stock reference
     symbol: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
@@ -94,6 +99,8 @@ class BlockTrade(Base):
         Index("ix_block_symbol_time", "symbol", "trade_time"),
         Index("ix_block_time", "trade_time"),
         Index("ix_block_value", "value"),
+        # Conflict target for set-based detection (INSERT ... ON CONFLICT DO NOTHING).
+        Index("uq_block_trade_symbol_time_price", "symbol", "trade_time", "price", unique=True),
     )
 
     def __repr__(self) -> str:
@@ -110,7 +117,9 @@ class InsiderAlert(Base):
 
     __tablename__ = "insider_alerts"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
 
     # Alert classification
     alert_type: Mapped[str] = mapped_column(SQLEnum(AlertType), nullable=False, index=True)
@@ -129,6 +138,8 @@ class InsiderAlert(Base):
 
     # User interaction
     user_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True, index=True)
+    # Authenticated account owning a private RULE_TRIGGER alert
+    owner_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True, index=True)
     read: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
     read_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
@@ -195,3 +206,63 @@ class AlertSettings(Base):
         return (
             f"<AlertSettings(user_id={self.user_id}, block_threshold={self.block_trade_threshold})>"
         )
+
+
+class AlertRuleType(str, Enum):
+    """Metric a streaming alert rule watches"""
+
+    PRICE = "price"  # last price crosses threshold (VND)
+    PCT_MOVE = "pct_move"  # % change vs previous close crosses threshold
+    VOLUME_SPIKE = "volume_spike"  # session volume / 20-session ADV crosses threshold
+    FOREIGN_NET_FLOW = "foreign_net_flow"  # foreign net value crosses threshold (VND)
+    RSI = "rsi"  # RSI(14) with the tick as today's close crosses threshold
+
+
+class AlertRuleDirection(str, Enum):
+    """Crossing direction for streaming alert rules"""
+
+    ABOVE = "above"
+    BELOW = "below"
+
+
+class AlertRule(Base):
+    """
+    User alert rule evaluated incrementally on realtime price/flow ticks.
+
+    A rule fires when its metric crosses ``threshold`` in ``direction``
+    between two consecutive ticks, at most once per ``cooldown_seconds``.
+    """
+
+    __tablename__ = "alert_rules"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+
+    # Authenticated account (``User.id``) that owns the rule
+    user_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    symbol: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+
+    # Predicate: metric crosses threshold in direction
+    rule_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    direction: Mapped[str] = mapped_column(String(10), nullable=False)
+    threshold: Mapped[float] = mapped_column(Float, nullable=False)
+
+    cooldown_seconds: Mapped[int] = mapped_column(Integer, default=300, nullable=False)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    note: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_triggered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Metadata
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (Index("ix_alert_rule_enabled_symbol", "enabled", "symbol"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<AlertRule(symbol='{self.symbol}', {self.rule_type} {self.direction} "
+            f"{self.threshold})>"
+        )
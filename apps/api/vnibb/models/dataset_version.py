@@ -0,0 +1,29 @@
+"""
+Dataset Version ORM Model
+
+One row per synced dataset (prices, screener, financials, ...). ``version``
+is bumped after every successful write so caches keyed on it invalidate
+exactly when the data changes.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vnibb.core.database import Base
+
+
+class DatasetVersion(Base):
+    """Monotonic version counter per dataset."""
+
+    __tablename__ = "dataset_versions"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<DatasetVersion(name='{self.name}', version={self.version})>"
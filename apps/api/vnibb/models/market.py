@@ -192,20 +192,27 @@ class SectorMetricSnapshot(Base):
 
 
 class RsSnapshot(Base):
-    """Weekly Relative Strength snapshot per (symbol, benchmark).
+    """Daily Relative Strength snapshot per (symbol or sector, benchmark).
 
     QA-v3 E.4: The Relative Rotation Graph (RRG) widget needs a polyline
     trail showing the symbol's path over recent weeks. Without persisted
     snapshots the widget could only render a single dot ("flat trail").
-    This table is written by a weekly cron job (Friday close) so the
-    widget can fetch the last 12 weeks and draw a meaningful path.
+    The nightly RRG job writes one row per session for every symbol
+    (``scope="symbol"``) and every ``VN_SECTORS`` group (``scope="sector"``,
+    ``symbol`` holds the sector id), so trails are read, not recomputed.
     """
 
     __tablename__ = "rs_snapshots"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # INTEGER on SQLite so multi-row upserts get rowid ids there too.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
 
-    symbol: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
+    symbol: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    scope: Mapped[str] = mapped_column(
+        String(10), default="symbol", server_default="symbol", nullable=False
+    )
     benchmark: Mapped[str] = mapped_column(String(20), default="VNINDEX", nullable=False)
     snapshot_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
 
@@ -224,6 +231,7 @@ class RsSnapshot(Base):
             name="uq_rs_snapshot_symbol_benchmark_date",
         ),
         Index("ix_rs_snapshot_symbol_date", "symbol", "snapshot_date"),
+        Index("ix_rs_snapshot_scope_benchmark_date", "scope", "benchmark", "snapshot_date"),
     )
 
     def __repr__(self) -> str:
@@ -231,3 +239,66 @@ class RsSnapshot(Base):
             f"<RsSnapshot(symbol='{self.symbol}', date='{self.snapshot_date}', "
             f"ratio={self.rs_ratio}, momentum={self.rs_momentum})>"
         )
+
+
+class RsRotationState(Base):
+    """EMA state behind the latest RS snapshot of one symbol or sector.
+
+    The nightly RRG job advances these values by the sessions since
+    ``as_of_date`` instead of replaying the full price history. ``level``
+    is the last RS numerator: the close for a symbol, the equal-weighted
+    index level for a sector.
+    """
+
+    __tablename__ = "rs_rotation_state"
+
+    entity: Mapped[str] = mapped_column(String(32), primary_key=True)
+    benchmark: Mapped[str] = mapped_column(String(20), primary_key=True, default="VNINDEX")
+    scope: Mapped[str] = mapped_column(String(10), default="symbol", nullable=False)
+    as_of_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    ema_fast: Mapped[float] = mapped_column(Float, nullable=False)
+    ema_slow: Mapped[float] = mapped_column(Float, nullable=False)
+    ema_momentum: Mapped[float] = mapped_column(Float, nullable=False)
+    level: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    sessions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RsRotationState(entity='{self.entity}', as_of='{self.as_of_date}', "
+            f"sessions={self.sessions})>"
+        )
+
+
+class GarchWarmStart(Base):
+    """Fitted GARCH(1,1) parameters of one symbol as of a session.
+
+    The next fit for the symbol starts from the row with the nearest
+    earlier ``as_of_date`` instead of the coarse grid; a row for the same
+    session and window is reused as is.
+    """
+
+    __tablename__ = "garch_warm_starts"
+
+    symbol: Mapped[str] = mapped_column(String(10), primary_key=True)
+    adjustment_mode: Mapped[str] = mapped_column(String(10), primary_key=True)
+    as_of_date: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    omega: Mapped[float] = mapped_column(Float, nullable=False)
+    alpha: Mapped[float] = mapped_column(Float, nullable=False)
+    beta: Mapped[float] = mapped_column(Float, nullable=False)
+    observations: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<GarchWarmStart(symbol='{self.symbol}', mode='{self.adjustment_mode}', "
+            f"as_of='{self.as_of_date}')>"
+        )
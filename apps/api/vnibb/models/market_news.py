@@ -4,11 +4,26 @@ Market News ORM Model
 Stores general market news from multiple Vietnamese sources.
 Aggregated using vnstock_news or fallback RSS crawling.
 Enhanced with AI sentiment analysis.
+
+``news_symbol_link`` is the symbol -> article inverted index written at
+ingest time by ``news_symbol_linker`` so company-news relevance is an
+indexed top-K lookup instead of a rescoring pass over the newest rows.
 """
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    inspect,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from vnibb.core.database import Base
@@ -83,23 +98,71 @@ class MarketNews(Base):
         return f"<MarketNews {self.source}: {self.title[:30]}...>"
 
     def to_dict(self):
-        """Convert to dictionary for API response."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "summary": self.summary,
-            "content": self.content,
-            "source": self.source,
-            "url": self.url,
-            "author": self.author,
-            "image_url": self.image_url,
-            "category": self.category,
-            "published_date": self.published_date.isoformat() if self.published_date else None,
-            "related_symbols": self.related_symbols.split(",") if self.related_symbols else [],
-            "sectors": self.sectors.split(",") if self.sectors else [],
-            "sentiment": self.sentiment,
-            "sentiment_score": self.sentiment_score,
-            "ai_summary": self.ai_summary,
-            "read_count": self.read_count,
-            "bookmarked": False,  # Will be populated from user data later
+        """Convert to dictionary for API response.
+
+        Columns left unloaded by a ``load_only`` projection are omitted
+        instead of triggering a lazy load.
+        """
+        state = inspect(self)
+        unloaded = state.unloaded if state.has_identity else frozenset()
+        payload = {
+            key: getattr(self, key)
+            for key in (
+                "id",
+                "title",
+                "summary",
+                "content",
+                "source",
+                "url",
+                "author",
+                "image_url",
+                "category",
+                "published_date",
+                "related_symbols",
+                "sectors",
+                "sentiment",
+                "sentiment_score",
+                "ai_summary",
+                "read_count",
+            )
+            if key not in unloaded
         }
+        if "published_date" in payload:
+            published_date = payload["published_date"]
+            payload["published_date"] = published_date.isoformat() if published_date else None
+        for key in ("related_symbols", "sectors"):
+            if key in payload:
+                payload[key] = payload[key].split(",") if payload[key] else []
+        payload["bookmarked"] = False  # Will be populated from user data later
+        return payload
+
+
+class NewsSymbolLink(Base):
+    """
+    One scored symbol mention for a market news article.
+
+    ``score``/``reason`` follow the relevance ladder used by
+    ``news_service._score_news_row`` (exact ticker in title, related list,
+    body, company keyword, peer mentions). ``published_date`` is copied from
+    the article so the per-symbol top-K by score and recency is served from
+    ``ix_news_symbol_link_rank`` without touching ``market_news``.
+    """
+    __tablename__ = "news_symbol_link"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    symbol: Mapped[str] = mapped_column(String(10), nullable=False)
+    article_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("market_news.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    reason: Mapped[str] = mapped_column(String(32), nullable=False)
+    published_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("symbol", "article_id", name="uq_news_symbol_link_symbol_article"),
+        Index("ix_news_symbol_link_rank", "symbol", "score", "published_date"),
+    )
+
+    def __repr__(self):
+        return f"<NewsSymbolLink {self.symbol} -> {self.article_id} ({self.reason})>"
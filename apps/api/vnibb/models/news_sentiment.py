@@ -0,0 +1,44 @@
+"""
+News Sentiment ORM Model
+
+Persistent memo of model sentiment results keyed by the normalized content
+hash of an article (see ``sentiment_analyzer.sentiment_content_hash``), so
+repeated and syndicated articles are scored once per model.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vnibb.core.database import Base
+
+
+class NewsSentimentResult(Base):
+    """One model verdict for one normalized article body."""
+
+    __tablename__ = "news_sentiment_results"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    model: Mapped[str] = mapped_column(String(64), nullable=False)
+    sentiment: Mapped[str] = mapped_column(String(20), nullable=False)
+    confidence: Mapped[int] = mapped_column(Integer, nullable=False)
+    symbols: Mapped[list[Any] | None] = mapped_column(JSON, nullable=True)
+    sectors: Mapped[list[Any] | None] = mapped_column(JSON, nullable=True)
+    ai_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("content_hash", "model", name="uq_news_sentiment_results_hash_model"),
+    )
+
+    def to_result(self) -> dict[str, Any]:
+        return {
+            "sentiment": self.sentiment,
+            "confidence": self.confidence,
+            "symbols": list(self.symbols or []),
+            "sectors": list(self.sectors or []),
+            "ai_summary": self.ai_summary or "",
+        }
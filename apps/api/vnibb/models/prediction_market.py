@@ -39,6 +39,12 @@ class PredictionMarket(Base):
     outcomes: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
     outcome_prices: Mapped[list[float]] = mapped_column(JSON, nullable=False, default=list)
     extra: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict, server_default="{}")
+    # Estimator inputs parsed once at ingest (see services/prediction_market_features.py).
+    features: Mapped[dict] = mapped_column(
+        JSON, nullable=False, default=dict, server_default="{}"
+    )
+    features_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    estimator_buckets: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -50,4 +56,5 @@ class PredictionMarket(Base):
         UniqueConstraint("source", "source_id", name="uq_prediction_markets_source_id"),
         Index("ix_prediction_markets_source_active", "source", "active"),
         Index("ix_prediction_markets_end_date", "end_date"),
+        Index("ix_prediction_markets_active_buckets", "active", "estimator_buckets"),
     )
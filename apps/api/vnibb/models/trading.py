@@ -5,6 +5,7 @@ Models for:
 - IntradayTrade: Tick-by-tick trade data
 - OrderbookSnapshot: Order book depth snapshots
 - ForeignTrading: Foreign investor buy/sell data
+- AverageDailyVolume: Precomputed 20-session average daily volume
 - FinancialRatio: Key financial ratios
 """
 
@@ -214,6 +215,27 @@ class OrderFlowDaily(Base):
         return f"<OrderFlowDaily(symbol='{self.symbol}', date='{self.trade_date}')>"
 
 
+class AverageDailyVolume(Base):
+    """
+    20-session average daily volume per symbol, precomputed once per trading day.
+
+    ``as_of_date`` is the trading day the average applies to; it is computed
+    from the daily bars strictly before that day, so intraday detection can
+    join against it without touching ``stock_prices``.
+    """
+
+    __tablename__ = "average_daily_volume"
+
+    symbol: Mapped[str] = mapped_column(String(10), primary_key=True)
+    as_of_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    adv_20d: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    sessions: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<AverageDailyVolume(symbol='{self.symbol}', date='{self.as_of_date}')>"
+
+
 class FinancialRatio(Base):
     """
     Key financial ratios.
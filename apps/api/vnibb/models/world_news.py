@@ -0,0 +1,73 @@
+"""
+World News ORM Models
+
+Persistent store for the world-news monitor. The background aggregator
+polls the RSS/Atom registry in ``world_news_service`` and upserts parsed
+articles here keyed by ``_build_article_id``; per-feed HTTP validators and
+adaptive poll schedules live in ``world_news_feed_states``.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Float, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vnibb.core.database import Base
+
+
+class WorldNewsArticleRecord(Base):
+    """One parsed world-news article (timestamps stored as naive UTC)."""
+
+    __tablename__ = "world_news_articles"
+
+    id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    source_id: Mapped[str] = mapped_column(String(96), nullable=False)
+    source: Mapped[str] = mapped_column(String(128), nullable=False)
+    source_domain: Mapped[str] = mapped_column(String(128), nullable=False)
+    source_url: Mapped[str] = mapped_column(Text, nullable=False)
+    feed_url: Mapped[str] = mapped_column(Text, nullable=False)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    region: Mapped[str] = mapped_column(String(32), nullable=False)
+    category: Mapped[str] = mapped_column(String(32), nullable=False)
+    language: Mapped[str] = mapped_column(String(8), nullable=False)
+    tags: Mapped[list[Any] | None] = mapped_column(JSON, nullable=True)
+    relevance_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    first_seen_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_world_news_articles_published", "published_at"),
+        Index("ix_world_news_articles_source_published", "source_id", "published_at"),
+        Index("ix_world_news_articles_first_seen", "first_seen_at"),
+    )
+
+
+class WorldNewsFeedState(Base):
+    """Conditional-GET validators and adaptive poll schedule for one feed URL."""
+
+    __tablename__ = "world_news_feed_states"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source_id: Mapped[str] = mapped_column(String(96), nullable=False)
+    feed_url: Mapped[str] = mapped_column(String(500), nullable=False)
+    etag: Mapped[str | None] = mapped_column(String(256), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    poll_interval_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=600)
+    next_poll_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    last_polled_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_success_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_status: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String(240), nullable=True)
+    consecutive_failures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_article_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_new_article_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("source_id", "feed_url", name="uq_world_news_feed_states_feed"),
+    )
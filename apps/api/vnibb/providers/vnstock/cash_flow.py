@@ -13,6 +13,7 @@ from pydantic import BaseModel, Field, field_validator
 from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -69,14 +70,11 @@ class VnstockCashFlowFetcher(BaseFetcher[CashFlowQueryParams, CashFlowData]):
         query: dict[str, Any],
         credentials: Optional[dict[str, str]] = None,
     ) -> List[dict[str, Any]]:
-        loop = asyncio.get_event_loop()
-        
         def _fetch_sync() -> List[dict]:
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=query["symbol"], source=settings.vnstock_source)
+                stock = get_stock_client(query["symbol"], settings.vnstock_source)
                 df = stock.finance.cash_flow(period=query.get("period", "year"), lang="en")
                 
                 if df is None or df.empty:
@@ -88,8 +86,10 @@ class VnstockCashFlowFetcher(BaseFetcher[CashFlowQueryParams, CashFlowData]):
                 raise ProviderError(message=str(e), provider="vnstock", details={"symbol": query["symbol"]})
         
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(None, _fetch_sync),
+            return await run_vnstock_call(
+                "cash_flow",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
         except asyncio.TimeoutError:
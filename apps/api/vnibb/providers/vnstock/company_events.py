@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field, field_validator
 from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 RATIO_PATTERN = re.compile(r"(\d+(?:[\.,]\d+)?)\s*[:/]\s*(\d+(?:[\.,]\d+)?)")
@@ -186,14 +187,12 @@ class VnstockCompanyEventsFetcher(BaseFetcher[CompanyEventsQueryParams, CompanyE
         credentials: Optional[dict[str, str]] = None,
     ) -> List[dict[str, Any]]:
         """Fetch company events from vnstock."""
-        loop = asyncio.get_event_loop()
 
         def _fetch_sync() -> List[dict]:
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=query["symbol"], source=settings.vnstock_source)
+                stock = get_stock_client(query["symbol"], settings.vnstock_source)
 
                 # Get company events
                 events_df = None
@@ -260,8 +259,10 @@ class VnstockCompanyEventsFetcher(BaseFetcher[CompanyEventsQueryParams, CompanyE
                 )
 
         try:
-            data = await asyncio.wait_for(
-                loop.run_in_executor(None, _fetch_sync),
+            data = await run_vnstock_call(
+                "company_events",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
 
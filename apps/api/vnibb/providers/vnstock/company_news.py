@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field, field_validator
 from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -92,14 +93,12 @@ class VnstockCompanyNewsFetcher(BaseFetcher[CompanyNewsQueryParams, CompanyNewsD
         credentials: Optional[dict[str, str]] = None,
     ) -> List[dict[str, Any]]:
         """Fetch company news from vnstock."""
-        loop = asyncio.get_event_loop()
 
         def _fetch_sync() -> List[dict]:
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=query["symbol"], source=settings.vnstock_source)
+                stock = get_stock_client(query["symbol"], settings.vnstock_source)
 
                 # Get company news
                 news_df = stock.company.news()
@@ -122,8 +121,10 @@ class VnstockCompanyNewsFetcher(BaseFetcher[CompanyNewsQueryParams, CompanyNewsD
                 )
 
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(None, _fetch_sync),
+            return await run_vnstock_call(
+                "company_news",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
         except asyncio.TimeoutError:
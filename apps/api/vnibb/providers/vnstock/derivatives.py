@@ -5,7 +5,6 @@ Provides access to derivatives/futures price data.
 Uses vnstock quote.history() for derivatives symbols like VN30F1M.
 """
 
-import asyncio
 import logging
 from datetime import date, timedelta
 from typing import List, Optional
@@ -14,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -99,10 +99,9 @@ class VnstockDerivativesFetcher:
         """
         try:
             def _fetch():
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=symbol.upper(), source=settings.vnstock_source)
+                stock = get_stock_client(symbol.upper(), settings.vnstock_source)
                 df = stock.quote.history(
                     start=start_date.strftime("%Y-%m-%d"),
                     end=end_date.strftime("%Y-%m-%d"),
@@ -110,8 +109,9 @@ class VnstockDerivativesFetcher:
                 )
                 return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
             
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call(
+                "derivatives", _fetch, key=(symbol.upper(), start_date, end_date, interval)
+            )
             
             result = []
             for r in records:
@@ -5,7 +5,6 @@ Provides access to dividend payment history.
 Uses vnstock company.dividends() method.
 """
 
-import asyncio
 import logging
 import math
 from typing import List, Optional
@@ -14,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -130,12 +130,11 @@ class VnstockDividendsFetcher:
                 except Exception as e:
                     logger.debug(f"VCI dividends events failed for {symbol}: {e}")
 
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
 
                 def _fetch_source(source: str):
-                    stock = Vnstock().stock(symbol=symbol.upper(), source=source)
+                    stock = get_stock_client(symbol.upper(), source)
                     if not hasattr(stock.company, "dividends"):
                         raise AttributeError("dividends not supported")
                     df = stock.company.dividends()
@@ -159,8 +158,7 @@ class VnstockDividendsFetcher:
 
                 return []
 
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call("dividends", _fetch, key=symbol.upper())
 
             result = []
             for r in records:
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field, field_validator
 from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -175,18 +176,13 @@ class VnstockEquityHistoricalFetcher(
         vnstock is synchronous, so we run it in a thread pool executor
         to avoid blocking the async event loop.
         """
-        loop = asyncio.get_event_loop()
 
         def _fetch_sync() -> List[dict[str, Any]]:
             """Synchronous fetch wrapped for executor."""
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(
-                    symbol=query["symbol"],
-                    source=query["source"],
-                )
+                stock = get_stock_client(query["symbol"], query["source"])
                 df = stock.quote.history(
                     start=query["start"],
                     end=query["end"],
@@ -209,8 +205,10 @@ class VnstockEquityHistoricalFetcher(
                 )
 
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(None, _fetch_sync),
+            return await run_vnstock_call(
+                "equity_historical",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
         except asyncio.TimeoutError:
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field, field_validator
 from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +108,6 @@ class VnstockEquityProfileFetcher(BaseFetcher[EquityProfileQueryParams, EquityPr
         credentials: Optional[dict[str, str]] = None,
     ) -> List[dict[str, Any]]:
         """Fetch company profile from vnstock."""
-        loop = asyncio.get_event_loop()
 
         def _fetch_sync() -> List[dict[str, Any]]:
             def _is_present(value: Any) -> bool:
@@ -120,10 +120,9 @@ class VnstockEquityProfileFetcher(BaseFetcher[EquityProfileQueryParams, EquityPr
                 return True
 
             try:
-                from vnibb.providers.vnstock.runtime import get_listing_class, get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_listing_class, get_stock_client
 
                 Listing = get_listing_class()
-                Vnstock = get_vnstock_class()
 
                 record: dict[str, Any] = {}
                 candidate_sources: list[str] = []
@@ -133,7 +132,7 @@ class VnstockEquityProfileFetcher(BaseFetcher[EquityProfileQueryParams, EquityPr
 
                 for source in candidate_sources:
                     try:
-                        stock = Vnstock().stock(symbol=query["symbol"], source=source)
+                        stock = get_stock_client(query["symbol"], source)
                         overview = stock.company.overview()
                     except Exception as source_error:
                         logger.debug(
@@ -178,8 +177,10 @@ class VnstockEquityProfileFetcher(BaseFetcher[EquityProfileQueryParams, EquityPr
                 )
 
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(None, _fetch_sync),
+            return await run_vnstock_call(
+                "equity_profile",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
         except asyncio.TimeoutError:
@@ -19,7 +19,7 @@ from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError, ProviderRateLimitError
 from vnibb.providers.vnstock import get_vnstock
-from concurrent.futures import ThreadPoolExecutor
+from vnibb.providers.vnstock.runtime import get_stock_client, run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +36,6 @@ if not any(isinstance(f, _VnstockNoiseFilter) for f in _vnstock_data_logger.filt
 
 logging.getLogger("vnstock.core.utils.field.mapper").setLevel(logging.WARNING)
 
-# Shared thread pool for parallel fetching across requests
-_executor = ThreadPoolExecutor(max_workers=12)
-
 
 def _is_rate_limit_error(error: Exception) -> bool:
     """Check if error is a rate limit error from VNStock."""
@@ -475,16 +472,15 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
         vnstock.stock().company.ratio_summary() returns financial metrics.
         We also fetch price/volume from quote.history() and company name from Listing.
         """
-        loop = asyncio.get_running_loop()
 
-        def _fetch_sync() -> List[dict[str, Any]]:
-            """Synchronous fetch wrapped for executor."""
+        def _fetch_sync() -> tuple[Optional[List[dict[str, Any]]], list[str], Any]:
+            """Resolve the listing; return records, or the symbols to fan out over."""
             try:
                 from vnibb.providers.vnstock.runtime import get_listing_class
                 from datetime import datetime, timedelta
 
                 Listing = get_listing_class()
-                stock = get_vnstock()
+                get_vnstock()  # exports the sponsor API key before clients are built
                 source = query.get("source", "KBS")
 
                 def _extract_ratio_snapshot(stock_obj: Any) -> dict[str, Any]:
@@ -619,7 +615,7 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
 
                 # If single symbol requested, get that specific stock's data
                 if query["symbol"]:
-                    screener = stock.stock(symbol=query["symbol"], source=source)
+                    screener = get_stock_client(query["symbol"], source)
 
                     record = _extract_ratio_snapshot(screener)
                     if record:
@@ -659,8 +655,8 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
                         except Exception as e:
                             logger.debug(f"Failed to get quote for {query['symbol']}: {e}")
 
-                        return [record]
-                    return []
+                        return [record], [], None
+                    return [], [], None
 
                 # For full stock list, use Listing to get symbols, then fetch ratio_summary for each
                 exchange = query.get("exchange")
@@ -669,7 +665,7 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
                 all_symbols_df = listing.all_symbols(exchange=exchange)
                 if all_symbols_df is None or all_symbols_df.empty:
                     logger.warning("No symbols found for exchange: %s", exchange)
-                    return []
+                    return [], [], None
 
                 exchange_listing_map = _build_listing_map(all_symbols_df)
 
@@ -688,7 +684,7 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
                 def _fetch_single_stock(symbol: str) -> Optional[dict[str, Any]]:
                     """Fetch data for a single stock."""
                     try:
-                        stock_obj = stock.stock(symbol=symbol, source=source)
+                        stock_obj = get_stock_client(symbol, source)
                         record = _extract_ratio_snapshot(stock_obj)
                         if record:
                             record["ticker"] = symbol
@@ -734,32 +730,7 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
                         logger.debug("Failed to fetch screener ratio for %s: %s", symbol, e)
                     return None
 
-                results = []
-                # Use shared executor to avoid blocking on shutdown
-                max_workers = min(len(symbols), 20)
-
-                from concurrent.futures import as_completed, TimeoutError
-
-                future_to_symbol = {_executor.submit(_fetch_single_stock, s): s for s in symbols}
-                try:
-                    # Add a slightly shorter timeout for the parallel batch than the global one
-                    batch_timeout = settings.vnstock_timeout - 5
-                    for future in as_completed(future_to_symbol, timeout=batch_timeout):
-                        try:
-                            res = future.result()
-                            if res:
-                                results.append(res)
-                        except Exception as e:
-                            error_msg = str(e)
-                            if "quá nhiều" in error_msg or "rate" in error_msg.lower():
-                                logger.warning("Rate limit detected in batch")
-                                # We can't easily cancel running futures, but we can stop processing
-                                break
-                except TimeoutError:
-                    logger.warning(f"Parallel screener fetch timed out after {batch_timeout}s")
-
-                logger.info("Fetched ratio data for %d/%d stocks", len(results), len(symbols))
-                return results
+                return None, symbols, _fetch_single_stock
 
             except Exception as e:
                 if _is_rate_limit_error(e):
@@ -768,7 +739,7 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
 
                 if _is_recoverable_screener_error(e):
                     logger.debug("Recoverable vnstock screener issue: %s", e)
-                    return []
+                    return [], [], None
 
                 logger.error(f"vnstock screener fetch error: {e}")
                 raise ProviderError(
@@ -777,10 +748,13 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
                     details={"query": query},
                 )
 
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
         try:
-            # Use shared executor to avoid "Executor shutdown" errors and blocking on timeout
-            return await asyncio.wait_for(
-                loop.run_in_executor(_executor, _fetch_sync),
+            records, symbols, fetch_single = await run_vnstock_call(
+                "equity_screener",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
         except asyncio.TimeoutError:
@@ -788,6 +762,45 @@ class VnstockScreenerFetcher(BaseFetcher[StockScreenerParams, ScreenerData]):
                 provider="vnstock",
                 timeout=settings.vnstock_timeout,
             )
+        if records is not None:
+            return records
+
+        # Fan out per symbol from here rather than from inside a pool worker, so
+        # the batch shares the provider runtime without a worker blocking on it.
+        source = query.get("source", "KBS")
+        tasks = [
+            asyncio.ensure_future(
+                run_vnstock_call(
+                    "equity_screener.symbol",
+                    lambda symbol=symbol: fetch_single(symbol),
+                    key={"symbol": symbol, "source": source},
+                )
+            )
+            for symbol in symbols
+        ]
+        # Leave a little headroom under the global provider timeout for the batch
+        batch_timeout = max(1.0, settings.vnstock_timeout - 5 - (loop.time() - started_at))
+        results = []
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=batch_timeout):
+                try:
+                    res = await next_done
+                    if res:
+                        results.append(res)
+                except Exception as e:
+                    error_msg = str(e)
+                    if "quá nhiều" in error_msg or "rate" in error_msg.lower():
+                        logger.warning("Rate limit detected in batch")
+                        break
+        except TimeoutError:
+            logger.warning(f"Parallel screener fetch timed out after {batch_timeout:.0f}s")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info("Fetched ratio data for %d/%d stocks", len(results), len(symbols))
+        return results
 
     @staticmethod
     def transform_data(
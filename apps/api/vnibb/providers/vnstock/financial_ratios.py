@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field, field_validator
 from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -205,13 +206,10 @@ class VnstockFinancialRatiosFetcher(BaseFetcher[FinancialRatiosQueryParams, Fina
         query: dict[str, Any],
         credentials: Optional[dict[str, str]] = None,
     ) -> List[dict[str, Any]]:
-        loop = asyncio.get_event_loop()
-
         def _fetch_sync() -> List[dict[str, Any]]:
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
 
                 candidate_sources: list[str] = []
                 for source in ["VCI", settings.vnstock_source, "KBS"]:
@@ -219,7 +217,7 @@ class VnstockFinancialRatiosFetcher(BaseFetcher[FinancialRatiosQueryParams, Fina
                         candidate_sources.append(source)
 
                 def _fetch_rows_for_source(source: str) -> List[dict[str, Any]]:
-                    stock = Vnstock().stock(symbol=query["symbol"], source=source)
+                    stock = get_stock_client(query["symbol"], source)
                     finance = stock.finance
                     method = finance.ratio
                     kwargs = {"period": query.get("period", "year")}
@@ -306,8 +304,10 @@ class VnstockFinancialRatiosFetcher(BaseFetcher[FinancialRatiosQueryParams, Fina
                 )
 
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(None, _fetch_sync),
+            return await run_vnstock_call(
+                "financial_ratios",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
         except asyncio.TimeoutError:
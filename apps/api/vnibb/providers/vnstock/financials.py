@@ -5,7 +5,6 @@ Fetches financial statements (Income Statement, Balance Sheet, Cash Flow)
 for Vietnam-listed companies via vnstock library.
 """
 
-import asyncio
 import inspect
 import logging
 import math
@@ -21,6 +20,7 @@ from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
 from vnibb.core.retry import circuit_breaker, vnstock_cb
 from vnibb.providers.base import BaseFetcher
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -177,13 +177,11 @@ class VnstockFinancialsFetcher(BaseFetcher[FinancialsQueryParams, FinancialState
         credentials: dict[str, str] | None = None,
     ) -> list[dict[str, Any]]:
         """Fetch financial statement data from vnstock."""
-        loop = asyncio.get_event_loop()
 
         def _fetch_sync() -> list[dict]:
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
 
                 statement_type = query["statement_type"]
                 period = query["period"]
@@ -367,7 +365,7 @@ class VnstockFinancialsFetcher(BaseFetcher[FinancialsQueryParams, FinancialState
 
                 for source in candidate_sources:
                     try:
-                        stock = Vnstock().stock(symbol=query["symbol"], source=source)
+                        stock = get_stock_client(query["symbol"], source)
                         finance = stock.finance
                     except Exception as source_init_error:
                         logger.debug(
@@ -563,8 +561,10 @@ class VnstockFinancialsFetcher(BaseFetcher[FinancialsQueryParams, FinancialState
             return records
 
         try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(None, _fetch_sync),
+            return await run_vnstock_call(
+                "financials",
+                _fetch_sync,
+                key=query,
                 timeout=settings.vnstock_timeout,
             )
         except TimeoutError as exc:
@@ -5,7 +5,6 @@ Provides analyst ratings and recommendations for stocks.
 Uses vnstock company.general_rating() method.
 """
 
-import asyncio
 import logging
 from typing import Optional
 
@@ -13,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -70,17 +70,15 @@ class VnstockGeneralRatingFetcher:
         """
         try:
             def _fetch():
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=symbol.upper(), source=settings.vnstock_source)
+                stock = get_stock_client(symbol.upper(), settings.vnstock_source)
                 df = stock.company.general_rating()
                 if df is None or len(df) == 0:
                     return {}
                 return df.to_dict(orient="records")[0] if len(df) > 0 else {}
             
-            loop = asyncio.get_event_loop()
-            record = await loop.run_in_executor(None, _fetch)
+            record = await run_vnstock_call("general_rating", _fetch, key=symbol.upper())
             
             return GeneralRatingData(
                 symbol=symbol.upper(),
@@ -5,7 +5,6 @@ Provides access to insider trading transactions.
 Uses vnstock company.insider_deals() method.
 """
 
-import asyncio
 import logging
 from datetime import date
 from typing import List, Optional
@@ -14,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -135,12 +135,11 @@ class VnstockInsiderDealsFetcher:
                 except Exception as e:
                     logger.debug(f"vnstock_data insider trading failed for {symbol}: {e}")
 
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
 
                 def _fetch_source(source: str):
-                    stock = Vnstock().stock(symbol=symbol.upper(), source=source)
+                    stock = get_stock_client(symbol.upper(), source)
                     if not hasattr(stock.company, "insider_deals"):
                         raise AttributeError("insider_deals not supported")
                     df = stock.company.insider_deals()
@@ -158,8 +157,7 @@ class VnstockInsiderDealsFetcher:
 
                 return []
             
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call("insider_deals", _fetch, key=(symbol.upper(), limit))
             
             result = []
             for r in records:
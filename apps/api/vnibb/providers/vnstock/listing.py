@@ -5,7 +5,6 @@ Provides access to stock listings by exchange, index group, and industry classif
 Uses vnstock Listing class.
 """
 
-import asyncio
 import logging
 from typing import List, Optional
 
@@ -13,7 +12,7 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.exceptions import ProviderError
 from vnibb.core.config import settings
-from vnibb.providers.vnstock.runtime import get_listing_class
+from vnibb.providers.vnstock.runtime import get_listing_class, run_vnstock_call
 
 
 logger = logging.getLogger(__name__)
@@ -133,8 +132,7 @@ class VnstockListingFetcher:
                 df = listing.all_symbols(to_df=True)
                 return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
 
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call("listing_all_symbols", _fetch, key=source)
 
             return [SymbolData(**r) for r in records]
 
@@ -165,8 +163,9 @@ class VnstockListingFetcher:
                 df = listing.symbols_by_exchange(lang=lang)
                 return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
 
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call(
+                "listing_symbols_by_exchange", _fetch, key=(source, lang)
+            )
 
             return [ExchangeSymbolData(**r) for r in records]
 
@@ -208,8 +207,9 @@ class VnstockListingFetcher:
                     symbols = df.tolist() if hasattr(df, "tolist") else list(df)
                     return [{"symbol": symbol, "group": group} for symbol in symbols]
 
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call(
+                "listing_symbols_by_group", _fetch, key=(group, source)
+            )
 
             return [IndexGroupSymbolData(**r) for r in records]
 
@@ -240,8 +240,7 @@ class VnstockListingFetcher:
                 df = listing.industries_icb()
                 return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
 
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call("listing_industries_icb", _fetch, key=source)
 
             return [IndustryData(**r) for r in records]
 
@@ -15,7 +15,7 @@ from vnibb.providers.base import BaseFetcher
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError, ProviderTimeoutError
 
-from vnibb.providers.vnstock import get_vnstock
+from vnibb.providers.vnstock.runtime import get_stock_client, run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -111,8 +111,6 @@ class VnstockMarketOverviewFetcher(BaseFetcher[MarketOverviewQueryParams, Market
 
         def _fetch_single_index(index_name: str, symbols: list[str]) -> Optional[dict[str, Any]]:
             """Fetch a single market index with timeout handling."""
-            stock_manager = get_vnstock()
-
             end_date = datetime.now()
             start_date = end_date - timedelta(days=5)
             prev_end_date = end_date - timedelta(days=1)
@@ -121,7 +119,7 @@ class VnstockMarketOverviewFetcher(BaseFetcher[MarketOverviewQueryParams, Market
             for source in source_candidates:
                 for symbol in symbols:
                     try:
-                        stock = stock_manager.stock(symbol=symbol, source=source)
+                        stock = get_stock_client(symbol, source)
                         df = stock.quote.history(
                             start=start_date.strftime("%Y-%m-%d"),
                             end=end_date.strftime("%Y-%m-%d"),
@@ -205,8 +203,10 @@ class VnstockMarketOverviewFetcher(BaseFetcher[MarketOverviewQueryParams, Market
         ) -> Optional[dict[str, Any]]:
             """Fetch a single index with timeout."""
             try:
-                return await asyncio.wait_for(
-                    asyncio.to_thread(_fetch_single_index, index_name, symbols),
+                return await run_vnstock_call(
+                    "market_overview",
+                    lambda: _fetch_single_index(index_name, symbols),
+                    key=(index_name, tuple(symbols)),
                     timeout=timeout,
                 )
             except asyncio.TimeoutError:
@@ -5,7 +5,6 @@ Provides ownership data including major shareholders and foreign ownership.
 Uses vnstock company.ownership() method.
 """
 
-import asyncio
 import logging
 from typing import List, Optional
 
@@ -13,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -103,17 +103,15 @@ class VnstockOwnershipFetcher:
         try:
 
             def _fetch():
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=symbol.upper(), source=settings.vnstock_source)
+                stock = get_stock_client(symbol.upper(), settings.vnstock_source)
                 df = stock.company.ownership()
                 if df is None or len(df) == 0:
                     return []
                 return df.to_dict(orient="records")
 
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call("ownership", _fetch, key=symbol.upper())
 
             results = []
             for row in records:
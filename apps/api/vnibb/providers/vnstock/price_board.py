@@ -5,7 +5,6 @@ Provides real-time price board data for multiple symbols simultaneously.
 Uses vnstock Trading.price_board() method.
 """
 
-import asyncio
 import logging
 import math
 from datetime import UTC, datetime
@@ -14,6 +13,7 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -124,8 +124,7 @@ class VnstockPriceBoardFetcher:
                     )
                     return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
 
-                loop = asyncio.get_event_loop()
-                records = await loop.run_in_executor(None, _fetch)
+                records = await run_vnstock_call("price_board", _fetch, key=(tuple(symbols), src))
                 if records:
                     if src != primary:
                         logger.info(
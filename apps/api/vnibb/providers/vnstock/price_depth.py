@@ -5,13 +5,13 @@ Provides real-time order book data showing bid and ask levels.
 Uses vnstock Quote.price_depth() method.
 """
 
-import asyncio
 import logging
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -98,15 +98,13 @@ class VnstockPriceDepthFetcher:
                     df = quote.price_depth()
                     return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
                 except Exception:
-                    from vnibb.providers.vnstock.runtime import get_vnstock_class
+                    from vnibb.providers.vnstock.runtime import get_stock_client
 
-                    Vnstock = get_vnstock_class()
-                    stock = Vnstock().stock(symbol=symbol.upper(), source=source.upper())
+                    stock = get_stock_client(symbol.upper(), source.upper())
                     df = stock.quote.price_depth()
                     return df.to_dict(orient="records") if df is not None and len(df) > 0 else []
 
-            loop = asyncio.get_event_loop()
-            records = await loop.run_in_executor(None, _fetch)
+            records = await run_vnstock_call("price_depth", _fetch, key=(symbol.upper(), source))
 
             if not records:
                 return PriceDepthData(symbol=symbol.upper())
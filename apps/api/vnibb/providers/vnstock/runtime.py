@@ -1,12 +1,40 @@
-"""Runtime helpers for preferring VNStock sponsor packages."""
+"""Runtime helpers for VNStock calls.
+
+Prefers the sponsor ``vnstock_data`` package and runs the (blocking) vnstock
+client calls on a dedicated, sized thread pool instead of the loop's default
+executor, so a burst of slow provider calls cannot starve ``asyncio.to_thread``
+users elsewhere in the API.
+
+:class:`VnstockRuntime` also
+
+- reuses ``Vnstock().stock(symbol, source)`` clients through a bounded LRU;
+- coalesces identical in-flight calls (same fetcher name and query key) onto
+  one executor job;
+- records per-fetcher latency, error/timeout counts and queue depth.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
-from typing import Any
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from vnibb.core.config import settings
+from vnibb.core.instrumentation import span
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+STOCK_CLIENT_CACHE_SIZE = 512
+LATENCY_SAMPLE_SIZE = 256
+
 
 def import_vnstock_symbol(name: str) -> tuple[Any, str]:
     """Return a vnstock symbol, preferring sponsor `vnstock_data`."""
@@ -40,3 +68,244 @@ def get_trading_class():
 
 def get_quote_class():
     return import_vnstock_symbol("Quote")[0]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn a query payload into a hashable coalescing key."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _percentile(samples: list[float], fraction: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _CallStats:
+    """Per-fetcher counters, updated from both the loop and worker threads."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "timeouts",
+        "coalesced",
+        "in_flight",
+        "queued",
+        "total_seconds",
+        "max_seconds",
+        "samples",
+        "_lock",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.coalesced = 0
+        self.in_flight = 0
+        self.queued = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.samples: deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._lock = threading.Lock()
+
+    def add(self, field: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def finish(self, seconds: float, *, failed: bool = False) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self.samples.append(seconds)
+            if failed:
+                self.errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            calls = self.calls
+            total_seconds = self.total_seconds
+            max_seconds = self.max_seconds
+            samples = list(self.samples)
+            counters = {
+                "calls": calls,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "coalesced": self.coalesced,
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+            }
+        p50 = _percentile(samples, 0.5)
+        p95 = _percentile(samples, 0.95)
+        return {
+            **counters,
+            "avg_ms": round(total_seconds / calls * 1000, 1) if calls else None,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "max_ms": round(max_seconds * 1000, 1) if calls else None,
+        }
+
+
+class VnstockRuntime:
+    """Dedicated executor, client cache and call coalescing for vnstock."""
+
+    def __init__(self, max_workers: int | None = None):
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._clients: OrderedDict[tuple, Any] = OrderedDict()
+        self._clients_lock = threading.Lock()
+        self._in_flight: dict[tuple, tuple[asyncio.Future, list[int]]] = {}
+        self._stats: dict[str, _CallStats] = {}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return max(1, int(self._max_workers or settings.vnstock_executor_workers))
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="vnstock",
+                    )
+        return self._executor
+
+    def stock_client(self, symbol: str, source: str) -> Any:
+        """Return a reusable ``Vnstock().stock(symbol=..., source=...)`` client."""
+        vnstock_class = get_vnstock_class()
+        key = (vnstock_class, symbol, source)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+        client = vnstock_class().stock(symbol=symbol, source=source)
+        with self._clients_lock:
+            self._clients[key] = client
+            self._clients.move_to_end(key)
+            while len(self._clients) > STOCK_CLIENT_CACHE_SIZE:
+                self._clients.popitem(last=False)
+        return client
+
+    def _stats_for(self, name: str) -> _CallStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            with self._stats_lock:
+                stats = self._stats.setdefault(name, _CallStats())
+        return stats
+
+    def _submit(self, name: str, fn: Callable[[], T]) -> asyncio.Future:
+        stats = self._stats_for(name)
+        stats.add("queued")
+        stats.add("in_flight")
+        started_at = time.perf_counter()
+
+        def _run() -> T:
+            stats.add("queued", -1)
+            return fn()
+
+        future = asyncio.get_running_loop().run_in_executor(self.executor, _run)
+
+        def _done(completed: asyncio.Future) -> None:
+            failed = not completed.cancelled() and completed.exception() is not None
+            stats.finish(time.perf_counter() - started_at, failed=failed)
+
+        future.add_done_callback(_done)
+        return future
+
+    async def call(
+        self,
+        name: str,
+        fn: Callable[[], T],
+        *,
+        key: Any = None,
+        timeout: float | None = None,
+    ) -> T:
+        """Run ``fn`` on the provider pool.
+
+        Calls with the same ``name`` and non-None ``key`` that overlap share a
+        single executor job; once a call has been shared every caller receives
+        its own deep copy of the result, so one caller mutating it cannot
+        affect another. A timeout abandons only the
+        waiting caller; the shared job keeps running for the others.
+        """
+        stats = self._stats_for(name)
+        coalesce_key = (name, _freeze(key)) if key is not None else None
+        entry = self._in_flight.get(coalesce_key) if coalesce_key is not None else None
+        if entry is not None and entry[0].get_loop() is not asyncio.get_running_loop():
+            entry = None
+        if entry is None:
+            future = self._submit(name, fn)
+            entry = (future, [0])
+            if coalesce_key is not None:
+                self._in_flight[coalesce_key] = entry
+                future.add_done_callback(
+                    lambda _completed, _key=coalesce_key: self._in_flight.pop(_key, None)
+                )
+        else:
+            entry[1][0] += 1
+            stats.add("coalesced")
+        future, joined = entry
+
+        try:
+            with span(f"provider.{name}"):
+                if timeout is None:
+                    result = await asyncio.shield(future)
+                else:
+                    result = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except TimeoutError:
+            stats.add("timeouts")
+            raise
+        return copy.deepcopy(result) if joined[0] else result
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "cached_clients": len(self._clients),
+            "in_flight_keys": len(self._in_flight),
+            "fetchers": {name: stats.snapshot() for name, stats in sorted(dict(self._stats).items())},
+        }
+
+    def clear_clients(self) -> None:
+        with self._clients_lock:
+            self._clients.clear()
+
+    def shutdown(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+vnstock_runtime = VnstockRuntime()
+
+
+async def run_vnstock_call(
+    name: str,
+    fn: Callable[[], T],
+    *,
+    key: Any = None,
+    timeout: float | None = None,
+) -> T:
+    """Run a blocking vnstock call on the shared provider runtime."""
+    return await vnstock_runtime.call(name, fn, key=key, timeout=timeout)
+
+
+def get_stock_client(symbol: str, source: str) -> Any:
+    return vnstock_runtime.stock_client(symbol, source)
@@ -5,7 +5,6 @@ Provides real-time price quotes for a single stock symbol.
 Optimized wrapper around Trading.price_board() for single-stock use case.
 """
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -13,6 +12,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -115,8 +115,7 @@ class VnstockStockPriceFetcher:
                     return None
                 return df.to_dict(orient="records")[0]
             
-            loop = asyncio.get_event_loop()
-            record = await loop.run_in_executor(None, _fetch)
+            record = await run_vnstock_call("stock_price", _fetch, key=(symbol.upper(), source))
             
             if not record:
                 # Return empty quote if no data
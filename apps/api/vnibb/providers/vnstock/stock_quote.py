@@ -6,7 +6,6 @@ vnstock.quote.history() with today's date to get the latest trading data.
 Extracts: price, change, change_pct, volume, high, low
 """
 
-import asyncio
 import logging
 from datetime import date, datetime, timedelta
 from typing import Optional
@@ -14,6 +13,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -148,13 +148,9 @@ class VnstockStockQuoteFetcher:
                 # Fetch last 3 days to ensure we get data even on weekends/holidays
                 start_date = today - timedelta(days=5)
                 
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(
-                    symbol=symbol,
-                    source=source.upper(),
-                )
+                stock = get_stock_client(symbol, source.upper())
                 
                 # Fetch historical data for recent days
                 df = stock.quote.history(
@@ -176,8 +172,7 @@ class VnstockStockQuoteFetcher:
                 
                 return latest, prev
             
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, _fetch)
+            result = await run_vnstock_call("stock_quote", _fetch, key=(symbol.upper(), source))
             
             if not result:
                 # Return empty quote if no data
@@ -8,7 +8,6 @@ FIXED: Handles MultiIndex DataFrame from price_board() and calculates
 price change from match_price and ref_price.
 """
 
-import asyncio
 import logging
 from typing import List, Optional, Literal, Tuple
 
@@ -16,13 +15,10 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError
-from concurrent.futures import ThreadPoolExecutor
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
-# Shared thread pool for parallel fetching across requests
-_executor = ThreadPoolExecutor(max_workers=10)
-
 
 def _build_source_candidates(preferred_source: str | None) -> list[str]:
     preferred = (preferred_source or "").strip().upper()
@@ -389,9 +385,10 @@ class VnstockTopMoversFetcher:
                     logger.error("Top movers upstream failed across all sources: %s", last_error)
                 return []
 
-            loop = asyncio.get_event_loop()
             # Add a 15 second timeout to the top movers fetch
-            records = await asyncio.wait_for(loop.run_in_executor(_executor, _fetch), timeout=15.0)
+            records = await run_vnstock_call(
+                "top_movers", _fetch, key=(type, index, limit), timeout=15.0
+            )
 
             if not records:
                 logger.warning(f"No records returned for top movers {type}/{index}")
@@ -578,10 +575,9 @@ class VnstockTopMoversFetcher:
                     )
                 return [], {}
 
-            loop = asyncio.get_event_loop()
             # Add a 20 second timeout to the sector top movers fetch
-            result_tuple = await asyncio.wait_for(
-                loop.run_in_executor(_executor, _fetch), timeout=20.0
+            result_tuple = await run_vnstock_call(
+                "sector_top_movers", _fetch, key=(type, limit_per_sector, source), timeout=20.0
             )
             records, industry_map = result_tuple
 
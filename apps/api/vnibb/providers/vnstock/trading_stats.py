@@ -5,7 +5,6 @@ Provides trading statistics for a company.
 Uses vnstock company.trading_stats() method (VCI only).
 """
 
-import asyncio
 import logging
 from typing import Optional
 
@@ -13,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from vnibb.core.config import settings
 from vnibb.core.exceptions import ProviderError
+from vnibb.providers.vnstock.runtime import run_vnstock_call
 
 
 logger = logging.getLogger(__name__)
@@ -79,12 +79,11 @@ class VnstockTradingStatsFetcher:
         """
         try:
             def _fetch():
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
+                from vnibb.providers.vnstock.runtime import get_stock_client
 
-                Vnstock = get_vnstock_class()
                 # trading_stats is primarily a VCI source feature
                 # we try settings source first, then fallback to VCI if needed
-                stock = Vnstock().stock(symbol=symbol.upper(), source=settings.vnstock_source)
+                stock = get_stock_client(symbol.upper(), settings.vnstock_source)
 
 
                 df = stock.company.trading_stats()
@@ -92,8 +91,7 @@ class VnstockTradingStatsFetcher:
                     return {}
                 return df.to_dict(orient="records")[0] if len(df) > 0 else {}
             
-            loop = asyncio.get_event_loop()
-            record = await loop.run_in_executor(None, _fetch)
+            record = await run_vnstock_call("trading_stats", _fetch, key=symbol.upper())
             
             return TradingStatsData(
                 symbol=symbol.upper(),
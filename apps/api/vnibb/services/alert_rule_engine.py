@@ -0,0 +1,514 @@
+"""
+Streaming alert rule engine.
+
+User :class:`~vnibb.models.alerts.AlertRule` rows are compiled into one
+:class:`SymbolRuleTable` per symbol. Each table keeps, per metric and
+crossing direction, the rule thresholds in a sorted list. A tick updates the
+symbol's metrics (price, % move vs previous close, session volume / 20-session
+ADV, foreign net value, RSI(14) with the tick as today's close), and the rules
+whose threshold lies between the previous and the current metric value are
+found by bisection. Evaluation therefore touches only the rules of the ticked
+symbol, never the whole rule set.
+
+Rules are edge-triggered: a rule fires when its metric *crosses* the threshold
+between two consecutive ticks, then stays quiet for ``cooldown_seconds``.
+Matches are pushed straight from the tick path to the WebSocket connections
+authenticated as the rule's owner only; persisting them as private
+``insider_alerts`` rows (``owner_id`` set) happens afterwards in a background
+task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from itertools import pairwise
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import and_, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vnibb.core.config import settings
+from vnibb.core.database import async_session_maker
+from vnibb.models.alerts import (
+    AlertRule,
+    AlertRuleDirection,
+    AlertRuleType,
+    AlertSeverity,
+    AlertType,
+    InsiderAlert,
+)
+from vnibb.models.stock import StockPrice
+from vnibb.services.websocket_service import manager
+
+logger = logging.getLogger(__name__)
+
+ALERT_RULE_REFRESH_SECONDS = 60
+RSI_PERIOD = 14
+ADV_SESSIONS = 20
+# Calendar days of daily bars loaded to seed previous close, ADV and RSI.
+SEED_LOOKBACK_DAYS = 60
+
+
+@dataclass(frozen=True, slots=True)
+class Tick:
+    """One realtime price/flow update for a symbol."""
+
+    symbol: str
+    price: float
+    volume: int | None = None  # accumulated session volume
+    change_pct: float | None = None
+    foreign_net_value: float | None = None
+    timestamp: datetime | None = None
+
+
+@dataclass(slots=True)
+class SymbolSeed:
+    """Daily-bar context a symbol's intraday metrics are computed against."""
+
+    previous_close: float | None = None
+    adv_20d: float | None = None
+    # Gain/loss sums over the last RSI_PERIOD - 1 daily deltas; the tick
+    # supplies the final delta (same simple-average RSI as get_rsi).
+    rsi_gain_sum: float | None = None
+    rsi_loss_sum: float | None = None
+
+
+@dataclass(slots=True)
+class CompiledRule:
+    id: int
+    user_id: str
+    symbol: str
+    rule_type: AlertRuleType
+    direction: AlertRuleDirection
+    threshold: float
+    cooldown_seconds: int = 300
+    note: str | None = None
+    last_triggered_at: datetime | None = None
+
+    @classmethod
+    def from_model(cls, rule: AlertRule) -> CompiledRule:
+        return cls(
+            id=rule.id,
+            user_id=rule.user_id,
+            symbol=rule.symbol.upper(),
+            rule_type=AlertRuleType(rule.rule_type),
+            direction=AlertRuleDirection(rule.direction),
+            threshold=float(rule.threshold),
+            cooldown_seconds=int(rule.cooldown_seconds or 0),
+            note=rule.note,
+            last_triggered_at=rule.last_triggered_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RuleMatch:
+    rule: CompiledRule
+    value: float
+    previous: float
+    triggered_at: datetime
+
+
+class _ThresholdIndex:
+    """Rules on one metric and direction, sorted by threshold."""
+
+    __slots__ = ("thresholds", "rules")
+
+    def __init__(self) -> None:
+        self.thresholds: list[float] = []
+        self.rules: list[CompiledRule] = []
+
+    def add(self, rule: CompiledRule) -> None:
+        position = bisect.bisect_right(self.thresholds, rule.threshold)
+        self.thresholds.insert(position, rule.threshold)
+        self.rules.insert(position, rule)
+
+    def remove(self, rule_id: int) -> bool:
+        for position, rule in enumerate(self.rules):
+            if rule.id == rule_id:
+                del self.thresholds[position]
+                del self.rules[position]
+                return True
+        return False
+
+    def crossed(self, previous: float, value: float) -> list[CompiledRule]:
+        """Rules with a threshold in (previous, value] rising or [value, previous) falling."""
+        if value > previous:
+            low = bisect.bisect_right(self.thresholds, previous)
+            high = bisect.bisect_right(self.thresholds, value)
+        else:
+            low = bisect.bisect_left(self.thresholds, value)
+            high = bisect.bisect_left(self.thresholds, previous)
+        return self.rules[low:high]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+def _metric_price(tick: Tick, seed: SymbolSeed) -> float | None:
+    return tick.price if tick.price > 0 else None
+
+
+def _metric_pct_move(tick: Tick, seed: SymbolSeed) -> float | None:
+    if seed.previous_close and tick.price > 0:
+        return (tick.price / seed.previous_close - 1.0) * 100.0
+    return tick.change_pct
+
+
+def _metric_volume_spike(tick: Tick, seed: SymbolSeed) -> float | None:
+    if tick.volume is None or not seed.adv_20d:
+        return None
+    return tick.volume / seed.adv_20d
+
+
+def _metric_foreign_net_flow(tick: Tick, seed: SymbolSeed) -> float | None:
+    return tick.foreign_net_value
+
+
+def _metric_rsi(tick: Tick, seed: SymbolSeed) -> float | None:
+    if seed.rsi_gain_sum is None or seed.rsi_loss_sum is None or not seed.previous_close:
+        return None
+    delta = tick.price - seed.previous_close
+    loss = (seed.rsi_loss_sum + max(-delta, 0.0)) / RSI_PERIOD
+    if loss == 0:
+        return None
+    gain = (seed.rsi_gain_sum + max(delta, 0.0)) / RSI_PERIOD
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+METRICS: dict[AlertRuleType, Callable[[Tick, SymbolSeed], float | None]] = {
+    AlertRuleType.PRICE: _metric_price,
+    AlertRuleType.PCT_MOVE: _metric_pct_move,
+    AlertRuleType.VOLUME_SPIKE: _metric_volume_spike,
+    AlertRuleType.FOREIGN_NET_FLOW: _metric_foreign_net_flow,
+    AlertRuleType.RSI: _metric_rsi,
+}
+
+
+@dataclass(slots=True)
+class SymbolRuleTable:
+    """Predicate table for one symbol: sorted thresholds per metric/direction."""
+
+    seed: SymbolSeed = field(default_factory=SymbolSeed)
+    indexes: dict[tuple[AlertRuleType, AlertRuleDirection], _ThresholdIndex] = field(
+        default_factory=dict
+    )
+    last_values: dict[AlertRuleType, float] = field(default_factory=dict)
+
+    def add(self, rule: CompiledRule) -> None:
+        key = (rule.rule_type, rule.direction)
+        self.indexes.setdefault(key, _ThresholdIndex()).add(rule)
+
+    def remove(self, rule: CompiledRule) -> None:
+        key = (rule.rule_type, rule.direction)
+        index = self.indexes.get(key)
+        if index is not None and index.remove(rule.id) and not index:
+            del self.indexes[key]
+
+    def evaluate(self, tick: Tick, now: datetime) -> list[RuleMatch]:
+        matches: list[RuleMatch] = []
+        for rule_type in {rule_type for rule_type, _ in self.indexes}:
+            value = METRICS[rule_type](tick, self.seed)
+            if value is None:
+                continue
+            previous = self.last_values.get(rule_type)
+            self.last_values[rule_type] = value
+            if previous is None or previous == value:
+                continue
+            direction = (
+                AlertRuleDirection.ABOVE if value > previous else AlertRuleDirection.BELOW
+            )
+            index = self.indexes.get((rule_type, direction))
+            if index is None:
+                continue
+            for rule in index.crossed(previous, value):
+                last = rule.last_triggered_at
+                if last is not None and now - last < timedelta(seconds=rule.cooldown_seconds):
+                    continue
+                rule.last_triggered_at = now
+                matches.append(
+                    RuleMatch(rule=rule, value=value, previous=previous, triggered_at=now)
+                )
+        return matches
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self.indexes.values())
+
+
+def seed_from_bars(closes: list[float], volumes: list[float]) -> SymbolSeed:
+    """Build a symbol seed from daily closes/volumes before today (oldest first)."""
+    seed = SymbolSeed()
+    if closes:
+        seed.previous_close = float(closes[-1])
+    recent_volumes = [float(volume) for volume in volumes[-ADV_SESSIONS:] if volume is not None]
+    if recent_volumes:
+        seed.adv_20d = sum(recent_volumes) / len(recent_volumes)
+    if len(closes) >= RSI_PERIOD:
+        window = closes[-RSI_PERIOD:]
+        deltas = [after - before for before, after in pairwise(window)]
+        seed.rsi_gain_sum = sum(delta for delta in deltas if delta > 0)
+        seed.rsi_loss_sum = -sum(delta for delta in deltas if delta < 0)
+    return seed
+
+
+def _market_date() -> date:
+    try:
+        timezone = ZoneInfo(settings.intraday_market_tz)
+    except Exception:
+        timezone = ZoneInfo("Asia/Ho_Chi_Minh")
+    return datetime.now(timezone).date()
+
+
+async def load_symbol_seeds(
+    session: AsyncSession, symbols: Iterable[str], as_of: date | None = None
+) -> dict[str, SymbolSeed]:
+    """Seed previous close, ADV and RSI state from daily bars before ``as_of``."""
+    symbols = sorted({symbol.upper() for symbol in symbols})
+    if not symbols:
+        return {}
+    as_of = as_of or _market_date()
+    result = await session.execute(
+        select(StockPrice.symbol, StockPrice.close, StockPrice.volume)
+        .where(
+            and_(
+                StockPrice.symbol.in_(symbols),
+                StockPrice.interval == "1D",
+                StockPrice.time < as_of,
+                StockPrice.time >= as_of - timedelta(days=SEED_LOOKBACK_DAYS),
+            )
+        )
+        .order_by(StockPrice.symbol, StockPrice.time)
+    )
+    closes: dict[str, list[float]] = {}
+    volumes: dict[str, list[float]] = {}
+    for symbol, close, volume in result.all():
+        closes.setdefault(symbol, []).append(float(close))
+        volumes.setdefault(symbol, []).append(volume)
+    return {symbol: seed_from_bars(closes[symbol], volumes[symbol]) for symbol in closes}
+
+
+class AlertRuleEngine:
+    """Per-symbol indexed alert rules evaluated incrementally on ticks."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] = async_session_maker,
+        refresh_seconds: float = ALERT_RULE_REFRESH_SECONDS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._refresh_seconds = refresh_seconds
+        self._tables: dict[str, SymbolRuleTable] = {}
+        self._rules: dict[int, CompiledRule] = {}
+        self._loaded_at: float | None = None
+        self._load_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self._background: set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------------
+    # Rule tables
+    # ------------------------------------------------------------------
+
+    def load(
+        self, rules: Iterable[CompiledRule], seeds: dict[str, SymbolSeed] | None = None
+    ) -> None:
+        """Replace the rule set, keeping per-symbol tick state and cooldowns."""
+        seeds = seeds or {}
+        tables: dict[str, SymbolRuleTable] = {}
+        compiled: dict[int, CompiledRule] = {}
+        for rule in rules:
+            known = self._rules.get(rule.id)
+            if known and known.last_triggered_at and (
+                rule.last_triggered_at is None or known.last_triggered_at > rule.last_triggered_at
+            ):
+                rule.last_triggered_at = known.last_triggered_at
+            table = tables.get(rule.symbol)
+            if table is None:
+                previous = self._tables.get(rule.symbol)
+                table = SymbolRuleTable(
+                    seed=seeds.get(rule.symbol) or (previous.seed if previous else SymbolSeed()),
+                    last_values=dict(previous.last_values) if previous else {},
+                )
+                tables[rule.symbol] = table
+            table.add(rule)
+            compiled[rule.id] = rule
+        self._tables = tables
+        self._rules = compiled
+        self._loaded_at = time.monotonic()
+
+    def add_rule(self, rule: CompiledRule, seed: SymbolSeed | None = None) -> None:
+        self.remove_rule(rule.id)
+        table = self._tables.setdefault(rule.symbol, SymbolRuleTable())
+        if seed is not None:
+            table.seed = seed
+        table.add(rule)
+        self._rules[rule.id] = rule
+
+    def remove_rule(self, rule_id: int) -> bool:
+        rule = self._rules.pop(rule_id, None)
+        if rule is None:
+            return False
+        table = self._tables.get(rule.symbol)
+        if table is not None:
+            table.remove(rule)
+            if not table:
+                del self._tables[rule.symbol]
+        return True
+
+    def watched_symbols(self) -> set[str]:
+        return set(self._tables)
+
+    def has_seed(self, symbol: str) -> bool:
+        table = self._tables.get(symbol.upper())
+        return table is not None and table.seed.previous_close is not None
+
+    def rule_count(self) -> int:
+        return len(self._rules)
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate(self, tick: Tick) -> list[RuleMatch]:
+        """Update the symbol's metrics and return the rules the tick fired."""
+        table = self._tables.get(tick.symbol.upper())
+        if table is None:
+            return []
+        return table.evaluate(tick, tick.timestamp or datetime.utcnow())
+
+    async def process_tick(self, tick: Tick) -> list[RuleMatch]:
+        """Evaluate a tick, push matches to their owners and persist them in the background."""
+        await self.ensure_loaded()
+        matches = self.evaluate(tick)
+        if not matches:
+            return matches
+
+        payloads = [alert_payload(match) for match in matches]
+        for payload in payloads:
+            await manager.send_user_alert(payload["user_id"], payload)
+        self._spawn(self._persist(matches, payloads))
+        return matches
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _persist(self, matches: list[RuleMatch], payloads: list[dict[str, Any]]) -> None:
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    insert(InsiderAlert),
+                    [
+                        {
+                            "alert_type": AlertType.RULE_TRIGGER,
+                            "severity": AlertSeverity.MEDIUM,
+                            "symbol": payload["symbol"],
+                            "title": payload["title"],
+                            "description": payload["description"],
+                            "owner_id": payload["user_id"],
+                            "read": False,
+                            "timestamp": match.triggered_at,
+                            "created_at": datetime.utcnow(),
+                        }
+                        for match, payload in zip(matches, payloads, strict=True)
+                    ],
+                )
+                await session.execute(
+                    update(AlertRule)
+                    .where(AlertRule.id.in_([match.rule.id for match in matches]))
+                    .values(last_triggered_at=matches[0].triggered_at)
+                )
+                await session.commit()
+        except Exception as exc:
+            logger.warning("Persisting %d alert rule matches failed: %s", len(matches), exc)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def ensure_loaded(self) -> None:
+        """Load rules on first use; refresh stale tables without blocking ticks."""
+        if self._loaded_at is None:
+            async with self._load_lock:
+                if self._loaded_at is None:
+                    await self.refresh()
+            return
+        if time.monotonic() - self._loaded_at < self._refresh_seconds:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh())
+
+    async def refresh(self) -> int:
+        """Reload enabled rules (and seeds for their symbols) from the database."""
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    select(AlertRule).where(AlertRule.enabled.is_(True))
+                )
+                rules = [CompiledRule.from_model(rule) for rule in result.scalars().all()]
+                seeds = await load_symbol_seeds(session, {rule.symbol for rule in rules})
+        except Exception as exc:
+            logger.warning("Alert rule refresh failed: %s", exc)
+            self._loaded_at = time.monotonic()
+            return self.rule_count()
+        self.load(rules, seeds)
+        return len(rules)
+
+
+def alert_payload(match: RuleMatch) -> dict[str, Any]:
+    """WebSocket payload for a rule match."""
+    rule = match.rule
+    labels = {
+        AlertRuleType.PRICE: ("Price", "{:,.0f}"),
+        AlertRuleType.PCT_MOVE: ("Move", "{:+.2f}%"),
+        AlertRuleType.VOLUME_SPIKE: ("Volume", "{:.2f}x ADV"),
+        AlertRuleType.FOREIGN_NET_FLOW: ("Foreign net flow", "{:,.0f} VND"),
+        AlertRuleType.RSI: ("RSI(14)", "{:.1f}"),
+    }
+    label, value_format = labels[rule.rule_type]
+    title = f"{rule.symbol}: {label} crossed {rule.direction.value} " + value_format.format(
+        rule.threshold
+    )
+    description = f"{label} moved from {value_format.format(match.previous)} to " + (
+        value_format.format(match.value)
+    )
+    if rule.note:
+        description += f" - {rule.note}"
+    return {
+        "type": "rule_alert",
+        "alert_type": AlertType.RULE_TRIGGER.value,
+        "severity": AlertSeverity.MEDIUM.value,
+        "rule_id": rule.id,
+        "user_id": rule.user_id,
+        "symbol": rule.symbol,
+        "rule_type": rule.rule_type.value,
+        "direction": rule.direction.value,
+        "threshold": rule.threshold,
+        "value": match.value,
+        "title": title,
+        "description": description,
+        "timestamp": match.triggered_at.isoformat(),
+    }
+
+
+alert_rule_engine = AlertRuleEngine()
+
+
+__all__ = [
+    "AlertRuleEngine",
+    "CompiledRule",
+    "RuleMatch",
+    "SymbolRuleTable",
+    "SymbolSeed",
+    "Tick",
+    "alert_payload",
+    "alert_rule_engine",
+    "load_symbol_seeds",
+    "seed_from_bars",
+]
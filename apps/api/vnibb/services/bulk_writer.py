@@ -0,0 +1,331 @@
+"""
+Bulk upsert writer for pipeline tables.
+
+`get_upsert_stmt` issues one ``INSERT ... ON CONFLICT`` round trip per row,
+which makes full seeding and backfills round-trip bound. `bulk_upsert`
+takes a whole batch of row dicts and writes them with as few statements as
+possible:
+
+- PostgreSQL + asyncpg: rows are streamed into a transaction-scoped temp
+  table with ``copy_records_to_table`` and merged with a single
+  ``INSERT ... SELECT ... ON CONFLICT DO UPDATE``.
+- Anything else (SQLite in tests, psycopg): one multi-row
+  ``INSERT ... ON CONFLICT DO UPDATE`` per batch.
+
+Both paths keep `get_upsert_stmt` semantics: every non-key, non-primary-key
+column is overwritten from the incoming row, and Python-side column
+defaults are applied to columns the caller did not provide. Duplicate
+(non-NULL) keys inside one call are collapsed (last row wins) so the merge
+never touches the same target row twice.
+
+The writer runs inside the caller's session/transaction; callers still own
+``commit()``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import JSON, Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+BULK_MAX_ROWS = 5_000
+BULK_MAX_BYTES = 4 * 1024 * 1024
+# SQLite caps bound parameters per statement (32766 on modern builds).
+SQLITE_MAX_PARAMS = 32_000
+
+
+def _estimate_value_bytes(value: Any) -> int:
+    if value is None:
+        return 1
+    if isinstance(value, (str, bytes)):
+        return len(value) + 4
+    if isinstance(value, dict):
+        return sum(len(str(k)) + _estimate_value_bytes(v) for k, v in value.items()) + 2
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_value_bytes(v) for v in value) + 2
+    return 8
+
+
+def iter_batches(
+    rows: Sequence[dict[str, Any]],
+    *,
+    max_rows: int = BULK_MAX_ROWS,
+    max_bytes: int = BULK_MAX_BYTES,
+) -> Iterator[list[dict[str, Any]]]:
+    """Split rows into batches bounded by row count and estimated payload bytes."""
+    batch: list[dict[str, Any]] = []
+    batch_bytes = 0
+    for row in rows:
+        row_bytes = sum(_estimate_value_bytes(value) for value in row.values())
+        if batch and (len(batch) >= max_rows or batch_bytes + row_bytes > max_bytes):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(row)
+        batch_bytes += row_bytes
+    if batch:
+        yield batch
+
+
+def _column_default(column: Any) -> Any:
+    default = column.default
+    if default is None:
+        return None
+    if getattr(default, "is_scalar", False):
+        return default.arg
+    if getattr(default, "is_callable", False):
+        return default.arg(None)
+    return None
+
+
+def _prepare_rows(
+    table: Table,
+    index_elements: Sequence[str],
+    rows: Iterable[dict[str, Any]],
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """Normalize rows to one column set, apply defaults, and dedupe by key."""
+    materialized = [row for row in rows if row]
+    if not materialized:
+        return [], []
+
+    provided: set[str] = set()
+    for row in materialized:
+        provided.update(row.keys())
+
+    unknown = provided - set(table.c.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {sorted(unknown)}")
+
+    defaults = {
+        column.name: column
+        for column in table.columns
+        if column.name not in provided and not column.primary_key and column.default is not None
+    }
+    columns = [
+        column.name
+        for column in table.columns
+        if column.name in provided or column.name in defaults
+    ]
+
+    deduped: dict[tuple, dict[str, Any]] = {}
+    for row in materialized:
+        normalized = {}
+        for name in columns:
+            if name in row:
+                normalized[name] = row[name]
+            elif name in defaults:
+                normalized[name] = _column_default(defaults[name])
+            else:
+                normalized[name] = None
+        key = tuple(normalized.get(name) for name in index_elements)
+        if any(part is None for part in key):
+            # NULL keys never conflict, so every such row is inserted as-is.
+            key = (object(),)
+        deduped.pop(key, None)
+        deduped[key] = normalized
+    return columns, list(deduped.values())
+
+
+def _update_columns(table: Table, index_elements: Sequence[str]) -> list[str]:
+    return [
+        column.name
+        for column in table.columns
+        if column.name not in index_elements and not column.primary_key
+    ]
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def build_merge_sql(
+    table: Table,
+    temp_table: str,
+    columns: Sequence[str],
+    index_elements: Sequence[str],
+) -> str:
+    """SQL that merges a staged temp table into ``table`` with upsert semantics."""
+    column_list = ", ".join(_quote(name) for name in columns)
+    conflict = ", ".join(_quote(name) for name in index_elements)
+    updates = ", ".join(
+        f"{_quote(name)} = EXCLUDED.{_quote(name)}"
+        for name in _update_columns(table, index_elements)
+    )
+    action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+    return (
+        f"INSERT INTO {_quote(table.name)} ({column_list}) "
+        f"SELECT {column_list} FROM {_quote(temp_table)} "
+        f"ON CONFLICT ({conflict}) {action}"
+    )
+
+
+def _coerce_copy_value(value: Any, is_json: bool) -> Any:
+    if value is None:
+        return None
+    if is_json:
+        return json.dumps(value, default=str)
+    item = getattr(value, "item", None)
+    if callable(item) and type(value).__module__ == "numpy":
+        return item()
+    to_pydatetime = getattr(value, "to_pydatetime", None)
+    if callable(to_pydatetime):
+        return to_pydatetime()
+    return value
+
+
+async def _copy_merge(
+    session: AsyncSession,
+    table: Table,
+    columns: list[str],
+    index_elements: Sequence[str],
+    batches: Iterable[list[dict[str, Any]]],
+) -> int:
+    connection = await session.connection()
+    # The asyncpg adapter issues BEGIN lazily on the first statement; make sure
+    # the transaction is open so the ON COMMIT DROP staging table survives.
+    await connection.exec_driver_sql("SELECT 1")
+    raw_connection = await connection.get_raw_connection()
+    driver = raw_connection.driver_connection
+
+    temp_table = f"_bulk_{table.name}_{uuid4().hex[:8]}"
+    column_list = ", ".join(_quote(name) for name in columns)
+    json_flags = [isinstance(table.c[name].type, JSON) for name in columns]
+    merge_sql = build_merge_sql(table, temp_table, columns, index_elements)
+
+    await driver.execute(
+        f"CREATE TEMP TABLE {_quote(temp_table)} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {_quote(table.name)} WITH NO DATA"
+    )
+    written = 0
+    for batch in batches:
+        records = [
+            tuple(
+                _coerce_copy_value(row[name], is_json)
+                for name, is_json in zip(columns, json_flags, strict=True)
+            )
+            for row in batch
+        ]
+        await driver.copy_records_to_table(temp_table, records=records, columns=columns)
+        await driver.execute(merge_sql)
+        await driver.execute(f"TRUNCATE {_quote(temp_table)}")
+        written += len(records)
+    # On failure the aborted transaction discards the temp table itself.
+    await driver.execute(f"DROP TABLE {_quote(temp_table)}")
+    return written
+
+
+def _build_values_upsert(dialect_name: str, table: Table, index_elements: Sequence[str], rows):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+    stmt = dialect_insert(table).values(rows)
+    update_columns = _update_columns(table, index_elements)
+    if not update_columns:
+        return stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={name: stmt.excluded[name] for name in update_columns},
+    )
+
+
+async def bulk_upsert(
+    session: AsyncSession,
+    model: Any,
+    index_elements: Sequence[str],
+    rows: Iterable[dict[str, Any]],
+    *,
+    max_rows: int = BULK_MAX_ROWS,
+    max_bytes: int = BULK_MAX_BYTES,
+) -> int:
+    """
+    Upsert many rows into ``model``'s table within the caller's transaction.
+
+    Args:
+        session: Active async session; the caller commits.
+        model: ORM model (or Table) to write.
+        index_elements: Conflict target columns (unique constraint).
+        rows: Row dicts keyed by column name.
+        max_rows: Maximum rows per COPY/INSERT batch.
+        max_bytes: Approximate maximum payload bytes per batch.
+
+    Returns:
+        Number of distinct rows written.
+    """
+    table: Table = getattr(model, "__table__", model)
+    columns, prepared = _prepare_rows(table, index_elements, rows)
+    if not prepared:
+        return 0
+
+    dialect = session.get_bind().dialect
+    if dialect.name == "postgresql" and dialect.driver == "asyncpg":
+        batches = iter_batches(prepared, max_rows=max_rows, max_bytes=max_bytes)
+        written = await _copy_merge(session, table, columns, index_elements, batches)
+    else:
+        if dialect.name == "sqlite":
+            max_rows = max(1, min(max_rows, SQLITE_MAX_PARAMS // max(len(columns), 1)))
+        written = 0
+        for batch in iter_batches(prepared, max_rows=max_rows, max_bytes=max_bytes):
+            await session.execute(_build_values_upsert(dialect.name, table, index_elements, batch))
+            written += len(batch)
+
+    logger.debug("Bulk upserted %d rows into %s", written, table.name)
+    return written
+
+
+async def bulk_upsert_isolating_failures(
+    session: AsyncSession,
+    model: Any,
+    index_elements: Sequence[str],
+    rows: Iterable[dict[str, Any]],
+) -> tuple[int, list[tuple[dict[str, Any], Exception]]]:
+    """
+    ``bulk_upsert`` that degrades to one savepoint per row when the batch fails.
+
+    Callers that used to wrap each per-row upsert in ``try`` keep their
+    per-row accounting: a bad row fails only itself and is returned with its
+    error instead of aborting the batch.
+
+    Returns:
+        ``(rows_written, [(row, error), ...])``.
+    """
+    materialized = list(rows)
+    if not materialized:
+        return 0, []
+    try:
+        async with session.begin_nested():
+            return await bulk_upsert(session, model, index_elements, materialized), []
+    except Exception as exc:
+        logger.warning(
+            "Bulk upsert of %d rows failed (%s); retrying row by row",
+            len(materialized),
+            exc,
+        )
+
+    written = 0
+    failures: list[tuple[dict[str, Any], Exception]] = []
+    for row in materialized:
+        try:
+            async with session.begin_nested():
+                written += await bulk_upsert(session, model, index_elements, [row])
+        except Exception as exc:
+            failures.append((row, exc))
+    return written, failures
+
+
+__all__ = [
+    "BULK_MAX_BYTES",
+    "BULK_MAX_ROWS",
+    "build_merge_sql",
+    "bulk_upsert",
+    "bulk_upsert_isolating_failures",
+    "iter_batches",
+]
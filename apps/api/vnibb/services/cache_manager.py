@@ -11,16 +11,18 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Any, Generic, List, Optional, TypeVar
 
-from sqlalchemy import and_, select, func
+from sqlalchemy import and_, select
 
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vnibb.core.database import async_session_factory
 from vnibb.core.cache_constants import DB_CACHE_TTLS
+from vnibb.core.dataset_versions import DATASET_SCREENER, dataset_versions
 from vnibb.models.screener import ScreenerSnapshot
 from vnibb.models.company import Company
 from vnibb.models.stock import Stock
+from vnibb.services.screener_snapshot_store import ScreenerSnapshotRow, screener_snapshot_store
 
 logger = logging.getLogger(__name__)
 
@@ -93,9 +95,9 @@ class CacheManager:
         symbol: Optional[str] = None,
         source: Optional[str] = "VCI",
         allow_stale: bool = True,
-    ) -> CacheResult[List[ScreenerSnapshot]]:
+    ) -> CacheResult[List[ScreenerSnapshotRow]]:
         """
-        Get cached screener data from database.
+        Get cached screener data from the process-level snapshot frame.
 
         Args:
             symbol: Optional ticker symbol. If None, returns all symbols.
@@ -103,12 +105,12 @@ class CacheManager:
             allow_stale: If True, returns stale data when fresh cache is unavailable.
 
         Returns:
-            CacheResult containing list of ScreenerSnapshot records.
+            CacheResult containing read-only ScreenerSnapshotRow views that
+            expose the ScreenerSnapshot column attributes.
         """
-        session = await self._get_session()
-        own_session = self._db is None
-
         try:
+            frame = await screener_snapshot_store.get_frame(self._db)
+
             now = datetime.utcnow()
             today = date.today()
             fresh_threshold = now - timedelta(minutes=self.SCREENER_TTL_MINUTES)
@@ -121,52 +123,37 @@ class CacheManager:
             # timeout -> empty heatmap/breadth. We now treat `source` as a soft
             # preference: try source-specific first, then fall back to
             # source-agnostic so a label mismatch can't blank the universe.
-            async def _resolve(match_source: bool):
-                conditions = []
-                if match_source and source:
-                    conditions.append(ScreenerSnapshot.source == source)
-                if not allow_stale:
-                    conditions.append(ScreenerSnapshot.snapshot_date == today)
-                if symbol:
-                    conditions.append(ScreenerSnapshot.symbol == symbol.upper())
-
-                query = select(ScreenerSnapshot).where(and_(*conditions))
-
+            def _resolve(match_source: bool):
+                scope = source if match_source and source else None
+                target_date = today
                 if allow_stale:
-                    latest_date_query = select(func.max(ScreenerSnapshot.snapshot_date))
-                    if match_source and source:
-                        latest_date_query = latest_date_query.where(
-                            ScreenerSnapshot.source == source
-                        )
-                    latest_date_result = await session.execute(latest_date_query)
-                    latest_date = latest_date_result.scalar()
-
+                    latest_date = frame.latest_date(scope)
                     if latest_date is None:
-                        return None, None  # nothing for this source scope
+                        return None, ()  # nothing for this source scope
 
                     # QA-v4 Heatmap: cap stale snapshots at MAX_STALE_DAYS so an
                     # indefinitely-stuck screener cron doesn't keep poisoning every
                     # downstream caller forever. Older than that, treat as a miss.
                     if (today - latest_date).days > self.MAX_STALE_DAYS:
-                        return "stale", None
+                        return "stale", ()
 
-                    query = query.where(ScreenerSnapshot.snapshot_date == latest_date)
+                    target_date = latest_date
 
-                result = await session.execute(query)
-                return "ok", list(result.scalars().all())
+                positions = frame.positions(snapshot_date=target_date, source=scope, symbol=symbol)
+                return "ok", positions
 
-            status, snapshots = await _resolve(match_source=True)
-            if (not snapshots) and source:
+            status, positions = _resolve(match_source=True)
+            if (not positions) and source:
                 # Soft fallback: read latest snapshots regardless of source label.
-                fb_status, fb_snapshots = await _resolve(match_source=False)
-                if fb_snapshots:
+                fb_status, fb_positions = _resolve(match_source=False)
+                if fb_positions:
                     logger.info(
                         "Screener source '%s' matched no rows; using source-agnostic "
                         "snapshot fallback (%d records).",
                         source,
-                        len(fb_snapshots),
+                        len(fb_positions),
                     )
-                    status, snapshots = fb_status, fb_snapshots
+                    status, positions = fb_status, fb_positions
                 elif status != "stale":
                     status = fb_status
 
@@ -179,18 +166,19 @@ class CacheManager:
                 )
                 return CacheResult(data=None, is_stale=True, cached_at=None, hit=False)
 
-            if not snapshots:
+            if not positions:
                 logger.debug(f"Cache miss for screener data (symbol={symbol}, source={source})")
                 return CacheResult(data=None, is_stale=False, cached_at=None, hit=False)
 
             # Check if data is fresh
-            latest_created = max(s.created_at for s in snapshots)
+            latest_created = frame.max_created_at(positions) or datetime.min
             is_stale = latest_created < fresh_threshold
 
             if is_stale and not allow_stale:
                 logger.debug(f"Cache stale for screener data, age={now - latest_created}")
                 return CacheResult(data=None, is_stale=True, cached_at=latest_created, hit=False)
 
+            snapshots = frame.rows(positions)
             logger.info(
                 f"Cache hit for screener data: {len(snapshots)} records, "
                 f"stale={is_stale}, age={now - latest_created}"
@@ -205,9 +193,6 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Cache lookup error for screener: {e}")
             return CacheResult(data=None, is_stale=False, cached_at=None, hit=False)
-        finally:
-            if own_session:
-                await session.close()
 
     async def store_screener_data(
         self,
@@ -348,6 +333,8 @@ class CacheManager:
 
             await session.execute(stmt)
             await session.commit()
+            await screener_snapshot_store.refresh_after_write(session)
+            await dataset_versions.bump(DATASET_SCREENER)
 
             logger.info(f"Stored {len(prep_data)} screener records (source={source})")
             return len(prep_data)
@@ -764,6 +751,7 @@ class CacheManager:
 
             result = await session.execute(stmt)
             await session.commit()
+            screener_snapshot_store.invalidate()
 
             count = result.rowcount
             logger.info(f"Invalidated {count} screener cache records")
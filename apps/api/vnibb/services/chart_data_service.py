@@ -15,6 +15,7 @@ from sqlalchemy import select
 from vnibb.core.config import settings
 from vnibb.core.database import async_session_maker
 from vnibb.models.stock import StockPrice
+from vnibb.providers.vnstock.runtime import get_stock_client, run_vnstock_call
 
 logger = logging.getLogger(__name__)
 
@@ -120,14 +121,9 @@ async def fetch_chart_data(
     start_date = _compute_start_date(period)
     end_date = date.today()
 
-    loop = asyncio.get_event_loop()
-
     def _fetch_sync() -> List[Dict[str, Any]]:
         try:
-            from vnibb.providers.vnstock.runtime import get_vnstock_class
-
-            Vnstock = get_vnstock_class()
-            stock = Vnstock().stock(symbol=symbol, source=source)
+            stock = get_stock_client(symbol, source)
             df = stock.quote.history(
                 start=start_date.isoformat(),
                 end=end_date.isoformat(),
@@ -166,8 +162,10 @@ async def fetch_chart_data(
             raise
 
     try:
-        data = await asyncio.wait_for(
-            loop.run_in_executor(None, _fetch_sync),
+        data = await run_vnstock_call(
+            "chart_history",
+            _fetch_sync,
+            key=(symbol, source, start_date, end_date),
             timeout=getattr(settings, "vnstock_timeout", 30),
         )
 
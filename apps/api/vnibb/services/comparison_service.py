@@ -12,8 +12,10 @@ import asyncio
 import logging
 import re
 import unicodedata
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional
+
+import numpy as np
 from pydantic import BaseModel, Field
 from sqlalchemy import desc, select
 
@@ -25,9 +27,30 @@ from vnibb.models.screener import ScreenerSnapshot
 from vnibb.models.stock import Stock, StockPrice
 from vnibb.models.trading import FinancialRatio
 from vnibb.services.cache_manager import CacheManager
+from vnibb.services.price_panel import forward_fill, load_close_panel, rebase
 
 logger = logging.getLogger(__name__)
 
+# Sector baskets for the performance overlay stay well inside one panel query.
+MAX_PERFORMANCE_SYMBOLS = 40
+_PERFORMANCE_PERIOD_DAYS = {
+    "1M": 30,
+    "3M": 90,
+    "6M": 180,
+    "1Y": 365,
+    "3Y": 365 * 3,
+    "5Y": 365 * 5,
+    "10Y": 365 * 10,
+    "ALL": 365 * 5,
+}
+
+
+def _performance_window(period: str, today: Optional[date] = None) -> tuple[date, date]:
+    end_date = today or date.today()
+    if period == "YTD":
+        return date(end_date.year, 1, 1), end_date
+    return end_date - timedelta(days=_PERFORMANCE_PERIOD_DAYS.get(period, 365)), end_date
+
 
 def _record_value(record: Any, *keys: str) -> Any:
     for key in keys:
@@ -689,77 +712,36 @@ class ComparisonService:
     ) -> List[PricePerformancePoint]:
         """
         Compare historical price performance normalized to 100 at the start.
+
+        Reads one aligned close panel for all symbols (stored prices first,
+        provider only for gaps), forward-fills missing sessions and rebases
+        each symbol on its first close in the window.
         """
-        from vnibb.providers.vnstock.equity_historical import (
-            VnstockEquityHistoricalFetcher,
-            EquityHistoricalQueryParams,
+        start_date, end_date = _performance_window(period)
+        panel = await load_close_panel(
+            symbols[:MAX_PERFORMANCE_SYMBOLS], start_date, end_date, source=source
         )
-        from datetime import date, timedelta
-
-        end_date = date.today()
-        if period == "1M":
-            start_date = end_date - timedelta(days=30)
-        elif period == "3M":
-            start_date = end_date - timedelta(days=90)
-        elif period == "6M":
-            start_date = end_date - timedelta(days=180)
-        elif period == "3Y":
-            start_date = end_date - timedelta(days=365 * 3)
-        elif period == "5Y":
-            start_date = end_date - timedelta(days=365 * 5)
-        elif period == "YTD":
-            start_date = date(end_date.year, 1, 1)
-        elif period == "ALL":
-            start_date = end_date - timedelta(days=365 * 5)
-        else:
-            start_date = end_date - timedelta(days=365)
-
-        # Fetch historical data for all symbols
-        all_series = {}
-        for symbol in symbols:
-            try:
-                params = EquityHistoricalQueryParams(
-                    symbol=symbol,
-                    start_date=start_date,
-                    end_date=end_date,
-                    interval="1D",
-                    source=source,
-                )
-                data = await VnstockEquityHistoricalFetcher.fetch(params)
-                if data:
-                    all_series[symbol] = {d.time.strftime("%Y-%m-%d"): d.close for d in data}
-            except Exception as e:
-                logger.warning(f"Performance fetch failed for {symbol}: {e}")
-                continue
-
-        if not all_series:
+        if panel.is_empty:
             return []
 
-        # Get common dates and normalize
-        all_dates = sorted(set(d for series in all_series.values() for d in series.keys()))
-        if not all_dates:
-            return []
-
-        normalized_history = []
-        base_prices = {}
-
-        for dt_str in all_dates:
-            point_values = {}
-            for symbol, series in all_series.items():
-                if dt_str in series:
-                    current_price = series[dt_str]
-                    if symbol not in base_prices:
-                        base_prices[symbol] = current_price
-
-                    if base_prices[symbol] > 0:
-                        point_values[symbol] = (current_price / base_prices[symbol]) * 100
-                    else:
-                        point_values[symbol] = 100.0
-
-            if point_values:
-                normalized_history.append(PricePerformancePoint(date=dt_str, values=point_values))
-
-        return normalized_history
+        normalized = rebase(forward_fill(panel.closes))
+        observed = ~np.isnan(normalized)
+        date_labels = np.datetime_as_string(panel.dates, unit="D")
+        symbols_in_panel = panel.symbols
+
+        history: List[PricePerformancePoint] = []
+        for row_index in np.flatnonzero(observed.any(axis=1)):
+            row = normalized[row_index]
+            history.append(
+                PricePerformancePoint(
+                    date=str(date_labels[row_index]),
+                    values={
+                        symbols_in_panel[column]: float(row[column])
+                        for column in np.flatnonzero(observed[row_index])
+                    },
+                )
+            )
+        return history
 
     async def get_peers(
         self, symbol: str, limit: int = 5, source: str = settings.vnstock_source
@@ -1424,8 +1406,10 @@ async def get_multi_performance_data(
             resolved_period = "1Y"
         elif days <= 365 * 3:
             resolved_period = "3Y"
-        else:
+        elif days <= 365 * 5:
             resolved_period = "5Y"
+        else:
+            resolved_period = "10Y"
 
     results = await comparison_service.compare_price_performance(symbols, period=resolved_period)
     # Convert to a format easy for Recharts: [{date: '...', VNM: 100, FPT: 105}, ...]
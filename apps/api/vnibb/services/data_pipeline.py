@@ -24,6 +24,16 @@ from sqlalchemy.exc import IntegrityError
 from vnibb.core.database import async_session_maker, engine
 from vnibb.core.cache import redis_client, build_cache_key
 from vnibb.core.config import settings
+from vnibb.core.dataset_versions import (
+    DATASET_COMPANY,
+    DATASET_FINANCIALS,
+    DATASET_FOREIGN_TRADING,
+    DATASET_INDICES,
+    DATASET_LISTING,
+    DATASET_PRICES,
+    DATASET_SCREENER,
+    bumps_datasets,
+)
 from vnibb.core.vn_sectors import resolve_sector_name
 from vnibb.core.cache_constants import (
     PIPELINE_TTL_LISTING,
@@ -62,7 +72,23 @@ from vnibb.models.market_news import MarketNews
 from vnibb.models.screener import ScreenerSnapshot
 from vnibb.models.sync_status import SyncStatus
 from vnibb.core.retry import with_retry
+from vnibb.services.bulk_writer import bulk_upsert, bulk_upsert_isolating_failures
+from vnibb.services.price_gap_planner import PriceGapPlanner
 from vnibb.services.realtime_pipeline import is_vietnam_market_open
+from vnibb.services.screener_snapshot_store import screener_snapshot_store
+from vnibb.services.stage_dag import (
+    STAGE_COMPLETED,
+    STAGE_FAILED,
+    STAGE_RUNNING,
+    StageGraph,
+    StageSpec,
+    aggregate_stage_progress,
+    completed_stages,
+    init_stage_progress,
+    root_progress,
+    run_stage_graph,
+)
+from vnibb.providers.vnstock.runtime import get_stock_client, run_vnstock_call
 from vnibb.providers.vnstock.financial_ratios import (
     FinancialRatiosQueryParams,
     VnstockFinancialRatiosFetcher,
@@ -106,6 +132,38 @@ DAILY_TRADING_STAGES = [
     "warrants",
 ]
 
+# Stages in the same non-default pool (bulk history writers) do not overlap.
+BULK_STAGE_POOL = "bulk"
+FULL_SEEDING_GRAPH = StageGraph(
+    [
+        StageSpec("stock_list"),
+        StageSpec("screener", depends_on=("stock_list",)),
+        StageSpec("profiles", depends_on=("stock_list",)),
+        StageSpec("prices", depends_on=("stock_list",), pool=BULK_STAGE_POOL),
+        StageSpec("indices"),
+        StageSpec("financials", depends_on=("stock_list",), pool=BULK_STAGE_POOL),
+    ]
+)
+DAILY_TRADING_GRAPH = StageGraph(
+    [
+        StageSpec("foreign_trading"),
+        StageSpec("intraday_trades"),
+        StageSpec("orderbook_snapshots"),
+        StageSpec("block_trades", depends_on=("intraday_trades",)),
+        StageSpec("derivatives"),
+        StageSpec("warrants"),
+    ]
+)
+REINFORCEMENT_GRAPH = StageGraph(
+    [
+        StageSpec("prices", pool=BULK_STAGE_POOL),
+        StageSpec("financials", pool=BULK_STAGE_POOL),
+        StageSpec("ratios", depends_on=("financials",)),
+        StageSpec("shareholders"),
+        StageSpec("officers"),
+    ]
+)
+
 RATE_MODE_NORMAL = "normal"
 RATE_MODE_REINFORCEMENT = "reinforcement"
 RATE_MODE_CONTEXT: ContextVar[str] = ContextVar("vnibb_rate_mode", default=RATE_MODE_NORMAL)
@@ -161,11 +219,13 @@ class RateLimiter:
     async def wait(self):
         if self.delay <= 0:
             return
+        # Reserve the next slot before sleeping so concurrent stages sharing
+        # this limiter queue up behind each other instead of bursting.
         now = asyncio.get_event_loop().time()
-        time_since_last = now - self.last_request
-        if time_since_last < self.delay:
-            await asyncio.sleep(self.delay - time_since_last)
-        self.last_request = asyncio.get_event_loop().time()
+        slot = max(now, self.last_request + self.delay)
+        self.last_request = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 
 class DataPipeline:
@@ -205,6 +265,7 @@ class DataPipeline:
         self.rate_limiters = {
             key: RateLimiter(calls_per_minute=value) for key, value in base_limits.items()
         }
+        self._price_gap_planner = PriceGapPlanner()
         if settings.vnstock_api_key:
             os.environ["VNSTOCK_API_KEY"] = settings.vnstock_api_key
             logger.info("VNStock API key configured (registration handled at startup)")
@@ -323,8 +384,10 @@ class DataPipeline:
                 return history_callable(start=start, end=end, interval=interval)
 
             try:
-                df = await asyncio.wait_for(
-                    asyncio.to_thread(_fetch_sync),
+                df = await run_vnstock_call(
+                    "quote_history",
+                    _fetch_sync,
+                    key=(symbol, source, start, end, interval, bypass_internal_retry),
                     timeout=timeout_seconds,
                 )
                 # Defensive empty check: tests / mocks may return non-DataFrame
@@ -585,13 +648,64 @@ class DataPipeline:
         key: str = SYNC_PROGRESS_KEY,
         ttl: int = SYNC_PROGRESS_TTL,
     ) -> None:
-        await self._save_progress(progress, key=key, ttl=ttl)
+        # Stage slices persist the whole run document with rolled-up counters.
+        document = root_progress(progress)
+        await self._save_progress(document, key=key, ttl=ttl)
         await self._update_sync_record(
             sync_id,
-            success_count=progress.get("success_count", 0),
-            error_count=progress.get("error_count", 0),
-            additional_data=progress,
+            success_count=document.get("success_count", 0),
+            error_count=document.get("error_count", 0),
+            additional_data=document,
+        )
+
+    async def _run_stage_dag(
+        self,
+        graph: StageGraph,
+        runner,
+        progress: Dict[str, Any],
+        sync_id: int,
+        *,
+        legacy_order: List[str],
+        key: str = SYNC_PROGRESS_KEY,
+        ttl: int = SYNC_PROGRESS_TTL,
+    ) -> None:
+        """Run ``graph`` with per-stage progress slices and resumable checkpoints.
+
+        ``runner(stage, stage_progress)`` executes one stage; stages already
+        marked completed in ``progress`` are skipped on resume.
+        """
+        slices = init_stage_progress(progress, graph, legacy_order=legacy_order)
+        progress.setdefault("started_at", datetime.utcnow().isoformat())
+
+        async def on_stage_start(stage: str) -> None:
+            stage_progress = slices[stage]
+            stage_progress["status"] = STAGE_RUNNING
+            stage_progress.setdefault("started_at", datetime.utcnow().isoformat())
+            await self._checkpoint(stage_progress, sync_id, key=key, ttl=ttl)
+
+        async def on_stage_done(stage: str) -> None:
+            stage_progress = slices[stage]
+            stage_progress["status"] = STAGE_COMPLETED
+            stage_progress["finished_at"] = datetime.utcnow().isoformat()
+            await self._checkpoint(stage_progress, sync_id, key=key, ttl=ttl)
+
+        async def run_stage(stage: str) -> None:
+            try:
+                await runner(stage, slices[stage])
+            except Exception:
+                slices[stage]["status"] = STAGE_FAILED
+                raise
+
+        await run_stage_graph(
+            graph,
+            run_stage,
+            completed=completed_stages(progress),
+            max_parallel=settings.sync_max_parallel_stages,
+            pool_limits={BULK_STAGE_POOL: settings.sync_bulk_stage_concurrency},
+            on_stage_start=on_stage_start,
+            on_stage_done=on_stage_done,
         )
+        aggregate_stage_progress(progress)
 
     def _parse_time_value(self, value: Optional[str], default_value: str) -> time:
         raw = value or default_value
@@ -683,51 +797,6 @@ class DataPipeline:
             return ""
         return MARKET_INDEX_ALIASES.get(normalized, normalized.replace("-", ""))
 
-    def _iter_weekdays(self, start_date: date, end_date: date):
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:
-                yield current
-            current += timedelta(days=1)
-
-    def _build_missing_date_ranges(
-        self,
-        existing_dates: set[date],
-        start_date: date,
-        end_date: date,
-        max_range_days: int = 30,
-    ) -> List[Tuple[date, date]]:
-        if start_date > end_date:
-            return []
-
-        missing_dates = [
-            day for day in self._iter_weekdays(start_date, end_date) if day not in existing_dates
-        ]
-        if not missing_dates:
-            return []
-
-        ranges: List[Tuple[date, date]] = []
-        range_start = missing_dates[0]
-        range_end = missing_dates[0]
-
-        for day in missing_dates[1:]:
-            day_gap = (day - range_end).days
-            contiguous = True
-            for offset in range(1, day_gap):
-                if (range_end + timedelta(days=offset)).weekday() < 5:
-                    contiguous = False
-                    break
-            if contiguous and (day - range_start).days < max_range_days:
-                range_end = day
-                continue
-
-            ranges.append((range_start, range_end))
-            range_start = day
-            range_end = day
-
-        ranges.append((range_start, range_end))
-        return ranges
-
     async def _get_or_create_company_id(self, session: AsyncSession, symbol: str) -> Optional[int]:
         result = await session.execute(select(Company.id).where(Company.symbol == symbol))
         company_id = result.scalar_one_or_none()
@@ -861,6 +930,7 @@ class DataPipeline:
 
         await self._cache_set_json(cache_key, payload, ttl)
 
+    @bumps_datasets(DATASET_LISTING)
     @with_retry(max_retries=3)
     async def sync_stock_list(
         self,
@@ -930,7 +1000,7 @@ class DataPipeline:
                 start_index = symbols.index(last_symbol) + 1
 
         batch_size = 200
-        cache_batch: List[Dict[str, Any]] = []
+        pending_rows: List[Dict[str, Any]] = []
 
         if progress is not None:
             progress.setdefault("stage_stats", {})
@@ -941,8 +1011,35 @@ class DataPipeline:
                 {"success": 0, "errors": 0, "total": len(df)},
             )
 
+        async def flush_pending(session: AsyncSession) -> int:
+            nonlocal pending_rows
+            written, failures = await bulk_upsert_isolating_failures(
+                session, Stock, ["symbol"], pending_rows
+            )
+            await session.commit()
+            failed_symbols = {failed_row["symbol"] for failed_row, _ in failures}
+            for failed_row, exc in failures:
+                logger.debug(f"Failed to upsert {failed_row['symbol']}: {exc}")
+            if progress is not None:
+                progress["success_count"] = progress.get("success_count", 0) + written
+                progress["error_count"] = progress.get("error_count", 0) + len(failures)
+                progress["stage_stats"]["stock_list"]["success"] += written
+                progress["stage_stats"]["stock_list"]["errors"] += len(failures)
+            for values in pending_rows:
+                if values["symbol"] in failed_symbols:
+                    continue
+                item = {
+                    key: values[key]
+                    for key in ("symbol", "company_name", "exchange", "industry", "sector")
+                }
+                cache_key = build_cache_key("vnibb", "listing", "symbol", item["symbol"])
+                await self._cache_set_json(cache_key, item, CACHE_TTL_LISTING)
+            pending_rows = []
+            return written
+
         async with async_session_maker() as session:
             count = 0
+            synced = 0
             for idx in range(start_index, len(df)):
                 row = df.iloc[idx]
                 symbol = str(row.get("symbol", row.get("ticker", ""))).upper()
@@ -966,43 +1063,17 @@ class DataPipeline:
                     "is_active": 1,
                     "updated_at": datetime.utcnow(),
                 }
-                try:
-                    stmt = get_upsert_stmt(Stock, ["symbol"], values)
-                    await session.execute(stmt)
-                    count += 1
-                    cache_batch.append(
-                        {
-                            "symbol": symbol,
-                            "company_name": values["company_name"],
-                            "exchange": values["exchange"],
-                            "industry": values["industry"],
-                            "sector": values["sector"],
-                        }
-                    )
-                    if progress is not None:
-                        progress["success_count"] = progress.get("success_count", 0) + 1
-                        progress["stage_stats"]["stock_list"]["success"] += 1
-                except Exception as exc:
-                    logger.debug(f"Failed to upsert {symbol}: {exc}")
-                    if progress is not None:
-                        progress["error_count"] = progress.get("error_count", 0) + 1
-                        progress["stage_stats"]["stock_list"]["errors"] += 1
+                pending_rows.append(values)
+                count += 1
 
-                if count > 0 and count % batch_size == 0:
-                    await session.commit()
-                    for item in cache_batch:
-                        cache_key = build_cache_key("vnibb", "listing", "symbol", item["symbol"])
-                        await self._cache_set_json(cache_key, item, CACHE_TTL_LISTING)
-                    cache_batch = []
+                if count % batch_size == 0:
+                    synced += await flush_pending(session)
                     if progress is not None and sync_id is not None:
                         progress["last_symbol"] = symbol
                         progress["last_index"] = idx
                         await self._checkpoint(progress, sync_id)
 
-            await session.commit()
-            for item in cache_batch:
-                cache_key = build_cache_key("vnibb", "listing", "symbol", item["symbol"])
-                await self._cache_set_json(cache_key, item, CACHE_TTL_LISTING)
+            synced += await flush_pending(session)
 
             listing_cache = [
                 {
@@ -1034,9 +1105,10 @@ class DataPipeline:
                 progress["last_index"] = None
                 await self._checkpoint(progress, sync_id)
 
-            logger.info(f"Synced {count} stocks.")
-            return count
+            logger.info(f"Synced {synced} stocks.")
+            return synced
 
+    @bumps_datasets(DATASET_SCREENER)
     @with_retry(max_retries=3)
     async def sync_screener_data(
         self,
@@ -1047,13 +1119,11 @@ class DataPipeline:
         sync_id: Optional[int] = None,
     ) -> int:
         """Sync comprehensive metrics for stocks using vnstock finance.ratio."""
-        from vnibb.providers.vnstock.runtime import get_listing_class, get_vnstock_class
+        from vnibb.providers.vnstock.runtime import get_listing_class
 
         Listing = get_listing_class()
-        Vnstock = get_vnstock_class()
 
         logger.info("Syncing screener data...")
-        loop = asyncio.get_running_loop()
 
         def _normalize_text(value: Any) -> Optional[str]:
             if value is None:
@@ -1265,8 +1335,10 @@ class DataPipeline:
                 }
 
         primary_source = (settings.vnstock_source or "KBS").upper()
-        listing_metadata = await loop.run_in_executor(
-            None, _extract_listing_metadata, primary_source
+        listing_metadata = await run_vnstock_call(
+            "listing_metadata",
+            lambda: _extract_listing_metadata(primary_source),
+            key=primary_source,
         )
 
         start_index = 0
@@ -1281,6 +1353,7 @@ class DataPipeline:
         ratio_sources = [primary_source]
         batch_size = 20
         cache_batch: List[Dict[str, Any]] = []
+        pending_rows: List[Dict[str, Any]] = []
         today = date.today()
 
         previous_snapshot_fallback: Dict[str, Dict[str, Any]] = {}
@@ -1354,6 +1427,28 @@ class DataPipeline:
                 {"success": 0, "errors": 0, "total": len(deduped_symbols)},
             )
 
+        async def flush_pending(session: AsyncSession) -> None:
+            nonlocal pending_rows, cache_batch
+            _, failures = await bulk_upsert_isolating_failures(
+                session, ScreenerSnapshot, ["symbol", "snapshot_date"], pending_rows
+            )
+            await session.commit()
+            failed_symbols = {failed_row["symbol"] for failed_row, _ in failures}
+            for failed_row, exc in failures:
+                logger.debug(f"Failed to upsert screener row for {failed_row['symbol']}: {exc}")
+            if failures and progress is not None:
+                progress["success_count"] = progress.get("success_count", 0) - len(failures)
+                progress["error_count"] = progress.get("error_count", 0) + len(failures)
+                progress["stage_stats"]["screener"]["success"] -= len(failures)
+                progress["stage_stats"]["screener"]["errors"] += len(failures)
+            for item in cache_batch:
+                if item["symbol"] in failed_symbols:
+                    continue
+                cache_key = build_cache_key("vnibb", "screener", "latest", item["symbol"])
+                await self._cache_set_json(cache_key, item, CACHE_TTL_SCREENER)
+            pending_rows = []
+            cache_batch = []
+
         async with async_session_maker() as session:
             count = 0
             for idx in range(start_index, len(deduped_symbols)):
@@ -1365,7 +1460,7 @@ class DataPipeline:
                         try:
 
                             def _fetch_ratio_snapshot(sym: str, src: str):
-                                stock = Vnstock().stock(symbol=sym, source=src)
+                                stock = get_stock_client(sym, src)
                                 df = stock.finance.ratio(period="year")
                                 if df is None or df.empty:
                                     return None
@@ -1459,10 +1554,12 @@ class DataPipeline:
 
                                 return ratio_row
 
-                            ratio_df = await asyncio.wait_for(
-                                loop.run_in_executor(
-                                    None, _fetch_ratio_snapshot, symbol, ratio_source
+                            ratio_df = await run_vnstock_call(
+                                "ratio_snapshot",
+                                lambda sym=symbol, src=ratio_source: _fetch_ratio_snapshot(
+                                    sym, src
                                 ),
+                                key=(symbol, ratio_source),
                                 timeout=settings.vnstock_timeout,
                             )
                             if ratio_df:
@@ -1627,8 +1724,7 @@ class DataPipeline:
                         "source": "vnstock_ratio",
                         "created_at": datetime.utcnow(),
                     }
-                    stmt = get_upsert_stmt(ScreenerSnapshot, ["symbol", "snapshot_date"], values)
-                    await session.execute(stmt)
+                    pending_rows.append(values)
                     count += 1
 
                     previous_snapshot_fallback[symbol] = {
@@ -1673,20 +1769,13 @@ class DataPipeline:
                         progress["stage_stats"]["screener"]["errors"] += 1
 
                 if count % batch_size == 0:
-                    await session.commit()
-                    for item in cache_batch:
-                        cache_key = build_cache_key("vnibb", "screener", "latest", item["symbol"])
-                        await self._cache_set_json(cache_key, item, CACHE_TTL_SCREENER)
-                    cache_batch = []
+                    await flush_pending(session)
                     if progress is not None and sync_id is not None:
                         progress["last_symbol"] = symbol
                         progress["last_index"] = idx
                         await self._checkpoint(progress, sync_id)
 
-            await session.commit()
-            for item in cache_batch:
-                cache_key = build_cache_key("vnibb", "screener", "latest", item["symbol"])
-                await self._cache_set_json(cache_key, item, CACHE_TTL_SCREENER)
+            await flush_pending(session)
 
             backfilled_rows = 0
             pending_rows = (
@@ -1862,6 +1951,8 @@ class DataPipeline:
                 await session.commit()
                 logger.info("Back-filled %d screener rows from financial ratios", backfilled_rows)
 
+            await screener_snapshot_store.refresh_after_write(session)
+
             if progress is not None and sync_id is not None:
                 progress["last_symbol"] = None
                 progress["last_index"] = None
@@ -1870,6 +1961,7 @@ class DataPipeline:
             logger.info(f"Synced {count} screener snapshots via ratio summary")
             return count
 
+    @bumps_datasets(DATASET_PRICES)
     async def sync_daily_prices(
         self,
         symbols: List[str] = None,
@@ -1915,68 +2007,29 @@ class DataPipeline:
                 {"success": 0, "errors": 0, "total": len(symbols)},
             )
 
+        async with async_session_maker() as session:
+            fetch_plans = await self._price_gap_planner.plan(
+                session,
+                symbols[start_index:],
+                start=resolved_start,
+                end=resolved_end,
+                fill_missing_gaps=fill_missing_gaps,
+            )
+
         total_synced = 0
         for idx in range(start_index, len(symbols)):
             symbol = symbols[idx]
             active_range: Optional[Tuple[str, str]] = None
             try:
-                fetch_ranges: List[Tuple[date, date]] = [(resolved_start, resolved_end)]
-                existing_dates: set[date] = set()
-
-                async with async_session_maker() as session:
-                    stock_id_result = await session.execute(
-                        select(Stock.id).where(Stock.symbol == symbol)
-                    )
-                    stock_id = stock_id_result.scalar()
-                    if not stock_id:
-                        continue
-
-                    if fill_missing_gaps:
-                        existing_rows_result = await session.execute(
-                            select(StockPrice.time).where(
-                                StockPrice.symbol == symbol,
-                                StockPrice.interval == "1D",
-                            )
-                        )
-                        existing_dates = {
-                            row_time
-                            for (row_time,) in existing_rows_result.fetchall()
-                            if isinstance(row_time, date)
-                        }
-                        if existing_dates:
-                            db_min_time = min(existing_dates)
-                            db_max_time = max(existing_dates)
-                            gap_ranges = self._build_missing_date_ranges(
-                                existing_dates=existing_dates,
-                                start_date=db_min_time,
-                                end_date=db_max_time,
-                                max_range_days=30,
-                            )
-                            fetch_ranges = gap_ranges or []
-
-                            if db_max_time < resolved_end:
-                                tail_start = max(db_max_time + timedelta(days=1), resolved_start)
-                                if tail_start <= resolved_end:
-                                    fetch_ranges.append((tail_start, resolved_end))
-                            if resolved_start < db_min_time:
-                                head_end = min(db_min_time - timedelta(days=1), resolved_end)
-                                if resolved_start <= head_end:
-                                    fetch_ranges.append((resolved_start, head_end))
-
-                            if not fetch_ranges:
-                                fetch_ranges = [(resolved_start, resolved_end)]
+                plan = fetch_plans.get(symbol)
+                if plan is None:
+                    continue
 
                 latest_row: Optional[Dict[str, Any]] = None
                 symbol_synced = 0
                 async with async_session_maker() as session:
-                    stock_id_result = await session.execute(
-                        select(Stock.id).where(Stock.symbol == symbol)
-                    )
-                    stock_id = stock_id_result.scalar()
-                    if not stock_id:
-                        continue
-
-                    for range_start, range_end in fetch_ranges:
+                    stock_id = plan.stock_id
+                    for range_start, range_end in plan.ranges:
                         if range_start > range_end:
                             continue
 
@@ -2000,24 +2053,28 @@ class DataPipeline:
                             )
                             continue
 
+                        price_rows = []
                         for _, row in range_df.iterrows():
                             row_time = (
                                 row["time"].date() if hasattr(row["time"], "date") else row["time"]
                             )
-                            val = {
-                                "stock_id": stock_id,
-                                "symbol": symbol,
-                                "time": row_time,
-                                "open": float(row["open"]),
-                                "high": float(row["high"]),
-                                "low": float(row["low"]),
-                                "close": float(row["close"]),
-                                "volume": int(row["volume"]),
-                                "interval": "1D",
-                                "source": "vnstock",
-                            }
-                            stmt = get_upsert_stmt(StockPrice, ["symbol", "time", "interval"], val)
-                            await session.execute(stmt)
+                            price_rows.append(
+                                {
+                                    "stock_id": stock_id,
+                                    "symbol": symbol,
+                                    "time": row_time,
+                                    "open": float(row["open"]),
+                                    "high": float(row["high"]),
+                                    "low": float(row["low"]),
+                                    "close": float(row["close"]),
+                                    "volume": int(row["volume"]),
+                                    "interval": "1D",
+                                    "source": "vnstock",
+                                }
+                            )
+                        await bulk_upsert(
+                            session, StockPrice, ["symbol", "time", "interval"], price_rows
+                        )
 
                         symbol_synced += len(range_df)
                         latest_candidate = range_df.iloc[-1].to_dict()
@@ -2305,6 +2362,7 @@ class DataPipeline:
 
         return results
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_company_profiles(
         self,
         symbols: List[str] = None,
@@ -2388,29 +2446,34 @@ class DataPipeline:
             symbol = symbols[idx]
             await self._wait_for_rate_limit("profiles")
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
-
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=symbol, source=settings.vnstock_source)
 
-                overview_row: Dict[str, Any] = {}
-                profile_row: Dict[str, Any] = {}
-
-                try:
-                    overview_df = stock.company.overview()
-                    if overview_df is not None and not overview_df.empty:
-                        overview_row = overview_df.iloc[0].to_dict()
-                except Exception as overview_error:
-                    logger.debug("Overview fetch failed for %s: %s", symbol, overview_error)
+                def _fetch_company_rows(sym: str) -> dict[str, Any]:
+                    stock = get_stock_client(sym, settings.vnstock_source)
+                    overview_row: dict[str, Any] = {}
+                    profile_row: dict[str, Any] = {}
 
-                try:
-                    profile_df = stock.company.profile()
-                    if profile_df is not None and not profile_df.empty:
-                        profile_row = profile_df.iloc[0].to_dict()
-                except Exception as profile_error:
-                    logger.debug("Profile fetch failed for %s: %s", symbol, profile_error)
+                    try:
+                        overview_df = stock.company.overview()
+                        if overview_df is not None and not overview_df.empty:
+                            overview_row = overview_df.iloc[0].to_dict()
+                    except Exception as overview_error:
+                        logger.debug("Overview fetch failed for %s: %s", sym, overview_error)
 
-                merged_row = {**profile_row, **overview_row}
+                    try:
+                        profile_df = stock.company.profile()
+                        if profile_df is not None and not profile_df.empty:
+                            profile_row = profile_df.iloc[0].to_dict()
+                    except Exception as profile_error:
+                        logger.debug("Profile fetch failed for %s: %s", sym, profile_error)
+
+                    return {**profile_row, **overview_row}
+
+                merged_row = await run_vnstock_call(
+                    "company_profile",
+                    lambda sym=symbol: _fetch_company_rows(sym),
+                    key=(symbol, settings.vnstock_source),
+                    timeout=settings.vnstock_timeout,
+                )
                 if not merged_row:
                     if progress is not None:
                         progress["error_count"] = progress.get("error_count", 0) + 1
@@ -2591,6 +2654,7 @@ class DataPipeline:
                     await self._checkpoint(progress, sync_id)
         return total
 
+    @bumps_datasets(DATASET_FINANCIALS)
     async def sync_financials(
         self,
         symbols: List[str] = None,
@@ -2745,6 +2809,7 @@ class DataPipeline:
                         continue
 
                     latest_cache_payload: List[Dict[str, Any]] = []
+                    statement_rows: List[Dict[str, Any]] = []
                     async with async_session_maker() as session:
                         for entry in items:
                             payload = entry.model_dump(mode="json")
@@ -3132,13 +3197,12 @@ class DataPipeline:
                                     "raw_data": raw_payload,
                                 }
 
-                            stmt = get_upsert_stmt(
-                                model, ["symbol", "period", "period_type"], values
-                            )
-                            await session.execute(stmt)
-
+                            statement_rows.append(values)
                             latest_cache_payload.append(payload)
 
+                        await bulk_upsert(
+                            session, model, ["symbol", "period", "period_type"], statement_rows
+                        )
                         await session.commit()
 
                     cache_key = build_cache_key(
@@ -3175,6 +3239,7 @@ class DataPipeline:
                     await self._checkpoint(progress, sync_id)
         return total
 
+    @bumps_datasets(DATASET_FINANCIALS)
     async def sync_financial_ratios(
         self,
         symbols: List[str] = None,
@@ -3873,6 +3938,7 @@ class DataPipeline:
                             progress["stage_stats"]["financial_ratios"]["errors"] += 1
                         continue
 
+                    ratio_rows: List[Dict[str, Any]] = []
                     for ratio in ratio_items:
                         period_str = str(ratio.period or "").strip()
                         period_upper = period_str.upper()
@@ -3986,11 +4052,11 @@ class DataPipeline:
                             "source": "vnstock",
                             "updated_at": datetime.utcnow(),
                         }
-                        stmt = get_upsert_stmt(
-                            FinancialRatio, ["symbol", "period", "period_type"], values
-                        )
-                        await session.execute(stmt)
+                        ratio_rows.append(values)
 
+                    await bulk_upsert(
+                        session, FinancialRatio, ["symbol", "period", "period_type"], ratio_rows
+                    )
                     await session.flush()
                     enriched_rows = await _enrich_ratio_rows(session, symbol)
                     await session.commit()
@@ -4028,6 +4094,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_company_news(
         self,
         symbols: List[str] = None,
@@ -4113,6 +4180,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_company_events(
         self,
         symbols: List[str] = None,
@@ -4191,6 +4259,7 @@ class DataPipeline:
                     continue
 
                 async with async_session_maker() as session:
+                    event_rows: List[Dict[str, Any]] = []
                     for payload in payloads:
                         event_type = str(payload.get("event_type") or "event").strip()
                         event_name = str(payload.get("event_name") or "").strip()
@@ -4220,13 +4289,11 @@ class DataPipeline:
                             "raw_data": payload.get("raw_data") or payload,
                             "updated_at": datetime.utcnow(),
                         }
-                        stmt = get_upsert_stmt(
-                            CompanyEvent,
-                            ["symbol", "event_type", "event_date"],
-                            values,
-                        )
-                        await session.execute(stmt)
+                        event_rows.append(values)
                         total += 1
+                    await bulk_upsert(
+                        session, CompanyEvent, ["symbol", "event_type", "event_date"], event_rows
+                    )
                     await session.commit()
 
                 if progress is not None:
@@ -4245,6 +4312,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_dividends(
         self,
         symbols: List[str] = None,
@@ -4291,6 +4359,7 @@ class DataPipeline:
                     continue
 
                 async with async_session_maker() as session:
+                    dividend_rows: List[Dict[str, Any]] = []
                     for item in items:
                         payload = item.model_dump()
                         exercise_date = self._parse_date_value(payload.get("ex_date"))
@@ -4307,13 +4376,11 @@ class DataPipeline:
                             "raw_data": payload,
                             "created_at": datetime.utcnow(),
                         }
-                        stmt = get_upsert_stmt(
-                            Dividend,
-                            ["symbol", "exercise_date", "cash_year"],
-                            values,
-                        )
-                        await session.execute(stmt)
+                        dividend_rows.append(values)
                         total += 1
+                    await bulk_upsert(
+                        session, Dividend, ["symbol", "exercise_date", "cash_year"], dividend_rows
+                    )
                     await session.commit()
 
                 if progress is not None:
@@ -4332,6 +4399,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_insider_deals(
         self,
         symbols: List[str] = None,
@@ -4421,6 +4489,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_shareholders(
         self,
         symbols: List[str] = None,
@@ -4495,6 +4564,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_officers(
         self,
         symbols: List[str] = None,
@@ -4569,6 +4639,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_COMPANY)
     async def sync_subsidiaries(
         self,
         symbols: List[str] = None,
@@ -4640,6 +4711,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_LISTING)
     async def sync_market_sectors(self) -> int:
         """Seed market sector master data from VN_SECTORS."""
         from vnibb.core.vn_sectors import get_all_sectors
@@ -4671,6 +4743,7 @@ class DataPipeline:
 
         return total
 
+    @bumps_datasets(DATASET_INDICES)
     async def sync_market_indices(
         self,
         progress: Optional[Dict[str, Any]] = None,
@@ -4789,6 +4862,7 @@ class DataPipeline:
         logger.info("Synced %d market index rows", upsert_count)
         return upsert_count
 
+    @bumps_datasets(DATASET_FOREIGN_TRADING)
     async def sync_foreign_trading(
         self,
         trade_date: Optional[date] = None,
@@ -4863,6 +4937,7 @@ class DataPipeline:
                 continue
 
             async with async_session_maker() as session:
+                foreign_rows: List[Dict[str, Any]] = []
                 for record in records:
                     payload = record.model_dump()
                     symbol = payload.get("symbol")
@@ -4888,8 +4963,7 @@ class DataPipeline:
                         "created_at": datetime.utcnow(),
                         "updated_at": datetime.utcnow(),
                     }
-                    stmt = get_upsert_stmt(ForeignTrading, ["symbol", "trade_date"], values)
-                    await session.execute(stmt)
+                    foreign_rows.append(values)
                     total += 1
 
                     cache_payload = {
@@ -4916,6 +4990,7 @@ class DataPipeline:
                         progress["success_count"] = progress.get("success_count", 0) + 1
                         progress["stage_stats"]["foreign_trading"]["success"] += 1
 
+                await bulk_upsert(session, ForeignTrading, ["symbol", "trade_date"], foreign_rows)
                 await session.commit()
 
             if progress is not None and sync_id is not None:
@@ -5086,24 +5161,19 @@ class DataPipeline:
             try:
                 source = settings.vnstock_source or "KBS"
 
-                async def _fetch_intraday() -> List[Dict[str, Any]]:
-                    def _sync_fetch() -> List[Dict[str, Any]]:
-                        from vnibb.providers.vnstock.runtime import get_vnstock_class
-
-                        Vnstock = get_vnstock_class()
-                        stock = Vnstock().stock(symbol=symbol, source=source)
-                        df = stock.quote.intraday()
-                        if df is None or df.empty:
-                            return []
-                        return df.tail(limit).to_dict("records")
-
-                    loop = asyncio.get_event_loop()
-                    return await asyncio.wait_for(
-                        loop.run_in_executor(None, _sync_fetch),
-                        timeout=settings.vnstock_timeout,
-                    )
-
-                raw_rows = await _fetch_intraday()
+                def _sync_fetch(sym: str = symbol, src: str = source) -> list[dict[str, Any]]:
+                    stock = get_stock_client(sym, src)
+                    df = stock.quote.intraday()
+                    if df is None or df.empty:
+                        return []
+                    return df.tail(limit).to_dict("records")
+
+                raw_rows = await run_vnstock_call(
+                    "intraday_trades",
+                    _sync_fetch,
+                    key=(symbol, source, limit),
+                    timeout=settings.vnstock_timeout,
+                )
 
                 # Always seed defaults from foreign_lookup so OrderFlowDaily
                 # rows have a usable signal even when intraday returns empty.
@@ -5551,7 +5621,12 @@ class DataPipeline:
         progress: Optional[Dict[str, Any]] = None,
         sync_id: Optional[int] = None,
     ) -> int:
-        """Detect block trades from intraday data."""
+        """
+        Detect block trades from intraday data.
+
+        Detection is a single set-based statement per trading day, so it is
+        cheap enough to run from the intraday scheduler as well as at close.
+        """
         from vnibb.services.insider_tracking import InsiderTrackingService
 
         trade_date = trade_date or self._get_market_date()
@@ -5578,7 +5653,7 @@ class DataPipeline:
                     )
             return 0
 
-        if settings.orderflow_at_close_only and not self._is_after_market_close():
+        if settings.block_trades_at_close_only and not self._is_after_market_close():
             logger.info("Block trade detection skipped before market close")
             if progress is not None:
                 progress.setdefault("stage_stats", {})
@@ -5601,7 +5676,7 @@ class DataPipeline:
             return 0
 
         if settings.intraday_require_market_hours and not self._is_market_hours():
-            if not (settings.orderflow_at_close_only and self._is_after_market_close()):
+            if not (settings.block_trades_at_close_only and self._is_after_market_close()):
                 logger.info("Block trade detection skipped outside market hours")
                 if progress is not None:
                     progress.setdefault("stage_stats", {})
@@ -5623,51 +5698,54 @@ class DataPipeline:
                         )
                 return 0
 
-        if not symbols:
-            async with async_session_maker() as session:
-                result = await session.execute(select(Stock.symbol).where(Stock.is_active == 1))
-                symbols = [r[0] for r in result.fetchall()]
-
-        if not symbols:
-            return 0
-
         symbol_exchange: Dict[str, str] = {}
         symbol_chunk_index: Dict[str, int] = {}
         if settings.cache_order_flow_chunked:
+            chunk_symbols = symbols
+            if not chunk_symbols:
+                async with async_session_maker() as session:
+                    result = await session.execute(
+                        select(Stock.symbol).where(Stock.is_active == 1)
+                    )
+                    chunk_symbols = [r[0] for r in result.fetchall()]
             symbol_exchange, symbol_chunk_index = await self._get_exchange_and_chunk_index(
-                symbols,
+                chunk_symbols,
                 settings.cache_chunk_size,
             )
 
-        start_index = 0
-        if progress and progress.get("stage") == "block_trades":
-            last_symbol = progress.get("last_symbol")
-            if last_symbol and last_symbol in symbols:
-                start_index = symbols.index(last_symbol) + 1
-
         if progress is not None:
             progress.setdefault("stage_stats", {})
             progress["stage"] = "block_trades"
             progress["stage_index"] = DAILY_TRADING_STAGES.index("block_trades")
-            progress["stage_stats"].setdefault(
-                "block_trades",
-                {"success": 0, "errors": 0, "total": len(symbols)},
-            )
+            progress["stage_stats"]["block_trades"] = {"success": 0, "errors": 0, "total": 1}
 
-        total = 0
-        async with async_session_maker() as session:
-            service = InsiderTrackingService(session)
-            for idx in range(start_index, len(symbols)):
-                symbol = symbols[idx]
-                try:
-                    trades = await service.detect_block_trades(
-                        symbol=symbol,
-                        threshold=settings.big_order_threshold_vnd,
+        # One set-based detection pass for the whole universe (or the given
+        # symbols); only trades not recorded by an earlier run come back.
+        day_start = datetime.combine(trade_date, time.min)
+        day_end = day_start + timedelta(days=1)
+        try:
+            async with async_session_maker() as session:
+                service = InsiderTrackingService(session)
+                trades = await service.detect_block_trades_for_day(
+                    trade_date=trade_date,
+                    threshold=settings.big_order_threshold_vnd,
+                    symbols=symbols,
+                )
+                affected = sorted({t["symbol"] for t in trades})
+                trades_by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+                flow_rows: List[OrderFlowDaily] = []
+                if affected:
+                    day_trades = await session.execute(
+                        select(BlockTrade)
+                        .where(
+                            BlockTrade.symbol.in_(affected),
+                            BlockTrade.trade_time >= day_start,
+                            BlockTrade.trade_time < day_end,
+                        )
+                        .order_by(BlockTrade.trade_time)
                     )
-                    total += len(trades)
-
-                    if trades:
-                        payload = [
+                    for t in day_trades.scalars().all():
+                        trades_by_symbol.setdefault(t.symbol, []).append(
                             {
                                 "symbol": t.symbol,
                                 "side": t.side,
@@ -5676,103 +5754,112 @@ class DataPipeline:
                                 "value": t.value,
                                 "trade_time": t.trade_time.isoformat(),
                             }
-                            for t in trades
-                        ]
-                        cache_key = build_cache_key(
-                            "vnibb",
-                            "block_trades",
-                            "daily",
-                            symbol,
-                            trade_date.isoformat(),
                         )
-                        await self._cache_set_json(cache_key, payload, CACHE_TTL_BLOCK_TRADES)
 
-                        await session.execute(
-                            update(OrderFlowDaily)
-                            .where(
-                                OrderFlowDaily.symbol == symbol,
-                                OrderFlowDaily.trade_date == trade_date,
-                            )
-                            .values(
-                                block_trade_count=len(trades),
-                                updated_at=datetime.utcnow(),
-                            )
+                    day_block_count = (
+                        select(func.count(BlockTrade.id))
+                        .where(
+                            BlockTrade.symbol == OrderFlowDaily.symbol,
+                            BlockTrade.trade_time >= day_start,
+                            BlockTrade.trade_time < day_end,
                         )
-                        await session.commit()
+                        .scalar_subquery()
+                    )
+                    await session.execute(
+                        update(OrderFlowDaily)
+                        .where(
+                            OrderFlowDaily.symbol.in_(affected),
+                            OrderFlowDaily.trade_date == trade_date,
+                        )
+                        .values(block_trade_count=day_block_count, updated_at=datetime.utcnow())
+                        .execution_options(synchronize_session=False)
+                    )
+                    await session.commit()
 
-                        result = await session.execute(
-                            select(OrderFlowDaily).where(
-                                OrderFlowDaily.symbol == symbol,
-                                OrderFlowDaily.trade_date == trade_date,
-                            )
+                    result = await session.execute(
+                        select(OrderFlowDaily).where(
+                            OrderFlowDaily.symbol.in_(affected),
+                            OrderFlowDaily.trade_date == trade_date,
                         )
-                        flow_row = result.scalar_one_or_none()
-                        if flow_row:
-                            flow_payload = {
-                                "symbol": flow_row.symbol,
-                                "trade_date": flow_row.trade_date.isoformat(),
-                                "buy_volume": flow_row.buy_volume,
-                                "sell_volume": flow_row.sell_volume,
-                                "buy_value": flow_row.buy_value,
-                                "sell_value": flow_row.sell_value,
-                                "net_volume": flow_row.net_volume,
-                                "net_value": flow_row.net_value,
-                                "big_order_count": flow_row.big_order_count,
-                                "block_trade_count": flow_row.block_trade_count,
-                                "foreign_buy_volume": flow_row.foreign_buy_volume,
-                                "foreign_sell_volume": flow_row.foreign_sell_volume,
-                                "foreign_net_volume": flow_row.foreign_net_volume,
-                                "proprietary_buy_volume": flow_row.proprietary_buy_volume,
-                                "proprietary_sell_volume": flow_row.proprietary_sell_volume,
-                                "proprietary_net_volume": flow_row.proprietary_net_volume,
-                            }
+                    )
+                    flow_rows = list(result.scalars().all())
+        except Exception as exc:
+            logger.warning(f"Block trade detection failed for {trade_date}: {exc}")
+            if progress is not None:
+                progress["error_count"] = progress.get("error_count", 0) + 1
+                progress["stage_stats"]["block_trades"]["errors"] += 1
+            return 0
 
-                            if settings.cache_order_flow_per_symbol:
-                                flow_key = build_cache_key(
-                                    "vnibb",
-                                    "order_flow",
-                                    "daily",
-                                    symbol,
-                                    trade_date.isoformat(),
-                                )
-                                await self._cache_set_json(
-                                    flow_key,
-                                    flow_payload,
-                                    CACHE_TTL_ORDER_FLOW,
-                                )
+        for symbol, payload in trades_by_symbol.items():
+            cache_key = build_cache_key(
+                "vnibb",
+                "block_trades",
+                "daily",
+                symbol,
+                trade_date.isoformat(),
+            )
+            await self._cache_set_json(cache_key, payload, CACHE_TTL_BLOCK_TRADES)
+
+        for flow_row in flow_rows:
+            symbol = flow_row.symbol
+            flow_payload = {
+                "symbol": flow_row.symbol,
+                "trade_date": flow_row.trade_date.isoformat(),
+                "buy_volume": flow_row.buy_volume,
+                "sell_volume": flow_row.sell_volume,
+                "buy_value": flow_row.buy_value,
+                "sell_value": flow_row.sell_value,
+                "net_volume": flow_row.net_volume,
+                "net_value": flow_row.net_value,
+                "big_order_count": flow_row.big_order_count,
+                "block_trade_count": flow_row.block_trade_count,
+                "foreign_buy_volume": flow_row.foreign_buy_volume,
+                "foreign_sell_volume": flow_row.foreign_sell_volume,
+                "foreign_net_volume": flow_row.foreign_net_volume,
+                "proprietary_buy_volume": flow_row.proprietary_buy_volume,
+                "proprietary_sell_volume": flow_row.proprietary_sell_volume,
+                "proprietary_net_volume": flow_row.proprietary_net_volume,
+            }
 
-                            if settings.cache_order_flow_chunked:
-                                exchange = symbol_exchange.get(symbol, "UNKNOWN")
-                                chunk_index = symbol_chunk_index.get(symbol, 0)
-                                await self._upsert_chunked_record(
-                                    ["vnibb", "order_flow", "daily"],
-                                    trade_date,
-                                    flow_payload,
-                                    exchange,
-                                    chunk_index,
-                                    CACHE_TTL_ORDER_FLOW,
-                                )
+            if settings.cache_order_flow_per_symbol:
+                flow_key = build_cache_key(
+                    "vnibb",
+                    "order_flow",
+                    "daily",
+                    symbol,
+                    trade_date.isoformat(),
+                )
+                await self._cache_set_json(
+                    flow_key,
+                    flow_payload,
+                    CACHE_TTL_ORDER_FLOW,
+                )
 
-                    if progress is not None:
-                        progress["success_count"] = progress.get("success_count", 0) + 1
-                        progress["stage_stats"]["block_trades"]["success"] += 1
-                except Exception as exc:
-                    logger.warning(f"Block trade detection failed for {symbol}: {exc}")
-                    if progress is not None:
-                        progress["error_count"] = progress.get("error_count", 0) + 1
-                        progress["stage_stats"]["block_trades"]["errors"] += 1
+            if settings.cache_order_flow_chunked:
+                exchange = symbol_exchange.get(symbol, "UNKNOWN")
+                chunk_index = symbol_chunk_index.get(symbol, 0)
+                await self._upsert_chunked_record(
+                    ["vnibb", "order_flow", "daily"],
+                    trade_date,
+                    flow_payload,
+                    exchange,
+                    chunk_index,
+                    CACHE_TTL_ORDER_FLOW,
+                )
 
-                if progress is not None and sync_id is not None:
-                    progress["last_symbol"] = symbol
-                    if self._should_checkpoint(idx, len(symbols)):
-                        await self._checkpoint(
-                            progress,
-                            sync_id,
-                            key=DAILY_TRADING_PROGRESS_KEY,
-                            ttl=DAILY_TRADING_PROGRESS_TTL,
-                        )
+        if progress is not None:
+            progress["success_count"] = progress.get("success_count", 0) + 1
+            progress["stage_stats"]["block_trades"]["success"] += 1
+            progress["stage_stats"]["block_trades"]["detected"] = len(trades)
+            if sync_id is not None:
+                await self._checkpoint(
+                    progress,
+                    sync_id,
+                    key=DAILY_TRADING_PROGRESS_KEY,
+                    ttl=DAILY_TRADING_PROGRESS_TTL,
+                )
 
-        return total
+        return len(trades)
 
     async def sync_derivatives_prices(
         self,
@@ -6002,11 +6089,10 @@ class DataPipeline:
                 progress = {
                     "job_id": job_id,
                     "status": "running",
-                    "stage": DAILY_TRADING_STAGES[0],
-                    "stage_index": 0,
                     "success_count": 0,
                     "error_count": 0,
                     "stage_stats": {},
+                    "stages": {},
                     "trade_date": trade_date.isoformat(),
                 }
             else:
@@ -6030,54 +6116,53 @@ class DataPipeline:
                     ttl=DAILY_TRADING_PROGRESS_TTL,
                 )
 
-            start_index = progress.get("stage_index", 0)
-
-            try:
-                for stage in DAILY_TRADING_STAGES[start_index:]:
-                    progress["stage"] = stage
-                    progress["stage_index"] = DAILY_TRADING_STAGES.index(stage)
-                    await self._checkpoint(
-                        progress,
-                        sync_id,
-                        key=DAILY_TRADING_PROGRESS_KEY,
-                        ttl=DAILY_TRADING_PROGRESS_TTL,
+            async def run_stage(stage: str, stage_progress: Dict[str, Any]) -> None:
+                if stage == "foreign_trading":
+                    await self.sync_foreign_trading(
+                        trade_date=trade_date,
+                        progress=stage_progress,
+                        sync_id=sync_id,
+                    )
+                elif stage == "intraday_trades":
+                    await self.sync_intraday_trades(
+                        trade_date=trade_date,
+                        progress=stage_progress,
+                        sync_id=sync_id,
+                    )
+                elif stage == "orderbook_snapshots":
+                    await self.sync_orderbook_snapshots(
+                        progress=stage_progress,
+                        sync_id=sync_id,
+                    )
+                elif stage == "block_trades":
+                    await self.sync_block_trades(
+                        trade_date=trade_date,
+                        progress=stage_progress,
+                        sync_id=sync_id,
+                    )
+                elif stage == "derivatives":
+                    await self.sync_derivatives_prices(
+                        trade_date=trade_date,
+                        progress=stage_progress,
+                        sync_id=sync_id,
+                    )
+                elif stage == "warrants":
+                    await self.sync_warrant_prices(
+                        trade_date=trade_date,
+                        progress=stage_progress,
+                        sync_id=sync_id,
                     )
 
-                    if stage == "foreign_trading":
-                        await self.sync_foreign_trading(
-                            trade_date=trade_date,
-                            progress=progress,
-                            sync_id=sync_id,
-                        )
-                    elif stage == "intraday_trades":
-                        await self.sync_intraday_trades(
-                            trade_date=trade_date,
-                            progress=progress,
-                            sync_id=sync_id,
-                        )
-                    elif stage == "orderbook_snapshots":
-                        await self.sync_orderbook_snapshots(
-                            progress=progress,
-                            sync_id=sync_id,
-                        )
-                    elif stage == "block_trades":
-                        await self.sync_block_trades(
-                            trade_date=trade_date,
-                            progress=progress,
-                            sync_id=sync_id,
-                        )
-                    elif stage == "derivatives":
-                        await self.sync_derivatives_prices(
-                            trade_date=trade_date,
-                            progress=progress,
-                            sync_id=sync_id,
-                        )
-                    elif stage == "warrants":
-                        await self.sync_warrant_prices(
-                            trade_date=trade_date,
-                            progress=progress,
-                            sync_id=sync_id,
-                        )
+            try:
+                await self._run_stage_dag(
+                    DAILY_TRADING_GRAPH,
+                    run_stage,
+                    progress,
+                    sync_id,
+                    legacy_order=DAILY_TRADING_STAGES,
+                    key=DAILY_TRADING_PROGRESS_KEY,
+                    ttl=DAILY_TRADING_PROGRESS_TTL,
+                )
 
                 cleanup_results: Dict[str, int] = {}
                 for label, action in (
@@ -6133,60 +6218,69 @@ class DataPipeline:
                 "domain_results": [],
             }
 
-        allowed_domains = {"prices", "financials", "ratios", "shareholders", "officers"}
-        requested_domains = [
-            domain
-            for domain in (domains or ["prices", "financials", "ratios", "shareholders"])
-            if domain in allowed_domains
-        ]
+        requested_domains = list(
+            dict.fromkeys(
+                domain
+                for domain in (domains or ["prices", "financials", "ratios", "shareholders"])
+                if domain in REINFORCEMENT_GRAPH
+            )
+        )
 
         token = RATE_MODE_CONTEXT.set(RATE_MODE_REINFORCEMENT)
         started_at = datetime.utcnow()
-        domain_results: List[Dict[str, Any]] = []
-        try:
-            for domain in requested_domains:
-                domain_started = datetime.utcnow()
-                try:
-                    if domain == "prices":
-                        await self.sync_daily_prices(
-                            symbols=normalized_symbols,
-                            days=40,
-                            fill_missing_gaps=True,
-                        )
-                    elif domain == "financials":
-                        await self.sync_financials(symbols=normalized_symbols, period="quarter")
-                        await self.sync_financials(symbols=normalized_symbols, period="year")
-                    elif domain == "ratios":
-                        await self.sync_financial_ratios(
-                            symbols=normalized_symbols, period="quarter"
-                        )
-                        await self.sync_financial_ratios(symbols=normalized_symbols, period="year")
-                    elif domain == "shareholders":
-                        await self.sync_shareholders(symbols=normalized_symbols)
-                    elif domain == "officers":
-                        await self.sync_officers(symbols=normalized_symbols)
+        results_by_domain: Dict[str, Dict[str, Any]] = {}
 
-                    domain_results.append(
-                        {
-                            "domain": domain,
-                            "status": "completed",
-                            "elapsed_seconds": round(
-                                (datetime.utcnow() - domain_started).total_seconds(), 2
-                            ),
-                        }
-                    )
-                except Exception as exc:
-                    logger.warning("Reinforcement domain failed (%s): %s", domain, exc)
-                    domain_results.append(
-                        {
-                            "domain": domain,
-                            "status": "failed",
-                            "error": str(exc),
-                            "elapsed_seconds": round(
-                                (datetime.utcnow() - domain_started).total_seconds(), 2
-                            ),
-                        }
+        async def run_domain(domain: str) -> None:
+            domain_started = datetime.utcnow()
+            try:
+                if domain == "prices":
+                    await self.sync_daily_prices(
+                        symbols=normalized_symbols,
+                        days=40,
+                        fill_missing_gaps=True,
                     )
+                elif domain == "financials":
+                    await self.sync_financials(symbols=normalized_symbols, period="quarter")
+                    await self.sync_financials(symbols=normalized_symbols, period="year")
+                elif domain == "ratios":
+                    await self.sync_financial_ratios(symbols=normalized_symbols, period="quarter")
+                    await self.sync_financial_ratios(symbols=normalized_symbols, period="year")
+                elif domain == "shareholders":
+                    await self.sync_shareholders(symbols=normalized_symbols)
+                elif domain == "officers":
+                    await self.sync_officers(symbols=normalized_symbols)
+
+                results_by_domain[domain] = {
+                    "domain": domain,
+                    "status": "completed",
+                    "elapsed_seconds": round(
+                        (datetime.utcnow() - domain_started).total_seconds(), 2
+                    ),
+                }
+            except Exception as exc:
+                logger.warning("Reinforcement domain failed (%s): %s", domain, exc)
+                results_by_domain[domain] = {
+                    "domain": domain,
+                    "status": "failed",
+                    "error": str(exc),
+                    "elapsed_seconds": round(
+                        (datetime.utcnow() - domain_started).total_seconds(), 2
+                    ),
+                }
+
+        try:
+            # Independent domains overlap; all of them share the reinforcement budget.
+            await run_stage_graph(
+                REINFORCEMENT_GRAPH.subset(requested_domains),
+                run_domain,
+                max_parallel=settings.sync_max_parallel_stages,
+                pool_limits={BULK_STAGE_POOL: settings.sync_bulk_stage_concurrency},
+            )
+            domain_results = [
+                results_by_domain[domain]
+                for domain in requested_domains
+                if domain in results_by_domain
+            ]
 
             failed_domains = [
                 result for result in domain_results if result.get("status") == "failed"
@@ -6246,11 +6340,10 @@ class DataPipeline:
                 progress = {
                     "job_id": job_id,
                     "status": "running",
-                    "stage": STAGE_ORDER[0],
-                    "stage_index": 0,
                     "success_count": 0,
                     "error_count": 0,
                     "stage_stats": {},
+                    "stages": {},
                     "days": days,
                 }
             else:
@@ -6267,68 +6360,72 @@ class DataPipeline:
                 progress["sync_id"] = sync_id
                 await self._checkpoint(progress, sync_id)
 
-            start_index = progress.get("stage_index", 0)
+            graph = FULL_SEEDING_GRAPH.subset(stages)
 
             if cache_writes is False:
                 self.cache_writes_enabled = False
 
-            try:
-                for stage in stages[start_index:]:
-                    progress["stage"] = stage
-                    progress["stage_index"] = STAGE_ORDER.index(stage)
-                    await self._checkpoint(progress, sync_id)
-
-                    if stage == "stock_list":
-                        try:
-                            await self.sync_stock_list(progress=progress, sync_id=sync_id)
-                        except Exception as e:
-                            logger.warning(f"Stock list sync failed: {e}")
-                    elif stage == "screener":
+            async def run_stage(stage: str, stage_progress: Dict[str, Any]) -> None:
+                if stage == "stock_list":
+                    try:
+                        await self.sync_stock_list(progress=stage_progress, sync_id=sync_id)
+                    except Exception as e:
+                        logger.warning(f"Stock list sync failed: {e}")
+                elif stage == "screener":
+                    try:
+                        await self.sync_screener_data(progress=stage_progress, sync_id=sync_id)
+                        removed = await self.cleanup_screener_snapshots()
+                        if removed:
+                            logger.info(
+                                f"Pruned {removed} old screener snapshots beyond retention window"
+                            )
+                    except Exception as e:
+                        logger.warning(f"Screener sync failed: {e}")
+                elif stage == "profiles":
+                    try:
+                        await self.sync_company_profiles(progress=stage_progress, sync_id=sync_id)
+                    except Exception as e:
+                        logger.warning(f"Profile sync failed: {e}")
+                elif stage == "prices":
+                    if include_prices:
                         try:
-                            await self.sync_screener_data(progress=progress, sync_id=sync_id)
-                            removed = await self.cleanup_screener_snapshots()
+                            await self.sync_daily_prices(
+                                days=days,
+                                progress=stage_progress,
+                                sync_id=sync_id,
+                                cache_recent=False,
+                            )
+                            removed = await self.cleanup_price_history()
                             if removed:
                                 logger.info(
-                                    f"Pruned {removed} old screener snapshots beyond retention window"
+                                    f"Pruned {removed} old price rows beyond retention window"
                                 )
                         except Exception as e:
-                            logger.warning(f"Screener sync failed: {e}")
-                    elif stage == "profiles":
-                        try:
-                            await self.sync_company_profiles(progress=progress, sync_id=sync_id)
-                        except Exception as e:
-                            logger.warning(f"Profile sync failed: {e}")
-                    elif stage == "prices":
-                        if include_prices:
-                            try:
-                                await self.sync_daily_prices(
-                                    days=days,
-                                    progress=progress,
-                                    sync_id=sync_id,
-                                    cache_recent=False,
-                                )
-                                removed = await self.cleanup_price_history()
-                                if removed:
-                                    logger.info(
-                                        f"Pruned {removed} old price rows beyond retention window"
-                                    )
-                            except Exception as e:
-                                logger.warning(f"Price sync failed: {e}")
-                    elif stage == "indices":
-                        try:
-                            await self.sync_market_indices(progress=progress, sync_id=sync_id)
-                        except Exception as e:
-                            logger.warning(f"Market indices sync failed: {e}")
-                    elif stage == "financials":
-                        try:
-                            await self.sync_financials(
-                                period="year", progress=progress, sync_id=sync_id
-                            )
-                            await self.sync_financials(period="quarter")
-                            await self.sync_financial_ratios(period="year")
-                            await self.sync_financial_ratios(period="quarter")
-                        except Exception as e:
-                            logger.warning(f"Financials sync failed: {e}")
+                            logger.warning(f"Price sync failed: {e}")
+                elif stage == "indices":
+                    try:
+                        await self.sync_market_indices(progress=stage_progress, sync_id=sync_id)
+                    except Exception as e:
+                        logger.warning(f"Market indices sync failed: {e}")
+                elif stage == "financials":
+                    try:
+                        await self.sync_financials(
+                            period="year", progress=stage_progress, sync_id=sync_id
+                        )
+                        await self.sync_financials(period="quarter")
+                        await self.sync_financial_ratios(period="year")
+                        await self.sync_financial_ratios(period="quarter")
+                    except Exception as e:
+                        logger.warning(f"Financials sync failed: {e}")
+
+            try:
+                await self._run_stage_dag(
+                    graph,
+                    run_stage,
+                    progress,
+                    sync_id,
+                    legacy_order=STAGE_ORDER,
+                )
 
                 try:
                     removed_news = await self.cleanup_company_news()
@@ -6431,6 +6528,7 @@ async def run_intraday_sync():
     results: Dict[str, int] = {}
     results["intraday_trades"] = await data_pipeline.sync_intraday_trades(symbols=symbols)
     results["orderbook_snapshots"] = await data_pipeline.sync_orderbook_snapshots(symbols=symbols)
+    results["block_trades"] = await data_pipeline.sync_block_trades(symbols=symbols)
     results["derivative_prices"] = await data_pipeline.sync_derivatives_prices()
 
     from vnibb.services.appwrite_population import populate_appwrite_tables
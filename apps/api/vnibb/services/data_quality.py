@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from vnibb.core.config import settings
 from vnibb.core.database import async_session_maker
+from vnibb.core.trading_calendar import configured_market_holidays, get_trading_calendar
 from vnibb.models.data_quality import DataQualityBreachState, DataQualityRun
 from vnibb.models.news import CompanyEvent, CompanyNews
 from vnibb.models.screener import ScreenerSnapshot
@@ -48,19 +49,12 @@ def _to_iso(value: Any) -> str | None:
     return str(value)
 
 
-def _configured_market_holidays() -> set[date]:
-    return {date.fromisoformat(value) for value in settings.market_holiday_dates}
-
-
 def is_market_business_day(anchor: date, holidays: Iterable[date] = ()) -> bool:
-    return anchor.weekday() < 5 and anchor not in set(holidays)
+    return get_trading_calendar(holidays).is_session(anchor)
 
 
 def latest_market_business_day(anchor: date, holidays: Iterable[date] = ()) -> date:
-    holiday_dates = set(holidays)
-    while not is_market_business_day(anchor, holiday_dates):
-        anchor -= timedelta(days=1)
-    return anchor
+    return get_trading_calendar(holidays).latest_session(anchor)
 
 
 def market_day_staleness(
@@ -70,14 +64,7 @@ def market_day_staleness(
 ) -> int | None:
     if latest_market_date is None:
         return None
-    holiday_dates = set(holidays)
-    cursor = latest_market_date
-    staleness = 0
-    while cursor < observed_market_date:
-        cursor += timedelta(days=1)
-        if cursor.weekday() < 5 and cursor not in holiday_dates:
-            staleness += 1
-    return staleness
+    return get_trading_calendar(holidays).sessions_since(latest_market_date, observed_market_date)
 
 
 def _vietcap_freshness_warning(
@@ -477,7 +464,7 @@ async def run_data_quality_check(
 ) -> dict[str, Any]:
     started_at = datetime.utcnow()
     stable_run_id = run_id or f"manual-data-quality:{uuid4()}"
-    holidays = _configured_market_holidays()
+    holidays = configured_market_holidays()
     market_today = _market_today()
     observed_market_date = latest_market_business_day(market_today, holidays)
     market_day = is_market_business_day(market_today, holidays)
@@ -0,0 +1,140 @@
+"""
+Data version stamps for conditional GET on polled endpoints.
+
+Dashboard widgets poll ``/equity/{symbol}/quote``, ``/market/indices``,
+``/screener`` and ``/market/freshness`` every few seconds, but the data
+behind them only changes when a sync or the realtime feed writes. Each probe
+here reads the cheapest stamp that moves whenever the endpoint's inputs do
+(latest ``snapshot_date``/``time``, newest write, latest sync run id) so
+``ConditionalRequestMiddleware`` can answer ``304 Not Modified`` before the
+endpoint touches the DB or a provider.
+
+A probe returns ``None`` when the endpoint would be served from a source it
+cannot stamp (live provider fallback, an open trading session for indices);
+those requests always run the endpoint.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+from re import Pattern
+from typing import Any
+
+from sqlalchemy import func, select
+
+from vnibb.core.cache import build_cache_key, redis_client
+from vnibb.core.database import async_session_factory
+from vnibb.core.middleware.conditional import VersionProbe
+from vnibb.models.market_news import MarketNews
+from vnibb.models.screener import ScreenerSnapshot
+from vnibb.models.stock import StockIndex, StockPrice
+from vnibb.models.sync_status import SyncStatus
+from vnibb.models.trading import ForeignTrading
+from vnibb.services.cache_manager import CacheManager
+from vnibb.services.screener_snapshot_store import screener_snapshot_store
+
+# Phases where index levels still move intraday and cannot be stamped from the DB.
+LIVE_INDEX_PHASES = frozenset({"morning", "afternoon", "post-close"})
+
+
+def _latest_sync_run_id():
+    return (
+        select(func.max(SyncStatus.id))
+        .where(SyncStatus.status == "completed")
+        .scalar_subquery()
+    )
+
+
+async def _scalars(*columns: Any) -> tuple[Any, ...]:
+    """Evaluate scalar subqueries in one round trip."""
+    async with async_session_factory() as session:
+        row = (await session.execute(select(*columns))).one()
+    return tuple(row)
+
+
+async def quote_version(params: Mapping[str, str]) -> tuple[Any, ...] | None:
+    symbol = str(params.get("symbol") or "").strip().upper()
+    if not re.fullmatch(r"[A-Z0-9]{3}", symbol):
+        return None
+
+    # Realtime ticks land in the price cache first and the quote prefers it.
+    latest = await redis_client.get(build_cache_key("vnibb", "price", "latest", symbol))
+    if latest:
+        recent = await redis_client.get(build_cache_key("vnibb", "price", "recent", symbol))
+        return ("cache", latest, recent)
+
+    async with async_session_factory() as session:
+        price = (
+            await session.execute(
+                select(StockPrice.time, StockPrice.close, StockPrice.volume, StockPrice.created_at)
+                .where(StockPrice.symbol == symbol)
+                .order_by(StockPrice.time.desc())
+                .limit(1)
+            )
+        ).first()
+        snapshot = (
+            await session.execute(
+                select(
+                    ScreenerSnapshot.snapshot_date,
+                    ScreenerSnapshot.price,
+                    ScreenerSnapshot.created_at,
+                )
+                .where(ScreenerSnapshot.symbol == symbol)
+                .order_by(ScreenerSnapshot.snapshot_date.desc())
+                .limit(1)
+            )
+        ).first()
+        if price is None and snapshot is None:
+            # Served from Mongo/Appwrite/live provider; nothing local to stamp.
+            return None
+        sync_run_id = (await session.execute(select(_latest_sync_run_id()))).scalar()
+    return ("db", tuple(price or ()), tuple(snapshot or ()), sync_run_id)
+
+
+async def market_indices_version(params: Mapping[str, str]) -> tuple[Any, ...] | None:
+    from vnibb.api.v1.websocket import get_market_phase
+
+    if get_market_phase() in LIVE_INDEX_PHASES:
+        return None
+    stamp = await _scalars(
+        select(func.max(StockIndex.time)).scalar_subquery(),
+        select(func.max(StockIndex.created_at)).scalar_subquery(),
+        _latest_sync_run_id(),
+    )
+    return (date.today(), *stamp)
+
+
+async def screener_version(params: Mapping[str, str]) -> tuple[Any, ...] | None:
+    if str(params.get("use_cache", "true")).lower() in {"false", "0", "no"}:
+        return None
+    frame = screener_snapshot_store.current_frame()
+    if frame is None:
+        return None
+    latest_write = frame.version[-1]
+    fresh_threshold = datetime.utcnow() - timedelta(minutes=CacheManager.SCREENER_TTL_MINUTES)
+    is_stale = latest_write is None or latest_write < fresh_threshold
+    (sync_run_id,) = await _scalars(_latest_sync_run_id())
+    # listing_age_days and the stale flag move with the calendar, not the data.
+    return (frame.version, is_stale, date.today(), sync_run_id)
+
+
+async def market_freshness_version(params: Mapping[str, str]) -> tuple[Any, ...] | None:
+    stamp = await _scalars(
+        select(func.max(StockPrice.time)).where(StockPrice.interval == "1D").scalar_subquery(),
+        select(func.max(ForeignTrading.trade_date)).scalar_subquery(),
+        select(func.max(MarketNews.published_date)).scalar_subquery(),
+        select(func.max(MarketNews.crawled_at)).scalar_subquery(),
+        _latest_sync_run_id(),
+    )
+    # Ages are reported in days, so the stamp rolls over at midnight too.
+    return (date.today(), *stamp)
+
+
+ENDPOINT_VERSION_PROBES: tuple[tuple[Pattern[str], VersionProbe], ...] = (
+    (re.compile(r"^/api/v1/equity/(?P<symbol>[^/]+)/quote/?$"), quote_version),
+    (re.compile(r"^/api/v1/market/indices/?$"), market_indices_version),
+    (re.compile(r"^/api/v1/screener/?$"), screener_version),
+    (re.compile(r"^/api/v1/market/freshness/?$"), market_freshness_version),
+)
@@ -5,22 +5,38 @@ Handles:
 - Syncing insider deals from vnstock
 - Detecting large block trades
 - Generating alerts for insider activity
-- Managing alert thresholds and user preferences
+- Managing alert thresholds, streaming alert rules and user preferences
 """
 
 import logging
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    Float,
+    and_,
+    case,
+    cast,
+    desc,
+    false,
+    func,
+    insert,
+    literal,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 
 from vnibb.core.config import settings
+from vnibb.core.pagination import keyset_before
 from vnibb.models.news import InsiderDeal
-
-from vnibb.models.trading import IntradayTrade
+from vnibb.models.stock import StockPrice
+from vnibb.models.trading import AverageDailyVolume, IntradayTrade
 from vnibb.models.alerts import (
-    BlockTrade, InsiderAlert, AlertSettings,
+    AlertRule, BlockTrade, InsiderAlert, AlertSettings,
     AlertType, AlertSeverity, TradeSide
 )
 from vnibb.core.database import get_db
@@ -28,6 +44,20 @@ from vnibb.services.websocket_service import manager
 
 logger = logging.getLogger(__name__)
 
+BLOCK_TRADE_THRESHOLD_VND = 10_000_000_000
+BLOCK_TRADE_CONFLICT_KEY = ("symbol", "trade_time", "price")
+ADV_SESSIONS = 20
+# Calendar days scanned for the last 20 sessions (covers Tet-length closures).
+ADV_LOOKBACK_DAYS = 45
+
+
+def _dialect_insert(session: AsyncSession, model):
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(model)
+
 
 def _is_missing_block_trade_column_error(exc: Exception) -> bool:
     message = str(exc).lower()
@@ -157,88 +187,186 @@ class InsiderTrackingService:
 
         return stats
     
-    async def detect_block_trades(
-        self, 
-        symbol: str, 
-        threshold: Optional[float] = None
-    ) -> List[BlockTrade]:
+    async def refresh_average_daily_volume(self, trade_date: date) -> int:
         """
-        Detect block trades exceeding threshold.
-        
-        Args:
-            symbol: Stock symbol to analyze
-            threshold: Value threshold in VND (default: 10 billion)
-            
+        Recompute the 20-session average daily volume for every symbol.
+
+        One ``INSERT ... SELECT`` over ``stock_prices`` daily bars strictly
+        before ``trade_date``; rows are keyed by symbol and overwritten.
+
         Returns:
-            List of detected block trades
+            Number of symbols written
         """
-        if threshold is None:
-            threshold = 10_000_000_000  # VND 10 billion
-        
-        # Get recent intraday trades
-        today = datetime.now().date()
-        result = await self.db.execute(
-            select(IntradayTrade)
+        ranked = (
+            select(
+                StockPrice.symbol.label("symbol"),
+                StockPrice.volume.label("volume"),
+                func.row_number()
+                .over(partition_by=StockPrice.symbol, order_by=StockPrice.time.desc())
+                .label("session_rank"),
+            )
             .where(
                 and_(
-                    IntradayTrade.symbol == symbol,
-                    func.date(IntradayTrade.trade_time) == today
+                    StockPrice.interval == "1D",
+                    StockPrice.time < trade_date,
+                    StockPrice.time >= trade_date - timedelta(days=ADV_LOOKBACK_DAYS),
                 )
             )
-            .order_by(desc(IntradayTrade.trade_time))
+            .subquery()
         )
-        
-        trades = result.scalars().all()
-        block_trades = []
-        
-        # Calculate average volume for comparison
-        avg_volume = await self._get_average_volume(symbol, days=20)
-        
-        for trade in trades:
-            trade_value = trade.price * trade.volume
-            
-            if trade_value >= threshold:
-                # Check if already recorded
-                existing = await self.db.execute(
-                    select(BlockTrade).where(
-                        and_(
-                            BlockTrade.symbol == symbol,
-                            BlockTrade.trade_time == trade.trade_time,
-                            BlockTrade.price == trade.price
-                        )
-                    )
-                )
-                
-                if existing.scalar_one_or_none():
-                    continue
-                
-                # Determine trade side (simplified - could be enhanced)
-                side = TradeSide.BUY if trade.match_type == "BUY" else TradeSide.SELL
-                
-                # Create block trade record
-                block_trade = BlockTrade(
-                    symbol=symbol,
-                    side=side,
-                    quantity=trade.volume,
-                    price=trade.price,
-                    value=trade_value,
-                    trade_time=trade.trade_time,
-                    avg_volume_20d=avg_volume,
-                    volume_ratio=trade.volume / avg_volume if avg_volume > 0 else None
-                )
-                
-                self.db.add(block_trade)
-                block_trades.append(block_trade)
-                
-                # Generate alert
-                await self._generate_block_trade_alert(block_trade)
-        
+        source = (
+            select(
+                ranked.c.symbol,
+                literal(trade_date, Date),
+                cast(func.avg(ranked.c.volume), BigInteger),
+                func.count(),
+                literal(datetime.utcnow(), DateTime),
+            )
+            .where(ranked.c.session_rank <= ADV_SESSIONS)
+            .group_by(ranked.c.symbol)
+        )
+        stmt = _dialect_insert(self.db, AverageDailyVolume).from_select(
+            ["symbol", "as_of_date", "adv_20d", "sessions", "computed_at"], source
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol"],
+            set_={
+                name: stmt.excluded[name]
+                for name in ("as_of_date", "adv_20d", "sessions", "computed_at")
+            },
+        )
+        result = await self.db.execute(stmt)
+        return max(result.rowcount or 0, 0)
+
+    async def _ensure_average_daily_volume(self, trade_date: date) -> None:
+        result = await self.db.execute(
+            select(AverageDailyVolume.symbol)
+            .where(AverageDailyVolume.as_of_date == trade_date)
+            .limit(1)
+        )
+        if result.first() is None:
+            written = await self.refresh_average_daily_volume(trade_date)
+            logger.info(f"Refreshed 20-session ADV for {written} symbols as of {trade_date}")
+
+    async def detect_block_trades_for_day(
+        self,
+        trade_date: Optional[date] = None,
+        threshold: Optional[float] = None,
+        symbols: Optional[List[str]] = None,
+        min_volume_ratio: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect block trades for a whole trading day in one statement.
+
+        Intraday trades worth at least ``threshold`` are joined against the
+        precomputed 20-session ADV and inserted with ``ON CONFLICT DO
+        NOTHING``, so re-running the detection intraday only returns (and
+        alerts on) trades that were not recorded yet.
+
+        Args:
+            trade_date: Trading day to scan (default: today)
+            threshold: Value threshold in VND (default: 10 billion)
+            symbols: Restrict the scan to these symbols (default: all)
+            min_volume_ratio: Also require volume >= ratio x ADV
+
+        Returns:
+            Newly recorded block trades as dicts
+        """
+        if threshold is None:
+            threshold = BLOCK_TRADE_THRESHOLD_VND
+        trade_date = trade_date or datetime.now().date()
+        day_start = datetime.combine(trade_date, time.min)
+
+        await self._ensure_average_daily_volume(trade_date)
+
+        adv = AverageDailyVolume
+        trade_value = IntradayTrade.price * IntradayTrade.volume
+        side = case(
+            (IntradayTrade.match_type == "BUY", TradeSide.BUY.value),
+            else_=TradeSide.SELL.value,
+        )
+        conditions = [
+            IntradayTrade.trade_time >= day_start,
+            IntradayTrade.trade_time < day_start + timedelta(days=1),
+            trade_value >= threshold,
+        ]
+        if symbols:
+            conditions.append(IntradayTrade.symbol.in_([s.upper() for s in symbols]))
+        if min_volume_ratio is not None:
+            conditions.append(IntradayTrade.volume >= adv.adv_20d * min_volume_ratio)
+
+        source = (
+            select(
+                IntradayTrade.symbol,
+                cast(side, BlockTrade.__table__.c.side.type),
+                IntradayTrade.volume,
+                IntradayTrade.price,
+                trade_value,
+                IntradayTrade.trade_time,
+                adv.adv_20d,
+                cast(IntradayTrade.volume, Float) / cast(func.nullif(adv.adv_20d, 0), Float),
+                false(),
+                false(),
+                literal(datetime.utcnow(), DateTime),
+            )
+            .select_from(IntradayTrade)
+            .outerjoin(adv, and_(adv.symbol == IntradayTrade.symbol, adv.as_of_date == trade_date))
+            .where(and_(*conditions))
+        )
+        stmt = (
+            _dialect_insert(self.db, BlockTrade)
+            .from_select(
+                [
+                    "symbol",
+                    "side",
+                    "quantity",
+                    "price",
+                    "value",
+                    "trade_time",
+                    "avg_volume_20d",
+                    "volume_ratio",
+                    "is_foreign",
+                    "is_proprietary",
+                    "created_at",
+                ],
+                source,
+            )
+            .on_conflict_do_nothing(index_elements=list(BLOCK_TRADE_CONFLICT_KEY))
+            .returning(
+                BlockTrade.id,
+                BlockTrade.symbol,
+                BlockTrade.side,
+                BlockTrade.quantity,
+                BlockTrade.price,
+                BlockTrade.value,
+                BlockTrade.trade_time,
+                BlockTrade.volume_ratio,
+            )
+        )
+        result = await self.db.execute(stmt)
+        block_trades = [dict(row) for row in result.mappings().all()]
+
+        alerts = await self._insert_block_trade_alerts(block_trades)
+        await self.db.commit()
+
         if block_trades:
-            await self.db.commit()
-            logger.info(f"Detected {len(block_trades)} block trades for {symbol}")
-        
+            logger.info(f"Detected {len(block_trades)} block trades for {trade_date}")
+        for alert in alerts:
+            await manager.broadcast_alert(alert)
+
         return block_trades
-    
+
+    async def detect_block_trades(
+        self,
+        symbol: str,
+        threshold: Optional[float] = None,
+        trade_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Detect block trades for a single symbol (see detect_block_trades_for_day)."""
+        return await self.detect_block_trades_for_day(
+            trade_date=trade_date, threshold=threshold, symbols=[symbol]
+        )
+
     async def _generate_insider_alert(self, deal: InsiderDeal) -> InsiderAlert:
         """Generate alert for insider deal"""
         
@@ -293,86 +421,99 @@ class InsiderTrackingService:
         
         return alert
     
-    async def _generate_block_trade_alert(self, trade: BlockTrade) -> InsiderAlert:
-        """Generate alert for block trade"""
-        
+    @staticmethod
+    def _block_trade_alert_values(trade: Dict[str, Any], timestamp: datetime) -> Dict[str, Any]:
+        """Build the alert row for a newly recorded block trade"""
+
         # Determine severity based on value
         severity = AlertSeverity.MEDIUM
-        if trade.value >= 50_000_000_000:  # VND 50bn
+        if trade["value"] >= 50_000_000_000:  # VND 50bn
             severity = AlertSeverity.HIGH
-        elif trade.value >= 20_000_000_000:  # VND 20bn
+        elif trade["value"] >= 20_000_000_000:  # VND 20bn
             severity = AlertSeverity.MEDIUM
-        
+
         # Format title and description
-        side_str = "Buy" if trade.side == TradeSide.BUY else "Sell"
-        title = f"Large {side_str} Block: {trade.symbol}"
-        
-        value_bn = trade.value / 1_000_000_000
+        side_str = "Buy" if trade["side"] == TradeSide.BUY else "Sell"
+        title = f"Large {side_str} Block: {trade['symbol']}"
+
+        value_bn = trade["value"] / 1_000_000_000
         description = (
-            f"Block {side_str.lower()} of {trade.quantity:,} shares at "
-            f"{trade.price:,.0f} VND/share (Total: VND {value_bn:.2f}bn)"
+            f"Block {side_str.lower()} of {trade['quantity']:,} shares at "
+            f"{trade['price']:,.0f} VND/share (Total: VND {value_bn:.2f}bn)"
         )
-        
-        if trade.volume_ratio:
-            description += f" - {trade.volume_ratio:.1f}x average volume"
-        
-        # Create alert
-        alert = InsiderAlert(
-            alert_type=AlertType.BLOCK_TRADE,
-            severity=severity,
-            symbol=trade.symbol,
-            title=title,
-            description=description,
-            block_trade_id=trade.id,
-            timestamp=datetime.utcnow()
-        )
-        
-        self.db.add(alert)
-        logger.info(f"Generated block trade alert: {title}")
-        
-        # Broadcast via WebSocket
-        await manager.broadcast_alert(alert.to_dict() if hasattr(alert, 'to_dict') else {
-            "id": alert.id,
-            "type": "block_trade_alert",
-            "alert_type": alert.alert_type,
-            "severity": alert.severity,
-            "symbol": alert.symbol,
-            "title": alert.title,
-            "description": alert.description,
-            "timestamp": alert.timestamp.isoformat()
-        })
-        
-        return alert
-    
-    async def _get_average_volume(self, symbol: str, days: int = 20) -> int:
-        """Calculate average daily volume for a symbol"""
-        
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
+
+        if trade["volume_ratio"]:
+            description += f" - {trade['volume_ratio']:.1f}x average volume"
+
+        return {
+            "alert_type": AlertType.BLOCK_TRADE,
+            "severity": severity,
+            "symbol": trade["symbol"],
+            "title": title,
+            "description": description,
+            "block_trade_id": trade["id"],
+            "read": False,
+            "timestamp": timestamp,
+            "created_at": timestamp,
+        }
+
+    async def _insert_block_trade_alerts(
+        self, trades: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Bulk-insert alerts for block trades; returns WebSocket payloads"""
+        if not trades:
+            return []
+
+        timestamp = datetime.utcnow()
+        rows = [self._block_trade_alert_values(trade, timestamp) for trade in trades]
         result = await self.db.execute(
-            select(func.avg(IntradayTrade.volume))
-            .where(
-                and_(
-                    IntradayTrade.symbol == symbol,
-                    IntradayTrade.trade_time >= cutoff_date
-                )
-            )
+            insert(InsiderAlert).returning(InsiderAlert.id, sort_by_parameter_order=True),
+            rows,
         )
-        
-        avg = result.scalar()
-        return int(avg) if avg else 0
-    
+        alert_ids = result.scalars().all()
+        logger.info(f"Generated {len(rows)} block trade alerts")
+
+        return [
+            {
+                "id": alert_id,
+                "type": "block_trade_alert",
+                "alert_type": row["alert_type"],
+                "severity": row["severity"],
+                "symbol": row["symbol"],
+                "title": row["title"],
+                "description": row["description"],
+                "timestamp": timestamp.isoformat(),
+            }
+            for alert_id, row in zip(alert_ids, rows, strict=True)
+        ]
+
     async def get_recent_insider_deals(
         self, 
         symbol: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[tuple] = None,
+        columns: Optional[List[str]] = None,
     ) -> List[InsiderDeal]:
-        """Get recent insider deals, optionally filtered by symbol"""
+        """Get recent insider deals, optionally filtered by symbol.
+
+        ``after`` is the (announce_date, id) key of the last deal already
+        served; ``columns`` restricts the attributes loaded on each row.
+        """
         
-        query = select(InsiderDeal).order_by(desc(InsiderDeal.announce_date))
+        query = select(InsiderDeal).order_by(
+            desc(InsiderDeal.announce_date), desc(InsiderDeal.id)
+        )
         
         if symbol:
             query = query.where(InsiderDeal.symbol == symbol)
+        if after:
+            query = query.where(
+                keyset_before((InsiderDeal.announce_date, InsiderDeal.id), after)
+            )
+        if columns:
+            query = query.options(
+                load_only(*(getattr(InsiderDeal, name) for name in columns))
+            )
         
         query = query.limit(limit)
         
@@ -382,27 +523,44 @@ class InsiderTrackingService:
     async def get_recent_block_trades(
         self,
         symbol: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[tuple] = None,
+        columns: Optional[List[str]] = None,
     ) -> list[dict[str, Any]]:
-        """Get recent block trades, optionally filtered by symbol"""
-
-        query = select(
-            BlockTrade.id.label("id"),
-            BlockTrade.symbol.label("symbol"),
-            BlockTrade.side.label("side"),
-            BlockTrade.quantity.label("quantity"),
-            BlockTrade.price.label("price"),
-            BlockTrade.value.label("value"),
-            BlockTrade.trade_time.label("trade_time"),
-            BlockTrade.volume_ratio.label("volume_ratio"),
-            BlockTrade.is_foreign.label("is_foreign"),
-            BlockTrade.is_proprietary.label("is_proprietary"),
-        ).order_by(desc(BlockTrade.trade_time))
+        """Get recent block trades, optionally filtered by symbol.
 
-        if symbol:
-            query = query.where(BlockTrade.symbol == symbol)
+        ``after`` is the (trade_time, id) key of the last trade already
+        served; ``columns`` restricts the selected columns.
+        """
 
-        query = query.limit(limit)
+        def _select(names: tuple[str, ...]):
+            if columns:
+                names = tuple(name for name in names if name in columns)
+            query = select(
+                *(getattr(BlockTrade, name).label(name) for name in names)
+            ).order_by(desc(BlockTrade.trade_time), desc(BlockTrade.id))
+            if symbol:
+                query = query.where(BlockTrade.symbol == symbol)
+            if after:
+                query = query.where(
+                    keyset_before((BlockTrade.trade_time, BlockTrade.id), after)
+                )
+            return query.limit(limit)
+
+        query = _select(
+            (
+                "id",
+                "symbol",
+                "side",
+                "quantity",
+                "price",
+                "value",
+                "trade_time",
+                "volume_ratio",
+                "is_foreign",
+                "is_proprietary",
+            )
+        )
 
         try:
             result = await self.db.execute(query)
@@ -416,19 +574,7 @@ class InsiderTrackingService:
 
             logger.warning("Block trades query fell back to legacy schema: %s", exc)
 
-        fallback_query = select(
-            BlockTrade.id.label("id"),
-            BlockTrade.symbol.label("symbol"),
-            BlockTrade.quantity.label("quantity"),
-            BlockTrade.price.label("price"),
-            BlockTrade.value.label("value"),
-            BlockTrade.trade_time.label("trade_time"),
-        ).order_by(desc(BlockTrade.trade_time))
-
-        if symbol:
-            fallback_query = fallback_query.where(BlockTrade.symbol == symbol)
-
-        fallback_query = fallback_query.limit(limit)
+        fallback_query = _select(("id", "symbol", "quantity", "price", "value", "trade_time"))
 
         try:
             result = await self.db.execute(fallback_query)
@@ -454,11 +600,18 @@ class InsiderTrackingService:
         self,
         user_id: Optional[int] = None,
         unread_only: bool = False,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[tuple] = None,
+        columns: Optional[List[str]] = None,
     ) -> List[InsiderAlert]:
-        """Get alerts for a user"""
+        """Get alerts for a user, newest first, seeking past the (timestamp, id) ``after`` key"""
         
-        query = select(InsiderAlert).order_by(desc(InsiderAlert.timestamp))
+        # Rule-trigger alerts owned by an account are private to its websocket
+        query = (
+            select(InsiderAlert)
+            .where(InsiderAlert.owner_id.is_(None))
+            .order_by(desc(InsiderAlert.timestamp), desc(InsiderAlert.id))
+        )
         
         if user_id:
             query = query.where(InsiderAlert.user_id == user_id)
@@ -466,6 +619,15 @@ class InsiderTrackingService:
         if unread_only:
             query = query.where(InsiderAlert.read == False)
         
+        if after:
+            query = query.where(
+                keyset_before((InsiderAlert.timestamp, InsiderAlert.id), after)
+            )
+        if columns:
+            query = query.options(
+                load_only(*(getattr(InsiderAlert, name) for name in columns))
+            )
+        
         query = query.limit(limit)
         
         result = await self.db.execute(query)
@@ -526,6 +688,42 @@ class InsiderTrackingService:
         
         return settings
     
+    async def list_alert_rules(self, user_id: str) -> List[AlertRule]:
+        """Get streaming alert rules for a user"""
+
+        result = await self.db.execute(
+            select(AlertRule).where(AlertRule.user_id == user_id).order_by(AlertRule.id)
+        )
+        return list(result.scalars().all())
+
+    async def create_alert_rule(self, user_id: str, **fields) -> AlertRule:
+        """Create a streaming alert rule for a user"""
+
+        rule = AlertRule(user_id=user_id, **fields)
+        rule.symbol = rule.symbol.upper()
+        self.db.add(rule)
+        await self.db.commit()
+        await self.db.refresh(rule)
+        logger.info(f"Created alert rule {rule.id} for user {user_id}")
+
+        return rule
+
+    async def delete_alert_rule(self, user_id: str, rule_id: int) -> bool:
+        """Delete a user's streaming alert rule"""
+
+        result = await self.db.execute(
+            select(AlertRule).where(AlertRule.id == rule_id, AlertRule.user_id == user_id)
+        )
+        rule = result.scalar_one_or_none()
+        if rule is None:
+            return False
+
+        await self.db.delete(rule)
+        await self.db.commit()
+        logger.info(f"Deleted alert rule {rule_id} for user {user_id}")
+
+        return True
+
     async def calculate_insider_sentiment(
         self, 
         symbol: str, 
@@ -212,7 +212,7 @@ async def ingest_kalshi_markets(
     Returns the count of markets written. Reuses the same polymarket
     on_conflict_do_update strategy by calling the helper directly.
     """
-    from vnibb.services.prediction_market_service import _upsert_prediction_market
+    from vnibb.services.prediction_market_service import upsert_prediction_market
 
     payloads = await fetch_kalshi_markets(client, limit, max_pages=max_pages)
     dialect_name = session.get_bind().dialect.name
@@ -220,7 +220,7 @@ async def ingest_kalshi_markets(
     for payload in payloads:
         market = normalize_kalshi_market(payload)
         try:
-            await session.execute(_upsert_prediction_market(market.to_values(), dialect_name))
+            await upsert_prediction_market(session, market.to_values(), dialect_name)
         except UnsupportedPredictionMarketDialectError:
             raise
         count += 1
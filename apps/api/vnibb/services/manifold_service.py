@@ -23,7 +23,7 @@ from vnibb.services.prediction_market_service import (
     NormalizedPredictionMarket,
     PredictionMarketValues,
     category_taxonomy,
-    _upsert_prediction_market,
+    upsert_prediction_market,
 )
 
 
@@ -122,7 +122,7 @@ async def ingest_manifold_markets(
         if market is None:
             continue
         values: PredictionMarketValues = market.to_values()
-        await session.execute(_upsert_prediction_market(values, dialect_name))
+        await upsert_prediction_market(session, values, dialect_name)
         count += 1
     await session.commit()
     return count
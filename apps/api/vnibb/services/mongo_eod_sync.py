@@ -29,6 +29,7 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import Any
 
+from vnibb.core.dataset_versions import DATASET_PRICES, dataset_versions
 from vnibb.services.data_pipeline import data_pipeline
 from vnibb.services.mongo_market_data_service import get_mongo_market_data_service
 
@@ -191,4 +192,6 @@ async def run_mongo_eod_sync(
         total_rows,
         failures,
     )
+    if total_rows:
+        await dataset_versions.bump(DATASET_PRICES)
     return {"symbols": processed, "rows": total_rows, "failures": failures}
@@ -6,12 +6,13 @@ import asyncio
 import json
 import logging
 import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from datetime import UTC, date, datetime, time, timedelta
 from functools import lru_cache
 from typing import Any
 
 from vnibb.core.config import settings
+from vnibb.core.instrumentation import mongo_command_listener
 
 logger = logging.getLogger(__name__)
 
@@ -150,6 +151,7 @@ class MongoMarketDataService:
                 serverSelectionTimeoutMS=settings.mongodb_timeout_ms,
                 connectTimeoutMS=settings.mongodb_timeout_ms,
                 socketTimeoutMS=max(settings.mongodb_timeout_ms, 20000),
+                event_listeners=[mongo_command_listener()],
             )
 
         return self._client[settings.mongodb_database][name]
@@ -519,6 +521,59 @@ class MongoMarketDataService:
             logger.warning("Mongo EOD range read failed for %s: %s", symbol_upper, exc)
             return []
 
+    async def get_eod_prices_between_many(
+        self,
+        symbols: Sequence[str],
+        *,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Deduplicated EOD rows for many symbols in one ``$in`` query."""
+
+        symbols_upper = sorted({symbol.upper() for symbol in symbols if symbol})
+        if not symbols_upper:
+            return {}
+        start_dt = datetime.combine(start_date, time.min)
+        end_dt = datetime.combine(end_date, time.max)
+
+        def _read() -> dict[str, list[dict[str, Any]]]:
+            coll = self._get_collection("market_prices_eod")
+            cursor = coll.find(
+                {
+                    "symbol": {"$in": symbols_upper},
+                    "tradeDate": {"$gte": start_dt, "$lte": end_dt},
+                },
+                {
+                    "_id": 0,
+                    "symbol": 1,
+                    "tradeDate": 1,
+                    "open": 1,
+                    "high": 1,
+                    "low": 1,
+                    "close": 1,
+                    "volume": 1,
+                    "source": 1,
+                    "sourceKey": 1,
+                    "priceUnit": 1,
+                    "updatedAt": 1,
+                    "observedAt": 1,
+                    "ingestedAt": 1,
+                    "sourceUpdatedAt": 1,
+                },
+            )
+            grouped: dict[str, list[dict[str, Any]]] = {}
+            for row in cursor:
+                grouped.setdefault(str(row.get("symbol") or "").upper(), []).append(row)
+            return {symbol: _dedup_eod_rows(rows) for symbol, rows in grouped.items()}
+
+        try:
+            return await asyncio.to_thread(_read)
+        except Exception as exc:
+            logger.warning(
+                "Mongo EOD multi-symbol read failed (%s symbols): %s", len(symbols_upper), exc
+            )
+            return {}
+
     async def get_universe_latest_eod(
         self,
         *,
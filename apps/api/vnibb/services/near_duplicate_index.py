@@ -0,0 +1,196 @@
+"""
+MinHash/LSH near-duplicate index for news headlines.
+
+:class:`NearDuplicateIndex` keeps a MinHash signature per entry and buckets
+it by LSH bands, so a lookup only verifies the entries that share at least
+one band with the query instead of scanning every accepted headline.
+
+LSH only proposes candidates; each one is verified with ``similarity``
+(Jaccard by default, or :func:`overlap_coefficient`). MinHash estimates
+Jaccard, so the band layout bounds recall against the exact pairwise scan:
+a pair at Jaccard ``J`` becomes a candidate with probability
+``1 - (1 - J**rows)**bands``. With the default 32 bands x 2 rows that is
+above 99.9% at ``J = 0.45``, and unrelated headlines (Jaccard ~0.05) collide
+in fewer than 8% of lookups. Overlap-coefficient callers should use more
+bands: a short headline contained in a long one still scores 1.0 there at a
+Jaccard of 0.2-0.3, which 64 bands x 2 rows catch 93-99.8% of the time.
+
+The index is incremental: entries can be added and evicted one at a time,
+and ``max_items`` bounds long-lived indexes such as the crawler's.
+Shingling is left to the caller. World news uses its stop-word filtered
+headline tokens. :func:`headline_shingles` produces syllable bigrams, which
+suit Vietnamese headlines whose words are mostly short syllables.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from collections.abc import Set as AbstractSet
+from itertools import pairwise
+
+import numpy as np
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.45
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 32
+
+# Universal hashing h(x) = (a*x + b) mod p with p = 2^31 - 1 keeps a*x below
+# 2^62, so the products never overflow uint64.
+_PRIME = np.uint64((1 << 31) - 1)
+
+
+def jaccard_similarity(left: AbstractSet[str], right: AbstractSet[str]) -> float:
+    """Jaccard similarity ``|A & B| / |A | B|``."""
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def overlap_coefficient(left: AbstractSet[str], right: AbstractSet[str]) -> float:
+    """Overlap coefficient ``|A & B| / min(|A|, |B|)``; 1.0 when one contains the other."""
+    if not left or not right:
+        return 0.0
+    return len(left & right) / min(len(left), len(right))
+
+
+def _token_hash(token: str) -> int:
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def headline_shingles(title: str) -> frozenset[str]:
+    """Diacritic-insensitive syllable bigrams of a headline."""
+    normalized = unicodedata.normalize("NFKD", (title or "").lower().replace("đ", "d"))
+    ascii_text = "".join(char for char in normalized if not unicodedata.combining(char))
+    tokens = re.findall(r"[a-z0-9]+", ascii_text)
+    if len(tokens) < 2:
+        return frozenset(tokens)
+    return frozenset(f"{left} {right}" for left, right in pairwise(tokens))
+
+
+class NearDuplicateIndex:
+    """Incremental MinHash/LSH index over token sets."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        max_items: int | None = None,
+        seed: int = 1,
+        similarity: Callable[[AbstractSet[str], AbstractSet[str]], float] = jaccard_similarity,
+    ):
+        if bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        self.threshold = threshold
+        self.similarity = similarity
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_items = max_items
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._entries: OrderedDict[Hashable, tuple[frozenset[str], tuple[bytes, ...]]] = (
+            OrderedDict()
+        )
+        self._buckets: list[dict[bytes, set[Hashable]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _band_keys(self, tokens: frozenset[str]) -> tuple[bytes, ...]:
+        hashes = np.fromiter(
+            (_token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens)
+        ) % _PRIME
+        signature = ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME).min(axis=1)
+        return tuple(
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        )
+
+    def _best_match(
+        self, tokens: frozenset[str], band_keys: tuple[bytes, ...]
+    ) -> Hashable | None:
+        best_key: Hashable | None = None
+        best_score = self.threshold
+        seen: set[Hashable] = set()
+        for buckets, band_key in zip(self._buckets, band_keys, strict=True):
+            for candidate in buckets.get(band_key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                score = self.similarity(tokens, self._entries[candidate][0])
+                if score >= best_score and (best_key is None or score > best_score):
+                    best_key, best_score = candidate, score
+        return best_key
+
+    def query(self, tokens: AbstractSet[str]) -> Hashable | None:
+        """Return the key of the most similar entry at or above the threshold."""
+        frozen = frozenset(tokens)
+        if not frozen or not self._entries:
+            return None
+        return self._best_match(frozen, self._band_keys(frozen))
+
+    def add(self, key: Hashable, tokens: AbstractSet[str]) -> None:
+        """Insert or replace ``key``; empty token sets are not indexed."""
+        frozen = frozenset(tokens)
+        self.remove(key)
+        if not frozen:
+            return
+        self._insert(key, frozen, self._band_keys(frozen))
+
+    def add_if_unique(self, key: Hashable, tokens: AbstractSet[str]) -> Hashable | None:
+        """Index ``key`` unless it near-duplicates an entry; return that entry's key."""
+        frozen = frozenset(tokens)
+        if not frozen:
+            return None
+        band_keys = self._band_keys(frozen)
+        match = self._best_match(frozen, band_keys) if self._entries else None
+        if match is not None and match != key:
+            return match
+        self.remove(key)
+        self._insert(key, frozen, band_keys)
+        return None
+
+    def remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for buckets, band_key in zip(self._buckets, entry[1], strict=True):
+            members = buckets.get(band_key)
+            if members is None:
+                continue
+            members.discard(key)
+            if not members:
+                del buckets[band_key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def _insert(self, key: Hashable, tokens: frozenset[str], band_keys: tuple[bytes, ...]) -> None:
+        self._entries[key] = (tokens, band_keys)
+        for buckets, band_key in zip(self._buckets, band_keys, strict=True):
+            buckets.setdefault(band_key, set()).add(key)
+        if self.max_items is not None:
+            while len(self._entries) > self.max_items:
+                oldest = next(iter(self._entries))
+                self.remove(oldest)
+
+
+__all__ = [
+    "DEFAULT_SIMILARITY_THRESHOLD",
+    "NearDuplicateIndex",
+    "headline_shingles",
+    "jaccard_similarity",
+    "overlap_coefficient",
+]
@@ -20,17 +20,23 @@ from typing import Any
 from urllib.parse import urlparse
 
 import httpx
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, desc, or_, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from vnibb.core.database import async_session_maker
-from vnibb.models.market_news import MarketNews
+from vnibb.core.pagination import keyset_before, keyset_before_nulls_last
+from vnibb.models.market_news import MarketNews, NewsSymbolLink
+from vnibb.services.near_duplicate_index import NearDuplicateIndex, headline_shingles
 from vnibb.services.sentiment_analyzer import sentiment_analyzer
+from vnibb.services.sentiment_queue import sentiment_queue
 
 logger = logging.getLogger(__name__)
 
 VIETNAM_TZ = timezone(timedelta(hours=7))
+# Recent headlines kept for cross-source near-duplicate detection.
+HEADLINE_INDEX_MAX_ITEMS = 5_000
 
 
 # Free-tier RSS feed map. Used when `vnstock_news` (premium) is unavailable
@@ -223,6 +229,7 @@ class NewsCrawlerService:
 
     def __init__(self):
         self._news_available = False
+        self._headline_index = NearDuplicateIndex(max_items=HEADLINE_INDEX_MAX_ITEMS)
         self._check_vnstock_news()
 
     def _check_vnstock_news(self):
@@ -234,6 +241,38 @@ class NewsCrawlerService:
         except ImportError:
             logger.info("News crawler disabled - vnstock_news not configured")
 
+    @staticmethod
+    def _headline_key(article: dict[str, Any]) -> str:
+        return str(article.get("link") or article.get("url") or article.get("title") or "")
+
+    def _drop_near_duplicates(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Skip syndicated copies of a stored or same-batch headline under another URL.
+
+        Articles are keyed by URL, so re-crawling the same URL still reaches
+        ``_store_article`` (which backfills missing publish dates). Kept
+        articles join the long-lived index only through ``_remember_headlines``
+        once their insert has committed.
+        """
+        batch_index = NearDuplicateIndex()
+        kept: list[dict[str, Any]] = []
+        for article in articles:
+            key = self._headline_key(article)
+            tokens = headline_shingles(str(article.get("title") or ""))
+            duplicate_of = self._headline_index.query(tokens)
+            if duplicate_of is None or duplicate_of == key:
+                duplicate_of = batch_index.add_if_unique(key, tokens)
+            if duplicate_of is not None and duplicate_of != key:
+                logger.debug("Skipping near-duplicate headline %s (matches %s)", key, duplicate_of)
+                continue
+            kept.append(article)
+        return kept
+
+    def _remember_headlines(self, articles: list[dict[str, Any]]) -> None:
+        for article in articles:
+            self._headline_index.add(
+                self._headline_key(article), headline_shingles(str(article.get("title") or ""))
+            )
+
     async def crawl_market_news(
         self,
         sources: list[str] | None = None,
@@ -291,7 +330,7 @@ class NewsCrawlerService:
         per_source_limit = max(1, limit // max(len(FREE_RSS_FEEDS), 1))
         target_sources = sources or list(FREE_RSS_FEEDS.keys())
 
-        total = 0
+        stored: list[dict[str, Any]] = []
         async with async_session_maker() as session:
             async with httpx.AsyncClient(
                 timeout=httpx.Timeout(10.0),
@@ -304,14 +343,17 @@ class NewsCrawlerService:
                         continue
                     for feed_url in feeds:
                         articles = await self._fetch_rss_feed(client, source, feed_url, per_source_limit)
-                        for article in articles:
+                        for article in self._drop_near_duplicates(articles):
                             try:
-                                await self._store_article(session, article)
-                                total += 1
+                                async with session.begin_nested():
+                                    await self._store_article(session, article)
+                                stored.append(article)
                             except Exception as exc:  # noqa: BLE001
                                 logger.debug(f"RSS store failed: {exc}")
 
             await session.commit()
+        self._remember_headlines(stored)
+        total = len(stored)
 
         logger.info(f"RSS fallback crawled {total} articles across {len(target_sources)} sources")
         return total
@@ -466,7 +508,7 @@ class NewsCrawlerService:
             return all_articles
 
         # Run crawling in thread pool
-        articles = await asyncio.to_thread(_sync_crawl)
+        articles = self._drop_near_duplicates(await asyncio.to_thread(_sync_crawl))
 
         if not articles:
             return 0
@@ -479,18 +521,20 @@ class NewsCrawlerService:
         # for every subsequent INSERT after the first failure, dropping
         # the storage rate to 0/N (QA-v2: market_news kept showing
         # "Crawled 62 articles · 0 stored" because of this).
+        stored: list[dict[str, Any]] = []
         async with async_session_maker() as session:
-            count = 0
             for article in articles:
                 try:
                     async with session.begin_nested():
                         await self._store_article(session, article)
-                    count += 1
+                    stored.append(article)
                 except Exception as e:
                     logger.warning(f"Failed to store article: {e}")
                     continue
 
             await session.commit()
+        self._remember_headlines(stored)
+        count = len(stored)
 
         logger.info(f"Crawled and stored {count} market news articles")
         return count
@@ -551,9 +595,39 @@ class NewsCrawlerService:
                 MarketNews.published_date.is_(None),
                 insert_stmt.excluded.published_date.is_not(None),
             ),
-        )
+        ).returning(MarketNews.id)
 
-        await session.execute(stmt)
+        # No row comes back when the URL already exists and nothing changed;
+        # that article was linked when it was first stored.
+        article_id = (await session.execute(stmt)).scalar_one_or_none()
+        if article_id is not None:
+            await self._link_article(
+                session,
+                article_id=article_id,
+                published_date=pub_date,
+                title=article.get("title", ""),
+                body=" ".join(
+                    filter(
+                        None,
+                        [
+                            article.get("description") or article.get("summary"),
+                            article.get("content"),
+                            article.get("category"),
+                        ],
+                    )
+                ),
+                related_symbols=related_symbols,
+            )
+
+    async def _link_article(self, session: AsyncSession, **kwargs: Any) -> None:
+        """Write ``news_symbol_link`` rows without failing the article store."""
+        from vnibb.services.news_symbol_linker import news_symbol_linker
+
+        try:
+            async with session.begin_nested():
+                await news_symbol_linker.link_article(session, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Symbol linking failed for article {kwargs.get('article_id')}: {exc}")
 
     async def analyze_unprocessed_articles(
         self,
@@ -694,6 +768,8 @@ class NewsCrawlerService:
         symbol: str | None = None,
         limit: int = 20,
         offset: int = 0,
+        after: tuple[datetime, int] | None = None,
+        columns: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get latest news from database with filters.
@@ -704,9 +780,26 @@ class NewsCrawlerService:
             symbol: Filter by related symbol
             limit: Number of articles to return
             offset: Pagination offset
+            after: (published_date, id) of the last article already served;
+                the page seeks past it instead of skipping ``offset`` rows,
+                which is then ignored. Undated legacy rows sort after every
+                dated one, newest id first, and are paged through too.
+            columns: Only load these ``MarketNews`` columns
         """
         async with async_session_maker() as session:
-            query = select(MarketNews).order_by(desc(MarketNews.published_date))
+            query = select(MarketNews).order_by(
+                desc(MarketNews.published_date).nulls_last(), desc(MarketNews.id)
+            )
+            if columns:
+                query = query.options(
+                    load_only(
+                        *(
+                            getattr(MarketNews, name)
+                            for name in columns
+                            if name in MarketNews.__table__.c
+                        )
+                    )
+                )
 
             # Apply filters
             filters = []
@@ -715,18 +808,102 @@ class NewsCrawlerService:
             if sentiment:
                 filters.append(MarketNews.sentiment == sentiment)
             if symbol:
-                filters.append(MarketNews.related_symbols.ilike(f"%{symbol}%"))
+                from vnibb.services.news_symbol_linker import (
+                    EXACT_SYMBOL_REASONS,
+                    news_symbol_linker,
+                )
+
+                upper_symbol = symbol.upper().strip()
+                # Keyword and peer links are relevance, not mentions: a symbol
+                # filter only follows links where the article names the ticker.
+                mentions = MarketNews.id.in_(
+                    select(NewsSymbolLink.article_id).where(
+                        NewsSymbolLink.symbol == upper_symbol,
+                        NewsSymbolLink.reason.in_(EXACT_SYMBOL_REASONS),
+                    )
+                )
+                if await news_symbol_linker.backfill_complete(session):
+                    filters.append(mentions)
+                else:
+                    # Archive not fully linked yet: unlinked rows match by substring.
+                    filters.append(
+                        or_(mentions, MarketNews.related_symbols.ilike(f"%{symbol}%"))
+                    )
+
+            if after is not None:
+                filters.append(
+                    keyset_before_nulls_last(MarketNews.published_date, MarketNews.id, after)
+                )
 
             if filters:
                 query = query.where(and_(*filters))
 
-            query = query.limit(limit).offset(offset)
+            query = query.limit(limit).offset(0 if after is not None else offset)
 
             result = await session.execute(query)
             news = result.scalars().all()
 
             return [n.to_dict() for n in news]
 
+    async def get_linked_news(
+        self,
+        symbol: str,
+        source: str | None = None,
+        sentiment: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        after: tuple[float, datetime, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Top articles for a symbol from ``news_symbol_link``.
+
+        Ordered by link score, then recency, over the whole archive. Rows
+        carry ``relevance_score``/``match_reason`` from the link. ``after``
+        is the (score, published_date, article_id) key of the last row
+        already served.
+        """
+        upper_symbol = symbol.upper().strip()
+        if not upper_symbol:
+            return []
+
+        async with async_session_maker() as session:
+            query = (
+                select(MarketNews, NewsSymbolLink.score, NewsSymbolLink.reason)
+                .join(NewsSymbolLink, NewsSymbolLink.article_id == MarketNews.id)
+                .where(NewsSymbolLink.symbol == upper_symbol)
+                .order_by(
+                    desc(NewsSymbolLink.score),
+                    desc(NewsSymbolLink.published_date),
+                    desc(NewsSymbolLink.article_id),
+                )
+            )
+            if source:
+                query = query.where(MarketNews.source == source)
+            if sentiment:
+                query = query.where(MarketNews.sentiment == sentiment)
+            if after is not None:
+                query = query.where(
+                    keyset_before(
+                        (
+                            NewsSymbolLink.score,
+                            NewsSymbolLink.published_date,
+                            NewsSymbolLink.article_id,
+                        ),
+                        after,
+                    )
+                )
+
+            result = await session.execute(query.limit(limit).offset(offset))
+            return [
+                {
+                    **news.to_dict(),
+                    "relevance_score": float(score),
+                    "match_reason": reason,
+                    "matched_symbols": [upper_symbol],
+                }
+                for news, score, reason in result.all()
+            ]
+
     async def search_news(
         self,
         symbol: str,
@@ -789,9 +966,7 @@ class NewsCrawlerService:
                 )
 
             if pending_articles:
-                sentiments = await sentiment_analyzer.analyze_batch(
-                    pending_articles, max_concurrent=6
-                )
+                sentiments = await sentiment_queue.read(pending_articles)
                 for index, sentiment in zip(pending_indexes, sentiments, strict=False):
                     article_dicts[index]["sentiment"] = sentiment.get("sentiment", "neutral")
                     article_dicts[index]["sentiment_score"] = sentiment.get("confidence")
@@ -4,14 +4,15 @@ from datetime import datetime, timedelta
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import select
 
 from vnibb.core.database import async_session_maker
+from vnibb.core.pagination import decode_cursor, next_cursor
 from vnibb.models.stock import Stock
 from vnibb.providers.vnstock.company_news import CompanyNewsQueryParams, VnstockCompanyNewsFetcher
 from vnibb.services.news_crawler import news_crawler
-from vnibb.services.sentiment_analyzer import sentiment_analyzer
+from vnibb.services.sentiment_queue import sentiment_queue
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,18 @@ class NewsSentiment(StrEnum):
     BEARISH = "bearish"
 
 
+# Cursor scopes: the chronological feed seeks on (published_date, id), the
+# related-news feed on its rank key (relevance, published_date, id).
+FEED_CURSOR = "news.feed"
+RELATED_CURSOR = "news.related"
+
+# Fields the runtime sentiment pass fills in, and the columns it reads.
+SENTIMENT_FIELDS = frozenset(
+    {"sentiment", "sentiment_score", "ai_summary", "related_symbols", "sectors"}
+)
+_SENTIMENT_INPUT_COLUMNS = ("title", "summary", "content", *sorted(SENTIMENT_FIELDS))
+
+
 class NewsItem(BaseModel):
     id: str
     title: str
@@ -48,6 +61,8 @@ class NewsResponse(BaseModel):
     has_more: bool
     mode: str = "all"
     fallback_used: bool = False
+    # Served in the X-Next-Cursor header by the endpoint, not in the body.
+    next_cursor: str | None = Field(default=None, exclude=True)
 
 
 GENERIC_KEYWORDS = {
@@ -219,7 +234,9 @@ async def _enrich_sentiment_rows(rows: list[dict[str, Any]]) -> list[dict[str, A
     if not pending_articles:
         return normalized_rows
 
-    sentiments = await sentiment_analyzer.analyze_batch(pending_articles, max_concurrent=6)
+    # Never waits on the model: memoized results or a rule-based stand-in,
+    # with misses scored by the background sentiment queue.
+    sentiments = await sentiment_queue.read(pending_articles)
 
     for index, sentiment in zip(pending_indexes, sentiments, strict=False):
         row = normalized_rows[index]
@@ -549,6 +566,101 @@ async def get_company_news_rows(symbol: str, limit: int = 20) -> list[dict[str,
     return await _enrich_sentiment_rows(merged_rows[:limit])
 
 
+async def _load_linked_rows(
+    symbol: str,
+    *,
+    source: str | None,
+    sentiment: str | None,
+    limit: int,
+    after: tuple[float, datetime, int] | None = None,
+) -> list[dict[str, Any]]:
+    try:
+        return await news_crawler.get_linked_news(
+            symbol=symbol,
+            source=source,
+            sentiment=sentiment,
+            limit=limit,
+            offset=0,
+            after=after,
+        )
+    except Exception as error:
+        logger.debug(
+            "Linked news query failed",
+            extra={"symbol": symbol, "error": str(error)},
+        )
+        return []
+
+
+def _rank_related_rows(
+    linked_rows: list[dict[str, Any]],
+    recent_rows: list[dict[str, Any]],
+    context: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Rescore candidates, keeping the ingest-time link score when it is higher."""
+    ranked: dict[str, dict[str, Any]] = {}
+    for row in [*linked_rows, *recent_rows]:
+        stored_score = float(row.get("relevance_score") or 0)
+        stored_reason = row.get("match_reason")
+        scored = _score_news_row(row, context)
+        if stored_score > float(scored.get("relevance_score") or 0):
+            scored["relevance_score"] = stored_score
+            scored["match_reason"] = scored.get("match_reason") or stored_reason
+            for matched in row.get("matched_symbols") or []:
+                if matched not in scored["matched_symbols"]:
+                    scored["matched_symbols"].append(matched)
+        if float(scored.get("relevance_score") or 0) <= 0:
+            continue
+        key = str(row.get("id") or row.get("url") or row.get("title") or "")
+        current = ranked.get(key)
+        if current is None or float(scored["relevance_score"]) > float(
+            current.get("relevance_score") or 0
+        ):
+            ranked[key] = scored
+
+    rows = list(ranked.values())
+    rows.sort(key=_related_rank_key, reverse=True)
+    return rows
+
+
+def _article_id(row: dict[str, Any]) -> int | None:
+    try:
+        return int(row.get("id"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _related_rank_key(row: dict[str, Any]) -> tuple[float, datetime, int]:
+    return (
+        float(row.get("relevance_score") or 0),
+        _parse_published_at(row.get("published_date") or row.get("published_at")),
+        _article_id(row) or 0,
+    )
+
+
+def _feed_key(row: dict[str, Any]) -> tuple[datetime | None, int] | None:
+    """(published_date, id) of a feed row; undated rows keep a None date."""
+    published = row.get("published_date") or row.get("published_at")
+    article_id = _article_id(row)
+    if article_id is None:
+        return None
+    return (_parse_published_at(published) if published else None), article_id
+
+
+def decode_news_cursor(token: str | None, *, related: bool) -> tuple[Any, ...] | None:
+    return decode_cursor(token, RELATED_CURSOR if related else FEED_CURSOR)
+
+
+def news_next_cursor(
+    rows: list[dict[str, Any]], *, related: bool, fallback_used: bool, limit: int
+) -> str | None:
+    """Cursor for the page after ``rows``; market-wide fallback pages do not continue."""
+    if fallback_used:
+        return None
+    if related:
+        return next_cursor(RELATED_CURSOR, rows, _related_rank_key, limit)
+    return next_cursor(FEED_CURSOR, rows, _feed_key, limit)
+
+
 async def get_ranked_news_rows(
     *,
     source: str | None = None,
@@ -557,32 +669,46 @@ async def get_ranked_news_rows(
     limit: int = 20,
     offset: int = 0,
     mode: str = "all",
+    after: tuple[Any, ...] | None = None,
+    columns: list[str] | None = None,
 ) -> tuple[list[dict[str, Any]], bool]:
+    """Rows for one feed page.
+
+    ``after`` is a decoded keyset cursor (see ``news_next_cursor``) and
+    replaces ``offset``. ``columns`` narrows the chronological feed to those
+    article columns; the sentiment pass and its input columns are skipped
+    unless a sentiment-derived field is requested. Related mode always loads
+    full rows because rescoring reads the article text.
+    """
     upper_symbol = symbol.upper().strip() if symbol else None
     related_mode = upper_symbol is not None and mode == "related"
 
     try:
         if related_mode:
-            candidate_limit = min(max(limit * 6, 60), 180)
-            results = await news_crawler.get_latest_news(
-                source=source,
-                sentiment=sentiment,
-                symbol=None,
-                limit=candidate_limit,
-                offset=0,
+            # Indexed top-K from ``news_symbol_link`` over the whole archive;
+            # the recent-window rescoring only runs when the links cannot
+            # fill the page (archive not backfilled, sector-only matches).
+            # Behind a cursor the links seek past the last served key; the
+            # doubled window absorbs rows rescoring lifted onto earlier pages.
+            window = 2 * limit if after is not None else offset + limit
+            linked_rows = await _load_linked_rows(
+                upper_symbol, source=source, sentiment=sentiment, limit=window, after=after
             )
+            recent_rows: list[dict[str, Any]] = []
+            if len(linked_rows) < window:
+                candidate_limit = min(max(limit * 6, 60), 180)
+                recent_rows = await news_crawler.get_latest_news(
+                    source=source,
+                    sentiment=sentiment,
+                    symbol=None,
+                    limit=candidate_limit,
+                    offset=0,
+                )
             context = await _load_symbol_context(upper_symbol)
-            scored_rows = [_score_news_row(row, context) for row in results]
-            relevant_rows = [
-                row for row in scored_rows if float(row.get("relevance_score") or 0) > 0
-            ]
-            relevant_rows.sort(
-                key=lambda row: (
-                    float(row.get("relevance_score") or 0),
-                    _parse_published_at(row.get("published_date") or row.get("published_at")),
-                ),
-                reverse=True,
-            )
+            relevant_rows = _rank_related_rows(linked_rows, recent_rows, context)
+            if after is not None:
+                page = [row for row in relevant_rows if _related_rank_key(row) < after]
+                return await _enrich_sentiment_rows(page[:limit]), False
             if relevant_rows:
                 enriched_rows = await _enrich_sentiment_rows(relevant_rows[offset : offset + limit])
                 return enriched_rows, False
@@ -606,13 +732,29 @@ async def get_ranked_news_rows(
                 enriched_fallback_rows = await _enrich_sentiment_rows(fallback_rows)
                 return enriched_fallback_rows, True
         else:
+            enrich = columns is None or not SENTIMENT_FIELDS.isdisjoint(columns)
+            if columns is not None:
+                columns = list(
+                    dict.fromkeys(
+                        [
+                            "id",
+                            "published_date",
+                            *columns,
+                            *(_SENTIMENT_INPUT_COLUMNS if enrich else ()),
+                        ]
+                    )
+                )
             results = await news_crawler.get_latest_news(
                 source=source,
                 sentiment=sentiment,
                 symbol=upper_symbol if upper_symbol and mode != "all" else None,
                 limit=limit,
                 offset=offset,
+                after=after,
+                columns=columns,
             )
+            if not enrich:
+                return results, False
             enriched_results = await _enrich_sentiment_rows(results)
             return enriched_results, False
     except Exception as error:
@@ -626,6 +768,8 @@ async def get_ranked_news_rows(
             },
         )
 
+    if after is not None:
+        return [], False
     fallback_rows = await _hydrate_company_news_fallback(symbol=upper_symbol, limit=limit)
     enriched_fallback_rows = await _enrich_sentiment_rows(fallback_rows[offset : offset + limit])
     return enriched_fallback_rows, False
@@ -638,11 +782,13 @@ async def get_news_flow(
     limit: int = 20,
     offset: int = 0,
     mode: str = "related",
+    cursor: str | None = None,
 ) -> NewsResponse:
     """
     Fetch aggregated news from database via news_crawler.
     """
     symbol = symbols[0].strip().upper() if symbols and symbols[0].strip() else None
+    related = symbol is not None and mode == "related"
 
     _ = sector
     results, fallback_used = await get_ranked_news_rows(
@@ -651,6 +797,7 @@ async def get_news_flow(
         limit=limit,
         offset=offset,
         mode=mode,
+        after=decode_news_cursor(cursor, related=related),
     )
 
     items = [_to_news_item(row) for row in results]
@@ -661,4 +808,7 @@ async def get_news_flow(
         has_more=len(items) == limit,
         mode=mode,
         fallback_used=fallback_used,
+        next_cursor=news_next_cursor(
+            results, related=related, fallback_used=fallback_used, limit=limit
+        ),
     )
@@ -0,0 +1,427 @@
+"""
+Ingest-time symbol linking for market news.
+
+Company-news relevance used to be computed at read time: ``get_latest_news``
+filtered with ``related_symbols ILIKE '%SYM%'`` and related-mode ranking
+rescored only the newest 60-180 rows, so older relevant articles were never
+considered. This module scores every stored article against the whole
+ticker universe once, when it is ingested, and writes the hits to
+``news_symbol_link``. Reads become an indexed top-K by score and recency.
+
+Matching uses two Aho-Corasick automata, one over tickers (matched
+case-sensitively on word boundaries) and one over company keywords (matched
+on the lower-cased text). Peer relevance is derived from the mentioned
+tickers through an inverted peer map. Scores and reasons follow the ladder
+in ``news_service._score_news_row``; sector keywords are left to the
+read-time scorer because they would link an article to entire industries.
+
+A completed :meth:`NewsSymbolLinker.backfill` records itself in ``app_kv``;
+until then readers also match unlinked rows on ``related_symbols``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vnibb.core.database import async_session_maker
+from vnibb.models.app_kv import AppKeyValue
+from vnibb.models.market_news import MarketNews, NewsSymbolLink
+from vnibb.models.stock import Stock
+from vnibb.services.news_service import _extract_keywords, _normalize_text, _parse_symbols
+
+logger = logging.getLogger(__name__)
+
+LEXICON_TTL_SECONDS = 6 * 60 * 60
+PEER_LIMIT = 6
+# Keywords shared by more companies than this ("vietnam", "industries") say
+# nothing about which company an article is about.
+MAX_KEYWORD_OWNERS = 3
+MAX_LINKS_PER_ARTICLE = 40
+BACKFILL_BATCH_SIZE = 500
+
+REASON_TITLE = "exact_symbol_title"
+REASON_RELATED = "exact_symbol_related"
+REASON_BODY = "exact_symbol_body"
+REASON_COMPANY_KEYWORD = "company_keyword"
+REASON_PEER = "peer_mentions"
+# Links meaning "this article names the ticker", as opposed to keyword/peer relevance.
+EXACT_SYMBOL_REASONS = (REASON_TITLE, REASON_RELATED, REASON_BODY)
+BACKFILL_STATE_KEY = "news_symbol_link_backfill"
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher (goto/fail automaton)."""
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[str]] = [[]]
+        self._built = False
+
+    def __len__(self) -> int:
+        return sum(len(output) for output in self._output)
+
+    def add(self, pattern: str) -> None:
+        if self._built:
+            raise RuntimeError("patterns must be added before the automaton is built")
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        if pattern not in self._output[state]:
+            self._output[state].append(pattern)
+
+    def build(self) -> AhoCorasick:
+        if self._built:
+            return self
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield ``(start, pattern)`` for every occurrence, overlaps included."""
+        if not self._built:
+            self.build()
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._output[state]:
+                yield index - len(pattern) + 1, pattern
+
+
+def _on_word_boundary(text: str, start: int, end: int) -> bool:
+    before = text[start - 1] if start > 0 else ""
+    after = text[end] if end < len(text) else ""
+    return not before.isalnum() and not after.isalnum()
+
+
+def _bounded_matches(matcher: AhoCorasick, text: str) -> set[str]:
+    return {
+        pattern
+        for start, pattern in matcher.iter_matches(text)
+        if _on_word_boundary(text, start, start + len(pattern))
+    }
+
+
+@dataclass(frozen=True)
+class SymbolLink:
+    symbol: str
+    score: float
+    reason: str
+
+
+@dataclass
+class SymbolLexicon:
+    """Ticker, company-keyword and peer lookups for the whole universe."""
+
+    symbols: frozenset[str] = frozenset()
+    peers: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    peer_of: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    keyword_owners: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    ticker_matcher: AhoCorasick = field(default_factory=AhoCorasick)
+    keyword_matcher: AhoCorasick = field(default_factory=AhoCorasick)
+
+    def link(
+        self,
+        *,
+        title: Any,
+        body: Any = None,
+        related_symbols: Any = None,
+    ) -> list[SymbolLink]:
+        """Score one article against every symbol; best links first."""
+        title_text = str(title or "")
+        body_text = str(body or "")
+        title_tickers = _bounded_matches(self.ticker_matcher, title_text)
+        body_tickers = _bounded_matches(self.ticker_matcher, body_text)
+        related = set(_parse_symbols(related_symbols))
+
+        scores: dict[str, tuple[float, str]] = {}
+
+        def _offer(symbol: str, score: float, reason: str) -> None:
+            current = scores.get(symbol)
+            if current is None:
+                scores[symbol] = (score, reason)
+            elif score > current[0]:
+                scores[symbol] = (score, current[1])
+
+        for symbol in title_tickers:
+            _offer(symbol, 1.0, REASON_TITLE)
+        for symbol in related - title_tickers:
+            _offer(symbol, 0.97, REASON_RELATED)
+        for symbol in body_tickers - title_tickers - related:
+            _offer(symbol, 0.94, REASON_BODY)
+
+        keyword_text = _normalize_text(f"{title_text} {body_text}")
+        for keyword in _bounded_matches(self.keyword_matcher, keyword_text):
+            for symbol in self.keyword_owners.get(keyword, ()):
+                if scores.get(symbol, (0.0, ""))[0] < 0.9:
+                    _offer(symbol, 0.84, REASON_COMPANY_KEYWORD)
+
+        peer_hits: dict[str, int] = defaultdict(int)
+        for mentioned in title_tickers | related | body_tickers:
+            for symbol in self.peer_of.get(mentioned, ()):
+                peer_hits[symbol] += 1
+        for symbol, hits in peer_hits.items():
+            _offer(symbol, round(min(0.78, 0.62 + hits * 0.06), 3), REASON_PEER)
+
+        links = [SymbolLink(symbol, score, reason) for symbol, (score, reason) in scores.items()]
+        links.sort(key=lambda link: (-link.score, link.symbol))
+        return links[:MAX_LINKS_PER_ARTICLE]
+
+
+def _peer_group_key(stock: Mapping[str, Any]) -> tuple[str, str] | None:
+    # Same precedence as ``news_service._load_symbol_context``.
+    for column in ("industry", "sector", "exchange"):
+        value = stock.get(column)
+        if value:
+            return column, str(value)
+    return None
+
+
+def build_symbol_lexicon(stocks: Iterable[Mapping[str, Any]]) -> SymbolLexicon:
+    """Build the matching automata from stock rows.
+
+    Each row needs ``symbol`` and may carry ``short_name``, ``company_name``,
+    ``industry``, ``sector`` and ``exchange``.
+    """
+    rows = []
+    for stock in stocks:
+        symbol = str(stock.get("symbol") or "").strip().upper()
+        if symbol:
+            rows.append({**stock, "symbol": symbol})
+
+    groups: dict[tuple[str, str], list[str]] = defaultdict(list)
+    for stock in rows:
+        for column in ("industry", "sector", "exchange"):
+            if stock.get(column):
+                groups[(column, str(stock[column]))].append(stock["symbol"])
+    for members in groups.values():
+        members.sort()
+
+    peers: dict[str, tuple[str, ...]] = {}
+    peer_of: dict[str, list[str]] = defaultdict(list)
+    owners: dict[str, set[str]] = defaultdict(set)
+    ticker_matcher = AhoCorasick()
+    for stock in rows:
+        symbol = stock["symbol"]
+        ticker_matcher.add(symbol)
+        group = _peer_group_key(stock)
+        if group is not None:
+            stock_peers = tuple(
+                member for member in groups[group] if member != symbol
+            )[:PEER_LIMIT]
+            peers[symbol] = stock_peers
+            for peer in stock_peers:
+                peer_of[peer].append(symbol)
+        for keyword in _extract_keywords(stock.get("short_name"), stock.get("company_name")):
+            owners[keyword].add(symbol)
+
+    keyword_owners = {
+        keyword: tuple(sorted(symbols))
+        for keyword, symbols in owners.items()
+        if len(symbols) <= MAX_KEYWORD_OWNERS
+    }
+    keyword_matcher = AhoCorasick()
+    for keyword in keyword_owners:
+        keyword_matcher.add(keyword)
+
+    return SymbolLexicon(
+        symbols=frozenset(stock["symbol"] for stock in rows),
+        peers=peers,
+        peer_of={ticker: tuple(symbols) for ticker, symbols in peer_of.items()},
+        keyword_owners=keyword_owners,
+        ticker_matcher=ticker_matcher.build(),
+        keyword_matcher=keyword_matcher.build(),
+    )
+
+
+def _article_body(article: MarketNews) -> str:
+    return " ".join(filter(None, [article.summary, article.content, article.category]))
+
+
+class NewsSymbolLinker:
+    """Caches the lexicon and writes ``news_symbol_link`` rows."""
+
+    def __init__(self, ttl_seconds: float = LEXICON_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lexicon: SymbolLexicon | None = None
+        self._built_at = 0.0
+        self._lock = asyncio.Lock()
+        self._backfilled = False
+
+    def invalidate(self) -> None:
+        self._lexicon = None
+
+    async def backfill_complete(self, session: AsyncSession) -> bool:
+        """Whether a full backfill has linked the archive (sticky once true)."""
+        if not self._backfilled:
+            record = await session.get(AppKeyValue, BACKFILL_STATE_KEY)
+            self._backfilled = bool(record and record.value and record.value.get("completed_at"))
+        return self._backfilled
+
+    async def get_lexicon(self, session: AsyncSession) -> SymbolLexicon:
+        lexicon = self._lexicon
+        if lexicon is not None and time.monotonic() - self._built_at < self.ttl_seconds:
+            return lexicon
+        async with self._lock:
+            if self._lexicon is not None and time.monotonic() - self._built_at < self.ttl_seconds:
+                return self._lexicon
+            result = await session.execute(
+                select(
+                    Stock.symbol,
+                    Stock.short_name,
+                    Stock.company_name,
+                    Stock.industry,
+                    Stock.sector,
+                    Stock.exchange,
+                )
+            )
+            lexicon = build_symbol_lexicon(dict(row) for row in result.mappings().all())
+            self._lexicon = lexicon
+            self._built_at = time.monotonic()
+            logger.info(
+                "Built news symbol lexicon: %s tickers, %s company keywords",
+                len(lexicon.symbols),
+                len(lexicon.keyword_owners),
+            )
+            return lexicon
+
+    async def link_article(
+        self,
+        session: AsyncSession,
+        *,
+        article_id: int,
+        published_date: datetime | None,
+        title: Any,
+        body: Any = None,
+        related_symbols: Any = None,
+    ) -> list[SymbolLink]:
+        """Replace the links of one stored article."""
+        lexicon = await self.get_lexicon(session)
+        links = lexicon.link(title=title, body=body, related_symbols=related_symbols)
+        await session.execute(delete(NewsSymbolLink).where(NewsSymbolLink.article_id == article_id))
+        if links:
+            now = datetime.utcnow()
+            await session.execute(
+                insert(NewsSymbolLink),
+                [
+                    {
+                        "symbol": link.symbol,
+                        "article_id": article_id,
+                        "score": link.score,
+                        "reason": link.reason,
+                        "published_date": published_date,
+                        "created_at": now,
+                    }
+                    for link in links
+                ],
+            )
+        return links
+
+    async def backfill(
+        self,
+        session: AsyncSession | None = None,
+        *,
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        after_id: int = 0,
+    ) -> dict[str, int]:
+        """Relink every stored article in id order, committing per batch."""
+        if session is None:
+            async with async_session_maker() as owned_session:
+                return await self.backfill(owned_session, batch_size=batch_size, after_id=after_id)
+
+        self.invalidate()
+        articles_seen = 0
+        links_written = 0
+        last_id = after_id
+        while True:
+            result = await session.execute(
+                select(MarketNews)
+                .where(MarketNews.id > last_id)
+                .order_by(MarketNews.id.asc())
+                .limit(batch_size)
+            )
+            batch = result.scalars().all()
+            if not batch:
+                break
+            for article in batch:
+                links = await self.link_article(
+                    session,
+                    article_id=article.id,
+                    published_date=article.published_date,
+                    title=article.title,
+                    body=_article_body(article),
+                    related_symbols=article.related_symbols,
+                )
+                links_written += len(links)
+            articles_seen += len(batch)
+            last_id = batch[-1].id
+            await session.commit()
+
+        now = datetime.utcnow()
+        state = await session.get(AppKeyValue, BACKFILL_STATE_KEY)
+        payload = {"completed_at": now.isoformat(), "last_id": last_id}
+        if state:
+            state.value = payload
+            state.updated_at = now
+        else:
+            session.add(AppKeyValue(key=BACKFILL_STATE_KEY, value=payload, updated_at=now))
+        await session.commit()
+        self._backfilled = True
+
+        logger.info(
+            "News symbol link backfill: %s articles, %s links", articles_seen, links_written
+        )
+        return {"articles": articles_seen, "links": links_written, "last_id": last_id}
+
+
+news_symbol_linker = NewsSymbolLinker()
+
+
+async def run_news_symbol_link_backfill() -> dict[str, int]:
+    """Wrapper for admin/background tasks."""
+    return await news_symbol_linker.backfill()
+
+
+__all__ = [
+    "AhoCorasick",
+    "EXACT_SYMBOL_REASONS",
+    "NewsSymbolLinker",
+    "SymbolLexicon",
+    "SymbolLink",
+    "build_symbol_lexicon",
+    "news_symbol_linker",
+    "run_news_symbol_link_backfill",
+]
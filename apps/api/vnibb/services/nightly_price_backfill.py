@@ -16,8 +16,9 @@ Triggered after HOSE close (set in `core/scheduler.py`).
 from __future__ import annotations
 
 import logging
-from datetime import date, timedelta
+from datetime import date
 
+from vnibb.core.trading_calendar import get_trading_calendar
 from vnibb.services.data_pipeline import data_pipeline
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,8 @@ async def run_nightly_price_backfill() -> int:
     """
 
     end = date.today()
-    start = end - timedelta(days=5)
+    calendar = get_trading_calendar()
+    start = calendar.session_date(calendar.session_ordinal(end) - 4)
     symbols = list(dict.fromkeys(ACTIVE_TIER_1))
     logger.info(
         "Nightly price backfill: %d symbols, %s -> %s",
@@ -0,0 +1,286 @@
+"""
+Basket-wide pair scan: correlations, Engle-Granger style diagnostics, ranking.
+
+``/quant/{symbol}/pair/{other}`` diagnoses one pair after loading two frames.
+:func:`scan_pairs` takes an aligned :class:`~vnibb.services.price_panel.ClosePanel`
+for a whole basket and evaluates all N*(N-1)/2 pairs at once:
+
+* return correlation matrix (pairwise overlap) and the latest 63-session one;
+* the rolling 63-session correlation series of every returned candidate;
+* OLS hedge ratio of log prices, fixed-lag ADF t-stat on the residual,
+  AR(1) half-life and spread z-score, per pair, as column-wise array sums
+  over a ``sessions x pairs`` block (closed-form 2x2 normal equations, no
+  per-pair ``lstsq``).
+
+Each pair is measured from the first session both symbols have a close;
+interior gaps are forward-filled. The statistics match
+``_compute_pair_diagnostics`` for the same aligned window.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from vnibb.services.price_panel import ClosePanel, forward_fill
+
+# Engle-Granger step-2 ADF approximate critical values (cointegration residual,
+# constant only, large sample, MacKinnon). Labeled approximate downstream.
+ADF_COINTEGRATION_CRITICAL = {"1%": -3.90, "5%": -3.34, "10%": -3.04}
+ADF_CAVEAT = (
+    "Approximate Engle-Granger step-2 ADF (fixed lag=1, MacKinnon 5% ≈ -3.34). "
+    "Indicative only — not a formal cointegration test."
+)
+PAIR_MIN_OVERLAP = 60
+ROLLING_CORRELATION_WINDOW = 63
+MAX_BASKET_SYMBOLS = 60
+# Sessions x pairs cells per vectorized block (~2 MB per float array), so long
+# histories are processed in narrower blocks instead of one huge matrix.
+PAIR_BLOCK_CELLS = 262_144
+
+
+def adf_verdict(adf_tstat: float | None) -> str | None:
+    if adf_tstat is None:
+        return None
+    if adf_tstat <= ADF_COINTEGRATION_CRITICAL["5%"]:
+        return "residual stationary at ~5% (approx)"
+    if adf_tstat <= ADF_COINTEGRATION_CRITICAL["10%"]:
+        return "residual stationary at ~10% (approx)"
+    return "no stationarity evidence (approx)"
+
+
+def _round(value: Any, decimals: int = 4) -> float | None:
+    if value is None:
+        return None
+    numeric = float(value)
+    if not np.isfinite(numeric):
+        return None
+    return round(numeric, decimals)
+
+
+def _pairwise_correlation(returns: np.ndarray) -> np.ndarray:
+    """Pearson correlation of every column pair over the rows both observe."""
+    observed = (~np.isnan(returns)).astype(float)
+    values = np.where(np.isnan(returns), 0.0, returns)
+    count = observed.T @ observed
+    sum_x = values.T @ observed
+    sum_xy = values.T @ values
+    sum_xx = (values**2).T @ observed
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = count * sum_xy - sum_x * sum_x.T
+        var = (count * sum_xx - sum_x**2) * (count * sum_xx - sum_x**2).T
+        corr = cov / np.sqrt(var)
+    corr[count < 3] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _window_correlation(returns: np.ndarray, window: int) -> np.ndarray:
+    """Correlation over the last ``window`` rows; NaN for columns with gaps there."""
+    size = returns.shape[1]
+    corr = np.full((size, size), np.nan)
+    if returns.shape[0] < window:
+        return corr
+    tail = returns[-window:]
+    complete = ~np.isnan(tail).any(axis=0)
+    if complete.sum() < 2:
+        return corr
+    block = tail[:, complete]
+    centred = block - block.mean(axis=0)
+    norms = np.sqrt((centred**2).sum(axis=0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sub = (centred.T @ centred) / np.outer(norms, norms)
+    index = np.flatnonzero(complete)
+    corr[np.ix_(index, index)] = np.clip(sub, -1.0, 1.0)
+    return corr
+
+
+def _rolling_pair_correlation(
+    returns: np.ndarray, left: np.ndarray, right: np.ndarray, window: int
+) -> np.ndarray:
+    """``(windows x pairs)`` correlation of each trailing ``window``; NaN where it has gaps."""
+    if returns.shape[0] < window or not left.size:
+        return np.full((max(returns.shape[0] - window + 1, 0), left.size), np.nan)
+    a = sliding_window_view(returns[:, left], window, axis=0)
+    b = sliding_window_view(returns[:, right], window, axis=0)
+    a = a - a.mean(axis=-1, keepdims=True)
+    b = b - b.mean(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = (a * b).sum(axis=-1) / np.sqrt((a**2).sum(axis=-1) * (b**2).sum(axis=-1))
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _pair_block_stats(
+    logs: np.ndarray, first_row: np.ndarray, left: np.ndarray, right: np.ndarray
+) -> dict[str, np.ndarray]:
+    """Regress ``left`` on ``right`` log prices for a block of pairs at once."""
+    sessions = logs.shape[0]
+    start = np.maximum(first_row[left], first_row[right])
+    count = (sessions - start).astype(float)
+    mask = np.arange(sessions)[:, None] >= start[None, :]
+    a = np.where(mask, logs[:, left], 0.0)
+    b = np.where(mask, logs[:, right], 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_a = a.sum(axis=0) / count
+        mean_b = b.sum(axis=0) / count
+        dev_b = (b - mean_b) * mask
+        var_b = (dev_b**2).sum(axis=0)
+        hedge = ((a - mean_a) * dev_b).sum(axis=0) / var_b
+        intercept = mean_a - hedge * mean_b
+        hedge[var_b <= 1e-18] = np.nan
+        residuals = (a - intercept - hedge * b) * mask
+
+        # AR(1) half-life and z-score on the demeaned residual.
+        centred = (residuals - residuals.sum(axis=0) / count) * mask
+        phi = (centred[1:] * centred[:-1]).sum(axis=0) / (centred[:-1] ** 2).sum(axis=0)
+        half_life = np.where((phi > 0) & (phi < 1), np.log(0.5) / np.log(phi), np.nan)
+        spread_std = np.sqrt((centred**2).sum(axis=0) / (count - 1))
+        z_score = np.where(spread_std > 1e-18, centred[-1] / spread_std, np.nan)
+
+        # ADF, fixed lag 1, no constant: dy_t = gamma * y_{t-1} + delta * dy_{t-1}.
+        # Row k is usable once y_{k-2} is inside the pair's window.
+        adf_mask = mask[:-2]
+        diffs = np.diff(residuals, axis=0)
+        target = diffs[1:] * adf_mask
+        lagged = residuals[1:-1] * adf_mask
+        lagged_diff = diffs[:-1] * adf_mask
+        s11 = (lagged**2).sum(axis=0)
+        s12 = (lagged * lagged_diff).sum(axis=0)
+        s22 = (lagged_diff**2).sum(axis=0)
+        s1y = (lagged * target).sum(axis=0)
+        s2y = (lagged_diff * target).sum(axis=0)
+        det = s11 * s22 - s12**2
+        gamma = (s22 * s1y - s12 * s2y) / det
+        delta = (s11 * s2y - s12 * s1y) / det
+        rss = ((target - gamma * lagged - delta * lagged_diff) ** 2).sum(axis=0)
+        dof = count - 4
+        sigma2 = rss / dof
+        se_gamma = np.sqrt(sigma2 * s22 / det)
+        adf = gamma / se_gamma
+        degenerate = (det <= 1e-12 * s11 * s22) | (sigma2 <= 1e-30) | (se_gamma <= 1e-30)
+        adf[(count < 30) | degenerate] = np.nan
+
+    return {
+        "aligned": sessions - start,
+        "hedge": hedge,
+        "intercept": intercept,
+        "adf": adf,
+        "half_life": half_life,
+        "z_score": z_score,
+    }
+
+
+def scan_pairs(
+    panel: ClosePanel,
+    *,
+    limit: int = 25,
+    max_half_life: float | None = None,
+    min_overlap: int = PAIR_MIN_OVERLAP,
+) -> dict[str, Any]:
+    """Diagnose every pair in ``panel`` and rank mean-reversion candidates.
+
+    Candidates need at least ``min_overlap`` shared sessions and a finite
+    half-life; they are ranked by half-life (fastest first), then by the
+    absolute spread z-score.
+    """
+    symbols = list(panel.symbols)
+    closes = np.where(panel.closes > 0, panel.closes, np.nan)
+    closes = forward_fill(closes)
+    size = len(symbols)
+    sessions = closes.shape[0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.log(closes)
+        returns = closes[1:] / closes[:-1] - 1.0 if sessions > 1 else np.empty((0, size))
+    observed = ~np.isnan(logs)
+    first_row = np.where(observed.any(axis=0), observed.argmax(axis=0), sessions)
+
+    correlation = _pairwise_correlation(returns)
+    rolling = _window_correlation(returns, ROLLING_CORRELATION_WINDOW)
+
+    left, right = np.triu_indices(size, 1)
+    block_size = max(8, PAIR_BLOCK_CELLS // max(sessions, 1))
+    rows: list[dict[str, Any]] = []
+    for offset in range(0, left.size, block_size):
+        block_left = left[offset : offset + block_size]
+        block_right = right[offset : offset + block_size]
+        stats = _pair_block_stats(logs, first_row, block_left, block_right)
+        for position, (i, j) in enumerate(zip(block_left.tolist(), block_right.tolist(), strict=True)):
+            aligned = int(stats["aligned"][position])
+            if aligned < min_overlap:
+                continue
+            adf_tstat = _round(stats["adf"][position])
+            rows.append(
+                {
+                    "_columns": (i, j),
+                    "symbol": symbols[i],
+                    "pair_symbol": symbols[j],
+                    "aligned_days": aligned,
+                    "hedge_ratio_ols": _round(stats["hedge"][position]),
+                    "hedge_intercept": _round(stats["intercept"][position]),
+                    "adf_tstat": adf_tstat,
+                    "adf_verdict": adf_verdict(adf_tstat),
+                    "half_life_days": _round(stats["half_life"][position], 2),
+                    "correlation": _round(correlation[i, j]),
+                    "rolling_correlation_63d": _round(rolling[i, j]),
+                    "spread_z_score": _round(stats["z_score"][position]),
+                }
+            )
+
+    candidates = [
+        row
+        for row in rows
+        if row["half_life_days"] is not None
+        and row["spread_z_score"] is not None
+        and (max_half_life is None or row["half_life_days"] <= max_half_life)
+    ]
+    candidates.sort(key=lambda row: (row["half_life_days"], -abs(row["spread_z_score"])))
+
+    returned = candidates[:limit]
+    columns = np.array([row.pop("_columns") for row in returned], dtype=int).reshape(-1, 2)
+    series = _rolling_pair_correlation(
+        returns, columns[:, 0], columns[:, 1], ROLLING_CORRELATION_WINDOW
+    )
+    for position, row in enumerate(returned):
+        row["rolling_correlation_63d_series"] = [_round(value) for value in series[:, position]]
+
+    def _matrix(values: np.ndarray) -> list[list[float | None]]:
+        return [[_round(value) for value in row] for row in values.tolist()]
+
+    return {
+        "symbols": symbols,
+        "sessions": sessions,
+        "start_date": str(panel.dates[0]) if sessions else None,
+        "end_date": str(panel.dates[-1]) if sessions else None,
+        "pair_count": int(left.size),
+        "scanned_pairs": len(rows),
+        "candidate_count": len(candidates),
+        "candidates": [{"rank": rank, **row} for rank, row in enumerate(returned, start=1)],
+        "rolling_correlation_dates": [
+            str(day) for day in panel.dates[ROLLING_CORRELATION_WINDOW:].tolist()
+        ],
+        "correlation_matrix": _matrix(correlation),
+        "latest_correlation_63d_matrix": _matrix(rolling),
+        "adf_critical_values": ADF_COINTEGRATION_CRITICAL,
+        "adf_caveat": ADF_CAVEAT,
+        "note": (
+            "Descriptive pair diagnostics over each pair's overlap window. Not a trading signal."
+        ),
+    }
+
+
+def normalize_basket_symbols(symbols: Sequence[str]) -> list[str]:
+    return list(dict.fromkeys(str(symbol).strip().upper() for symbol in symbols if symbol))
+
+
+__all__ = [
+    "ADF_CAVEAT",
+    "ADF_COINTEGRATION_CRITICAL",
+    "MAX_BASKET_SYMBOLS",
+    "adf_verdict",
+    "normalize_basket_symbols",
+    "scan_pairs",
+]
@@ -11,7 +11,7 @@ Contains:
 import asyncio
 import logging
 from contextvars import ContextVar
-from datetime import date, datetime, timedelta, time
+from datetime import date, datetime, time
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
@@ -24,6 +24,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from vnibb.core.database import async_session_maker, engine
 from vnibb.core.cache import redis_client, build_cache_key
 from vnibb.core.config import settings
+from vnibb.core.trading_calendar import get_trading_calendar
 from vnibb.core.cache_constants import (
     PIPELINE_TTL_LISTING,
     PIPELINE_TTL_PROFILE,
@@ -301,13 +302,6 @@ class BasePipeline:
                 continue
         return None
 
-    def _iter_weekdays(self, start_date: date, end_date: date):
-        current = start_date
-        while current <= end_date:
-            if current.weekday() < 5:
-                yield current
-            current += timedelta(days=1)
-
     def _build_missing_date_ranges(
         self,
         existing_dates: set[date],
@@ -318,9 +312,8 @@ class BasePipeline:
         if start_date > end_date:
             return []
 
-        missing_dates = [
-            day for day in self._iter_weekdays(start_date, end_date) if day not in existing_dates
-        ]
+        calendar = get_trading_calendar()
+        missing_dates = calendar.missing_sessions(existing_dates, start_date, end_date)
         if not missing_dates:
             return []
 
@@ -329,12 +322,7 @@ class BasePipeline:
         range_end = missing_dates[0]
 
         for day in missing_dates[1:]:
-            day_gap = (day - range_end).days
-            contiguous = True
-            for offset in range(1, day_gap):
-                if (range_end + timedelta(days=offset)).weekday() < 5:
-                    contiguous = False
-                    break
+            contiguous = not calendar.has_session_between(range_end, day)
             if contiguous and (day - range_start).days < max_range_days:
                 range_end = day
                 continue
@@ -18,7 +18,8 @@ from vnibb.core.config import settings
 from vnibb.core.retry import with_retry
 from vnibb.models.stock import Stock
 from vnibb.models.financials import IncomeStatement, BalanceSheet, CashFlow
-from vnibb.services.pipeline.base import BasePipeline, get_upsert_stmt
+from vnibb.services.bulk_writer import bulk_upsert
+from vnibb.services.pipeline.base import BasePipeline
 
 logger = logging.getLogger(__name__)
 
@@ -164,6 +165,7 @@ class FinancialsPipeline(BasePipeline):
         if not model:
             return
 
+        rows: List[Dict[str, Any]] = []
         for record in data:
             fiscal_year, fiscal_quarter = self._parse_year_quarter(record.get("period"))
             if fiscal_year is None:
@@ -200,14 +202,19 @@ class FinancialsPipeline(BasePipeline):
                     "financing_cash_flow": self._parse_float(record.get("financing_cash_flow")),
                 })
 
-            async with self._get_session() as session:
-                stmt = get_upsert_stmt(
-                    model,
-                    ["symbol", "fiscal_year", "fiscal_quarter", "period_type"],
-                    values,
-                )
-                await session.execute(stmt)
-                await session.commit()
+            rows.append(values)
+
+        if not rows:
+            return
+
+        async with self._get_session() as session:
+            await bulk_upsert(
+                session,
+                model,
+                ["symbol", "fiscal_year", "fiscal_quarter", "period_type"],
+                rows,
+            )
+            await session.commit()
 
     async def sync_financial_ratios(
         self,
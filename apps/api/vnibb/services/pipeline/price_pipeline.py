@@ -21,7 +21,8 @@ from vnibb.core.cache_constants import (
 from vnibb.core.config import settings
 from vnibb.core.retry import with_retry
 from vnibb.models.stock import Stock, StockPrice
-from vnibb.services.pipeline.base import BasePipeline, get_upsert_stmt
+from vnibb.services.bulk_writer import bulk_upsert
+from vnibb.services.pipeline.base import BasePipeline
 
 logger = logging.getLogger(__name__)
 
@@ -266,24 +267,28 @@ class PricePipeline(BasePipeline):
                             )
                             continue
 
+                        price_rows = []
                         for _, row in range_df.iterrows():
                             row_time = (
                                 row["time"].date() if hasattr(row["time"], "date") else row["time"]
                             )
-                            val = {
-                                "stock_id": stock_id,
-                                "symbol": symbol,
-                                "time": row_time,
-                                "open": float(row["open"]),
-                                "high": float(row["high"]),
-                                "low": float(row["low"]),
-                                "close": float(row["close"]),
-                                "volume": int(row["volume"]),
-                                "interval": "1D",
-                                "source": "vnstock",
-                            }
-                            stmt = get_upsert_stmt(StockPrice, ["symbol", "time", "interval"], val)
-                            await session.execute(stmt)
+                            price_rows.append(
+                                {
+                                    "stock_id": stock_id,
+                                    "symbol": symbol,
+                                    "time": row_time,
+                                    "open": float(row["open"]),
+                                    "high": float(row["high"]),
+                                    "low": float(row["low"]),
+                                    "close": float(row["close"]),
+                                    "volume": int(row["volume"]),
+                                    "interval": "1D",
+                                    "source": "vnstock",
+                                }
+                            )
+                        await bulk_upsert(
+                            session, StockPrice, ["symbol", "time", "interval"], price_rows
+                        )
 
                         symbol_synced += len(range_df)
                         latest_candidate = range_df.iloc[-1].to_dict()
@@ -4,7 +4,6 @@ Screener Pipeline
 Handles synchronization of screener/financial ratio data from vnstock providers.
 """
 
-import asyncio
 import logging
 from datetime import date
 from typing import Any, Dict, List, Optional
@@ -21,6 +20,7 @@ from vnibb.models.stock import Stock, StockPrice
 from vnibb.models.company import Company
 from vnibb.models.screener import ScreenerSnapshot
 from vnibb.services.pipeline.base import BasePipeline, get_upsert_stmt
+from vnibb.services.screener_snapshot_store import screener_snapshot_store
 
 logger = logging.getLogger(__name__)
 
@@ -86,13 +86,16 @@ class ScreenerPipeline(BasePipeline):
         sync_id: Optional[int] = None,
     ) -> int:
         """Sync comprehensive metrics for stocks using vnstock finance.ratio."""
-        from vnibb.providers.vnstock.runtime import get_listing_class, get_vnstock_class
+        from vnibb.providers.vnstock.runtime import (
+            get_listing_class,
+            get_vnstock_class,
+            run_vnstock_call,
+        )
 
         Listing = get_listing_class()
         Vnstock = get_vnstock_class()
 
         logger.info("Syncing screener data...")
-        loop = asyncio.get_running_loop()
 
         normalized_exchanges: List[str] = []
         if exchanges:
@@ -165,7 +168,7 @@ class ScreenerPipeline(BasePipeline):
                         logger.debug(f"Ratio fetch failed for {symbol}: {e}")
                         return None
 
-                ratio_df = await loop.run_in_executor(None, _fetch_sync)
+                ratio_df = await run_vnstock_call("finance_ratios", _fetch_sync, key=symbol)
 
                 if ratio_df is not None and not ratio_df.empty:
                     # Process ratio data and store
@@ -252,6 +255,9 @@ class ScreenerPipeline(BasePipeline):
                 if progress is not None:
                     progress["error_count"] = progress.get("error_count", 0) + 1
 
+        if total_synced:
+            await screener_snapshot_store.refresh_after_write()
+
         logger.info(f"Synced screener data for {total_synced} symbols")
         return total_synced
 
@@ -18,6 +18,13 @@ Buckets we recognise:
   or "global recession" (etc.) for a given year.
 * `macro` — composite of cpi + fed + recession + Polymarket SPX closes.
 
+Keyword bucketing, thresholds and FOMC labels are parsed once at ingest
+(:mod:`vnibb.services.prediction_market_features`). The estimators read the
+running aggregates in
+:mod:`vnibb.services.prediction_market_estimator_state`, which ingest keeps
+current market by market, instead of loading and re-parsing every active
+row.
+
 The numeric output is intentionally approximate; this is a sentiment /
 positioning signal, not a forecast. Documentation lives in
 `docs/PREDICTION_MARKET_ESTIMATORS.md` (TODO: write in a follow-up).
@@ -25,117 +32,20 @@ positioning signal, not a forecast. Documentation lives in
 
 from __future__ import annotations
 
-import re
-from collections import defaultdict
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vnibb.core.cache import coerce_estimator_payload, estimation_cache
-from vnibb.models.prediction_market import PredictionMarket
+from vnibb.services.prediction_market_estimator_state import EstimatorState, estimator_state
 from vnibb.services.prediction_market_service import category_taxonomy  # noqa: F401
 
-
-# ---------------------------------------------------------------------------
-# Keyword matchers
-# ---------------------------------------------------------------------------
-
-CPI_KEYWORDS = (
-    "cpi",
-    "core cpi",
-    "core inflation",
-    "headline inflation",
-    "headline cpi",
-    "inflation rate",
-)
-
-FED_KEYWORDS = (
-    "fed",
-    "fomc",
-    "rate cut",
-    "rate hike",
-    "powell",
-    "federal reserve",
-    "interest rate",
-)
-
-RECESSION_KEYWORDS = (
-    "us recession",
-    "global recession",
-    "global recession in",
-    "us recession in",
-    "recession in {year}",
-)
-
-SPX_KEYWORDS = (
-    "s&p",
-    "s&p 500",
-    "spx",
-    "sp500",
-)
-
-
-_FOMC_MONTHS = {
-    "jan": 1,
-    "feb": 2,
-    "mar": 3,
-    "apr": 4,
-    "may": 5,
-    "jun": 6,
-    "jul": 7,
-    "aug": 8,
-    "sep": 9,
-    "oct": 10,
-    "nov": 11,
-    "dec": 12,
-}
-
-_FOMC_MEETING_KEYWORDS = ("fomc", "federal reserve", "interest rate", "rate cut", "rate hike", "fed", "powell")
-
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _match_any(text: str, keywords: tuple[str, ...]) -> bool:
-    lower = text.lower()
-    return any(keyword in lower for keyword in keywords)
-
-
-def _extract_threshold(question: str) -> float | None:
-    """Extract a percentage threshold from a CPI-style question.
-
-    Returns a `low` and `high` as a 2-tuple, or None if the question does not
-    look numeric. Tries a few regex sweeps so titles like "Core CPI > 3.0%"
-    and "headline cpi above 2.5%" both resolve.
-    """
-    lowered = question.lower()
-    match = re.search(
-        r"(?:>|≥|<|≤|over|under|above|below|more than|less than|at least|at most)\s*(\d+(?:\.\d+)?)\s*%?",
-        lowered,
-    )
-    if match:
-        return float(match.group(1))
-    match = re.search(
-        r"(\d+(?:\.\d+)?)\s*%\s*(?:or more|or above|or less|or below|>|≥|<|≤|over|under)",
-        lowered,
-    )
-    if match:
-        return float(match.group(1))
-    return None
-
-
-def _safe_value(market: PredictionMarket) -> float:
-    if isinstance(market.outcome_prices, list) and len(market.outcome_prices) > 0:
-        first = market.outcome_prices[0]
-        if isinstance(first, (int, float)):
-            return float(first)
-    return 0.0
-
-
 def _weighted_percentile(samples: list[float], weights: list[float], percentile: float) -> float:
     """Linear-interpolated weighted percentile. `percentile` in [0, 1]."""
     if not samples:
@@ -166,9 +76,8 @@ def _weighted_percentile(samples: list[float], weights: list[float], percentile:
 # ---------------------------------------------------------------------------
 
 
-async def _load_active_markets(db: AsyncSession) -> list[PredictionMarket]:
-    result = await db.execute(select(PredictionMarket).where(PredictionMarket.active.is_(True)))
-    return list(result.scalars().all())
+async def _state(db: AsyncSession) -> EstimatorState:
+    return await estimator_state.ensure_loaded(db)
 
 
 async def estimate_cpi(db: AsyncSession) -> dict[str, Any]:
@@ -183,34 +92,21 @@ async def estimate_cpi(db: AsyncSession) -> dict[str, Any]:
     cache_key = "prediction-markets:estimate:cpi"
 
     async def loader() -> dict[str, Any]:
-        markets = await _load_active_markets(db)
-        matching = [
-            market
-            for market in markets
-            if _match_any(f"{market.question} {market.description or ''}", CPI_KEYWORDS)
-        ]
-        if not matching:
+        state = await _state(db)
+        if state.cpi_count <= 0:
             return _empty_cpi()
 
-        bins: list[tuple[float, float]] = []  # (threshold, probability_mass)
-        total_liquidity = 0.0
-        for market in matching:
-            threshold = _extract_threshold(market.question)
-            if threshold is None:
-                continue
-            mass = max(_safe_value(market), 0.01)
-            bins.append((threshold, mass))
-            if isinstance(market.liquidity, (int, float)):
-                total_liquidity += float(market.liquidity)
+        # (threshold, probability_mass) per contract, kept current by ingest.
+        bins = list(state.cpi_bins.values())
         if not bins:
             return _empty_cpi()
 
         samples = [threshold for threshold, _ in bins]
         weights = [mass for _, mass in bins]
-        confidence = _confidence_score(len(bins), total_liquidity)
+        confidence = _confidence_score(len(bins), state.cpi_liquidity)
         return {
             "date": datetime.utcnow().date().isoformat(),
-            "n_markets": len(matching),
+            "n_markets": state.cpi_count,
             "p10": round(_weighted_percentile(samples, weights, 0.10), 3),
             "p25": round(_weighted_percentile(samples, weights, 0.25), 3),
             "p50": round(_weighted_percentile(samples, weights, 0.50), 3),
@@ -256,33 +152,11 @@ async def estimate_fed(db: AsyncSession) -> dict[str, Any]:
     cache_key = "prediction-markets:estimate:fed"
 
     async def loader() -> dict[str, Any]:
-        markets = await _load_active_markets(db)
-        matching = [
-            market
-            for market in markets
-            if _match_any(f"{market.question} {market.description or ''}", FED_KEYWORDS)
-        ]
-        # Bucket contracts by year-month inferred from the question's "in {Month}"
-        # close phrase or the market end_date.
-        buckets: dict[str, dict[str, float]] = defaultdict(
-            lambda: {"cut": 0.0, "hold": 0.0, "hike": 0.0, "weight": 0.0}
-        )
-        for market in matching:
-            label = _infer_fomc_label(market)
-            if label is None:
-                continue
-            yes_price = _safe_value(market)
-            question = market.question.lower()
-            if "hike" in question or "increase" in question or "+25bps" in question:
-                buckets[label]["hike"] += yes_price
-            elif "cut" in question or "reduce" in question or "-25bps" in question or "lower" in question:
-                buckets[label]["cut"] += yes_price
-            else:
-                # "hold" / "pause" / "no change" bucket
-                buckets[label]["hold"] += yes_price
-            buckets[label]["weight"] += 1.0
+        state = await _state(db)
+        # Contracts are bucketed at ingest by the year-month inferred from the
+        # question's "in {Month}" close phrase or the market end_date.
+        buckets = state.fed_buckets
         meetings: list[dict[str, Any]] = []
-        total_liquidity = 0.0
         for label, aggregates in sorted(buckets.items()):
             total = aggregates["cut"] + aggregates["hold"] + aggregates["hike"]
             if total <= 0:
@@ -296,13 +170,10 @@ async def estimate_fed(db: AsyncSession) -> dict[str, Any]:
                     "implied_terminal_rate": _infer_terminal_rate(aggregates),
                 }
             )
-        for market in matching:
-            if isinstance(market.liquidity, (int, float)):
-                total_liquidity += float(market.liquidity)
         return {
             "meetings": meetings[:4],
-            "n_markets": len(matching),
-            "confidence": round(_confidence_score(len(matching), total_liquidity), 3),
+            "n_markets": state.fed_count,
+            "confidence": round(_confidence_score(state.fed_count, state.fed_liquidity), 3),
             "schema_version": 8,
             "last_updated": datetime.utcnow().isoformat(),
         }
@@ -310,18 +181,6 @@ async def estimate_fed(db: AsyncSession) -> dict[str, Any]:
     return coerce_estimator_payload(await estimation_cache.get_or_set(cache_key, loader))
 
 
-def _infer_fomc_label(market: PredictionMarket) -> str | None:
-    text = " ".join([market.question, market.description or ""]).lower()
-    for month_name, month_number in _FOMC_MONTHS.items():
-        if month_name in text:
-            year_match = re.search(r"(20\d{2})", text)
-            year = year_match.group(1) if year_match else str(datetime.utcnow().year)
-            return f"{year}-{month_number:02d}-15"
-    if market.end_date is not None:
-        return market.end_date.strftime("%Y-%m-15")
-    return None
-
-
 def _infer_terminal_rate(bucket: dict[str, float]) -> float:
     """Infer the implied terminal rate from cut/hold/hike weights.
 
@@ -345,51 +204,27 @@ async def estimate_recession(db: AsyncSession) -> dict[str, Any]:
     current_year = datetime.utcnow().year
 
     async def loader() -> dict[str, Any]:
-        markets = await _load_active_markets(db)
-        target_year = current_year
-        contract_year = current_year
-        matching: list[PredictionMarket] = []
-        for market in markets:
-            text = f"{market.question} {market.description or ''}".lower()
-            if not _match_any(text, ("recession",)):
-                continue
-            year_match = re.search(r"(20\d{2})", text)
-            if year_match:
-                contract_year = int(year_match.group(1))
-                if contract_year >= current_year:
-                    target_year = contract_year
-            matching.append(market)
-        sources: list[dict[str, Any]] = []
-        total_probability = 0.0
-        total_liquidity = 0.0
-        per_source_count: dict[str, int] = {}
-        for market in matching:
-            yes_price = _safe_value(market)
-            total_probability += yes_price
-            if isinstance(market.liquidity, (int, float)):
-                total_liquidity += float(market.liquidity)
-            per_source_count[market.source] = per_source_count.get(market.source, 0) + 1
-            sources.append(
-                {
-                    "source": market.source,
-                    "source_id": market.source_id,
-                    "probability": yes_price,
-                }
-            )
-        consensus = total_probability / len(matching) if matching else None
+        state = await _state(db)
+        # The furthest-dated contract year still ahead of us, else this year.
+        upcoming = [year for year in state.recession_years if year >= current_year]
+        target_year = max(upcoming, default=current_year)
+        count = state.recession_count
+        consensus = state.recession_sum / count if count > 0 else None
+        # Population variance from the running sums: E[p^2] - E[p]^2.
         variance = (
-            sum((s["probability"] - (consensus or 0)) ** 2 for s in sources) / len(sources)
-            if sources
+            max(state.recession_sum_sq / count - (consensus or 0.0) ** 2, 0.0)
+            if count > 0
             else 0.0
         )
+        sources = list(state.recession_sources.values())
         return {
             "year": target_year,
             "p_recession": round(consensus, 4) if consensus is not None else 0.0,
             "variance": round(variance, 6),
-            "n_contracts_per_source": per_source_count,
+            "n_contracts_per_source": dict(state.recession_source_counts),
             "sources": sources[:25],
-            "n_markets": len(matching),
-            "confidence": round(_confidence_score(len(matching), total_liquidity), 3),
+            "n_markets": count,
+            "confidence": round(_confidence_score(count, state.recession_liquidity), 3),
             "schema_version": 8,
             "last_updated": datetime.utcnow().isoformat(),
         }
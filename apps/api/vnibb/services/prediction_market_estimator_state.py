@@ -0,0 +1,307 @@
+"""Incrementally maintained inputs for the prediction-market estimators.
+
+Each active market that feeds an estimator contributes a small
+:class:`MarketContribution`: its parsed features plus its YES price and
+liquidity. :class:`EstimatorState` keeps running per-bucket aggregates over
+those contributions (CPI threshold bins, per-meeting Fed cut/hold/hike sums,
+recession probability sums and squares). A price change therefore costs one
+subtract-and-add, not a reload and re-parse of every active market.
+
+Ingest stages each upserted market on its session
+(:meth:`EstimatorState.stage`). The staged contributions are applied only
+after that session commits, and dropped on rollback. Other workers never see
+this worker's ingest, so the state also reloads from the DB (bucketed rows
+only, parsed columns only) once it is older than :data:`STATE_MAX_AGE_SECONDS`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+from sqlalchemy import event, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vnibb.core.cache import estimation_cache
+from vnibb.models.prediction_market import PredictionMarket
+from vnibb.services.prediction_market_features import FEATURES_VERSION, market_features
+
+logger = logging.getLogger(__name__)
+
+STATE_MAX_AGE_SECONDS: Final = 600.0
+ESTIMATE_CACHE_KEYS: Final = (
+    "prediction-markets:estimate:cpi",
+    "prediction-markets:estimate:fed",
+    "prediction-markets:estimate:recession",
+    "prediction-markets:estimate:macro",
+)
+
+_PENDING_KEY = "prediction_market_estimator_pending"
+_LISTENING_KEY = "prediction_market_estimator_listening"
+
+MarketKey = tuple[str, str]
+
+
+def _yes_price(outcome_prices: Any) -> float:
+    if isinstance(outcome_prices, (list, tuple)) and len(outcome_prices) > 0:
+        first = outcome_prices[0]
+        if isinstance(first, (int, float)):
+            return float(first)
+    return 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class MarketContribution:
+    """What one market adds to the estimator aggregates."""
+
+    source: str
+    source_id: str
+    buckets: frozenset[str]
+    yes_price: float
+    liquidity: float | None
+    cpi_threshold: float | None = None
+    fomc_label: str | None = None
+    fed_direction: str | None = None
+    recession_year: int | None = None
+
+    @property
+    def key(self) -> MarketKey:
+        return (self.source, self.source_id)
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        source: str,
+        source_id: str,
+        active: bool,
+        features: Mapping[str, Any] | None,
+        outcome_prices: Any,
+        liquidity: Any,
+    ) -> MarketContribution | None:
+        """Return the contribution, or None when the market feeds no estimator."""
+        buckets = frozenset((features or {}).get("buckets") or ())
+        if not active or not buckets:
+            return None
+        return cls(
+            source=source,
+            source_id=source_id,
+            buckets=buckets,
+            yes_price=_yes_price(outcome_prices),
+            liquidity=float(liquidity) if isinstance(liquidity, (int, float)) else None,
+            cpi_threshold=features.get("cpi_threshold"),
+            fomc_label=features.get("fomc_label"),
+            fed_direction=features.get("fed_direction"),
+            recession_year=features.get("recession_year"),
+        )
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Any]) -> MarketContribution | None:
+        return cls.build(
+            source=values["source"],
+            source_id=values["source_id"],
+            active=bool(values.get("active", True)),
+            features=values.get("features"),
+            outcome_prices=values.get("outcome_prices"),
+            liquidity=values.get("liquidity"),
+        )
+
+
+def _new_fed_bucket() -> dict[str, float]:
+    return {"cut": 0.0, "hold": 0.0, "hike": 0.0, "weight": 0.0}
+
+
+class EstimatorState:
+    """Running per-bucket aggregates over active, estimator-relevant markets."""
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self.loaded_at: float | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.loaded_at = None
+        self.contributions: dict[MarketKey, MarketContribution] = {}
+
+        self.cpi_count = 0
+        self.cpi_bins: dict[MarketKey, tuple[float, float]] = {}
+        self.cpi_liquidity = 0.0
+
+        self.fed_count = 0
+        self.fed_liquidity = 0.0
+        self.fed_buckets: dict[str, dict[str, float]] = defaultdict(_new_fed_bucket)
+
+        self.recession_count = 0
+        self.recession_sum = 0.0
+        self.recession_sum_sq = 0.0
+        self.recession_liquidity = 0.0
+        self.recession_sources: dict[MarketKey, dict[str, Any]] = {}
+        self.recession_source_counts: Counter[str] = Counter()
+        self.recession_years: Counter[int] = Counter()
+
+    # -- incremental updates ------------------------------------------------
+
+    def _accumulate(self, item: MarketContribution, sign: int) -> None:
+        liquidity = (item.liquidity or 0.0) * sign
+        if "cpi" in item.buckets:
+            self.cpi_count += sign
+            if item.cpi_threshold is not None:
+                if sign > 0:
+                    self.cpi_bins[item.key] = (item.cpi_threshold, max(item.yes_price, 0.01))
+                else:
+                    self.cpi_bins.pop(item.key, None)
+                self.cpi_liquidity += liquidity
+        if "fed" in item.buckets:
+            self.fed_count += sign
+            self.fed_liquidity += liquidity
+            if item.fomc_label is not None:
+                bucket = self.fed_buckets[item.fomc_label]
+                bucket[item.fed_direction or "hold"] += item.yes_price * sign
+                bucket["weight"] += sign
+                if bucket["weight"] <= 0:
+                    del self.fed_buckets[item.fomc_label]
+        if "recession" in item.buckets:
+            self.recession_count += sign
+            self.recession_sum += item.yes_price * sign
+            self.recession_sum_sq += item.yes_price * item.yes_price * sign
+            self.recession_liquidity += liquidity
+            self.recession_source_counts[item.source] += sign
+            if self.recession_source_counts[item.source] <= 0:
+                del self.recession_source_counts[item.source]
+            if item.recession_year is not None:
+                self.recession_years[item.recession_year] += sign
+                if self.recession_years[item.recession_year] <= 0:
+                    del self.recession_years[item.recession_year]
+            if sign > 0:
+                self.recession_sources[item.key] = {
+                    "source": item.source,
+                    "source_id": item.source_id,
+                    "probability": item.yes_price,
+                }
+            else:
+                self.recession_sources.pop(item.key, None)
+            if self.recession_count == 0:
+                # Drop accumulated float error once the bucket empties.
+                self.recession_sum = self.recession_sum_sq = self.recession_liquidity = 0.0
+
+    def apply(self, key: MarketKey, contribution: MarketContribution | None) -> bool:
+        """Replace one market's contribution; returns True when anything changed."""
+        previous = self.contributions.get(key)
+        if previous == contribution:
+            return False
+        if previous is not None:
+            self._accumulate(previous, -1)
+            del self.contributions[key]
+        if contribution is not None:
+            self._accumulate(contribution, 1)
+            self.contributions[key] = contribution
+        return True
+
+    def apply_many(self, items: Iterable[tuple[MarketKey, MarketContribution | None]]) -> int:
+        changed = sum(1 for key, contribution in items if self.apply(key, contribution))
+        if changed:
+            for cache_key in ESTIMATE_CACHE_KEYS:
+                estimation_cache.invalidate(cache_key)
+        return changed
+
+    # -- ingest hook ----------------------------------------------------------
+
+    def stage(self, session: AsyncSession, values: Mapping[str, Any]) -> None:
+        """Queue one upserted market; applied when ``session`` commits."""
+        pending = session.info.setdefault(_PENDING_KEY, {})
+        pending[(values["source"], values["source_id"])] = MarketContribution.from_values(values)
+        if not session.info.get(_LISTENING_KEY):
+            session.info[_LISTENING_KEY] = True
+            event.listen(session.sync_session, "after_commit", self._after_commit)
+            event.listen(session.sync_session, "after_rollback", self._after_rollback)
+
+    def _after_commit(self, sync_session) -> None:
+        pending = sync_session.info.pop(_PENDING_KEY, None)
+        # Before the first load the DB is the source of truth; nothing to patch.
+        if pending and self.loaded_at is not None:
+            self.apply_many(pending.items())
+
+    def _after_rollback(self, sync_session) -> None:
+        sync_session.info.pop(_PENDING_KEY, None)
+
+    # -- loading --------------------------------------------------------------
+
+    @property
+    def is_fresh(self) -> bool:
+        return (
+            self.loaded_at is not None
+            and time.monotonic() - self.loaded_at < STATE_MAX_AGE_SECONDS
+        )
+
+    async def ensure_loaded(self, db: AsyncSession) -> EstimatorState:
+        if self.is_fresh:
+            return self
+        async with self._lock:
+            if not self.is_fresh:
+                await self._load(db)
+        return self
+
+    async def _load(self, db: AsyncSession) -> None:
+        from vnibb.services.prediction_market_service import canonical_topics
+
+        result = await db.execute(
+            select(
+                PredictionMarket.source,
+                PredictionMarket.source_id,
+                PredictionMarket.question,
+                PredictionMarket.description,
+                PredictionMarket.category,
+                PredictionMarket.end_date,
+                PredictionMarket.outcome_prices,
+                PredictionMarket.liquidity,
+                PredictionMarket.extra,
+                PredictionMarket.features,
+                PredictionMarket.features_version,
+            )
+            .where(
+                PredictionMarket.active.is_(True),
+                or_(
+                    PredictionMarket.estimator_buckets.is_not(None),
+                    # Rows ingested before features existed, or under older rules.
+                    PredictionMarket.features_version.is_(None),
+                    PredictionMarket.features_version < FEATURES_VERSION,
+                ),
+            )
+            .order_by(PredictionMarket.id)
+        )
+        self.reset()
+        reparsed = 0
+        for row in result.all():
+            features = row.features
+            if row.features_version != FEATURES_VERSION:
+                topics = (row.extra or {}).get("canonical_topics") or canonical_topics(
+                    row.question, row.category
+                )
+                features = market_features(
+                    row.question, row.description, row.end_date, topics=topics
+                )
+                reparsed += 1
+            contribution = MarketContribution.build(
+                source=row.source,
+                source_id=row.source_id,
+                active=True,
+                features=features,
+                outcome_prices=row.outcome_prices,
+                liquidity=row.liquidity,
+            )
+            if contribution is not None:
+                self.apply(contribution.key, contribution)
+        self.loaded_at = time.monotonic()
+        if reparsed:
+            logger.info("Estimator state parsed %d markets without stored features", reparsed)
+
+
+estimator_state = EstimatorState()
+
+
+__all__ = ["EstimatorState", "MarketContribution", "estimator_state"]
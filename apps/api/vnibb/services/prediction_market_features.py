@@ -0,0 +1,190 @@
+"""Parsed prediction-market features, computed once at ingest.
+
+The estimators in :mod:`vnibb.services.prediction_market_estimator` bucket
+contracts by keyword and pull a numeric threshold / FOMC meeting label out of
+the question text. Doing that per estimator call meant re-running the regex
+sweep over every active market on every cache miss. Ingest now calls
+:func:`market_features` once per upsert and stores the result on
+``prediction_markets.features`` (plus the ``estimator_buckets`` filter
+column), so estimators only read the parsed values.
+
+Bump :data:`FEATURES_VERSION` whenever the parsing rules change; rows carrying
+an older version are re-parsed the next time the estimator state loads them.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Final, Protocol
+
+FEATURES_VERSION: Final = 1
+
+CPI_KEYWORDS = (
+    "cpi",
+    "core cpi",
+    "core inflation",
+    "headline inflation",
+    "headline cpi",
+    "inflation rate",
+)
+
+FED_KEYWORDS = (
+    "fed",
+    "fomc",
+    "rate cut",
+    "rate hike",
+    "powell",
+    "federal reserve",
+    "interest rate",
+)
+
+RECESSION_KEYWORDS = (
+    "us recession",
+    "global recession",
+    "global recession in",
+    "us recession in",
+    "recession in {year}",
+)
+
+SPX_KEYWORDS = (
+    "s&p",
+    "s&p 500",
+    "spx",
+    "sp500",
+)
+
+_FOMC_MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+_THRESHOLD_PREFIX_RE = re.compile(
+    r"(?:>|≥|<|≤|over|under|above|below|more than|less than|at least|at most)"
+    r"\s*(\d+(?:\.\d+)?)\s*%?"
+)
+_THRESHOLD_SUFFIX_RE = re.compile(
+    r"(\d+(?:\.\d+)?)\s*%\s*(?:or more|or above|or less|or below|>|≥|<|≤|over|under)"
+)
+_YEAR_RE = re.compile(r"(20\d{2})")
+
+
+class MarketText(Protocol):
+    question: str
+    description: str | None
+    end_date: datetime | None
+
+
+def _match_any(text: str, keywords: tuple[str, ...]) -> bool:
+    lower = text.lower()
+    return any(keyword in lower for keyword in keywords)
+
+
+def extract_threshold(question: str) -> float | None:
+    """Extract a percentage threshold from a CPI-style question.
+
+    Tries a few regex sweeps so titles like "Core CPI > 3.0%" and
+    "headline cpi above 2.5%" both resolve. Returns None when the question
+    does not look numeric.
+    """
+    lowered = question.lower()
+    match = _THRESHOLD_PREFIX_RE.search(lowered)
+    if match:
+        return float(match.group(1))
+    match = _THRESHOLD_SUFFIX_RE.search(lowered)
+    if match:
+        return float(match.group(1))
+    return None
+
+
+def _fomc_label(question: str, description: str | None, end_date: datetime | None) -> str | None:
+    text = " ".join([question, description or ""]).lower()
+    for month_name, month_number in _FOMC_MONTHS.items():
+        if month_name in text:
+            year_match = _YEAR_RE.search(text)
+            year = year_match.group(1) if year_match else str(datetime.utcnow().year)
+            return f"{year}-{month_number:02d}-15"
+    if end_date is not None:
+        return end_date.strftime("%Y-%m-15")
+    return None
+
+
+def infer_fomc_label(market: MarketText) -> str | None:
+    """Map a Fed contract onto a ``YYYY-MM-15`` meeting label."""
+    return _fomc_label(market.question, market.description, market.end_date)
+
+
+def fed_direction(question: str) -> str:
+    """Classify a Fed contract as ``cut``, ``hike`` or ``hold``."""
+    lowered = question.lower()
+    if "hike" in lowered or "increase" in lowered or "+25bps" in lowered:
+        return "hike"
+    if "cut" in lowered or "reduce" in lowered or "-25bps" in lowered or "lower" in lowered:
+        return "cut"
+    # "hold" / "pause" / "no change" bucket
+    return "hold"
+
+
+def market_features(
+    question: str,
+    description: str | None = None,
+    end_date: datetime | None = None,
+    *,
+    topics: Sequence[str] = (),
+) -> dict[str, Any]:
+    """Parse the estimator-relevant features of one market.
+
+    The returned dict is JSON-serialisable and is stored verbatim on
+    ``prediction_markets.features``. ``buckets`` lists the estimators the
+    market feeds (``cpi`` / ``fed`` / ``recession``).
+    """
+    question = question or ""
+    text = f"{question} {description or ''}"
+    buckets: list[str] = []
+    features: dict[str, Any] = {"version": FEATURES_VERSION, "topics": list(topics)}
+
+    if _match_any(text, CPI_KEYWORDS):
+        buckets.append("cpi")
+        features["cpi_threshold"] = extract_threshold(question)
+    if _match_any(text, FED_KEYWORDS):
+        buckets.append("fed")
+        features["fomc_label"] = _fomc_label(question, description, end_date)
+        features["fed_direction"] = fed_direction(question)
+    if _match_any(text, ("recession",)):
+        buckets.append("recession")
+        year_match = _YEAR_RE.search(text.lower())
+        features["recession_year"] = int(year_match.group(1)) if year_match else None
+
+    features["buckets"] = buckets
+    return features
+
+
+def estimator_buckets_column(features: dict[str, Any]) -> str | None:
+    """Space-joined bucket list for the indexed ``estimator_buckets`` column."""
+    buckets = features.get("buckets") or []
+    return " ".join(buckets) if buckets else None
+
+
+__all__ = [
+    "CPI_KEYWORDS",
+    "FEATURES_VERSION",
+    "FED_KEYWORDS",
+    "RECESSION_KEYWORDS",
+    "SPX_KEYWORDS",
+    "estimator_buckets_column",
+    "extract_threshold",
+    "fed_direction",
+    "infer_fomc_label",
+    "market_features",
+]
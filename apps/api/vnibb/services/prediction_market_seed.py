@@ -27,8 +27,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from vnibb.services.prediction_market_service import (
     NormalizedPredictionMarket,
     PredictionMarketValues,
-    _upsert_prediction_market,
     category_taxonomy,
+    upsert_prediction_market,
 )
 
 logger = logging.getLogger(__name__)
@@ -154,7 +154,7 @@ async def _seed_from_fixture(
         if market is None:
             continue
         values: PredictionMarketValues = market.to_values()
-        await session.execute(_upsert_prediction_market(values, dialect_name))
+        await upsert_prediction_market(session, values, dialect_name)
         count += 1
     await session.commit()
     logger.info("Seeded %d markets from %s", count, path)
@@ -179,9 +179,7 @@ async def seed_predictit_from_fixture(session: AsyncSession, *, path: str | None
             market = _normalise_predictit_row(row)
             if market is None:
                 continue
-            await session.execute(
-                _upsert_prediction_market(market.to_values(), dialect_name)
-            )
+            await upsert_prediction_market(session, market.to_values(), dialect_name)
             count += 1
         await session.commit()
         logger.info("Seeded %d PredictIt markets from %s", count, path)
@@ -206,9 +204,7 @@ async def seed_limitless_from_fixture(session: AsyncSession, *, path: str | None
             market = _normalise_limitless_row(row)
             if market is None:
                 continue
-            await session.execute(
-                _upsert_prediction_market(market.to_values(), dialect_name)
-            )
+            await upsert_prediction_market(session, market.to_values(), dialect_name)
             count += 1
         await session.commit()
         logger.info("Seeded %d Limitless markets from %s", count, path)
@@ -233,9 +229,7 @@ async def seed_manifold_from_fixture(session: AsyncSession, *, path: str | None
             market = _normalise_manifold_row(row)
             if market is None:
                 continue
-            await session.execute(
-                _upsert_prediction_market(market.to_values(), dialect_name)
-            )
+            await upsert_prediction_market(session, market.to_values(), dialect_name)
             count += 1
         await session.commit()
         logger.info("Seeded %d Manifold markets from %s", count, path)
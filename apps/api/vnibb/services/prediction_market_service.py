@@ -14,6 +14,12 @@ from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vnibb.models.prediction_market import PredictionMarket
+from vnibb.services.prediction_market_estimator_state import estimator_state
+from vnibb.services.prediction_market_features import (
+    FEATURES_VERSION,
+    estimator_buckets_column,
+    market_features,
+)
 
 GAMMA_BASE_URL: Final = "https://gamma-api.polymarket.com"
 
@@ -82,6 +88,9 @@ class PredictionMarketValues(TypedDict, total=False):
     outcomes: list[str]
     outcome_prices: list[float]
     extra: dict
+    features: dict
+    features_version: int
+    estimator_buckets: str | None
     updated_at: datetime
 
 
@@ -278,7 +287,7 @@ async def ingest_polymarket_gamma_markets(
     dialect_name = session.get_bind().dialect.name
     for payload in payloads:
         market = normalize_gamma_market(payload)
-        await session.execute(_upsert_prediction_market(market.to_values(), dialect_name))
+        await upsert_prediction_market(session, market.to_values(), dialect_name)
         count += 1
     await session.commit()
     return count
@@ -297,7 +306,38 @@ async def ingest_polymarket_gamma_markets_with_default_client(
         return await ingest_polymarket_gamma_markets(session, client, limit)
 
 
+def with_market_features(values: PredictionMarketValues) -> PredictionMarketValues:
+    """Attach the parsed estimator features to a normalized market row."""
+    if values.get("features_version") == FEATURES_VERSION:
+        return values
+    question = values.get("question") or ""
+    topics = (values.get("extra") or {}).get("canonical_topics") or canonical_topics(
+        question, values.get("category")
+    )
+    features = market_features(
+        question, values.get("description"), values.get("end_date"), topics=topics
+    )
+    return {
+        **values,
+        "features": features,
+        "features_version": FEATURES_VERSION,
+        "estimator_buckets": estimator_buckets_column(features),
+    }
+
+
+async def upsert_prediction_market(
+    session: AsyncSession,
+    values: PredictionMarketValues,
+    dialect_name: str,
+) -> None:
+    """Upsert one market and stage it for the incremental estimator state."""
+    values = with_market_features(values)
+    await session.execute(_upsert_prediction_market(values, dialect_name))
+    estimator_state.stage(session, values)
+
+
 def _upsert_prediction_market(values: PredictionMarketValues, dialect_name: str):
+    values = with_market_features(values)
     match dialect_name:
         case "postgresql":
             stmt = pg_insert(PredictionMarket).values(**values)
@@ -322,6 +362,9 @@ def _upsert_prediction_market(values: PredictionMarketValues, dialect_name: str)
             "outcomes": stmt.excluded.outcomes,
             "outcome_prices": stmt.excluded.outcome_prices,
             "extra": stmt.excluded.extra,
+            "features": stmt.excluded.features,
+            "features_version": stmt.excluded.features_version,
+            "estimator_buckets": stmt.excluded.estimator_buckets,
             "updated_at": stmt.excluded.updated_at,
         },
     )
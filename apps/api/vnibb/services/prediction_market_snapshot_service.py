@@ -1,8 +1,12 @@
 """Nightly snapshot job for prediction markets.
 
-Writes one row per active market to the `prediction_market_snapshots` table
-on each run. The `/movers` endpoint diffs the latest snapshot against a
-windowed historical snapshot.
+Writes a row to the `prediction_market_snapshots` table for each active
+market whose YES probability or liquidity moved since its last snapshot. The
+`/movers` endpoint diffs the latest snapshot against a windowed historical
+snapshot, so an unchanged market needs no new row: its latest snapshot
+still holds its current value. A keyframe row is still written every
+`SNAPSHOT_KEYFRAME_DAYS` so 30-day retention never removes the last snapshot
+of a quiet market.
 """
 
 from __future__ import annotations
@@ -20,22 +24,86 @@ from vnibb.models.prediction_market_snapshot import PredictionMarketSnapshot
 
 SNAPSHOT_RETENTION_DAYS = 30
 SNAPSHOT_BACKFILL_MIN_THRESHOLD = 100
+SNAPSHOT_KEYFRAME_DAYS = 7
+# Smallest moves that count as a change: 0.1 probability points, 1% liquidity.
+SNAPSHOT_PROBABILITY_EPSILON = 0.001
+SNAPSHOT_LIQUIDITY_REL_EPSILON = 0.01
 
 
 logger = logging.getLogger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def snapshot_changed(
+    previous: tuple[float, float | None, datetime] | None,
+    yes_price: float,
+    liquidity: float | None,
+    keyframe_cutoff: datetime,
+) -> bool:
+    """Whether a market needs a new snapshot row given its latest one."""
+    if previous is None:
+        return True
+    previous_price, previous_liquidity, captured_at = previous
+    if _as_utc(captured_at) <= keyframe_cutoff:
+        return True
+    if abs(yes_price - previous_price) >= SNAPSHOT_PROBABILITY_EPSILON:
+        return True
+    if (liquidity is None) != (previous_liquidity is None):
+        return True
+    if liquidity is not None and previous_liquidity is not None:
+        scale = max(abs(previous_liquidity), 1.0)
+        return abs(liquidity - previous_liquidity) / scale >= SNAPSHOT_LIQUIDITY_REL_EPSILON
+    return False
+
+
+async def _latest_snapshots(
+    session: AsyncSession,
+) -> dict[tuple[str, str], tuple[float, float | None, datetime]]:
+    latest = (
+        select(
+            PredictionMarketSnapshot.source,
+            PredictionMarketSnapshot.source_id,
+            func.max(PredictionMarketSnapshot.captured_at).label("captured_at"),
+        )
+        .group_by(PredictionMarketSnapshot.source, PredictionMarketSnapshot.source_id)
+        .subquery()
+    )
+    result = await session.execute(
+        select(
+            PredictionMarketSnapshot.source,
+            PredictionMarketSnapshot.source_id,
+            PredictionMarketSnapshot.yes_price,
+            PredictionMarketSnapshot.liquidity,
+            PredictionMarketSnapshot.captured_at,
+        ).join(
+            latest,
+            (latest.c.source == PredictionMarketSnapshot.source)
+            & (latest.c.source_id == PredictionMarketSnapshot.source_id)
+            & (latest.c.captured_at == PredictionMarketSnapshot.captured_at),
+        )
+    )
+    return {
+        (source, source_id): (yes_price, liquidity, captured_at)
+        for source, source_id, yes_price, liquidity, captured_at in result.all()
+    }
+
+
 async def snapshot_active_prediction_markets(session: AsyncSession) -> int:
-    """Snapshot every active market in the DB into a new snapshot row.
+    """Snapshot every active market whose probability or liquidity moved.
 
     Returns the number of rows written. Inserts are batched into a single
     `session.add_all` so the cost stays low even at 10k+ markets.
     """
     now = datetime.now(timezone.utc)
+    keyframe_cutoff = now - timedelta(days=SNAPSHOT_KEYFRAME_DAYS)
     result = await session.execute(
         select(PredictionMarket).where(PredictionMarket.active.is_(True))
     )
     markets = result.scalars().all()
+    previous = await _latest_snapshots(session)
     rows = []
     for market in markets:
         yes_price = 0.0
@@ -43,6 +111,14 @@ async def snapshot_active_prediction_markets(session: AsyncSession) -> int:
             first = market.outcome_prices[0]
             if isinstance(first, (int, float)):
                 yes_price = float(first)
+        liquidity = market.liquidity if isinstance(market.liquidity, (int, float)) else None
+        if not snapshot_changed(
+            previous.get((market.source, market.source_id)),
+            yes_price,
+            liquidity,
+            keyframe_cutoff,
+        ):
+            continue
         rows.append(
             PredictionMarketSnapshot(
                 market_id=market.id,
@@ -53,7 +129,7 @@ async def snapshot_active_prediction_markets(session: AsyncSession) -> int:
                 url=market.url,
                 yes_price=yes_price,
                 volume=market.volume if isinstance(market.volume, (int, float)) else None,
-                liquidity=market.liquidity if isinstance(market.liquidity, (int, float)) else None,
+                liquidity=liquidity,
                 captured_at=now,
                 extra={"raw_outcome_prices": market.outcome_prices, "raw_outcomes": market.outcomes},
             )
@@ -61,6 +137,9 @@ async def snapshot_active_prediction_markets(session: AsyncSession) -> int:
     if rows:
         session.add_all(rows)
     await session.commit()
+    logger.info(
+        "Prediction-market snapshot: %d of %d active markets changed", len(rows), len(markets)
+    )
 
     # Retention housekeeping: keep at most SNAPSHOT_RETENTION_DAYS of history
     # to bound table growth. Anything older is deleted in batches.
@@ -0,0 +1,268 @@
+"""
+Universe-wide price gap planner for ``DataPipeline.sync_daily_prices``.
+
+``PriceGapPlanner``:
+
+- resolves symbol -> ``Stock.id`` once and keeps the map for the lifetime of
+  the pipeline instance;
+- computes each symbol's stored bounds and missing trading days for the whole
+  universe in one statement (on PostgreSQL: ``generate_series`` over the
+  weekday/holiday calendar anti-joined against ``stock_prices``);
+- coalesces the missing days into fetch windows of at most
+  ``max_range_days`` calendar days, bridging weekends and configured market
+  holidays.
+
+Other dialects (SQLite in tests) load ``(symbol, time)`` for the universe in
+one query and diff it against the shared trading calendar, which yields the
+same plan.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vnibb.core.trading_calendar import configured_market_holidays, get_trading_calendar
+from vnibb.models.stock import Stock, StockPrice
+
+logger = logging.getLogger(__name__)
+
+DateRange = tuple[date, date]
+
+DEFAULT_MAX_RANGE_DAYS = 30
+SYMBOL_LOOKUP_CHUNK = 1_000
+
+_POSTGRES_GAP_SQL = text(
+    """
+    WITH bounds AS (
+        SELECT symbol, MIN(time) AS first_day, MAX(time) AS last_day
+        FROM stock_prices
+        WHERE interval = '1D' AND symbol = ANY(:symbols)
+        GROUP BY symbol
+    ),
+    calendar AS (
+        SELECT gs.d::date AS day
+        FROM generate_series(
+            (SELECT MIN(first_day) FROM bounds),
+            (SELECT MAX(last_day) FROM bounds),
+            INTERVAL '1 day'
+        ) AS gs(d)
+        WHERE EXTRACT(ISODOW FROM gs.d) < 6
+          AND NOT (gs.d::date = ANY(CAST(:holidays AS date[])))
+    )
+    SELECT b.symbol, b.first_day, b.last_day, c.day AS missing_day
+    FROM bounds b
+    LEFT JOIN calendar c
+      ON c.day BETWEEN b.first_day AND b.last_day
+     AND NOT EXISTS (
+         SELECT 1
+         FROM stock_prices p
+         WHERE p.symbol = b.symbol AND p.interval = '1D' AND p.time = c.day
+     )
+    ORDER BY b.symbol, c.day
+    """
+).bindparams(bindparam("symbols"), bindparam("holidays"))
+
+
+def iter_trading_days(start: date, end: date, holidays: Collection[date] = ()) -> Iterable[date]:
+    return get_trading_calendar(holidays).sessions_between(start, end)
+
+
+def coalesce_missing_days(
+    missing_days: Sequence[date],
+    *,
+    max_range_days: int = DEFAULT_MAX_RANGE_DAYS,
+    holidays: Collection[date] = (),
+) -> list[DateRange]:
+    """Merge sorted missing trading days into fetch windows.
+
+    Two missing days share a window when no trading day lies between them and
+    the window stays shorter than ``max_range_days`` calendar days.
+    """
+    if not missing_days:
+        return []
+
+    calendar = get_trading_calendar(holidays)
+    ranges: list[DateRange] = []
+    range_start = range_end = missing_days[0]
+    for day in missing_days[1:]:
+        contiguous = not calendar.has_session_between(range_end, day)
+        if contiguous and (day - range_start).days < max_range_days:
+            range_end = day
+            continue
+        ranges.append((range_start, range_end))
+        range_start = range_end = day
+    ranges.append((range_start, range_end))
+    return ranges
+
+
+def plan_fetch_ranges(
+    *,
+    bounds: DateRange | None,
+    missing_days: Sequence[date],
+    start: date,
+    end: date,
+    max_range_days: int = DEFAULT_MAX_RANGE_DAYS,
+    holidays: Collection[date] = (),
+) -> list[DateRange]:
+    """Fetch windows for one symbol: interior gaps plus head/tail extensions.
+
+    A symbol with no stored rows, or with nothing to fill, falls back to the
+    requested ``(start, end)`` window so recent bars still get refreshed.
+    """
+    if bounds is None:
+        return [(start, end)]
+
+    first_day, last_day = bounds
+    ranges = coalesce_missing_days(
+        missing_days, max_range_days=max_range_days, holidays=holidays
+    )
+    if last_day < end:
+        tail_start = max(last_day + timedelta(days=1), start)
+        if tail_start <= end:
+            ranges.append((tail_start, end))
+    if start < first_day:
+        head_end = min(first_day - timedelta(days=1), end)
+        if start <= head_end:
+            ranges.append((start, head_end))
+    return ranges or [(start, end)]
+
+
+@dataclass(frozen=True)
+class PriceFetchPlan:
+    symbol: str
+    stock_id: int
+    ranges: tuple[DateRange, ...]
+
+
+class PriceGapPlanner:
+    """Builds per-symbol fetch plans for a whole universe in a few queries."""
+
+    def __init__(self) -> None:
+        self._stock_ids: dict[str, int] = {}
+
+    async def resolve_stock_ids(
+        self, session: AsyncSession, symbols: Sequence[str]
+    ) -> dict[str, int]:
+        """Map symbols to ``Stock.id``, querying only symbols not cached yet."""
+        unknown = [symbol for symbol in dict.fromkeys(symbols) if symbol not in self._stock_ids]
+        for offset in range(0, len(unknown), SYMBOL_LOOKUP_CHUNK):
+            chunk = unknown[offset : offset + SYMBOL_LOOKUP_CHUNK]
+            result = await session.execute(
+                select(Stock.symbol, Stock.id).where(Stock.symbol.in_(chunk))
+            )
+            for symbol, stock_id in result.fetchall():
+                if stock_id:
+                    self._stock_ids[symbol] = stock_id
+        return {symbol: self._stock_ids[symbol] for symbol in symbols if symbol in self._stock_ids}
+
+    async def load_gaps(
+        self,
+        session: AsyncSession,
+        symbols: Sequence[str],
+        holidays: Collection[date],
+    ) -> tuple[dict[str, DateRange], dict[str, list[date]]]:
+        """Return stored ``(first, last)`` bounds and missing trading days per symbol."""
+        if not symbols:
+            return {}, defaultdict(list)
+        if session.get_bind().dialect.name == "postgresql":
+            return await self.load_gaps_postgres(session, symbols, holidays)
+        return await self.load_gaps_portable(session, symbols, holidays)
+
+    async def load_gaps_postgres(
+        self,
+        session: AsyncSession,
+        symbols: Sequence[str],
+        holidays: Collection[date],
+    ) -> tuple[dict[str, DateRange], dict[str, list[date]]]:
+        """One ``generate_series`` anti-join for the whole universe."""
+        bounds: dict[str, DateRange] = {}
+        missing: dict[str, list[date]] = defaultdict(list)
+        result = await session.execute(
+            _POSTGRES_GAP_SQL,
+            {"symbols": list(symbols), "holidays": sorted(holidays)},
+        )
+        for symbol, first_day, last_day, missing_day in result.fetchall():
+            bounds[symbol] = (first_day, last_day)
+            if missing_day is not None:
+                missing[symbol].append(missing_day)
+        return bounds, missing
+
+    async def load_gaps_portable(
+        self,
+        session: AsyncSession,
+        symbols: Sequence[str],
+        holidays: Collection[date],
+    ) -> tuple[dict[str, DateRange], dict[str, list[date]]]:
+        """Load stored days per symbol and diff them against the trading calendar."""
+        bounds: dict[str, DateRange] = {}
+        missing: dict[str, list[date]] = defaultdict(list)
+        stored: dict[str, set[date]] = defaultdict(set)
+        for offset in range(0, len(symbols), SYMBOL_LOOKUP_CHUNK):
+            chunk = list(symbols[offset : offset + SYMBOL_LOOKUP_CHUNK])
+            result = await session.execute(
+                select(StockPrice.symbol, StockPrice.time).where(
+                    StockPrice.symbol.in_(chunk),
+                    StockPrice.interval == "1D",
+                )
+            )
+            for symbol, row_time in result.fetchall():
+                if isinstance(row_time, date):
+                    stored[symbol].add(row_time)
+
+        calendar = get_trading_calendar(holidays)
+        for symbol, days in stored.items():
+            first_day, last_day = min(days), max(days)
+            bounds[symbol] = (first_day, last_day)
+            missing[symbol] = calendar.missing_sessions(days, first_day, last_day)
+        return bounds, missing
+
+    async def plan(
+        self,
+        session: AsyncSession,
+        symbols: Sequence[str],
+        *,
+        start: date,
+        end: date,
+        fill_missing_gaps: bool,
+        max_range_days: int = DEFAULT_MAX_RANGE_DAYS,
+    ) -> dict[str, PriceFetchPlan]:
+        """Plan fetch windows for every symbol that exists in ``stocks``."""
+        stock_ids = await self.resolve_stock_ids(session, symbols)
+        planned_symbols = [symbol for symbol in symbols if symbol in stock_ids]
+
+        if not fill_missing_gaps:
+            return {
+                symbol: PriceFetchPlan(symbol, stock_ids[symbol], ((start, end),))
+                for symbol in planned_symbols
+            }
+
+        holidays = configured_market_holidays()
+        bounds, missing = await self.load_gaps(session, planned_symbols, holidays)
+        plans: dict[str, PriceFetchPlan] = {}
+        gap_windows = 0
+        for symbol in planned_symbols:
+            ranges = plan_fetch_ranges(
+                bounds=bounds.get(symbol),
+                missing_days=missing.get(symbol, ()),
+                start=start,
+                end=end,
+                max_range_days=max_range_days,
+                holidays=holidays,
+            )
+            gap_windows += len(ranges)
+            plans[symbol] = PriceFetchPlan(symbol, stock_ids[symbol], tuple(ranges))
+
+        logger.info(
+            "Planned %d price fetch windows for %d symbols (%d with stored history)",
+            gap_windows,
+            len(plans),
+            len(bounds),
+        )
+        return plans
@@ -0,0 +1,294 @@
+"""
+Aligned multi-symbol close-price panel.
+
+:func:`load_close_panel` backs ``ComparisonService.compare_price_performance``
+with one ``dates x symbols`` NumPy matrix, filled from:
+
+1. one ``StockPrice`` query for all symbols;
+2. one Mongo ``market_prices_eod`` ``$in`` query (the canonical EOD corpus)
+   laid over it;
+3. concurrent provider fetches only for the gaps that remain: symbols with
+   no stored bars, history before a short stored series starts, stale tails
+   and interior holes.
+
+Forward-fill and rebasing are whole-matrix NumPy operations, so baskets of
+30+ symbols over multi-year windows cost a few array passes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+import numpy as np
+from sqlalchemy import select
+
+from vnibb.core.config import settings
+from vnibb.core.database import async_session_maker
+from vnibb.core.trading_calendar import get_trading_calendar
+from vnibb.models.stock import StockPrice
+from vnibb.services.price_gap_planner import DateRange, plan_fetch_ranges
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_FETCH_CONCURRENCY = 8
+# More holes than this and one request spanning them is cheaper.
+MAX_PROVIDER_RANGES_PER_SYMBOL = 3
+# A stored series starting this many sessions (or fewer) after the window
+# start counts as complete at the head, e.g. across unconfigured holidays.
+HEAD_GAP_TOLERANCE_SESSIONS = 5
+
+
+@dataclass(frozen=True)
+class ClosePanel:
+    """Close prices on a shared trading-date index; NaN where a symbol has no bar."""
+
+    dates: np.ndarray  # datetime64[D], ascending
+    symbols: tuple[str, ...]
+    closes: np.ndarray  # float64, shape (len(dates), len(symbols))
+
+    @property
+    def is_empty(self) -> bool:
+        return self.closes.size == 0
+
+
+def build_close_panel(
+    series: Mapping[str, Mapping[date, float]],
+    symbols: Sequence[str] | None = None,
+) -> ClosePanel:
+    """Align per-symbol ``{date: close}`` maps on the union of their dates."""
+    ordered = tuple(symbols) if symbols is not None else tuple(series)
+    all_days = sorted({day for symbol in ordered for day in series.get(symbol, {})})
+    dates = np.array(all_days, dtype="datetime64[D]")
+    closes = np.full((len(dates), len(ordered)), np.nan)
+    for column, symbol in enumerate(ordered):
+        points = series.get(symbol) or {}
+        if not points:
+            continue
+        days = np.array(list(points.keys()), dtype="datetime64[D]")
+        values = np.array(list(points.values()), dtype=float)
+        closes[np.searchsorted(dates, days), column] = values
+    return ClosePanel(dates=dates, symbols=ordered, closes=closes)
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """Carry each column's last observation down over NaN gaps."""
+    if values.size == 0:
+        return values.copy()
+    rows = np.arange(values.shape[0])[:, None]
+    last_valid = np.where(np.isnan(values), 0, rows)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    filled = values[last_valid, np.arange(values.shape[1])]
+    # Leading NaNs stay NaN: the accumulated index points at row 0.
+    return filled
+
+
+def rebase(values: np.ndarray, base: float = 100.0) -> np.ndarray:
+    """Scale each column so its first observation equals ``base``.
+
+    Columns whose first observation is not positive are pinned to ``base``.
+    """
+    if values.size == 0:
+        return values.copy()
+    observed = ~np.isnan(values)
+    first_row = observed.argmax(axis=0)
+    first = values[first_row, np.arange(values.shape[1])]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rebased = values / first * base
+    rebased[:, ~(first > 0)] = base
+    rebased[~observed] = np.nan
+    return rebased
+
+
+def _close_value(row: Any, *keys: str) -> float | None:
+    for key in keys:
+        value = row.get(key) if isinstance(row, Mapping) else getattr(row, key, None)
+        if value is None:
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            continue
+        if np.isfinite(number):
+            return number
+    return None
+
+
+def _trade_day(value: Any) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+async def _load_db_closes(
+    symbols: Sequence[str], start_date: date, end_date: date
+) -> dict[str, dict[date, float]]:
+    series: dict[str, dict[date, float]] = {}
+    try:
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(StockPrice.symbol, StockPrice.time, StockPrice.close).where(
+                    StockPrice.symbol.in_(list(symbols)),
+                    StockPrice.interval == "1D",
+                    StockPrice.time >= start_date,
+                    StockPrice.time <= end_date,
+                )
+            )
+            for symbol, day, close in result.all():
+                if close is not None:
+                    series.setdefault(str(symbol).upper(), {})[day] = float(close)
+    except Exception as exc:
+        logger.warning(f"Price panel DB read failed: {exc}")
+    return series
+
+
+async def _load_mongo_closes(
+    symbols: Sequence[str], start_date: date, end_date: date
+) -> dict[str, dict[date, float]]:
+    from vnibb.services.mongo_market_data_service import get_mongo_market_data_service
+
+    mongo = get_mongo_market_data_service()
+    if not mongo.enabled:
+        return {}
+    docs = await mongo.get_eod_prices_between_many(
+        symbols, start_date=start_date, end_date=end_date
+    )
+    series: dict[str, dict[date, float]] = {}
+    for symbol, rows in docs.items():
+        for row in rows:
+            day = _trade_day(row.get("tradeDate"))
+            close = _close_value(row, "close")
+            if day is not None and close is not None:
+                series.setdefault(symbol, {})[day] = close
+    return series
+
+
+def _provider_ranges(
+    stored: Mapping[date, float],
+    expected_days: Sequence[date],
+    start_date: date,
+    end_date: date,
+    holidays: frozenset[date],
+) -> list[DateRange]:
+    if not stored:
+        return [(start_date, end_date)]
+    first_day = min(stored)
+    ranges: list[DateRange] = []
+    if sum(1 for day in expected_days if day < first_day) > HEAD_GAP_TOLERANCE_SESSIONS:
+        ranges.append((start_date, first_day - timedelta(days=1)))
+    missing = [day for day in expected_days if day >= first_day and day not in stored]
+    if missing:
+        ranges += plan_fetch_ranges(
+            bounds=(first_day, max(stored)),
+            missing_days=[day for day in missing if day <= max(stored)],
+            start=first_day,
+            end=max(missing),
+            holidays=holidays,
+        )
+    if len(ranges) > MAX_PROVIDER_RANGES_PER_SYMBOL:
+        return [(min(r[0] for r in ranges), max(r[1] for r in ranges))]
+    return ranges
+
+
+async def _fetch_provider_closes(
+    symbol: str, ranges: Sequence[DateRange], source: str
+) -> dict[date, float]:
+    from vnibb.providers.vnstock.equity_historical import (
+        EquityHistoricalQueryParams,
+        VnstockEquityHistoricalFetcher,
+    )
+
+    closes: dict[date, float] = {}
+    for range_start, range_end in ranges:
+        try:
+            rows = await VnstockEquityHistoricalFetcher.fetch(
+                EquityHistoricalQueryParams(
+                    symbol=symbol,
+                    start_date=range_start,
+                    end_date=range_end,
+                    interval="1D",
+                    source=source,
+                )
+            )
+        except Exception as exc:
+            logger.warning(f"Performance fetch failed for {symbol}: {exc}")
+            continue
+        for row in rows or []:
+            day = _trade_day(getattr(row, "time", None))
+            close = _close_value(row, "close")
+            if day is not None and close is not None:
+                closes[day] = close
+    return closes
+
+
+async def load_close_panel(
+    symbols: Sequence[str],
+    start_date: date,
+    end_date: date,
+    *,
+    source: str = settings.vnstock_source,
+) -> ClosePanel:
+    """Build the close panel from stored prices, filling gaps from the provider."""
+    ordered = tuple(dict.fromkeys(symbol.upper() for symbol in symbols if symbol))
+    if not ordered:
+        return build_close_panel({}, ())
+
+    db_series, mongo_series = await asyncio.gather(
+        _load_db_closes(ordered, start_date, end_date),
+        _load_mongo_closes(ordered, start_date, end_date),
+    )
+    series: dict[str, dict[date, float]] = {}
+    for symbol in ordered:
+        merged = dict(db_series.get(symbol, {}))
+        merged.update(mongo_series.get(symbol, {}))
+        series[symbol] = merged
+
+    # Today's bar is usually not stored yet; only completed sessions count as gaps.
+    calendar = get_trading_calendar()
+    holidays = calendar.holidays
+    required_end = min(end_date, date.today() - timedelta(days=1))
+    expected_days = calendar.sessions_between(start_date, required_end)
+    plans = {
+        symbol: ranges
+        for symbol in ordered
+        if (
+            ranges := _provider_ranges(
+                series[symbol], expected_days, start_date, end_date, holidays
+            )
+        )
+    }
+
+    if plans:
+        semaphore = asyncio.Semaphore(PROVIDER_FETCH_CONCURRENCY)
+
+        async def fill(symbol: str, ranges: list[DateRange]) -> tuple[str, dict[date, float]]:
+            async with semaphore:
+                return symbol, await _fetch_provider_closes(symbol, ranges, source)
+
+        for symbol, closes in await asyncio.gather(
+            *(fill(symbol, ranges) for symbol, ranges in plans.items())
+        ):
+            for day, close in closes.items():
+                series[symbol].setdefault(day, close)
+
+    return build_close_panel(series, ordered)
+
+
+__all__ = [
+    "ClosePanel",
+    "build_close_panel",
+    "forward_fill",
+    "load_close_panel",
+    "rebase",
+]
@@ -22,6 +22,7 @@ from vnibb.core.database import async_session_maker
 from vnibb.core.scheduler_lock import DistributedJobLock
 from vnibb.models.stock import StockIndex
 from vnibb.models.trading import IntradayTrade, OrderbookSnapshot
+from vnibb.services.alert_rule_engine import Tick, alert_rule_engine
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,38 @@ def is_vietnam_market_open(check_time: datetime | None = None) -> bool:
     return time(9) <= current_time < time(11, 30) or time(13) <= current_time < time(14, 45)
 
 
+def tick_from_stream(data: dict) -> Tick | None:
+    """Map a ``stockps`` stream/price-board row onto an alert rule tick."""
+    symbol = str(data.get("symbol", data.get("code", "")) or "").upper()
+    try:
+        price = float(data.get("price", data.get("close", 0)) or 0)
+    except (TypeError, ValueError):
+        return None
+    if not symbol or price <= 0:
+        return None
+
+    def _optional_float(*keys: str) -> float | None:
+        for key in keys:
+            value = data.get(key)
+            if value is None:
+                continue
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+        return None
+
+    volume = _optional_float("accumulated_volume", "totalVolume", "volume", "vol")
+    return Tick(
+        symbol=symbol,
+        price=price,
+        volume=int(volume) if volume is not None else None,
+        change_pct=_optional_float("changePct", "change_pct"),
+        foreign_net_value=_optional_float("foreign_net_value", "foreignNetValue"),
+        timestamp=datetime.utcnow(),
+    )
+
+
 class RealtimePipeline:
     """
     Real-time data streaming manager.
@@ -156,6 +189,8 @@ class RealtimePipeline:
 
     async def _on_data_received(self, data_type: str, data: dict):
         """Callback for incoming WebSocket data."""
+        if data_type == "stockps":
+            await self._evaluate_alert_rules(data)
         try:
             async with async_session_maker() as session:
                 if data_type == "stockps":
@@ -169,6 +204,16 @@ class RealtimePipeline:
         except Exception as e:
             logger.error(f"Failed to store {data_type} data: {e}")
 
+    async def _evaluate_alert_rules(self, data: dict) -> None:
+        """Run streaming alert rules on a price tick before it is stored."""
+        tick = tick_from_stream(data)
+        if tick is None:
+            return
+        try:
+            await alert_rule_engine.process_tick(tick)
+        except Exception as e:
+            logger.error(f"Alert rule evaluation failed for {tick.symbol}: {e}")
+
     async def _store_stock_price(self, session: AsyncSession, data: dict):
         """Store real-time stock price snapshot."""
         symbol = data.get("symbol", data.get("code", ""))
@@ -245,9 +290,12 @@ class RealtimePipeline:
                 df = trading.price_board(symbols_list=symbols)
 
                 if df is not None and not df.empty:
+                    rows = [row.to_dict() for _, row in df.iterrows()]
+                    for row in rows:
+                        await self._evaluate_alert_rules(row)
                     async with async_session_maker() as session:
-                        for _, row in df.iterrows():
-                            await self._store_stock_price(session, row.to_dict())
+                        for row in rows:
+                            await self._store_stock_price(session, row)
                         await session.commit()
 
                     logger.debug(f"Polled {len(df)} price updates")
@@ -0,0 +1,240 @@
+"""
+Relative Rotation Graph (RRG) over an aligned close panel.
+
+RS-Ratio and RS-Momentum are computed for every column of a
+``sessions x entities`` matrix against one benchmark, one time step at a
+time with every column updated together:
+
+- RS line ``rs = numerator / benchmark`` on the benchmark's sessions;
+- RS-Ratio ``= 100 * EMA_fast(rs) / EMA_slow(rs)``, so 100 means the
+  relative trend is flat;
+- RS-Momentum ``= 100 * RS-Ratio / EMA_momentum(RS-Ratio)``.
+
+Both ratios are scale-free, so the three EMAs plus a session count are the
+whole per-entity state (:class:`RrgState`). The nightly job advances
+yesterday's state by the new sessions instead of replaying history.
+Sector columns are equal-weighted indices of member returns, built for all
+sectors with one membership-matrix product.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+FAST_SPAN = 10
+SLOW_SPAN = 63  # ~13 weeks, the window the weekly snapshot job used
+MOMENTUM_SPAN = 10
+WARMUP_SESSIONS = SLOW_SPAN
+TRAIL_STEP = 5  # sessions between trail points (one trading week)
+SECTOR_BASE_LEVEL = 100.0
+
+NO_STATE_DATE = np.datetime64("1900-01-01", "D")
+
+
+def _alpha(span: int) -> float:
+    return 2.0 / (span + 1.0)
+
+
+def resolve_quadrant(rs_ratio: float | None, rs_momentum: float | None) -> str:
+    if rs_ratio is None or rs_momentum is None:
+        return "Unknown"
+    if rs_ratio >= 100 and rs_momentum >= 100:
+        return "Leading"
+    if rs_ratio < 100 and rs_momentum >= 100:
+        return "Improving"
+    if rs_ratio < 100 and rs_momentum < 100:
+        return "Lagging"
+    return "Weakening"
+
+
+@dataclass
+class RrgState:
+    """Per-entity EMA state; NaN EMAs and ``NO_STATE_DATE`` mark a fresh entity."""
+
+    entities: tuple[str, ...]
+    as_of: np.ndarray  # datetime64[D]
+    ema_fast: np.ndarray
+    ema_slow: np.ndarray
+    ema_momentum: np.ndarray
+    level: np.ndarray
+    sessions: np.ndarray  # int64
+
+    @classmethod
+    def empty(cls, entities: Sequence[str]) -> RrgState:
+        size = len(entities)
+        return cls(
+            entities=tuple(entities),
+            as_of=np.full(size, NO_STATE_DATE),
+            ema_fast=np.full(size, np.nan),
+            ema_slow=np.full(size, np.nan),
+            ema_momentum=np.full(size, np.nan),
+            level=np.full(size, np.nan),
+            sessions=np.zeros(size, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_rows(
+        cls, entities: Sequence[str], rows: Mapping[str, Mapping[str, object]]
+    ) -> RrgState:
+        """Build state for ``entities`` from stored rows; entities without a row start fresh."""
+        state = cls.empty(entities)
+        for column, entity in enumerate(state.entities):
+            row = rows.get(entity)
+            if not row:
+                continue
+            state.as_of[column] = np.datetime64(row["as_of_date"], "D")
+            state.ema_fast[column] = row["ema_fast"]
+            state.ema_slow[column] = row["ema_slow"]
+            state.ema_momentum[column] = row["ema_momentum"]
+            state.level[column] = np.nan if row.get("level") is None else row["level"]
+            state.sessions[column] = row["sessions"]
+        return state
+
+
+@dataclass(frozen=True)
+class RrgSeries:
+    """RS-Ratio/RS-Momentum per session; NaN before warm-up and on skipped sessions."""
+
+    dates: np.ndarray  # datetime64[D], ascending
+    entities: tuple[str, ...]
+    rs_ratio: np.ndarray  # float64, shape (len(dates), len(entities))
+    rs_momentum: np.ndarray
+
+
+def advance_rrg(
+    state: RrgState,
+    dates: np.ndarray,
+    numerators: np.ndarray,
+    benchmark: np.ndarray,
+) -> tuple[RrgState, RrgSeries]:
+    """Advance ``state`` over the sessions in ``dates``.
+
+    ``numerators`` is ``(len(dates), len(state.entities))`` and ``benchmark``
+    has one close per session, both already forward-filled. A column only
+    moves on sessions after its ``as_of`` date where its RS value is finite,
+    so passing an overlapping window never double-counts a session.
+    """
+    a_fast, a_slow, a_momentum = _alpha(FAST_SPAN), _alpha(SLOW_SPAN), _alpha(MOMENTUM_SPAN)
+    as_of = state.as_of.copy()
+    fast = state.ema_fast.copy()
+    slow = state.ema_slow.copy()
+    momentum_ema = state.ema_momentum.copy()
+    level = state.level.copy()
+    sessions = state.sessions.copy()
+    ratio_out = np.full(numerators.shape, np.nan)
+    momentum_out = np.full(numerators.shape, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = numerators / benchmark[:, None]
+        rs[~(rs > 0) | ~np.isfinite(rs)] = np.nan
+
+        for row, session in enumerate(dates):
+            value = rs[row]
+            live = np.isfinite(value) & (session > as_of)
+            if not live.any():
+                continue
+            seed = live & np.isnan(slow)
+            fast = np.where(seed, value, np.where(live, fast + a_fast * (value - fast), fast))
+            slow = np.where(seed, value, np.where(live, slow + a_slow * (value - slow), slow))
+            ratio = 100.0 * fast / slow
+            momentum_seed = live & np.isnan(momentum_ema)
+            momentum_ema = np.where(
+                momentum_seed,
+                ratio,
+                np.where(live, momentum_ema + a_momentum * (ratio - momentum_ema), momentum_ema),
+            )
+            sessions += live
+            as_of[live] = session
+            level[live] = numerators[row, live]
+            ready = live & (sessions >= WARMUP_SESSIONS)
+            ratio_out[row, ready] = ratio[ready]
+            momentum_out[row, ready] = 100.0 * ratio[ready] / momentum_ema[ready]
+
+    advanced = RrgState(
+        entities=state.entities,
+        as_of=as_of,
+        ema_fast=fast,
+        ema_slow=slow,
+        ema_momentum=momentum_ema,
+        level=level,
+        sessions=sessions,
+    )
+    series = RrgSeries(
+        dates=dates,
+        entities=state.entities,
+        rs_ratio=ratio_out,
+        rs_momentum=momentum_out,
+    )
+    return advanced, series
+
+
+def sector_levels(
+    dates: np.ndarray,
+    symbols: Sequence[str],
+    closes: np.ndarray,
+    sectors: Mapping[str, Sequence[str]],
+    state: RrgState,
+) -> np.ndarray:
+    """Equal-weighted index level per sector on each session.
+
+    ``closes`` is forward-filled ``(len(dates), len(symbols))``; the columns
+    of the result follow ``state.entities``. Each session's sector return is
+    the mean of its members' close-to-close returns, computed for all sectors
+    as one matrix product. Levels continue from ``state.level`` after a
+    sector's ``as_of`` date; a fresh sector starts at ``SECTOR_BASE_LEVEL``
+    on the session before its first observed return.
+    """
+    position = {symbol: column for column, symbol in enumerate(symbols)}
+    weights = np.zeros((len(symbols), len(state.entities)))
+    for column, sector in enumerate(state.entities):
+        members = [position[symbol] for symbol in sectors.get(sector, ()) if symbol in position]
+        weights[members, column] = 1.0
+
+    returns = np.full(closes.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if len(dates) > 1:
+            returns[1:] = closes[1:] / closes[:-1] - 1.0
+        returns[~np.isfinite(returns)] = np.nan
+        observed = np.isfinite(returns)
+        counts = observed.astype(float) @ weights
+        sector_returns = (np.where(observed, returns, 0.0) @ weights) / counts
+
+    has_return = np.isfinite(sector_returns)
+    pending = dates[:, None] > state.as_of[None, :]
+    growth = np.where(has_return & pending, 1.0 + sector_returns, 1.0)
+    fresh = np.isnan(state.level)
+    start = np.where(fresh, SECTOR_BASE_LEVEL, state.level)
+    levels = start[None, :] * np.cumprod(growth, axis=0)
+
+    # A fresh sector has no level until the session before its first return.
+    started = np.logical_or.accumulate(has_return, axis=0)
+    started[:-1] |= has_return[1:]
+    return np.where(fresh[None, :] & ~started, np.nan, levels)
+
+
+def trail_positions(count: int, weeks: int, step: int = TRAIL_STEP) -> list[int]:
+    """Row positions of a weekly trail ending at the last of ``count`` rows, oldest first."""
+    return [
+        count - 1 - offset * step
+        for offset in range(weeks, -1, -1)
+        if count - 1 - offset * step >= 0
+    ]
+
+
+__all__ = [
+    "FAST_SPAN",
+    "MOMENTUM_SPAN",
+    "NO_STATE_DATE",
+    "RrgSeries",
+    "RrgState",
+    "SLOW_SPAN",
+    "TRAIL_STEP",
+    "WARMUP_SESSIONS",
+    "advance_rrg",
+    "resolve_quadrant",
+    "sector_levels",
+    "trail_positions",
+]
@@ -1,186 +1,448 @@
-"""Persist weekly RS snapshots so the Relative Rotation Graph trail
+"""Persist daily RS snapshots so the Relative Rotation Graph trail
 renders as a meaningful polyline (QA-v3 E.4).
 
-Run it on Friday close (or whenever close is available). Idempotent:
-re-running the same snapshot_date upserts.
+:func:`take_rs_snapshot` loads one aligned close panel for the whole
+universe against the benchmark, advances the stored per-entity EMA state
+(:mod:`vnibb.services.rrg_panel`) by the sessions since the last run and
+bulk-upserts one ``rs_snapshots`` row per symbol/sector and session.
+Entities without state replay ``REBUILD_LOOKBACK_DAYS`` of history once.
+:func:`get_rs_trail` and :func:`get_rotation` only read stored rows.
+
+Run it nightly after the price sync. Idempotent: re-running over the same
+sessions upserts the same rows.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import date, datetime, timedelta
-from typing import Iterable
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, timedelta
+from itertools import groupby
+from typing import Any
 
 import numpy as np
-import pandas as pd
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from vnibb.core.database import async_session_maker
-from vnibb.models.market import RsSnapshot
-from vnibb.models.stock import StockPrice
+from vnibb.models.market import RsRotationState, RsSnapshot
+from vnibb.models.stock import StockIndex, StockPrice
+from vnibb.services.bulk_writer import bulk_upsert
+from vnibb.services.price_panel import build_close_panel, forward_fill
+from vnibb.services.rrg_panel import (
+    SLOW_SPAN,
+    TRAIL_STEP,
+    RrgSeries,
+    RrgState,
+    advance_rrg,
+    resolve_quadrant,
+    sector_levels,
+    trail_positions,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BENCHMARK = "VNINDEX"
+SCOPE_SYMBOL = "symbol"
+SCOPE_SECTOR = "sector"
+DEFAULT_TRAIL_WEEKS = 12
+# Enough sessions for the slow EMA to settle before the trail starts.
+REBUILD_LOOKBACK_DAYS = 400
+# State older than this (delisted/suspended) does not hold back the load window.
+STALE_STATE_DAYS = 30
+SNAPSHOT_BACKFILL_SESSIONS = DEFAULT_TRAIL_WEEKS * TRAIL_STEP + 1
+SNAPSHOT_RETENTION_DAYS = 400
+
+
+async def _load_state_rows(
+    session: AsyncSession, benchmark: str
+) -> dict[str, dict[str, dict[str, Any]]]:
+    rows = (
+        await session.execute(select(RsRotationState).where(RsRotationState.benchmark == benchmark))
+    ).scalars()
+    by_scope: dict[str, dict[str, dict[str, Any]]] = {}
+    for row in rows:
+        by_scope.setdefault(row.scope, {})[row.entity] = {
+            "as_of_date": row.as_of_date,
+            "ema_fast": row.ema_fast,
+            "ema_slow": row.ema_slow,
+            "ema_momentum": row.ema_momentum,
+            "level": row.level,
+            "sessions": row.sessions,
+        }
+    return by_scope
+
+
+async def _load_closes(
+    session: AsyncSession,
+    start_date: date,
+    end_date: date,
+    symbols: Sequence[str] | None = None,
+) -> dict[str, dict[date, float]]:
+    stmt = select(StockPrice.symbol, StockPrice.time, StockPrice.close).where(
+        StockPrice.interval == "1D",
+        StockPrice.time >= start_date,
+        StockPrice.time <= end_date,
+    )
+    if symbols is not None:
+        stmt = stmt.where(StockPrice.symbol.in_(list(symbols)))
+    series: dict[str, dict[date, float]] = {}
+    for symbol, day, close in (await session.execute(stmt)).all():
+        if symbol and close is not None:
+            series.setdefault(str(symbol).upper(), {})[day] = float(close)
+    return series
+
+
+async def _load_benchmark(
+    session: AsyncSession, benchmark: str, start_date: date, end_date: date
+) -> dict[date, float]:
+    rows = await session.execute(
+        select(StockIndex.time, StockIndex.close).where(
+            StockIndex.index_code == benchmark,
+            StockIndex.time >= start_date,
+            StockIndex.time <= end_date,
+        )
+    )
+    return {day: float(close) for day, close in rows.all() if close is not None}
+
 
-def _compute_rs_pair(symbol_returns: pd.Series, bench_returns: pd.Series) -> tuple[float | None, float | None]:
-    """Compute (RS-Ratio, RS-Momentum) on a 13-week / ~63-trading-day window.
+def align_to_benchmark(
+    closes: Mapping[str, Mapping[date, float]],
+    benchmark_closes: Mapping[date, float],
+    symbols: Sequence[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``(dates, closes, benchmark)`` on the benchmark's sessions, forward-filled.
 
-    Following the standard RRG definition: cumulative relative
-    performance vs benchmark, normalised so 100 = parity. RS-Ratio is
-    the smoothed level; RS-Momentum is the rate of change.
+    Bars on days the benchmark did not print still carry into the next
+    benchmark session.
     """
+    bench_key = "\0benchmark"
+    panel = build_close_panel({**closes, bench_key: benchmark_closes}, [*symbols, bench_key])
+    on_session = np.isfinite(panel.closes[:, -1])
+    filled = forward_fill(panel.closes)[on_session]
+    return panel.dates[on_session], filled[:, :-1], filled[:, -1]
+
+
+def _snapshot_rows(
+    series: RrgSeries, scope: str, benchmark: str, first_row: int
+) -> list[dict[str, Any]]:
+    ratio = series.rs_ratio[first_row:]
+    momentum = series.rs_momentum[first_row:]
+    days = series.dates[first_row:].astype(object)
+    rows, columns = np.nonzero(np.isfinite(ratio) & np.isfinite(momentum))
+    snapshot_rows = []
+    for row, column in zip(rows.tolist(), columns.tolist(), strict=True):
+        rs_ratio = round(float(ratio[row, column]), 4)
+        rs_momentum = round(float(momentum[row, column]), 4)
+        snapshot_rows.append(
+            {
+                "symbol": series.entities[column],
+                "scope": scope,
+                "benchmark": benchmark,
+                "snapshot_date": days[row],
+                "rs_ratio": rs_ratio,
+                "rs_momentum": rs_momentum,
+                "quadrant": resolve_quadrant(rs_ratio, rs_momentum),
+                "lookback_days": SLOW_SPAN,
+            }
+        )
+    return snapshot_rows
+
 
-    window = 63
-    if len(symbol_returns) < window + 5:
-        return None, None
-    aligned = pd.concat([symbol_returns, bench_returns], axis=1, join="inner").dropna()
-    if len(aligned) < window + 5:
-        return None, None
-    aligned.columns = ["symbol", "bench"]
-    rel = (1 + aligned["symbol"]) / (1 + aligned["bench"]) - 1
-    rs_ratio_raw = (1 + rel.rolling(window).sum()) * 100
-    rs_momentum_raw = rs_ratio_raw / rs_ratio_raw.shift(10) * 100
-
-    last_ratio = rs_ratio_raw.iloc[-1]
-    last_momentum = rs_momentum_raw.iloc[-1]
-    if not np.isfinite(last_ratio) or not np.isfinite(last_momentum):
-        return None, None
-    return float(last_ratio), float(last_momentum)
-
-
-def _resolve_quadrant(rs_ratio: float, rs_momentum: float) -> str:
-    if rs_ratio >= 100 and rs_momentum >= 100:
-        return "Leading"
-    if rs_ratio < 100 and rs_momentum >= 100:
-        return "Improving"
-    if rs_ratio < 100 and rs_momentum < 100:
-        return "Lagging"
-    return "Weakening"
+def _state_rows(
+    before: RrgState, after: RrgState, scope: str, benchmark: str
+) -> list[dict[str, Any]]:
+    moved = np.nonzero(after.as_of > before.as_of)[0]
+    return [
+        {
+            "entity": after.entities[column],
+            "benchmark": benchmark,
+            "scope": scope,
+            "as_of_date": after.as_of[column].astype(object),
+            "ema_fast": float(after.ema_fast[column]),
+            "ema_slow": float(after.ema_slow[column]),
+            "ema_momentum": float(after.ema_momentum[column]),
+            "level": float(after.level[column]) if np.isfinite(after.level[column]) else None,
+            "sessions": int(after.sessions[column]),
+        }
+        for column in moved.tolist()
+    ]
 
 
 async def take_rs_snapshot(
     *,
     symbols: Iterable[str] | None = None,
-    benchmark: str = "VNINDEX",
-    snapshot_date: date | None = None,
-    lookback_days: int = 63,
+    sectors: Mapping[str, Sequence[str]] | None = None,
+    benchmark: str = DEFAULT_BENCHMARK,
+    as_of: date | None = None,
+    session_factory=async_session_maker,
 ) -> int:
-    """Compute and upsert RS snapshots for the given symbols vs benchmark."""
+    """Advance RRG state up to ``as_of`` and upsert the new snapshot rows.
 
-    target_date = snapshot_date or date.today()
+    ``symbols=None`` covers every symbol with daily bars in the window.
+    ``sectors`` maps sector ids to member symbols and adds one
+    equal-weighted column per sector. Returns the number of snapshot rows
+    written.
+    """
 
-    async with async_session_maker() as session:
-        # Pull benchmark close history (we use VNINDEX from `stock_indices`,
-        # but if unavailable we fall back to a representative liquid stock).
-        # Prefer the StockIndex table if VNINDEX is there.
-        from vnibb.models.stock import StockIndex
-
-        bench_q = (
-            select(StockIndex.time, StockIndex.close)
-            .where(StockIndex.index_code == benchmark)
-            .order_by(StockIndex.time.asc())
+    end_date = as_of or date.today()
+    rebuild_start = end_date - timedelta(days=REBUILD_LOOKBACK_DAYS)
+    sectors = {sector_id: list(members) for sector_id, members in (sectors or {}).items()}
+    wanted: list[str] | None = None
+    if symbols is not None:
+        wanted = sorted(
+            {str(symbol).strip().upper() for symbol in symbols if symbol and str(symbol).strip()}
+            | {member for members in sectors.values() for member in members}
         )
-        bench_rows = (await session.execute(bench_q)).all()
-        if not bench_rows:
+
+    async with session_factory() as session:
+        state_rows = await _load_state_rows(session, benchmark)
+        symbol_state = state_rows.get(SCOPE_SYMBOL, {})
+        sector_state = state_rows.get(SCOPE_SECTOR, {})
+        recent = [
+            row["as_of_date"]
+            for rows in state_rows.values()
+            for row in rows.values()
+            if row["as_of_date"] >= end_date - timedelta(days=STALE_STATE_DAYS)
+        ]
+        start_date = min(recent) if recent else rebuild_start
+
+        closes = await _load_closes(session, start_date, end_date, wanted)
+        if start_date > rebuild_start:
+            # New listings and new sectors need full history once.
+            history_symbols = {symbol for symbol in closes if symbol not in symbol_state}
+            for sector_id, members in sectors.items():
+                if sector_id not in sector_state:
+                    history_symbols.update(members)
+            if history_symbols:
+                closes.update(
+                    await _load_closes(session, rebuild_start, end_date, sorted(history_symbols))
+                )
+                start_date = rebuild_start
+        benchmark_closes = await _load_benchmark(session, benchmark, start_date, end_date)
+        if not benchmark_closes:
             logger.warning("No benchmark history for %s; skipping RS snapshot", benchmark)
             return 0
 
-        bench_series = pd.Series(
-            {row.time: float(row.close) for row in bench_rows if row.close is not None}
-        ).sort_index()
-        bench_returns = bench_series.pct_change().dropna()
-
-        if symbols is None:
-            symbol_q = select(StockPrice.symbol).distinct()
-            rows = (await session.execute(symbol_q)).all()
-            symbols = sorted({row[0] for row in rows if row[0]})
-
-        upserted = 0
-        for symbol in symbols:
-            sym_q = (
-                select(StockPrice.time, StockPrice.close)
-                .where(
-                    StockPrice.symbol == symbol,
-                    StockPrice.interval == "1D",
-                )
-                .order_by(StockPrice.time.asc())
-            )
-            sym_rows = (await session.execute(sym_q)).all()
-            if not sym_rows:
-                continue
-            sym_series = pd.Series(
-                {row.time: float(row.close) for row in sym_rows if row.close is not None}
-            ).sort_index()
-            sym_returns = sym_series.pct_change().dropna()
-
-            ratio, momentum = _compute_rs_pair(sym_returns, bench_returns)
-            if ratio is None or momentum is None:
-                continue
-            quadrant = _resolve_quadrant(ratio, momentum)
-
-            stmt = (
-                pg_insert(RsSnapshot)
-                .values(
-                    symbol=symbol,
-                    benchmark=benchmark,
-                    snapshot_date=target_date,
-                    rs_ratio=round(ratio, 4),
-                    rs_momentum=round(momentum, 4),
-                    quadrant=quadrant,
-                    lookback_days=lookback_days,
-                )
-                .on_conflict_do_update(
-                    constraint="uq_rs_snapshot_symbol_benchmark_date",
-                    set_={
-                        "rs_ratio": round(ratio, 4),
-                        "rs_momentum": round(momentum, 4),
-                        "quadrant": quadrant,
-                        "lookback_days": lookback_days,
-                    },
-                )
-            )
-            await session.execute(stmt)
-            upserted += 1
+        universe = sorted(closes) if wanted is None else [s for s in wanted if s in closes]
+        dates, close_matrix, bench = align_to_benchmark(closes, benchmark_closes, universe)
+        first_row = max(0, len(dates) - SNAPSHOT_BACKFILL_SESSIONS)
+
+        before = RrgState.from_rows(universe, symbol_state)
+        after, series = advance_rrg(before, dates, close_matrix, bench)
+        snapshot_rows = _snapshot_rows(series, SCOPE_SYMBOL, benchmark, first_row)
+        state_updates = _state_rows(before, after, SCOPE_SYMBOL, benchmark)
+
+        if sectors:
+            sector_before = RrgState.from_rows(sorted(sectors), sector_state)
+            levels = sector_levels(dates, universe, close_matrix, sectors, sector_before)
+            sector_after, sector_series = advance_rrg(sector_before, dates, levels, bench)
+            snapshot_rows.extend(_snapshot_rows(sector_series, SCOPE_SECTOR, benchmark, first_row))
+            state_updates.extend(_state_rows(sector_before, sector_after, SCOPE_SECTOR, benchmark))
 
+        written = await bulk_upsert(
+            session,
+            RsSnapshot,
+            ["symbol", "benchmark", "snapshot_date"],
+            snapshot_rows,
+        )
+        await bulk_upsert(session, RsRotationState, ["entity", "benchmark"], state_updates)
+        await session.execute(
+            delete(RsSnapshot).where(
+                RsSnapshot.benchmark == benchmark,
+                RsSnapshot.snapshot_date < end_date - timedelta(days=SNAPSHOT_RETENTION_DAYS),
+            )
+        )
         await session.commit()
-        logger.info("RS snapshot complete: %d symbols upserted for %s", upserted, target_date)
-        return upserted
+
+    logger.info(
+        "RS snapshot complete: %d rows, %d entities advanced, %d sessions through %s",
+        written,
+        len(state_updates),
+        len(dates),
+        end_date,
+    )
+    return written
+
+
+async def run_rs_rotation_snapshot() -> int:
+    """Scheduler entry point: the full universe plus every ``VN_SECTORS`` group."""
+    # Sector membership rules live with the sectors API; imported lazily so
+    # the service layer does not load the router at import time.
+    from vnibb.api.v1.sectors import resolve_all_sector_symbols
+
+    async with async_session_maker() as session:
+        sectors = await resolve_all_sector_symbols(session)
+    return await take_rs_snapshot(sectors=sectors)
+
+
+def _trail_point(snapshot_date: date, rs_ratio: Any, rs_momentum: Any) -> dict[str, object]:
+    return {
+        "snapshot_date": snapshot_date.isoformat(),
+        "rs_ratio": float(rs_ratio) if rs_ratio is not None else None,
+        "rs_momentum": float(rs_momentum) if rs_momentum is not None else None,
+    }
+
+
+def _rotation_point(
+    symbol: str, points: Sequence[tuple[date, Any, Any]], weeks: int
+) -> dict[str, object]:
+    """Latest reading plus a weekly trail from ``(date, ratio, momentum)`` rows, oldest first."""
+    snapshot_date, rs_ratio, rs_momentum = points[-1]
+    return {
+        "symbol": symbol,
+        "snapshot_date": snapshot_date.isoformat(),
+        "rs_ratio": round(float(rs_ratio), 2),
+        "rs_momentum": round(float(rs_momentum), 2),
+        "quadrant": resolve_quadrant(rs_ratio, rs_momentum),
+        "trail": [
+            _trail_point(*points[position]) for position in trail_positions(len(points), weeks)
+        ],
+    }
+
+
+def _sort_points(points: list[dict[str, object]]) -> list[dict[str, object]]:
+    return sorted(points, key=lambda point: point["rs_ratio"], reverse=True)
+
+
+def rotation_points_from_series(series: RrgSeries, weeks: int) -> list[dict[str, object]]:
+    """Rotation points straight from a computed series, for callers without snapshots."""
+    days = series.dates.astype(object)
+    ready = np.isfinite(series.rs_ratio) & np.isfinite(series.rs_momentum)
+    points = []
+    for column, entity in enumerate(series.entities):
+        rows = np.nonzero(ready[:, column])[0]
+        if not rows.size:
+            continue
+        history = [
+            (days[row], series.rs_ratio[row, column], series.rs_momentum[row, column])
+            for row in rows[-(weeks * TRAIL_STEP + 1) :].tolist()
+        ]
+        points.append(_rotation_point(entity, history, weeks))
+    return _sort_points(points)
+
+
+async def compute_rotation(
+    db: AsyncSession,
+    symbols: Sequence[str],
+    *,
+    start_date: date,
+    end_date: date,
+    benchmark: str = DEFAULT_BENCHMARK,
+    weeks: int = DEFAULT_TRAIL_WEEKS,
+) -> dict[str, Any]:
+    """:func:`get_rotation`'s payload computed from stored bars, without persisting.
+
+    Fallback for when the nightly job has not written snapshots yet.
+    """
+    closes = await _load_closes(db, start_date, end_date, symbols)
+    benchmark_closes = await _load_benchmark(db, benchmark, start_date, end_date)
+    universe = [symbol for symbol in symbols if symbol in closes]
+    if not universe or not benchmark_closes:
+        return {"benchmark": benchmark, "scope": SCOPE_SYMBOL, "as_of": None, "points": []}
+
+    dates, close_matrix, bench = align_to_benchmark(closes, benchmark_closes, universe)
+    _, series = advance_rrg(RrgState.empty(universe), dates, close_matrix, bench)
+    return {
+        "benchmark": benchmark,
+        "scope": SCOPE_SYMBOL,
+        "as_of": dates[-1].astype(object).isoformat() if len(dates) else None,
+        "points": rotation_points_from_series(series, weeks),
+    }
+
+
+async def _fetch_all(db: AsyncSession | None, stmt) -> list[Any]:
+    if db is not None:
+        return list((await db.execute(stmt)).all())
+    async with async_session_maker() as session:
+        return list((await session.execute(stmt)).all())
 
 
 async def get_rs_trail(
     symbol: str,
     *,
-    benchmark: str = "VNINDEX",
-    weeks: int = 12,
+    benchmark: str = DEFAULT_BENCHMARK,
+    weeks: int = DEFAULT_TRAIL_WEEKS,
+    scope: str = SCOPE_SYMBOL,
+    db: AsyncSession | None = None,
 ) -> list[dict[str, object]]:
-    """Return the last N weekly RS snapshots for a symbol so the RRG widget
-    can draw a polyline."""
+    """Return a weekly trail (oldest first) from the stored daily snapshots
+    so the RRG widget can draw a polyline."""
 
-    cutoff = date.today() - timedelta(weeks=weeks + 1)
-    async with async_session_maker() as session:
-        q = (
-            select(
-                RsSnapshot.snapshot_date,
-                RsSnapshot.rs_ratio,
-                RsSnapshot.rs_momentum,
-                RsSnapshot.quadrant,
-            )
-            .where(
-                RsSnapshot.symbol == symbol.upper(),
-                RsSnapshot.benchmark == benchmark,
-                RsSnapshot.snapshot_date >= cutoff,
-            )
-            .order_by(RsSnapshot.snapshot_date.asc())
+    entity = symbol.upper() if scope == SCOPE_SYMBOL else symbol
+    rows = await _fetch_all(
+        db,
+        select(
+            RsSnapshot.snapshot_date,
+            RsSnapshot.rs_ratio,
+            RsSnapshot.rs_momentum,
+            RsSnapshot.quadrant,
+        )
+        .where(
+            RsSnapshot.symbol == entity,
+            RsSnapshot.scope == scope,
+            RsSnapshot.benchmark == benchmark,
         )
-        rows = (await session.execute(q)).all()
+        .order_by(RsSnapshot.snapshot_date.desc())
+        .limit(weeks * TRAIL_STEP + 1),
+    )
+    rows.reverse()
+    trail = []
+    for position in trail_positions(len(rows), weeks):
+        row = rows[position]
+        point = _trail_point(row.snapshot_date, row.rs_ratio, row.rs_momentum)
+        trail.append({**point, "quadrant": row.quadrant})
+    return trail
 
-    return [
-        {
-            "snapshot_date": row.snapshot_date.isoformat(),
-            "rs_ratio": float(row.rs_ratio) if row.rs_ratio is not None else None,
-            "rs_momentum": float(row.rs_momentum) if row.rs_momentum is not None else None,
-            "quadrant": row.quadrant,
-        }
-        for row in rows
+
+async def get_rotation(
+    scope: str = SCOPE_SYMBOL,
+    *,
+    benchmark: str = DEFAULT_BENCHMARK,
+    entities: Iterable[str] | None = None,
+    weeks: int = DEFAULT_TRAIL_WEEKS,
+    db: AsyncSession | None = None,
+) -> dict[str, Any]:
+    """Latest RS-Ratio/RS-Momentum and weekly trail for every stored entity
+    of ``scope`` (optionally limited to ``entities``), strongest first."""
+
+    base = (RsSnapshot.scope == scope, RsSnapshot.benchmark == benchmark)
+    session_rows = await _fetch_all(
+        db,
+        select(RsSnapshot.snapshot_date)
+        .where(*base)
+        .distinct()
+        .order_by(RsSnapshot.snapshot_date.desc())
+        .limit(weeks * TRAIL_STEP + 1),
+    )
+    if not session_rows:
+        return {"benchmark": benchmark, "scope": scope, "as_of": None, "points": []}
+
+    stmt = (
+        select(
+            RsSnapshot.symbol,
+            RsSnapshot.snapshot_date,
+            RsSnapshot.rs_ratio,
+            RsSnapshot.rs_momentum,
+        )
+        .where(*base, RsSnapshot.snapshot_date >= session_rows[-1].snapshot_date)
+        .order_by(RsSnapshot.symbol, RsSnapshot.snapshot_date)
+    )
+    if entities is not None:
+        stmt = stmt.where(RsSnapshot.symbol.in_(list(entities)))
+    rows = await _fetch_all(db, stmt)
+
+    points = [
+        _rotation_point(
+            symbol,
+            [(row.snapshot_date, row.rs_ratio, row.rs_momentum) for row in group],
+            weeks,
+        )
+        for symbol, group in groupby(rows, key=lambda row: row.symbol)
     ]
+    return {
+        "benchmark": benchmark,
+        "scope": scope,
+        "as_of": session_rows[0].snapshot_date.isoformat(),
+        "points": _sort_points(points),
+    }
@@ -13,6 +13,7 @@ from sqlalchemy import select
 
 from vnibb.core.database import async_session_maker
 from vnibb.core.config import settings
+from vnibb.core.dataset_versions import DATASET_SCREENER, bumps_datasets
 from vnibb.models.screener import ScreenerSnapshot
 from vnibb.providers.vnstock.equity_screener import VnstockScreenerFetcher, StockScreenerParams
 
@@ -24,6 +25,7 @@ class ScreenerService:
     Dedicated service for syncing screener data.
     """
 
+    @bumps_datasets(DATASET_SCREENER)
     async def sync_screener_data(
         self,
         exchanges: List[str] = None,
@@ -0,0 +1,281 @@
+"""Process-level columnar screener snapshot.
+
+Heatmap, screener, comparison and peers all read the latest
+``screener_snapshots`` universe (~1,600 symbols). Instead of running
+``max(snapshot_date)`` + a full ORM ``select(ScreenerSnapshot)`` on every
+Redis miss, each worker keeps one immutable :class:`ScreenerSnapshotFrame`
+holding the latest snapshot date per source as plain column tuples plus a
+symbol -> row index. Readers get :class:`ScreenerSnapshotRow` views that
+reference the shared columns without copying them.
+
+The frame is rebuilt once after ``store_screener_data`` /
+``sync_screener_data`` and swapped in with a single reference assignment,
+so concurrent readers always see either the old or the new frame. Writes
+from other processes (scheduler worker) are picked up after
+``REFRESH_INTERVAL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vnibb.core.database import async_session_factory
+from vnibb.models.screener import ScreenerSnapshot
+
+logger = logging.getLogger(__name__)
+
+SCREENER_SNAPSHOT_COLUMNS: tuple[str, ...] = tuple(
+    column.key for column in ScreenerSnapshot.__table__.columns
+)
+
+_EMPTY_POSITIONS: tuple[int, ...] = ()
+
+
+class ScreenerSnapshotRow:
+    """Read-only attribute view over one row of a :class:`ScreenerSnapshotFrame`.
+
+    Exposes the same attribute names as the ``ScreenerSnapshot`` ORM model so
+    existing ``getattr(row, ...)`` consumers keep working. Unknown attributes
+    raise ``AttributeError`` like the ORM object would.
+    """
+
+    __slots__ = ("_columns", "_position")
+
+    def __init__(self, columns: Mapping[str, tuple[Any, ...]], position: int):
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_position", position)
+
+    def __getattr__(self, name: str) -> Any:
+        values = self._columns.get(name)
+        if values is None:
+            raise AttributeError(name)
+        return values[self._position]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ScreenerSnapshotRow is read-only")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: values[self._position] for name, values in self._columns.items()}
+
+    def __repr__(self) -> str:
+        return f"<ScreenerSnapshotRow(symbol='{self.symbol}', date='{self.snapshot_date}')>"
+
+
+@dataclass(frozen=True)
+class ScreenerSnapshotFrame:
+    """Immutable columnar copy of the latest screener snapshot per source."""
+
+    columns: Mapping[str, tuple[Any, ...]]
+    symbol_index: Mapping[str, tuple[int, ...]]
+    partition_index: Mapping[tuple[str, date], tuple[int, ...]]
+    date_index: Mapping[date, tuple[int, ...]]
+    latest_by_source: Mapping[str, date]
+    built_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[Any, ...]]) -> ScreenerSnapshotFrame:
+        """Transpose DB rows (in ``SCREENER_SNAPSHOT_COLUMNS`` order) into a frame."""
+        if rows:
+            transposed = zip(*rows, strict=True)
+            columns = {
+                name: tuple(values)
+                for name, values in zip(SCREENER_SNAPSHOT_COLUMNS, transposed, strict=True)
+            }
+        else:
+            columns = dict.fromkeys(SCREENER_SNAPSHOT_COLUMNS, ())
+
+        symbol_index: dict[str, list[int]] = {}
+        partition_index: dict[tuple[str, date], list[int]] = {}
+        date_index: dict[date, list[int]] = {}
+        latest_by_source: dict[str, date] = {}
+
+        for position, (symbol, snapshot_date, source) in enumerate(
+            zip(columns["symbol"], columns["snapshot_date"], columns["source"], strict=True)
+        ):
+            symbol_index.setdefault(str(symbol).upper(), []).append(position)
+            partition_index.setdefault((source, snapshot_date), []).append(position)
+            date_index.setdefault(snapshot_date, []).append(position)
+            current = latest_by_source.get(source)
+            if current is None or snapshot_date > current:
+                latest_by_source[source] = snapshot_date
+
+        return cls(
+            columns=MappingProxyType(columns),
+            symbol_index=MappingProxyType({k: tuple(v) for k, v in symbol_index.items()}),
+            partition_index=MappingProxyType({k: tuple(v) for k, v in partition_index.items()}),
+            date_index=MappingProxyType({k: tuple(v) for k, v in date_index.items()}),
+            latest_by_source=MappingProxyType(latest_by_source),
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns["symbol"])
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.built_at
+
+    @cached_property
+    def version(self) -> tuple[Any, ...]:
+        """Data stamp of the frame: latest date per source, row count and newest write."""
+        return (
+            tuple(sorted(self.latest_by_source.items())),
+            len(self),
+            max(filter(None, self.columns["created_at"]), default=None),
+        )
+
+    def latest_date(self, source: str | None = None) -> date | None:
+        """Latest snapshot date for ``source``, or across all sources when None."""
+        if source:
+            return self.latest_by_source.get(source)
+        return max(self.latest_by_source.values(), default=None)
+
+    def positions(
+        self,
+        *,
+        snapshot_date: date,
+        source: str | None = None,
+        symbol: str | None = None,
+    ) -> tuple[int, ...]:
+        if source:
+            scoped = self.partition_index.get((source, snapshot_date), _EMPTY_POSITIONS)
+        else:
+            scoped = self.date_index.get(snapshot_date, _EMPTY_POSITIONS)
+        if not symbol:
+            return scoped
+        candidates = self.symbol_index.get(symbol.upper(), _EMPTY_POSITIONS)
+        allowed = set(scoped)
+        return tuple(position for position in candidates if position in allowed)
+
+    def rows(self, positions: tuple[int, ...]) -> list[ScreenerSnapshotRow]:
+        """Build zero-copy row views for the given positions."""
+        return [ScreenerSnapshotRow(self.columns, position) for position in positions]
+
+    def select(
+        self,
+        *,
+        snapshot_date: date,
+        source: str | None = None,
+        symbol: str | None = None,
+    ) -> list[ScreenerSnapshotRow]:
+        """Return row views for one (source, date) partition, optionally one symbol."""
+        return self.rows(
+            self.positions(snapshot_date=snapshot_date, source=source, symbol=symbol)
+        )
+
+    def max_created_at(self, positions: tuple[int, ...]) -> datetime | None:
+        created = self.columns["created_at"]
+        return max((created[position] for position in positions if created[position]), default=None)
+
+
+class ScreenerSnapshotStore:
+    """Holds the published :class:`ScreenerSnapshotFrame` for this process."""
+
+    REFRESH_INTERVAL_SECONDS = 300
+
+    def __init__(self) -> None:
+        self._frame: ScreenerSnapshotFrame | None = None
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def frame(self) -> ScreenerSnapshotFrame | None:
+        return self._frame
+
+    def current_frame(self) -> ScreenerSnapshotFrame | None:
+        """The published frame if it is still fresh enough to serve, without loading."""
+        frame = self._frame
+        return frame if self._is_usable(frame) else None
+
+    def _is_usable(self, frame: ScreenerSnapshotFrame | None) -> bool:
+        return (
+            frame is not None
+            and not frame.is_empty
+            and frame.age_seconds < self.REFRESH_INTERVAL_SECONDS
+        )
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def get_frame(self, session: AsyncSession | None = None) -> ScreenerSnapshotFrame:
+        """Return the published frame, building it first if missing or expired."""
+        frame = self._frame
+        if self._is_usable(frame):
+            return frame
+
+        async with self._get_lock():
+            frame = self._frame
+            if self._is_usable(frame):
+                return frame
+            return await self.rebuild(session)
+
+    async def rebuild(self, session: AsyncSession | None = None) -> ScreenerSnapshotFrame:
+        """Load the latest snapshot per source and publish it atomically.
+
+        Empty frames are returned but never published, so the next reader
+        retries instead of caching "no data" for the refresh interval.
+        """
+        if session is not None:
+            frame = await self._load(session)
+        else:
+            async with async_session_factory() as own_session:
+                frame = await self._load(own_session)
+
+        if not frame.is_empty:
+            self._frame = frame
+            logger.info(
+                "Published screener snapshot frame: %d rows across %d source(s)",
+                len(frame),
+                len(frame.latest_by_source),
+            )
+        return frame
+
+    async def refresh_after_write(self, session: AsyncSession | None = None) -> None:
+        """Rebuild after a screener write; failures drop the frame instead of raising."""
+        try:
+            await self.rebuild(session)
+        except Exception as exc:
+            logger.warning("Screener snapshot frame rebuild failed: %s", exc)
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        self._frame = None
+
+    @staticmethod
+    async def _load(session: AsyncSession) -> ScreenerSnapshotFrame:
+        latest_result = await session.execute(
+            select(ScreenerSnapshot.source, func.max(ScreenerSnapshot.snapshot_date)).group_by(
+                ScreenerSnapshot.source
+            )
+        )
+        partitions = [
+            and_(ScreenerSnapshot.source == source, ScreenerSnapshot.snapshot_date == latest)
+            for source, latest in latest_result.all()
+            if latest is not None
+        ]
+        if not partitions:
+            return ScreenerSnapshotFrame.from_rows([])
+
+        table = ScreenerSnapshot.__table__
+        result = await session.execute(
+            select(*(table.c[name] for name in SCREENER_SNAPSHOT_COLUMNS)).where(or_(*partitions))
+        )
+        return ScreenerSnapshotFrame.from_rows([tuple(row) for row in result.all()])
+
+
+screener_snapshot_store = ScreenerSnapshotStore()
@@ -3,14 +3,28 @@ Sentiment Analyzer Service using Gemini AI
 
 Analyzes Vietnamese news articles for market sentiment.
 Classifies as: Bullish, Neutral, or Bearish with confidence scores.
+
+Articles are keyed by a normalized content hash. Results are memoized in
+process and in ``news_sentiment_results`` per model, so repeated and
+syndicated articles are scored once. Cache misses are packed into batches
+of ``settings.sentiment_batch_size`` articles per model request with a JSON
+response schema. The model sits behind :class:`SentimentBackend`, so tests
+can swap in a local deterministic backend.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
+import unicodedata
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+from sqlalchemy import select
 
 from vnibb.core.config import settings
 
@@ -24,6 +38,135 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+MEMORY_CACHE_MAX_ITEMS = 5_000
+CONTENT_HASH_BODY_CHARS = 500
+
+
+def sentiment_content_hash(
+    title: str | None,
+    content: str | None = None,
+    summary: str | None = None,
+) -> str:
+    """SHA-256 of the normalized title and lead, shared by syndicated copies."""
+
+    def _normalize(value: str | None) -> str:
+        text = unicodedata.normalize("NFKC", str(value or "")).lower()
+        text = re.sub(r"[^\w\s]", " ", text)
+        return re.sub(r"\s+", " ", text).strip()
+
+    lead = _normalize(summary or content)[:CONTENT_HASH_BODY_CHARS]
+    payload = f"{_normalize(title)}\n{lead}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _normalize_model_result(result: dict[str, Any]) -> dict[str, Any]:
+    sentiment = str(result.get("sentiment") or "neutral").lower()
+    if sentiment not in ["bullish", "neutral", "bearish"]:
+        sentiment = "neutral"
+
+    try:
+        confidence = int(result.get("confidence", 50))
+    except (TypeError, ValueError):
+        confidence = 50
+    confidence = max(0, min(100, confidence))  # Clamp to 0-100
+
+    return {
+        "sentiment": sentiment,
+        "confidence": confidence,
+        "symbols": list(result.get("symbols") or [])[:5],  # Max 5 symbols
+        "sectors": list(result.get("sectors") or [])[:3],  # Max 3 sectors
+        "ai_summary": str(result.get("summary") or result.get("ai_summary") or ""),
+    }
+
+
+class SentimentBackend(Protocol):
+    """Scores a batch of articles; ``None`` marks an article it could not score."""
+
+    name: str
+
+    async def analyze_many(self, articles: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        ...
+
+
+class BatchSentimentItem(BaseModel):
+    id: int
+    sentiment: str
+    confidence: int
+    symbols: list[str] = []
+    sectors: list[str] = []
+    summary: str = ""
+
+
+class GeminiSentimentBackend:
+    """Packs a batch of articles into one structured-output Gemini request."""
+
+    BATCH_SENTIMENT_PROMPT = """Phân tích từng bài báo tài chính tiếng Việt dưới đây.
+
+Với mỗi bài báo (xác định bằng "id"), trả về:
+1. sentiment: "bullish" (tích cực), "neutral" (trung lập), hoặc "bearish" (tiêu cực)
+2. confidence: Độ tin cậy từ 0-100 (số nguyên)
+3. symbols: Danh sách mã cổ phiếu được đề cập (tối đa 5 mã)
+4. sectors: Danh sách ngành được đề cập (tối đa 3 ngành)
+5. summary: Tóm tắt 2-3 câu bằng tiếng Việt
+
+Trả về một mảng JSON, mỗi phần tử ứng với một bài báo và giữ nguyên "id".
+
+Các bài báo:
+{articles}"""
+
+    # Keep the packed prompt well inside the model's input budget.
+    MAX_CONTENT_CHARS = 1200
+
+    def __init__(self, client: Any, model_name: str):
+        self.client = client
+        self.name = model_name
+
+    def build_prompt(self, articles: list[dict[str, Any]]) -> str:
+        packed = [
+            {
+                "id": index,
+                "title": article.get("title", ""),
+                "content": str(
+                    article.get("content") or article.get("summary") or article.get("title") or ""
+                )[: self.MAX_CONTENT_CHARS],
+            }
+            for index, article in enumerate(articles)
+        ]
+        return self.BATCH_SENTIMENT_PROMPT.format(
+            articles=json.dumps(packed, ensure_ascii=False, indent=1)
+        )
+
+    async def analyze_many(self, articles: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        response = await self.client.aio.models.generate_content(
+            model=self.name,
+            contents=self.build_prompt(articles),
+            config=types.GenerateContentConfig(
+                temperature=0.3,
+                top_p=0.8,
+                top_k=40,
+                response_mime_type="application/json",
+                response_schema=list[BatchSentimentItem],
+            ),
+        )
+
+        # Remove markdown code blocks if present
+        result_text = re.sub(r"```(?:json)?\s*", "", response.text.strip())
+        parsed = json.loads(result_text)
+        if not isinstance(parsed, list):
+            raise ValueError("batch sentiment response is not a JSON array")
+
+        results: list[dict[str, Any] | None] = [None] * len(articles)
+        for item in parsed:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < len(articles):
+                results[index] = _normalize_model_result(item)
+        return results
+
 
 class SentimentAnalyzer:
     """
@@ -68,36 +211,19 @@ class SentimentAnalyzer:
         "lỗ nặng",
     ]
 
-    SENTIMENT_PROMPT = """Phân tích bài báo tài chính tiếng Việt sau đây và trả về kết quả theo định dạng JSON chính xác:
-
-Bài báo:
-Tiêu đề: {title}
-Nội dung: {content}
-
-Yêu cầu phân tích:
-1. Sentiment: Xác định tâm lý thị trường là "bullish" (tích cực), "neutral" (trung lập), hoặc "bearish" (tiêu cực)
-2. Confidence: Độ tin cậy từ 0-100 (số nguyên)
-3. Symbols: Danh sách mã cổ phiếu được đề cập (tối đa 5 mã)
-4. Sectors: Danh sách ngành được đề cập (tối đa 3 ngành)
-5. Summary: Tóm tắt 2-3 câu bằng tiếng Việt
-
-Trả về CHÍNH XÁC theo định dạng JSON sau (không thêm markdown hay text khác):
-{{
-  "sentiment": "bullish|neutral|bearish",
-  "confidence": 85,
-  "symbols": ["VNM", "HPG"],
-  "sectors": ["Ngân hàng", "Bất động sản"],
-  "summary": "Tóm tắt ngắn gọn về nội dung chính của bài báo."
-}}"""
-
-    def __init__(self):
+    def __init__(self, backend: SentimentBackend | None = None):
         self.api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
         self.client = None
         self.model_name = "gemini-1.5-flash"
-        self._initialized = False
-        self._cache = {}  # Simple in-memory cache
+        self.backend: SentimentBackend | None = backend
+        self._initialized = backend is not None
+        # (model, content_hash) -> (result, cached_at), least recently used first
+        self._cache: OrderedDict[tuple[str, str], tuple[dict[str, Any], datetime]] = OrderedDict()
         self._cache_ttl = timedelta(hours=24)
 
+        if backend is not None:
+            return
+
         if not settings.enable_ai_sentiment_analysis:
             logger.info("AI sentiment analysis is paused. Using neutral-only processing.")
             return
@@ -105,6 +231,7 @@ Trả về CHÍNH XÁC theo định dạng JSON sau (không thêm markdown hay t
         if self.api_key and HAS_GEMINI:
             try:
                 self.client = genai.Client(api_key=self.api_key)
+                self.backend = GeminiSentimentBackend(self.client, self.model_name)
                 self._initialized = True
                 logger.info("SentimentAnalyzer initialized with Gemini 1.5 Flash")
             except Exception as e:
@@ -118,7 +245,7 @@ Trả về CHÍNH XÁC theo định dạng JSON sau (không thêm markdown hay t
     @property
     def is_available(self) -> bool:
         """Check if AI sentiment analysis is available."""
-        return self._initialized and self.client is not None
+        return self._initialized and self.backend is not None
 
     @property
     def is_paused(self) -> bool:
@@ -135,6 +262,15 @@ Trả về CHÍNH XÁC theo định dạng JSON sau (không thêm markdown hay t
         result["ai_summary"] = (summary or title)[:200]
         return result
 
+    def quick_result(self, article: dict[str, Any]) -> dict[str, Any]:
+        """Rule-based result used while the model result is pending or unavailable."""
+        title = article.get("title", "") or ""
+        if self.is_paused:
+            return self.paused_result(title, article.get("content"), article.get("summary"))
+        return self._analyze_with_rules(
+            title, article.get("content") or article.get("summary") or title
+        )
+
     async def analyze_article(
         self,
         title: str,
@@ -150,89 +286,93 @@ Trả về CHÍNH XÁC theo định dạng JSON sau (không thêm markdown hay t
         Returns:
             Dict with sentiment, confidence, symbols, sectors, summary
         """
-        # Use cache key based on title
-        cache_key = f"sentiment_{hash(title)}"
-
-        # Check cache
-        if cache_key in self._cache:
-            cached_result, cached_time = self._cache[cache_key]
-            if datetime.utcnow() - cached_time < self._cache_ttl:
-                logger.debug(f"Using cached sentiment for: {title[:50]}")
-                return cached_result
-
-        # Prepare text for analysis
-        text_to_analyze = content or summary or title
-
-        if self.is_paused:
-            result = self.paused_result(title, content, summary)
-            self._cache[cache_key] = (result, datetime.utcnow())
-            return result
-
-        if self.is_available:
-            result = await self._analyze_with_ai(title, text_to_analyze)
-        else:
-            result = self._analyze_with_rules(title, text_to_analyze)
-
-        # Cache result
-        self._cache[cache_key] = (result, datetime.utcnow())
-
+        article = {"title": title, "content": content, "summary": summary}
+        return (await self.analyze_batch([article]))[0]
+
+    def _cache_get(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        result, cached_at = cached
+        if datetime.utcnow() - cached_at >= self._cache_ttl:
+            self._cache.pop(key, None)
+            return None
+        self._cache.move_to_end(key)
         return result
 
-    async def _analyze_with_ai(self, title: str, content: str) -> dict[str, Any]:
-        """Analyze using Gemini AI."""
-        try:
-            # Truncate content to avoid token limits (max ~2000 chars)
-            content_truncated = content[:2000] if len(content) > 2000 else content
-
-            prompt = self.SENTIMENT_PROMPT.format(title=title, content=content_truncated)
-
-            # Generate response
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.3,
-                    top_p=0.8,
-                    top_k=40,
-                    response_mime_type="application/json",
-                ),
-            )
-
-            # Parse JSON response
-            result_text = response.text.strip()
-
-            # Remove markdown code blocks if present
-            result_text = re.sub(r"```json\s*", "", result_text)
-            result_text = re.sub(r"```\s*", "", result_text)
-
-            import json
-
-            result = json.loads(result_text)
-
-            # Validate and normalize
-            sentiment = result.get("sentiment", "neutral").lower()
-            if sentiment not in ["bullish", "neutral", "bearish"]:
-                sentiment = "neutral"
+    def _cache_put(self, key: tuple[str, str], result: dict[str, Any]) -> None:
+        self._cache[key] = (result, datetime.utcnow())
+        self._cache.move_to_end(key)
+        while len(self._cache) > MEMORY_CACHE_MAX_ITEMS:
+            self._cache.popitem(last=False)
 
-            confidence = int(result.get("confidence", 50))
-            confidence = max(0, min(100, confidence))  # Clamp to 0-100
+    async def _load_persisted(self, model: str, hashes: list[str]) -> dict[str, dict[str, Any]]:
+        if not hashes:
+            return {}
+        from vnibb.core.database import async_session_maker
+        from vnibb.models.news_sentiment import NewsSentimentResult
 
-            symbols = result.get("symbols", [])[:5]  # Max 5 symbols
-            sectors = result.get("sectors", [])[:3]  # Max 3 sectors
-            ai_summary = result.get("summary", "")
+        try:
+            async with async_session_maker() as session:
+                result = await session.execute(
+                    select(NewsSentimentResult).where(
+                        NewsSentimentResult.model == model,
+                        NewsSentimentResult.content_hash.in_(hashes),
+                    )
+                )
+                return {row.content_hash: row.to_result() for row in result.scalars().all()}
+        except Exception as e:
+            logger.debug(f"Sentiment memo lookup failed: {e}")
+            return {}
 
-            return {
-                "sentiment": sentiment,
-                "confidence": confidence,
-                "symbols": symbols,
-                "sectors": sectors,
-                "ai_summary": ai_summary,
+    async def _persist(self, model: str, results: dict[str, dict[str, Any]]) -> None:
+        if not results:
+            return
+        from vnibb.core.database import async_session_maker
+        from vnibb.models.news_sentiment import NewsSentimentResult
+        from vnibb.services.bulk_writer import bulk_upsert
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "content_hash": content_hash,
+                "model": model,
+                "sentiment": result["sentiment"],
+                "confidence": result["confidence"],
+                "symbols": result.get("symbols") or [],
+                "sectors": result.get("sectors") or [],
+                "ai_summary": result.get("ai_summary"),
+                "created_at": now,
             }
-
+            for content_hash, result in results.items()
+        ]
+        try:
+            async with async_session_maker() as session:
+                await bulk_upsert(session, NewsSentimentResult, ["content_hash", "model"], rows)
+                await session.commit()
         except Exception as e:
-            logger.error(f"AI sentiment analysis failed: {e}")
-            # Fallback to rule-based
-            return self._analyze_with_rules(title, content)
+            logger.debug(f"Sentiment memo write failed: {e}")
+
+    async def lookup_cached(self, articles: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        """Memoized model results only; never calls the model."""
+        if self.is_paused or not self.is_available:
+            return [None] * len(articles)
+
+        model = self.backend.name
+        hashes = [
+            sentiment_content_hash(a.get("title"), a.get("content"), a.get("summary"))
+            for a in articles
+        ]
+        found: dict[str, dict[str, Any]] = {}
+        for content_hash in hashes:
+            cached = self._cache_get((model, content_hash))
+            if cached is not None:
+                found[content_hash] = cached
+        missing = sorted({h for h in hashes if h not in found})
+        for content_hash, result in (await self._load_persisted(model, missing)).items():
+            self._cache_put((model, content_hash), result)
+            found[content_hash] = result
+        return [dict(found[h]) if h in found else None for h in hashes]
 
     def _analyze_with_rules(self, title: str, content: str) -> dict[str, Any]:
         """Fallback rule-based sentiment analysis."""
@@ -272,41 +412,65 @@ Trả về CHÍNH XÁC theo định dạng JSON sau (không thêm markdown hay t
         self, articles: list[dict[str, Any]], max_concurrent: int = 5
     ) -> list[dict[str, Any]]:
         """
-        Analyze multiple articles in batch with concurrency control.
+        Analyze multiple articles, packing cache misses into batched model calls.
         Args:
             articles: List of dicts with 'title', 'content', 'summary'
-            max_concurrent: Max concurrent API calls
+            max_concurrent: Max concurrent model requests (each covers a batch)
         Returns:
-            List of sentiment results
+            List of sentiment results, aligned with ``articles``
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def analyze_with_semaphore(article):
-            async with semaphore:
-                return await self.analyze_article(
-                    title=article.get("title", ""),
-                    content=article.get("content"),
-                    summary=article.get("summary"),
-                )
-
-        tasks = [analyze_with_semaphore(article) for article in articles]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch analysis failed for article {i}: {result}")
-                # Use fallback
-                processed_results.append(
-                    self._analyze_with_rules(
-                        articles[i].get("title", ""), articles[i].get("content", "")
-                    )
-                )
-            else:
-                processed_results.append(result)
-
-        return processed_results
+        if not articles:
+            return []
+        if self.is_paused:
+            return [
+                self.paused_result(a.get("title", "") or "", a.get("content"), a.get("summary"))
+                for a in articles
+            ]
+        if not self.is_available:
+            return [self.quick_result(article) for article in articles]
+
+        model = self.backend.name
+        hashes = [
+            sentiment_content_hash(a.get("title"), a.get("content"), a.get("summary"))
+            for a in articles
+        ]
+        cached = await self.lookup_cached(articles)
+        found = {h: result for h, result in zip(hashes, cached, strict=False) if result is not None}
+
+        # One representative article per uncached hash.
+        pending: dict[str, dict[str, Any]] = {}
+        for content_hash, article in zip(hashes, articles, strict=False):
+            if content_hash not in found and content_hash not in pending:
+                pending[content_hash] = article
+
+        if pending:
+            batch_size = max(1, settings.sentiment_batch_size)
+            items = list(pending.items())
+            batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+            semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+            async def score(batch: list[tuple[str, dict[str, Any]]]):
+                async with semaphore:
+                    return await self.backend.analyze_many([article for _, article in batch])
+
+            responses = await asyncio.gather(*(score(b) for b in batches), return_exceptions=True)
+
+            scored: dict[str, dict[str, Any]] = {}
+            for batch, response in zip(batches, responses, strict=False):
+                if isinstance(response, Exception):
+                    logger.error(f"Batch sentiment analysis failed: {response}")
+                    response = [None] * len(batch)
+                for (content_hash, article), result in zip(batch, response, strict=False):
+                    if result is None:
+                        # Rule-based stand-in; not memoized so the model retries later.
+                        found[content_hash] = self.quick_result(article)
+                        continue
+                    scored[content_hash] = result
+                    found[content_hash] = result
+                    self._cache_put((model, content_hash), result)
+            await self._persist(model, scored)
+
+        return [dict(found[content_hash]) for content_hash in hashes]
 
     def calculate_market_sentiment(self, articles: list[dict[str, Any]]) -> dict[str, Any]:
         """
@@ -0,0 +1,143 @@
+"""
+Background sentiment queue.
+
+Read paths (news flow, company news, market sentiment) must never wait on
+model inference. :meth:`SentimentQueue.read` returns memoized model results
+where they exist. For everything else it returns the rule-based result
+straight away and queues the article. A single worker task drains the queue
+in ``settings.sentiment_batch_size`` chunks through
+``SentimentAnalyzer.analyze_batch``. That call persists each result by
+content hash, so the next read of the article, or of a syndicated copy,
+gets the model's verdict.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from vnibb.core.config import settings
+from vnibb.services.sentiment_analyzer import (
+    SentimentAnalyzer,
+    sentiment_analyzer,
+    sentiment_content_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+# Concurrent model requests per drain; each request carries a whole batch.
+WORKER_MAX_CONCURRENT = 2
+
+
+class SentimentQueue:
+    """Deduplicating in-process queue with one background drain task."""
+
+    def __init__(
+        self,
+        analyzer: SentimentAnalyzer = sentiment_analyzer,
+        *,
+        max_size: int | None = None,
+    ):
+        self.analyzer = analyzer
+        self.max_size = max_size or settings.sentiment_queue_max_size
+        self._pending: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.dropped = 0
+        self.processed = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def accepts_work(self) -> bool:
+        return not self.analyzer.is_paused and self.analyzer.is_available
+
+    def submit(self, articles: list[dict[str, Any]]) -> int:
+        """Queue articles for model scoring without waiting; returns how many were added."""
+        if not self.accepts_work:
+            return 0
+        added = 0
+        for article in articles:
+            content_hash = sentiment_content_hash(
+                article.get("title"), article.get("content"), article.get("summary")
+            )
+            if content_hash in self._pending:
+                continue
+            if len(self._pending) >= self.max_size:
+                self.dropped += 1
+                continue
+            self._pending[content_hash] = {
+                "title": article.get("title", ""),
+                "content": article.get("content"),
+                "summary": article.get("summary"),
+            }
+            added += 1
+        if added:
+            self._wakeup.set()
+        return added
+
+    async def read(self, articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Memoized model results, else an immediate rule-based result plus a queued job."""
+        cached = await self.analyzer.lookup_cached(articles)
+        results: list[dict[str, Any]] = []
+        misses: list[dict[str, Any]] = []
+        for article, result in zip(articles, cached, strict=False):
+            if result is None:
+                misses.append(article)
+                result = self.analyzer.quick_result(article)
+            results.append(result)
+        self.submit(misses)
+        return results
+
+    async def drain(self, max_items: int | None = None) -> int:
+        """Score queued articles in batches; returns how many were processed."""
+        processed = 0
+        batch_size = max(1, settings.sentiment_batch_size)
+        chunk_size = batch_size * WORKER_MAX_CONCURRENT
+        while self._pending and (max_items is None or processed < max_items):
+            take = chunk_size if max_items is None else min(chunk_size, max_items - processed)
+            chunk = [self._pending.popitem(last=False)[1] for _ in range(min(take, len(self)))]
+            try:
+                await self.analyzer.analyze_batch(chunk, max_concurrent=WORKER_MAX_CONCURRENT)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Background sentiment batch failed: {exc}")
+            processed += len(chunk)
+        self.processed += processed
+        return processed
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            await self.drain()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="sentiment-queue-worker")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "pending": len(self),
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+sentiment_queue = SentimentQueue()
+
+
+__all__ = ["SentimentQueue", "sentiment_queue"]
@@ -0,0 +1,406 @@
+"""
+Declarative stage graph for long-running pipeline jobs.
+
+``run_full_seeding``, ``run_daily_trading_updates`` and ``run_reinforcement``
+used to walk a flat stage list one stage at a time even when stages share
+nothing (officers vs dividends vs foreign trading). A :class:`StageGraph`
+declares each stage's dependencies and resource pool instead, and
+:func:`run_stage_graph` starts every stage whose dependencies are done, up
+to ``max_parallel`` stages at once and ``pool_limits[pool]`` per pool. All
+stages still draw provider calls from the pipeline's shared rate limiters,
+so overlapping stages share one request budget rather than multiplying it.
+
+Progress is kept per stage. Each stage receives its own
+:class:`StageProgress` slice of the run's progress document, so the
+existing ``last_symbol`` resume logic in the ``sync_*`` methods works per
+(stage, symbol) even while several stages run concurrently. Checkpointing a
+slice saves the whole document with aggregated counters, and
+:func:`summarize_progress` turns a saved document into per-stage
+throughput and ETA figures for the progress API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL = "provider"
+
+STAGE_PENDING = "pending"
+STAGE_RUNNING = "running"
+STAGE_COMPLETED = "completed"
+STAGE_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class StageSpec:
+    name: str
+    depends_on: tuple[str, ...] = ()
+    pool: str = DEFAULT_POOL
+
+
+class StageGraph:
+    """Validated stage DAG; iteration order is a stable topological order."""
+
+    def __init__(self, specs: Iterable[StageSpec]):
+        self.specs: dict[str, StageSpec] = {}
+        for spec in specs:
+            if spec.name in self.specs:
+                raise ValueError(f"Duplicate stage: {spec.name}")
+            self.specs[spec.name] = spec
+
+        for spec in self.specs.values():
+            unknown = [dep for dep in spec.depends_on if dep not in self.specs]
+            if unknown:
+                raise ValueError(f"Stage {spec.name} depends on unknown stages: {unknown}")
+
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> list[str]:
+        order: list[str] = []
+        done: set[str] = set()
+        remaining = list(self.specs)
+        while remaining:
+            ready = [
+                name
+                for name in remaining
+                if all(dep in done for dep in self.specs[name].depends_on)
+            ]
+            if not ready:
+                raise ValueError(f"Stage graph has a cycle among: {remaining}")
+            order.extend(ready)
+            done.update(ready)
+            remaining = [name for name in remaining if name not in done]
+        return order
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.specs
+
+    def subset(self, names: Iterable[str]) -> StageGraph:
+        """Graph limited to ``names``; dependencies outside the subset are dropped."""
+        selected = set(names)
+        unknown = selected - set(self.specs)
+        if unknown:
+            raise ValueError(f"Unknown stages: {sorted(unknown)}")
+        return StageGraph(
+            StageSpec(
+                name=name,
+                depends_on=tuple(dep for dep in self.specs[name].depends_on if dep in selected),
+                pool=self.specs[name].pool,
+            )
+            for name in self.order
+            if name in selected
+        )
+
+    def ready(self, done: Iterable[str], started: Iterable[str]) -> list[str]:
+        finished = set(done)
+        blocked = finished | set(started)
+        return [
+            name
+            for name in self.order
+            if name not in blocked
+            and all(dep in finished for dep in self.specs[name].depends_on)
+        ]
+
+
+class StageProgress(dict):
+    """One stage's slice of a run progress document.
+
+    It is stored inside ``root["stages"]`` and serializes as a plain dict;
+    ``root`` lets checkpoints persist the whole document.
+    """
+
+    def __init__(self, root: dict[str, Any], *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.root = root
+
+
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def init_stage_progress(
+    progress: dict[str, Any],
+    graph: StageGraph,
+    legacy_order: Sequence[str] = (),
+) -> dict[str, StageProgress]:
+    """Attach per-stage slices to ``progress`` and return them by stage name.
+
+    Documents saved before stage slices existed only carry a flat
+    ``stage_index``/``last_symbol`` cursor over ``legacy_order``; stages
+    before the cursor are treated as completed and the cursor stage resumes
+    from ``last_symbol`` with the previously recorded counters.
+    """
+    raw_stages = progress.get("stages")
+    if not isinstance(raw_stages, dict):
+        raw_stages = {}
+        legacy_index = progress.get("stage_index")
+        if legacy_order and isinstance(legacy_index, int):
+            for name in legacy_order[:legacy_index]:
+                raw_stages[name] = {"status": STAGE_COMPLETED}
+            if legacy_index < len(legacy_order):
+                current = legacy_order[legacy_index]
+                raw_stages[current] = {
+                    "status": STAGE_RUNNING,
+                    "stage": progress.get("stage"),
+                    "last_symbol": progress.get("last_symbol"),
+                    "last_index": progress.get("last_index"),
+                    "success_count": progress.get("success_count", 0),
+                    "error_count": progress.get("error_count", 0),
+                    "stage_stats": dict(progress.get("stage_stats") or {}),
+                }
+
+    slices: dict[str, StageProgress] = {}
+    for name in graph:
+        existing = raw_stages.get(name)
+        slice_ = StageProgress(progress, existing if isinstance(existing, dict) else {})
+        slice_.setdefault("status", STAGE_PENDING)
+        slice_.setdefault("success_count", 0)
+        slice_.setdefault("error_count", 0)
+        slice_.setdefault("stage_stats", {})
+        slices[name] = slice_
+    # Keep slices for stages outside this run's graph so their stats survive.
+    for name, existing in raw_stages.items():
+        if name not in slices and isinstance(existing, dict):
+            slices[name] = StageProgress(progress, existing)
+
+    progress["stages"] = slices
+    aggregate_stage_progress(progress)
+    return slices
+
+
+def completed_stages(progress: Mapping[str, Any]) -> set[str]:
+    stages = progress.get("stages") or {}
+    return {
+        name
+        for name, slice_ in stages.items()
+        if isinstance(slice_, Mapping) and slice_.get("status") == STAGE_COMPLETED
+    }
+
+
+def aggregate_stage_progress(progress: dict[str, Any]) -> dict[str, Any]:
+    """Roll per-stage counters up into the top-level progress fields."""
+    stages = progress.get("stages")
+    if not isinstance(stages, dict):
+        return progress
+
+    success = 0
+    errors = 0
+    stage_stats: dict[str, Any] = {}
+    running: list[str] = []
+    for name, slice_ in stages.items():
+        success += int(slice_.get("success_count") or 0)
+        errors += int(slice_.get("error_count") or 0)
+        stage_stats.update(slice_.get("stage_stats") or {})
+        if slice_.get("status") == STAGE_RUNNING:
+            running.append(name)
+
+    progress["success_count"] = success
+    progress["error_count"] = errors
+    progress["stage_stats"] = stage_stats
+    progress["running_stages"] = running
+    if running:
+        progress["stage"] = running[0]
+    return progress
+
+
+def root_progress(progress: dict[str, Any]) -> dict[str, Any]:
+    """Return the document to persist for ``progress`` (a slice or a root)."""
+    root = getattr(progress, "root", None)
+    if root is None:
+        return progress
+    return aggregate_stage_progress(root)
+
+
+StageRunner = Callable[[str], Awaitable[None]]
+StageHook = Callable[[str], Awaitable[None]]
+
+
+async def run_stage_graph(
+    graph: StageGraph,
+    runner: StageRunner,
+    *,
+    completed: Iterable[str] = (),
+    max_parallel: int = 1,
+    pool_limits: Mapping[str, int] | None = None,
+    on_stage_start: StageHook | None = None,
+    on_stage_done: StageHook | None = None,
+) -> list[str]:
+    """Run every stage of ``graph`` not already in ``completed``.
+
+    Stages start as soon as their dependencies finish, bounded by
+    ``max_parallel`` overall and ``pool_limits`` per pool (unlisted pools
+    are only bounded by ``max_parallel``). The first exception raised by
+    ``runner`` cancels the in-flight stages and is re-raised; runners that
+    should tolerate stage failures must handle them themselves.
+
+    Returns:
+        Names of the stages run by this call, in completion order.
+    """
+    limits = dict(pool_limits or {})
+    max_parallel = max(1, max_parallel)
+    done: set[str] = {name for name in completed if name in graph}
+    finished: list[str] = []
+    running: dict[asyncio.Task, str] = {}
+
+    def pool_usage(pool: str) -> int:
+        return sum(1 for name in running.values() if graph.specs[name].pool == pool)
+
+    def start_ready() -> None:
+        for name in graph.ready(done, running.values()):
+            if len(running) >= max_parallel:
+                return
+            pool = graph.specs[name].pool
+            limit = limits.get(pool)
+            if limit is not None and pool_usage(pool) >= max(1, limit):
+                continue
+            running[asyncio.create_task(_run_one(name), name=f"stage:{name}")] = name
+
+    async def _run_one(name: str) -> None:
+        if on_stage_start is not None:
+            await on_stage_start(name)
+        await runner(name)
+        if on_stage_done is not None:
+            await on_stage_done(name)
+
+    try:
+        start_ready()
+        while running:
+            completed_tasks, _ = await asyncio.wait(
+                running.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in completed_tasks:
+                name = running.pop(task)
+                task.result()
+                done.add(name)
+                finished.append(name)
+            start_ready()
+    except BaseException:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        raise
+
+    remaining = [name for name in graph if name not in done]
+    if remaining:
+        # Only reachable if a pool limit can never be satisfied.
+        raise RuntimeError(f"Stages could not be scheduled: {remaining}")
+    return finished
+
+
+def _parse_iso(value: Any) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=None)
+
+
+def _stage_counts(name: str, slice_: Mapping[str, Any]) -> tuple[int, int | None]:
+    stats = (slice_.get("stage_stats") or {}).get(name) or {}
+    if stats:
+        processed = int(stats.get("success") or 0) + int(stats.get("errors") or 0)
+        total = stats.get("total")
+        return processed, int(total) if isinstance(total, (int, float)) else None
+    processed = int(slice_.get("success_count") or 0) + int(slice_.get("error_count") or 0)
+    return processed, None
+
+
+def summarize_progress(
+    progress: Mapping[str, Any] | None,
+    now: datetime | None = None,
+) -> dict[str, Any] | None:
+    """Per-stage and overall throughput/ETA for a saved progress document."""
+    if not progress:
+        return None
+    now = now or datetime.utcnow()
+    stages = progress.get("stages") or {}
+
+    stage_rows: list[dict[str, Any]] = []
+    total_processed = 0
+    total_remaining = 0
+    totals_known = True
+    for name, slice_ in stages.items():
+        if not isinstance(slice_, Mapping):
+            continue
+        status = slice_.get("status", STAGE_PENDING)
+        processed, total = _stage_counts(name, slice_)
+        started_at = _parse_iso(slice_.get("started_at"))
+        finished_at = _parse_iso(slice_.get("finished_at"))
+        elapsed = None
+        if started_at is not None:
+            elapsed = max(((finished_at or now) - started_at).total_seconds(), 0.0)
+
+        throughput = processed / elapsed if elapsed and processed else None
+        remaining = max(total - processed, 0) if total is not None else None
+        eta = None
+        if status == STAGE_COMPLETED:
+            remaining = 0
+            eta = 0.0
+        elif remaining is not None and throughput:
+            eta = remaining / throughput
+
+        total_processed += processed
+        if remaining is None:
+            totals_known = totals_known and status == STAGE_COMPLETED
+        else:
+            total_remaining += remaining
+
+        stage_rows.append(
+            {
+                "stage": name,
+                "status": status,
+                "processed": processed,
+                "total": total,
+                "last_symbol": slice_.get("last_symbol"),
+                "elapsed_seconds": round(elapsed, 1) if elapsed is not None else None,
+                "throughput_per_second": round(throughput, 3) if throughput else None,
+                "eta_seconds": round(eta, 1) if eta is not None else None,
+            }
+        )
+
+    run_started = _parse_iso(progress.get("started_at"))
+    run_elapsed = (now - run_started).total_seconds() if run_started else None
+    run_throughput = (
+        total_processed / run_elapsed if run_elapsed and total_processed else None
+    )
+    run_eta = total_remaining / run_throughput if run_throughput and totals_known else None
+
+    return {
+        "job_id": progress.get("job_id"),
+        "status": progress.get("status"),
+        "running_stages": list(progress.get("running_stages") or []),
+        "success_count": progress.get("success_count", 0),
+        "error_count": progress.get("error_count", 0),
+        "started_at": progress.get("started_at"),
+        "updated_at": progress.get("updated_at"),
+        "elapsed_seconds": round(run_elapsed, 1) if run_elapsed is not None else None,
+        "throughput_per_second": round(run_throughput, 3) if run_throughput else None,
+        "eta_seconds": round(run_eta, 1) if run_eta is not None else None,
+        "stages": stage_rows,
+    }
+
+
+__all__ = [
+    "StageGraph",
+    "StageProgress",
+    "StageSpec",
+    "aggregate_stage_progress",
+    "completed_stages",
+    "init_stage_progress",
+    "root_progress",
+    "run_stage_graph",
+    "summarize_progress",
+]
@@ -21,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from vnibb.core.config import settings
 from vnibb.core.database import async_session_maker
 from vnibb.models.technical_indicator import TechnicalIndicator
+from vnibb.providers.vnstock.runtime import get_stock_client, run_vnstock_call
 from vnibb.providers.vnstock.stock_quote import VnstockStockQuoteFetcher
 
 logger = logging.getLogger(__name__)
@@ -176,13 +177,9 @@ class TechnicalAnalysisService:
         end_date: date,
     ) -> Dict[str, Any]:
         """Fallback calculations using basic vnstock and pandas."""
-        import asyncio
 
         def _sync_calculate():
-            from vnibb.providers.vnstock.runtime import get_vnstock_class
-
-            Vnstock = get_vnstock_class()
-            stock = Vnstock().stock(symbol=symbol, source=settings.vnstock_source)
+            stock = get_stock_client(symbol, settings.vnstock_source)
 
             df = stock.quote.history(
                 start=start_date.strftime("%Y-%m-%d"),
@@ -251,10 +248,11 @@ class TechnicalAnalysisService:
 
             return indicators
 
-        # Run in thread pool
-        import asyncio
-
-        return await asyncio.to_thread(_sync_calculate)
+        return await run_vnstock_call(
+            "technical_fallback",
+            _sync_calculate,
+            key=(symbol, settings.vnstock_source, start_date, end_date),
+        )
 
     async def store_indicators(
         self,
@@ -335,14 +333,9 @@ class TechnicalAnalysisService:
                 (cached_frame["time"] >= start_timestamp) & (cached_frame["time"] < end_timestamp)
             ].reset_index(drop=True)
 
-        import asyncio
-
         def _fetch():
             try:
-                from vnibb.providers.vnstock.runtime import get_vnstock_class
-
-                Vnstock = get_vnstock_class()
-                stock = Vnstock().stock(symbol=symbol, source=settings.vnstock_source)
+                stock = get_stock_client(symbol, settings.vnstock_source)
 
                 df = stock.quote.history(
                     start=start_date.strftime("%Y-%m-%d"),
@@ -354,7 +347,11 @@ class TechnicalAnalysisService:
                 logger.error(f"Failed to fetch OHLCV for {symbol}: {e}")
                 return None
 
-        frame = await asyncio.to_thread(_fetch)
+        frame = await run_vnstock_call(
+            "technical_ohlcv",
+            _fetch,
+            key=(symbol, settings.vnstock_source, start_date, end_date, interval),
+        )
         if frame is None or frame.empty:
             return frame
 
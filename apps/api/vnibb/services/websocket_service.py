@@ -36,16 +36,20 @@ class ConnectionManager:
 
     def __init__(self):
         self.active_connections: dict[WebSocket, set[str]] = {}
+        # Authenticated alert-rule owner of each connection that presented a token.
+        self.connection_users: dict[WebSocket, str] = {}
         self._price_cache: dict[str, PriceUpdate] = {}
         self._update_task = None
 
-    async def connect(self, websocket: WebSocket) -> bool:
+    async def connect(self, websocket: WebSocket, user_id: str | None = None) -> bool:
         """Accept a connection unless the process limit is reached."""
         await websocket.accept()
         if len(self.active_connections) >= settings.websocket_max_connections:
             await websocket.close(code=1013)
             return False
         self.active_connections[websocket] = set()
+        if user_id is not None:
+            self.connection_users[websocket] = user_id
         logger.info(f"WebSocket connected: {len(self.active_connections)} active")
         return True
 
@@ -53,6 +57,7 @@ class ConnectionManager:
         """Remove connection."""
         if websocket in self.active_connections:
             del self.active_connections[websocket]
+        self.connection_users.pop(websocket, None)
         logger.info(f"WebSocket disconnected: {len(self.active_connections)} active")
 
     def subscribe(
@@ -132,6 +137,14 @@ class ConnectionManager:
             settings.websocket_send_timeout_seconds,
         )
 
+    async def send_user_alert(self, user_id: str, alert_data: dict):
+        """Send an alert only to the connections opened by ``user_id``."""
+        await self._broadcast(
+            [websocket for websocket, owner in self.connection_users.items() if owner == user_id],
+            {"type": "insider_alert", **alert_data},
+            settings.websocket_send_timeout_seconds,
+        )
+
     async def broadcast_sync_status(self, status_data: dict):
         """Broadcast sync status update to all connected clients."""
         await self._broadcast(
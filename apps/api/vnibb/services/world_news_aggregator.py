@@ -0,0 +1,440 @@
+"""
+Background world-news aggregator and article store.
+
+RSS/Atom feeds are polled by a scheduled job rather than on each
+``/news/world`` request, so request latency does not depend on the slowest
+feed:
+
+- one pooled ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed) is
+  reused across polls;
+- feeds are fetched with conditional GETs using the stored ``ETag`` /
+  ``Last-Modified`` validators, so unchanged feeds cost a ``304``;
+- each feed gets its own poll interval derived from how often it actually
+  publishes, backing off on ``304``s and failures
+  (``world_news_poll_min_seconds`` .. ``world_news_poll_max_seconds``);
+- parsed articles are upserted into ``world_news_articles`` keyed by
+  ``_build_article_id``; ``updated_at`` records when a feed last carried the
+  article. Rows are pruned when that and ``published_at`` are both older than
+  ``WORLD_NEWS_RETENTION_DAYS``.
+
+``read_stored_world_news`` serves the endpoints from the store with indexed
+``(source_id, published_at)`` reads. It returns ``None`` until the selected
+feeds have been polled at least once, in which case the service falls back
+to the live fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from importlib.util import find_spec
+from itertools import pairwise
+from typing import Any
+
+import httpx
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vnibb.core.config import settings
+from vnibb.models.world_news import WorldNewsArticleRecord, WorldNewsFeedState
+from vnibb.services import world_news_service
+from vnibb.services.bulk_writer import bulk_upsert
+from vnibb.services.world_news_service import (
+    WORLD_NEWS_MAX_CONCURRENT_FETCHES,
+    FeedFetchResult,
+    WorldNewsArticle,
+    WorldNewsFailedFeed,
+    WorldNewsSourceConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+DEFAULT_POLL_INTERVAL_SECONDS = 600
+CADENCE_SAMPLE_SIZE = 20
+WORLD_NEWS_RETENTION_DAYS = 14
+ARTICLE_LOOKUP_CHUNK = 500
+
+FEED_STATUS_OK = "ok"
+FEED_STATUS_NOT_MODIFIED = "not_modified"
+FEED_STATUS_FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _to_naive_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _to_aware_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def next_poll_interval(
+    previous_seconds: int | None,
+    *,
+    status: str,
+    published_at: Iterable[datetime | None] = (),
+    new_articles: int = 0,
+    min_seconds: int | None = None,
+    max_seconds: int | None = None,
+) -> int:
+    """Pick the next poll interval for one feed.
+
+    Feeds that published something new are polled at half their median gap
+    between recent items (so a new article waits at most ~half a cadence);
+    unchanged feeds back off by 1.5x and failing feeds by 2x.
+    """
+    floor = min_seconds if min_seconds is not None else settings.world_news_poll_min_seconds
+    ceiling = max_seconds if max_seconds is not None else settings.world_news_poll_max_seconds
+    ceiling = max(floor, ceiling)
+    previous = min(max(previous_seconds or DEFAULT_POLL_INTERVAL_SECONDS, floor), ceiling)
+
+    if status == FEED_STATUS_FAILED:
+        candidate = previous * 2.0
+    elif status == FEED_STATUS_NOT_MODIFIED or new_articles <= 0:
+        candidate = previous * 1.5
+    else:
+        stamps = sorted(
+            (_to_aware_utc(value) for value in published_at if value is not None),
+            reverse=True,
+        )[:CADENCE_SAMPLE_SIZE]
+        gaps = [
+            (newer - older).total_seconds()
+            for newer, older in pairwise(stamps)
+            if newer > older
+        ]
+        candidate = statistics.median(gaps) / 2 if gaps else previous / 2
+    return int(min(max(candidate, floor), ceiling))
+
+
+def _article_row(
+    article: WorldNewsArticle, *, first_seen_at: datetime, now: datetime
+) -> dict[str, Any]:
+    return {
+        "id": article.id,
+        "title": article.title,
+        "summary": article.summary,
+        "source_id": article.source_id,
+        "source": article.source,
+        "source_domain": article.source_domain,
+        "source_url": article.source_url,
+        "feed_url": article.feed_url,
+        "url": article.url,
+        "published_at": _to_naive_utc(article.published_at),
+        "region": article.region,
+        "category": article.category,
+        "language": article.language,
+        "tags": list(article.tags),
+        "relevance_score": article.relevance_score,
+        "first_seen_at": first_seen_at,
+        "updated_at": now,
+    }
+
+
+def _record_to_article(record: WorldNewsArticleRecord) -> WorldNewsArticle:
+    return WorldNewsArticle(
+        id=record.id,
+        title=record.title,
+        summary=record.summary,
+        source_id=record.source_id,
+        source=record.source,
+        source_domain=record.source_domain,
+        source_url=record.source_url,
+        feed_url=record.feed_url,
+        url=record.url,
+        published_at=_to_aware_utc(record.published_at),
+        region=record.region,
+        category=record.category,
+        language=record.language,
+        tags=list(record.tags or []),
+        relevance_score=record.relevance_score or 0.0,
+        live=False,
+    )
+
+
+async def _load_first_seen(
+    session: AsyncSession, article_ids: Sequence[str]
+) -> dict[str, datetime]:
+    first_seen: dict[str, datetime] = {}
+    for offset in range(0, len(article_ids), ARTICLE_LOOKUP_CHUNK):
+        chunk = list(article_ids[offset : offset + ARTICLE_LOOKUP_CHUNK])
+        result = await session.execute(
+            select(WorldNewsArticleRecord.id, WorldNewsArticleRecord.first_seen_at).where(
+                WorldNewsArticleRecord.id.in_(chunk)
+            )
+        )
+        first_seen.update(dict(result.all()))
+    return first_seen
+
+
+async def prune_world_news_articles(session: AsyncSession, *, now: datetime) -> int:
+    """Delete articles that were neither carried by a feed nor published in the window.
+
+    Pruning by ``first_seen_at`` would drop articles a feed still carries and
+    re-insert them as new on the next poll.
+    """
+    cutoff = now - timedelta(days=WORLD_NEWS_RETENTION_DAYS)
+    result = await session.execute(
+        delete(WorldNewsArticleRecord).where(
+            WorldNewsArticleRecord.updated_at < cutoff,
+            or_(
+                WorldNewsArticleRecord.published_at.is_(None),
+                WorldNewsArticleRecord.published_at < cutoff,
+            ),
+        )
+    )
+    return int(result.rowcount or 0)
+
+
+@dataclass(frozen=True)
+class StoredWorldNews:
+    articles: list[WorldNewsArticle]
+    failed_feeds: list[WorldNewsFailedFeed]
+    fetched_at: datetime
+
+
+async def read_stored_world_news(
+    session: AsyncSession,
+    sources: Sequence[WorldNewsSourceConfig],
+    *,
+    freshness_hours: int,
+    now: datetime | None = None,
+) -> StoredWorldNews | None:
+    """Read the freshness window for ``sources`` from the article store.
+
+    Returns ``None`` when none of the selected feeds has been polled yet.
+    Category filtering, dedupe and sorting stay with the caller so stored and
+    live responses are shaped identically.
+    """
+    if not sources:
+        return None
+    source_by_id = {source.id: source for source in sources}
+    feed_keys = {(source.id, feed_url) for source in sources for feed_url in source.feed_urls}
+
+    state_result = await session.execute(
+        select(WorldNewsFeedState).where(WorldNewsFeedState.source_id.in_(list(source_by_id)))
+    )
+    polled = [
+        state
+        for state in state_result.scalars().all()
+        if (state.source_id, state.feed_url) in feed_keys and state.last_polled_at is not None
+    ]
+    if not polled:
+        return None
+
+    cutoff = (now or _utcnow()) - timedelta(hours=freshness_hours)
+    article_result = await session.execute(
+        select(WorldNewsArticleRecord).where(
+            WorldNewsArticleRecord.source_id.in_(list(source_by_id)),
+            or_(
+                WorldNewsArticleRecord.published_at >= cutoff,
+                and_(
+                    WorldNewsArticleRecord.published_at.is_(None),
+                    WorldNewsArticleRecord.first_seen_at >= cutoff,
+                ),
+            ),
+        )
+    )
+    articles = [_record_to_article(record) for record in article_result.scalars().all()]
+
+    failed_feeds = []
+    for state in polled:
+        if state.last_status != FEED_STATUS_FAILED:
+            continue
+        source = source_by_id[state.source_id]
+        failed_feeds.append(
+            WorldNewsFailedFeed(
+                source_id=source.id,
+                source=source.name,
+                source_domain=source.domain,
+                source_url=source.homepage_url,
+                feed_url=state.feed_url,
+                failed_at=_to_aware_utc(state.last_polled_at),
+                reason=state.last_error or "Feed fetch failed",
+            )
+        )
+
+    fetched_at = max(state.last_polled_at for state in polled)
+    return StoredWorldNews(
+        articles=articles,
+        failed_feeds=failed_feeds,
+        fetched_at=_to_aware_utc(fetched_at),
+    )
+
+
+class WorldNewsAggregator:
+    """Polls the world-news registry into the article store."""
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            timeout = min(max(settings.scraper_timeout, 5), 12)
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": settings.scraper_user_agent},
+                follow_redirects=True,
+                timeout=httpx.Timeout(timeout),
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=WORLD_NEWS_MAX_CONCURRENT_FETCHES * 2,
+                    max_keepalive_connections=WORLD_NEWS_MAX_CONCURRENT_FETCHES,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def poll(
+        self,
+        session: AsyncSession | None = None,
+        *,
+        force: bool = False,
+        now: datetime | None = None,
+    ) -> dict[str, int]:
+        """Fetch every due feed once and persist articles plus feed state."""
+        if session is None:
+            from vnibb.core.database import async_session_maker
+
+            async with async_session_maker() as own_session:
+                return await self.poll(own_session, force=force, now=now)
+
+        now = now or _utcnow()
+        state_result = await session.execute(select(WorldNewsFeedState))
+        states = {
+            (state.source_id, state.feed_url): state for state in state_result.scalars().all()
+        }
+
+        due: list[tuple[WorldNewsSourceConfig, str, WorldNewsFeedState]] = []
+        for source in world_news_service.WORLD_NEWS_SOURCES:
+            for feed_url in source.feed_urls:
+                state = states.get((source.id, feed_url))
+                if state is None:
+                    state = WorldNewsFeedState(
+                        source_id=source.id,
+                        feed_url=feed_url,
+                        poll_interval_seconds=DEFAULT_POLL_INTERVAL_SECONDS,
+                        consecutive_failures=0,
+                        last_article_count=0,
+                        last_new_article_count=0,
+                    )
+                    session.add(state)
+                if force or state.next_poll_at is None or state.next_poll_at <= now:
+                    due.append((source, feed_url, state))
+
+        summary = {
+            "feeds_due": len(due),
+            "updated": 0,
+            "not_modified": 0,
+            "failed": 0,
+            "articles": 0,
+            "new_articles": 0,
+            "pruned": 0,
+        }
+        if not due:
+            await session.commit()
+            return summary
+
+        client = self._get_client()
+        semaphore = asyncio.Semaphore(WORLD_NEWS_MAX_CONCURRENT_FETCHES)
+
+        async def fetch(
+            source: WorldNewsSourceConfig, feed_url: str, state: WorldNewsFeedState
+        ) -> FeedFetchResult:
+            async with semaphore:
+                return await world_news_service._fetch_feed(
+                    client,
+                    source,
+                    feed_url,
+                    etag=state.etag,
+                    last_modified=state.last_modified,
+                )
+
+        raw_results = await asyncio.gather(
+            *(fetch(source, feed_url, state) for source, feed_url, state in due),
+            return_exceptions=True,
+        )
+        results: list[FeedFetchResult] = []
+        for (source, feed_url, _state), result in zip(due, raw_results, strict=True):
+            if isinstance(result, BaseException):
+                reason = world_news_service._feed_error_reason(result)
+                result = FeedFetchResult(
+                    articles=[],
+                    failed=True,
+                    failed_feed=world_news_service._failed_feed(source, feed_url, reason=reason),
+                )
+            results.append(result)
+
+        articles_by_id: dict[str, WorldNewsArticle] = {}
+        for result in results:
+            for article in result.articles:
+                articles_by_id[article.id] = article
+        first_seen = await _load_first_seen(session, list(articles_by_id))
+        rows = [
+            _article_row(article, first_seen_at=first_seen.get(article_id, now), now=now)
+            for article_id, article in articles_by_id.items()
+        ]
+        summary["articles"] = await bulk_upsert(session, WorldNewsArticleRecord, ["id"], rows)
+
+        for (_source, _feed_url, state), result in zip(due, results, strict=True):
+            new_articles = sum(1 for article in result.articles if article.id not in first_seen)
+            if result.failed:
+                status = FEED_STATUS_FAILED
+                state.consecutive_failures = (state.consecutive_failures or 0) + 1
+                state.last_error = (
+                    result.failed_feed.reason if result.failed_feed else "Feed fetch failed"
+                )[:240]
+                summary["failed"] += 1
+            else:
+                status = FEED_STATUS_NOT_MODIFIED if result.not_modified else FEED_STATUS_OK
+                state.consecutive_failures = 0
+                state.last_error = None
+                state.last_success_at = now
+                state.etag = (result.etag or None) and result.etag[:256]
+                state.last_modified = (result.last_modified or None) and result.last_modified[:64]
+                if result.not_modified:
+                    summary["not_modified"] += 1
+                else:
+                    summary["updated"] += 1
+                    state.last_article_count = len(result.articles)
+            state.last_new_article_count = new_articles
+            summary["new_articles"] += new_articles
+            state.last_status = status
+            state.last_polled_at = now
+            state.poll_interval_seconds = next_poll_interval(
+                state.poll_interval_seconds,
+                status=status,
+                published_at=(article.published_at for article in result.articles),
+                new_articles=new_articles,
+            )
+            state.next_poll_at = now + timedelta(seconds=state.poll_interval_seconds)
+
+        summary["pruned"] = await prune_world_news_articles(session, now=now)
+        await session.commit()
+        logger.info("World news aggregation complete: %s", summary)
+        return summary
+
+
+world_news_aggregator = WorldNewsAggregator()
+
+
+async def run_world_news_aggregation() -> dict[str, int]:
+    """Scheduler entry point: poll whichever feeds are due."""
+    return await world_news_aggregator.poll()
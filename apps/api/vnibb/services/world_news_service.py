@@ -16,8 +16,10 @@ from xml.etree import ElementTree as ET
 
 import httpx
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from vnibb.core.config import settings
+from vnibb.services.near_duplicate_index import NearDuplicateIndex, overlap_coefficient
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +42,12 @@ MAX_CUSTOM_RSS_URL_LENGTH = 500
 WORLD_NEWS_MAX_CONCURRENT_FETCHES = 8
 WORLD_NEWS_REFRESH_DEADLINE_SECONDS = 15.0
 WORLD_NEWS_MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+# Overlap-coefficient cut-off: the shorter headline shares 62% of its tokens,
+# so a short rewrite contained in a longer headline is a duplicate.
+HEADLINE_SIMILARITY_THRESHOLD = 0.62
+# 64 bands x 2 rows keep LSH recall high for subset rewrites (see near_duplicate_index).
+HEADLINE_INDEX_NUM_PERM = 128
+HEADLINE_INDEX_BANDS = 64
 _world_news_fetch_semaphore = asyncio.Semaphore(WORLD_NEWS_MAX_CONCURRENT_FETCHES)
 _world_news_cleanup_tasks: set[asyncio.Future[Any]] = set()
 
@@ -165,6 +173,9 @@ class FeedFetchResult:
     articles: list[WorldNewsArticle]
     failed: bool = False
     failed_feed: WorldNewsFailedFeed | None = None
+    not_modified: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 WORLD_NEWS_SOURCES: tuple[WorldNewsSourceConfig, ...] = (
@@ -1393,53 +1404,29 @@ def _track_world_news_cleanup(cleanup: asyncio.Task[None]) -> None:
     cleanup.add_done_callback(observe_cleanup)
 
 
-async def get_world_news_feed(
-    *,
-    region: str | None = None,
-    category: str | None = None,
-    language: str | None = None,
-    source: str | None = None,
-    custom_feed_url: str | None = None,
-    custom_source_name: str | None = None,
-    limit: int = 40,
-    freshness_hours: int = 72,
-) -> WorldNewsFeedResponse:
-    selected_sources = list(
-        _select_sources(
-            region=region,
-            category=None,
-            language=language,
-            source_id=source,
-        )
-    )
-    custom_source = _custom_source_from_url(
-        custom_feed_url,
-        name=custom_source_name,
-        region=region,
-        category=category,
-        language=language,
-    )
-    if custom_source is not None and not source:
-        selected_sources.append(custom_source)
+async def _read_stored_world_news(
+    db: AsyncSession | None,
+    sources: list[WorldNewsSourceConfig],
+    freshness_hours: int,
+):
+    """Serve from the aggregator's article store; ``None`` falls back to live."""
+    from vnibb.services.world_news_aggregator import read_stored_world_news
 
-    feed_count = sum(len(item.feed_urls) for item in selected_sources)
-    now = datetime.now(UTC)
+    try:
+        if db is not None:
+            return await read_stored_world_news(db, sources, freshness_hours=freshness_hours)
+        from vnibb.core.database import async_session_maker
+
+        async with async_session_maker() as session:
+            return await read_stored_world_news(session, sources, freshness_hours=freshness_hours)
+    except Exception as exc:
+        logger.debug("World news store read failed, fetching live: %s", exc)
+        return None
 
-    if not selected_sources:
-        return WorldNewsFeedResponse(
-            articles=[],
-            total=0,
-            fetched_at=now,
-            source_count=0,
-            feed_count=0,
-            failed_feed_count=0,
-            region=region,
-            category=category,
-            language=language,
-            source=source,
-            freshness_hours=freshness_hours,
-        )
 
+async def _fetch_live_feed_results(
+    selected_sources: list[WorldNewsSourceConfig],
+) -> list[FeedFetchResult]:
     timeout = min(max(settings.scraper_timeout, 5), 12)
     headers = {"User-Agent": settings.scraper_user_agent}
 
@@ -1496,6 +1483,71 @@ async def get_world_news_feed(
             await asyncio.shield(cleanup)
         raise
 
+    return results
+
+
+async def get_world_news_feed(
+    *,
+    region: str | None = None,
+    category: str | None = None,
+    language: str | None = None,
+    source: str | None = None,
+    custom_feed_url: str | None = None,
+    custom_source_name: str | None = None,
+    limit: int = 40,
+    freshness_hours: int = 72,
+    db: AsyncSession | None = None,
+) -> WorldNewsFeedResponse:
+    selected_sources = list(
+        _select_sources(
+            region=region,
+            category=None,
+            language=language,
+            source_id=source,
+        )
+    )
+    custom_source = _custom_source_from_url(
+        custom_feed_url,
+        name=custom_source_name,
+        region=region,
+        category=category,
+        language=language,
+    )
+    if custom_source is not None and not source:
+        selected_sources.append(custom_source)
+
+    feed_count = sum(len(item.feed_urls) for item in selected_sources)
+    now = datetime.now(UTC)
+
+    if not selected_sources:
+        return WorldNewsFeedResponse(
+            articles=[],
+            total=0,
+            fetched_at=now,
+            source_count=0,
+            feed_count=0,
+            failed_feed_count=0,
+            region=region,
+            category=category,
+            language=language,
+            source=source,
+            freshness_hours=freshness_hours,
+        )
+
+    stored = None
+    if custom_source is None and settings.world_news_aggregator_enabled:
+        stored = await _read_stored_world_news(db, selected_sources, freshness_hours)
+    if stored is not None:
+        results = [FeedFetchResult(articles=stored.articles)]
+        results.extend(
+            FeedFetchResult(articles=[], failed=True, failed_feed=failed_feed)
+            for failed_feed in stored.failed_feeds
+        )
+        fetched_at = stored.fetched_at
+    else:
+        results = await _fetch_live_feed_results(selected_sources)
+        fetched_at = now
+
     failed_feeds = [result.failed_feed for result in results if result.failed_feed is not None]
     failed_feed_count = sum(1 for result in results if result.failed)
     cutoff = now - timedelta(hours=freshness_hours)
@@ -1515,7 +1567,7 @@ async def get_world_news_feed(
     return WorldNewsFeedResponse(
         articles=limited_articles,
         total=len(deduped_articles),
-        fetched_at=now,
+        fetched_at=fetched_at,
         source_count=len(selected_sources),
         feed_count=feed_count,
         failed_feed_count=failed_feed_count,
@@ -1537,6 +1589,7 @@ async def get_world_news_map(
     custom_source_name: str | None = None,
     limit: int = 100,
     freshness_hours: int = 72,
+    db: AsyncSession | None = None,
 ) -> WorldNewsMapResponse:
     selected_sources = list(
         _select_sources(
@@ -1565,6 +1618,7 @@ async def get_world_news_map(
         custom_source_name=custom_source_name,
         limit=limit,
         freshness_hours=freshness_hours,
+        db=db,
     )
 
     bucket_meta: dict[str, dict[str, str | float]] = {}
@@ -1839,6 +1893,9 @@ async def _fetch_feed(
     client: httpx.AsyncClient,
     source: WorldNewsSourceConfig,
     feed_url: str,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
 ) -> FeedFetchResult:
     """Fetch a single RSS/Atom feed with bounded retries and backoff.
 
@@ -1846,6 +1903,10 @@ async def _fetch_feed(
     afford long retry loops here, but a single retry covers the bulk of
     transient 5xx / 429 / network-glitch failures we see from publisher CDNs
     without inflating the worst-case per-request latency budget too much.
+
+    When ``etag`` / ``last_modified`` validators are given the request is
+    conditional; a ``304 Not Modified`` returns ``not_modified=True`` with no
+    articles. Successful results carry the response validators back.
     """
 
     # Circuit breaker: skip feeds that have been failing repeatedly until
@@ -1860,13 +1921,30 @@ async def _fetch_feed(
 
     last_error: Exception | None = None
     response_body: bytes | None = None
+    response_etag: str | None = None
+    response_last_modified: str | None = None
+    conditional_headers: dict[str, str] = {}
+    if etag:
+        conditional_headers["If-None-Match"] = etag
+    if last_modified:
+        conditional_headers["If-Modified-Since"] = last_modified
 
     # 1 attempt + 1 retry. Backoff is short because the gather is concurrent
     # and the endpoint-level cache absorbs a fast retry on the next refresh.
     for attempt in range(2):
         try:
-            async with client.stream("GET", feed_url) as response:
+            async with client.stream("GET", feed_url, headers=conditional_headers or None) as response:
+                if response.status_code == 304:
+                    _feed_circuit_record_success(source.id, feed_url)
+                    return FeedFetchResult(
+                        articles=[],
+                        not_modified=True,
+                        etag=response.headers.get("etag") or etag,
+                        last_modified=response.headers.get("last-modified") or last_modified,
+                    )
                 response.raise_for_status()
+                response_etag = response.headers.get("etag")
+                response_last_modified = response.headers.get("last-modified")
                 content_length = response.headers.get("content-length")
                 if content_length and content_length.isdigit() and int(content_length) > WORLD_NEWS_MAX_RESPONSE_BYTES:
                     raise FeedResponseTooLargeError
@@ -1935,7 +2013,11 @@ async def _fetch_feed(
         )
 
     _feed_circuit_record_success(source.id, feed_url)
-    return FeedFetchResult(articles=articles)
+    return FeedFetchResult(
+        articles=articles,
+        etag=response_etag,
+        last_modified=response_last_modified,
+    )
 
 
 def _parse_feed(
@@ -2158,7 +2240,12 @@ def _build_article_id(source_id: str, link: str, title: str, guid: str | None) -
 def _dedupe_articles(articles: list[WorldNewsArticle]) -> list[WorldNewsArticle]:
     seen_urls: set[str] = set()
     seen_titles: set[str] = set()
-    seen_token_sets: list[set[str]] = []
+    similar_headlines = NearDuplicateIndex(
+        threshold=HEADLINE_SIMILARITY_THRESHOLD,
+        num_perm=HEADLINE_INDEX_NUM_PERM,
+        bands=HEADLINE_INDEX_BANDS,
+        similarity=overlap_coefficient,
+    )
     deduped: list[WorldNewsArticle] = []
     for article in sorted(articles, key=_article_sort_key, reverse=True):
         url_key = _dedupe_url_key(article)
@@ -2169,7 +2256,7 @@ def _dedupe_articles(articles: list[WorldNewsArticle]) -> list[WorldNewsArticle]
             continue
         if title_key and title_key in seen_titles:
             continue
-        if title_tokens and any(_headline_similarity(title_tokens, seen) >= 0.62 for seen in seen_token_sets):
+        if title_tokens and similar_headlines.query(title_tokens) is not None:
             continue
 
         if url_key:
@@ -2177,7 +2264,7 @@ def _dedupe_articles(articles: list[WorldNewsArticle]) -> list[WorldNewsArticle]
         if title_key:
             seen_titles.add(title_key)
         if title_tokens:
-            seen_token_sets.append(title_tokens)
+            similar_headlines.add(len(deduped), title_tokens)
         deduped.append(article)
     return deduped
 
@@ -2205,13 +2292,6 @@ def _headline_tokens(title: str) -> set[str]:
     }
 
 
-def _headline_similarity(left: set[str], right: set[str]) -> float:
-    if not left or not right:
-        return 0.0
-    overlap = len(left & right)
-    return overlap / min(len(left), len(right))
-
-
 def _normalize_headline(title: str) -> str:
     normalized = unicodedata.normalize("NFKD", title.lower())
     ascii_text = "".join(char for char in normalized if not unicodedata.combining(char))
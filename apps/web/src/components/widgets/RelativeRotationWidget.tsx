@@ -35,10 +35,16 @@ function quadrantFill(quadrant: string): string {
   return '#94a3b8'
 }
 
-function buildDomain(values: number[]): [number, number] {
-  const min = Math.min(...values)
-  const max = Math.max(...values)
-  return [Math.floor(Math.min(95, min - 1.5)), Math.ceil(Math.max(105, max + 1.5))]
+// RS-Ratio is 100 * EMA10/EMA63 of price relative to the benchmark, so it
+// mostly sits within ~90-110; RS-Momentum (ratio vs its own EMA10) within
+// ~98-102. Axes are centred on 100 and never narrower than these spans.
+const RS_RATIO_MIN_HALF_SPAN = 2
+const RS_MOMENTUM_MIN_HALF_SPAN = 0.5
+
+function buildDomain(values: number[], minHalfSpan: number): [number, number] {
+  const deviation = Math.max(minHalfSpan, ...values.map((value) => Math.abs(value - 100)))
+  const halfSpan = deviation * 1.1
+  return [Math.floor((100 - halfSpan) * 2) / 2, Math.ceil((100 + halfSpan) * 2) / 2]
 }
 
 function RotationDot(props: {
@@ -172,11 +178,11 @@ export function RelativeRotationWidget({ symbol, onDataChange }: RelativeRotatio
     [selected?.trail, upperSymbol]
   )
   const chartDomain = useMemo(() => {
-    const xValues = [100, ...universePoints.map((point) => point.rsRatio), ...trailPoints.map((point) => point.rsRatio)]
-    const yValues = [100, ...universePoints.map((point) => point.rsMomentum), ...trailPoints.map((point) => point.rsMomentum)]
+    const xValues = [...universePoints.map((point) => point.rsRatio), ...trailPoints.map((point) => point.rsRatio)]
+    const yValues = [...universePoints.map((point) => point.rsMomentum), ...trailPoints.map((point) => point.rsMomentum)]
     return {
-      x: buildDomain(xValues),
-      y: buildDomain(yValues),
+      x: buildDomain(xValues, RS_RATIO_MIN_HALF_SPAN),
+      y: buildDomain(yValues, RS_MOMENTUM_MIN_HALF_SPAN),
     }
   }, [trailPoints, universePoints])
   const hasChartData = universePoints.length > 0
@@ -297,6 +303,7 @@ export function RelativeRotationWidget({ symbol, onDataChange }: RelativeRotatio
                     <XAxis
                       type="number"
                       dataKey="rsRatio"
+                      tickFormatter={(value: number) => value.toFixed(1)}
                       domain={chartDomain.x}
                       tick={{ fontSize: 10, fill: 'var(--text-muted)' }}
                       axisLine={false}
@@ -306,6 +313,7 @@ export function RelativeRotationWidget({ symbol, onDataChange }: RelativeRotatio
                     <YAxis
                       type="number"
                       dataKey="rsMomentum"
+                      tickFormatter={(value: number) => value.toFixed(1)}
                       domain={chartDomain.y}
                       tick={{ fontSize: 10, fill: 'var(--text-muted)' }}
                       axisLine={false}